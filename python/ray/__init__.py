@@ -116,6 +116,7 @@ from ray._private.worker import (  # noqa: E402,F401
     WORKER_MODE,
     RESTORE_WORKER_MODE,
     SPILL_WORKER_MODE,
+    as_completed,
     cancel,
     get,
     get_actor,
@@ -176,6 +177,7 @@ __all__ = [
     "__version__",
     "_config",
     "get_runtime_context",
+    "as_completed",
     "autoscaler",
     "available_resources",
     "cancel",
@@ -208,6 +210,7 @@ __all__ = [
 
 # Public APIs that should automatically trigger ray.init().
 AUTO_INIT_APIS = {
+    "as_completed",
     "cancel",
     "get",
     "get_actor",
@@ -1,4 +1,5 @@
 import abc
+import io
 import logging
 import os
 import random
@@ -6,8 +7,8 @@ import shutil
 import time
 import urllib
 import uuid
-from collections import namedtuple
-from typing import IO, List, Optional, Tuple, Union
+from collections import defaultdict, namedtuple
+from typing import IO, Callable, List, Optional, Tuple, Union
 
 import ray
 from ray._private.ray_constants import DEFAULT_OBJECT_PREFIX
@@ -181,6 +182,64 @@ class ExternalStorage(metaclass=abc.ABCMeta):
                 f"size of {obtained_data_size}."
             )
 
+    def _read_object(self, f: IO, object_ref: ObjectRef, size: int) -> int:
+        """Restore the object at the current position of the given file handle.
+
+        Args:
+            f: File handle positioned at the first byte of the object.
+            object_ref: The ref of the object to restore.
+            size: Size of the object specified in the url_with_offset.
+
+        Returns:
+            The number of bytes restored.
+        """
+        address_len = int.from_bytes(f.read(8), byteorder="little")
+        metadata_len = int.from_bytes(f.read(8), byteorder="little")
+        buf_len = int.from_bytes(f.read(8), byteorder="little")
+        self._size_check(address_len, metadata_len, buf_len, size)
+        owner_address = f.read(address_len)
+        metadata = f.read(metadata_len)
+        # read remaining data to our buffer
+        self._put_object_to_store(metadata, buf_len, f, object_ref, owner_address)
+        return buf_len
+
+    def _read_multiple_objects(
+        self,
+        open_file: Callable[[str], IO],
+        object_refs: List[ObjectRef],
+        url_with_offset_list: List[bytes],
+    ) -> int:
+        """Restore the given objects, opening each spilled file only once.
+
+        Objects are grouped by the file they are stored in and read in the
+        order of their offsets, so objects that were spilled next to each other
+        are read sequentially without seeking or reopening the file.
+
+        Args:
+            open_file: Function that opens a spilled file for reading.
+            object_refs: List of object IDs (note that it is not ref).
+            url_with_offset_list: List of url_with_offset.
+
+        Returns:
+            The total number of bytes restored.
+        """
+        url_to_objects = defaultdict(list)
+        for object_ref, url_with_offset in zip(object_refs, url_with_offset_list):
+            parsed_result = parse_url_with_offset(url_with_offset.decode())
+            url_to_objects[parsed_result.base_url].append((parsed_result, object_ref))
+
+        total = 0
+        for base_url, objects in url_to_objects.items():
+            objects.sort(key=lambda item: item[0].offset)
+            with open_file(base_url) as f:
+                for parsed_result, object_ref in objects:
+                    # The object might have been skipped without being read
+                    # if it already exists, so check the actual position.
+                    if f.tell() != parsed_result.offset:
+                        f.seek(parsed_result.offset)
+                    total += self._read_object(f, object_ref, parsed_result.size)
+        return total
+
     @abc.abstractmethod
     def spill_objects(self, object_refs, owner_addresses) -> List[str]:
         """Spill objects to the external storage. Objects are specified
@@ -293,9 +352,7 @@ class FileSystemStorage(ExternalStorage):
         # mounted at different point.
         self._current_directory_index = random.randrange(0, len(self._directory_paths))
 
-    def spill_objects(self, object_refs, owner_addresses) -> List[str]:
-        if len(object_refs) == 0:
-            return []
+    def _get_spill_url(self, object_refs: List[ObjectRef]) -> str:
         # Choose the current directory path by round robin order.
         self._current_directory_index = (self._current_directory_index + 1) % len(
             self._directory_paths
@@ -303,36 +360,26 @@ class FileSystemStorage(ExternalStorage):
         directory_path = self._directory_paths[self._current_directory_index]
 
         filename = _get_unique_spill_filename(object_refs)
-        url = f"{os.path.join(directory_path, filename)}"
-        with open(url, "wb", buffering=self._buffer_size) as f:
+        return f"{os.path.join(directory_path, filename)}"
+
+    def _open(self, url: str, mode: str) -> IO:
+        if "w" in mode:
+            return open(url, mode, buffering=self._buffer_size)
+        return open(url, mode)
+
+    def spill_objects(self, object_refs, owner_addresses) -> List[str]:
+        if len(object_refs) == 0:
+            return []
+        url = self._get_spill_url(object_refs)
+        with self._open(url, "wb") as f:
             return self._write_multiple_objects(f, object_refs, owner_addresses, url)
 
     def restore_spilled_objects(
         self, object_refs: List[ObjectRef], url_with_offset_list: List[str]
     ):
-        total = 0
-        for i in range(len(object_refs)):
-            object_ref = object_refs[i]
-            url_with_offset = url_with_offset_list[i].decode()
-            # Retrieve the information needed.
-            parsed_result = parse_url_with_offset(url_with_offset)
-            base_url = parsed_result.base_url
-            offset = parsed_result.offset
-            # Read a part of the file and recover the object.
-            with open(base_url, "rb") as f:
-                f.seek(offset)
-                address_len = int.from_bytes(f.read(8), byteorder="little")
-                metadata_len = int.from_bytes(f.read(8), byteorder="little")
-                buf_len = int.from_bytes(f.read(8), byteorder="little")
-                self._size_check(address_len, metadata_len, buf_len, parsed_result.size)
-                total += buf_len
-                owner_address = f.read(address_len)
-                metadata = f.read(metadata_len)
-                # read remaining data to our buffer
-                self._put_object_to_store(
-                    metadata, buf_len, f, object_ref, owner_address
-                )
-        return total
+        return self._read_multiple_objects(
+            lambda url: self._open(url, "rb"), object_refs, url_with_offset_list
+        )
 
     def delete_spilled_objects(self, urls: List[str]):
         for url in urls:
@@ -404,29 +451,9 @@ class ExternalStorageRayStorageImpl(ExternalStorage):
     def restore_spilled_objects(
         self, object_refs: List[ObjectRef], url_with_offset_list: List[str]
     ):
-        total = 0
-        for i in range(len(object_refs)):
-            object_ref = object_refs[i]
-            url_with_offset = url_with_offset_list[i].decode()
-            # Retrieve the information needed.
-            parsed_result = parse_url_with_offset(url_with_offset)
-            base_url = parsed_result.base_url
-            offset = parsed_result.offset
-            # Read a part of the file and recover the object.
-            with self._fs.open_input_file(base_url) as f:
-                f.seek(offset)
-                address_len = int.from_bytes(f.read(8), byteorder="little")
-                metadata_len = int.from_bytes(f.read(8), byteorder="little")
-                buf_len = int.from_bytes(f.read(8), byteorder="little")
-                self._size_check(address_len, metadata_len, buf_len, parsed_result.size)
-                total += buf_len
-                owner_address = f.read(address_len)
-                metadata = f.read(metadata_len)
-                # read remaining data to our buffer
-                self._put_object_to_store(
-                    metadata, buf_len, f, object_ref, owner_address
-                )
-        return total
+        return self._read_multiple_objects(
+            self._fs.open_input_file, object_refs, url_with_offset_list
+        )
 
     def delete_spilled_objects(self, urls: List[str]):
         for url in urls:
@@ -527,23 +554,26 @@ class ExternalStorageSmartOpenImpl(ExternalStorage):
 
         self.transport_params.update(self.override_transport_params)
 
-    def spill_objects(self, object_refs, owner_addresses) -> List[str]:
-        if len(object_refs) == 0:
-            return []
-        from smart_open import open
-
+    def _get_spill_url(self, object_refs: List[ObjectRef]) -> str:
         # Choose the current uri by round robin order.
         self._current_uri_index = (self._current_uri_index + 1) % len(self._uris)
         uri = self._uris[self._current_uri_index]
 
         key = f"{self.prefix}-{_get_unique_spill_filename(object_refs)}"
-        url = f"{uri}/{key}"
+        return f"{uri}/{key}"
 
-        with open(
-            url,
-            mode="wb",
-            transport_params=self.transport_params,
-        ) as file_like:
+    def _open(self, url: str, mode: str) -> IO:
+        from smart_open import open
+
+        # For reads, smart open seek reads the file from offset-end_of_the_file
+        # when the seek is called.
+        return open(url, mode=mode, transport_params=self.transport_params)
+
+    def spill_objects(self, object_refs, owner_addresses) -> List[str]:
+        if len(object_refs) == 0:
+            return []
+        url = self._get_spill_url(object_refs)
+        with self._open(url, "wb") as file_like:
             return self._write_multiple_objects(
                 file_like, object_refs, owner_addresses, url
             )
@@ -551,34 +581,9 @@ class ExternalStorageSmartOpenImpl(ExternalStorage):
     def restore_spilled_objects(
         self, object_refs: List[ObjectRef], url_with_offset_list: List[str]
     ):
-        from smart_open import open
-
-        total = 0
-        for i in range(len(object_refs)):
-            object_ref = object_refs[i]
-            url_with_offset = url_with_offset_list[i].decode()
-
-            # Retrieve the information needed.
-            parsed_result = parse_url_with_offset(url_with_offset)
-            base_url = parsed_result.base_url
-            offset = parsed_result.offset
-
-            with open(base_url, "rb", transport_params=self.transport_params) as f:
-                # smart open seek reads the file from offset-end_of_the_file
-                # when the seek is called.
-                f.seek(offset)
-                address_len = int.from_bytes(f.read(8), byteorder="little")
-                metadata_len = int.from_bytes(f.read(8), byteorder="little")
-                buf_len = int.from_bytes(f.read(8), byteorder="little")
-                self._size_check(address_len, metadata_len, buf_len, parsed_result.size)
-                owner_address = f.read(address_len)
-                total += buf_len
-                metadata = f.read(metadata_len)
-                # read remaining data to our buffer
-                self._put_object_to_store(
-                    metadata, buf_len, f, object_ref, owner_address
-                )
-        return total
+        return self._read_multiple_objects(
+            lambda url: self._open(url, "rb"), object_refs, url_with_offset_list
+        )
 
     def delete_spilled_objects(self, urls: List[str]):
         pass
@@ -587,6 +592,271 @@ class ExternalStorageSmartOpenImpl(ExternalStorage):
         pass
 
 
+class SpillCompressor:
+    """Compresses spilled objects that are likely to be compressible.
+
+    Whether an object is compressed is decided per object by compressing a few
+    samples of its buffer, so incompressible objects (e.g., already compressed
+    images or random data) don't pay for a full compression.
+
+    Args:
+        codec: Either "lz4" or "zstd".
+        min_size: Objects smaller than this are never compressed.
+        sample_size: Size of each of the (up to 3) samples used to estimate
+            the compression ratio.
+        max_ratio: An object is only compressed if its samples compress to
+            at most this fraction of their size.
+
+    Raises:
+        ValueError: If the codec is unknown.
+        ModuleNotFoundError: If the library of the codec isn't installed.
+    """
+
+    CODEC_NONE = 0
+    CODEC_IDS = {"lz4": 1, "zstd": 2}
+
+    def __init__(
+        self,
+        codec: str,
+        min_size: int = 64 * 1024,
+        sample_size: int = 64 * 1024,
+        max_ratio: float = 0.8,
+    ):
+        if codec not in self.CODEC_IDS:
+            raise ValueError(
+                f"Unknown spill compression codec: {codec}. "
+                f"Supported codecs are {list(self.CODEC_IDS)}."
+            )
+        # Fail early if the library isn't installed.
+        _get_codec(self.CODEC_IDS[codec])
+        self.codec_id = self.CODEC_IDS[codec]
+        self._min_size = min_size
+        self._sample_size = sample_size
+        self._max_ratio = max_ratio
+
+    def compress(self, buf: memoryview) -> Tuple[int, Union[bytes, memoryview]]:
+        """Compress the buffer if it is compressible.
+
+        Returns:
+            The ID of the codec used, or CODEC_NONE, and the stored data.
+        """
+        if len(buf) < self._min_size:
+            return self.CODEC_NONE, buf
+        compress, _ = _get_codec(self.codec_id)
+        if len(buf) > 3 * self._sample_size:
+            # Estimate the compression ratio from the start, middle, and end
+            # of the buffer.
+            middle = (len(buf) - self._sample_size) // 2
+            sample = b"".join(
+                [
+                    buf[: self._sample_size],
+                    buf[middle : middle + self._sample_size],
+                    buf[-self._sample_size :],
+                ]
+            )
+            if len(compress(sample)) > self._max_ratio * len(sample):
+                return self.CODEC_NONE, buf
+        compressed = compress(buf)
+        if len(compressed) > self._max_ratio * len(buf):
+            return self.CODEC_NONE, buf
+        return self.codec_id, compressed
+
+    @staticmethod
+    def decompress(codec_id: int, data: bytes) -> bytes:
+        if codec_id == SpillCompressor.CODEC_NONE:
+            return data
+        _, decompress = _get_codec(codec_id)
+        return decompress(data)
+
+
+def _get_codec(codec_id: int) -> Tuple[Callable, Callable]:
+    """Return the compress and decompress functions of the codec."""
+    if codec_id == SpillCompressor.CODEC_IDS["lz4"]:
+        try:
+            import lz4.frame
+        except ModuleNotFoundError as e:
+            raise ModuleNotFoundError(
+                "lz4 is chosen to compress spilled objects, but lz4 is not "
+                f"installed. Original error: {e}"
+            )
+        return lz4.frame.compress, lz4.frame.decompress
+    elif codec_id == SpillCompressor.CODEC_IDS["zstd"]:
+        try:
+            import zstandard
+        except ModuleNotFoundError as e:
+            raise ModuleNotFoundError(
+                "zstd is chosen to compress spilled objects, but zstandard is not "
+                f"installed. Original error: {e}"
+            )
+        return (
+            zstandard.ZstdCompressor().compress,
+            zstandard.ZstdDecompressor().decompress,
+        )
+    raise ValueError(f"Unknown spill compression codec ID: {codec_id}")
+
+
+class TieredStorage(ExternalStorage):
+    """The external storage that spills to local directories first and
+    overflows to smart_open URIs (e.g., S3) once the local disk is full.
+
+    Objects can optionally be compressed with lz4 or zstd. Since compressed
+    objects can't be read by the raylet directly, this storage stores each
+    object with an extended header that also contains the compression codec
+    and the uncompressed size of the object.
+
+    Args:
+        node_id: The ID of the node.
+        directory_path: Local directory path(s), e.g., on a local NVMe disk.
+        uri: Optional smart_open URI(s) that objects overflow to.
+        local_capacity_threshold: Objects are spilled to the URIs once this
+            fraction of the local disk is used.
+        compression: Optional codec to compress objects with, "lz4" or "zstd".
+        compression_min_ratio: Objects are only compressed if samples of them
+            compress to at most this fraction of their size.
+        buffer_size: File buffer size for the local directories.
+        override_transport_params: Overriding the default value of
+            transport_params for smart-open library.
+
+    Raises:
+        ValueError: If the configuration is invalid.
+        ModuleNotFoundError: If smart_open or the compression library
+            isn't installed.
+    """
+
+    # 40 bytes to store owner address, metadata, stored and original buffer
+    # lengths and the compression codec.
+    HEADER_LENGTH = 40
+
+    def __init__(
+        self,
+        node_id: str,
+        directory_path: Union[str, List[str]],
+        uri: Optional[Union[str, List[str]]] = None,
+        local_capacity_threshold: float = 0.9,
+        compression: Optional[str] = None,
+        compression_min_ratio: float = 0.8,
+        buffer_size: Optional[int] = None,
+        override_transport_params: Optional[dict] = None,
+    ):
+        assert (
+            0 <= local_capacity_threshold <= 1
+        ), "local_capacity_threshold must be between 0 and 1."
+        self._local = FileSystemStorage(node_id, directory_path, buffer_size)
+        self._remote = None
+        if uri is not None:
+            self._remote = ExternalStorageSmartOpenImpl(
+                node_id, uri, override_transport_params
+            )
+        self._local_capacity_threshold = local_capacity_threshold
+        self._compressor = None
+        if compression is not None:
+            self._compressor = SpillCompressor(
+                compression, max_ratio=compression_min_ratio
+            )
+
+    def _is_local_full(self) -> bool:
+        # All the local directories are expected to be on the same disk.
+        usage = shutil.disk_usage(self._local._directory_paths[0])
+        return usage.used >= self._local_capacity_threshold * usage.total
+
+    def _is_local_url(self, url: str) -> bool:
+        return url.startswith(tuple(self._local._directory_paths))
+
+    def _write_multiple_objects(
+        self, f: IO, object_refs: List[ObjectRef], owner_addresses: List[str], url: str
+    ) -> List[str]:
+        keys = []
+        offset = 0
+        ray_object_pairs = self._get_objects_from_store(object_refs)
+        for ref, (buf, metadata), owner_address in zip(
+            object_refs, ray_object_pairs, owner_addresses
+        ):
+            if buf is None and len(metadata) == 0:
+                raise ValueError(f"Object {ref.hex()} does not exist.")
+            buf = memoryview(buf) if buf is not None else memoryview(b"")
+            codec_id = SpillCompressor.CODEC_NONE
+            data = buf
+            if self._compressor is not None:
+                codec_id, data = self._compressor.compress(buf)
+            header = b"".join(
+                length.to_bytes(8, byteorder="little")
+                for length in (
+                    len(owner_address),
+                    len(metadata),
+                    len(data),
+                    len(buf),
+                    codec_id,
+                )
+            )
+            written_bytes = 0
+            for part in (header, owner_address, metadata, data):
+                written_bytes += f.write(part)
+            assert (
+                self.HEADER_LENGTH + len(owner_address) + len(metadata) + len(data)
+                == written_bytes
+            )
+            url_with_offset = create_url_with_offset(
+                url=url, offset=offset, size=written_bytes
+            )
+            keys.append(url_with_offset.encode())
+            offset += written_bytes
+        f.flush()
+        return keys
+
+    def _read_object(self, f: IO, object_ref: ObjectRef, size: int) -> int:
+        address_len = int.from_bytes(f.read(8), byteorder="little")
+        metadata_len = int.from_bytes(f.read(8), byteorder="little")
+        stored_len = int.from_bytes(f.read(8), byteorder="little")
+        buf_len = int.from_bytes(f.read(8), byteorder="little")
+        codec_id = int.from_bytes(f.read(8), byteorder="little")
+        self._size_check(address_len, metadata_len, stored_len, size)
+        owner_address = f.read(address_len)
+        metadata = f.read(metadata_len)
+        if codec_id == SpillCompressor.CODEC_NONE:
+            self._put_object_to_store(metadata, buf_len, f, object_ref, owner_address)
+        else:
+            data = SpillCompressor.decompress(codec_id, f.read(stored_len))
+            self._put_object_to_store(
+                metadata, buf_len, io.BytesIO(data), object_ref, owner_address
+            )
+        return buf_len
+
+    def spill_objects(self, object_refs, owner_addresses) -> List[str]:
+        if len(object_refs) == 0:
+            return []
+        tier = self._local
+        if self._remote is not None and self._is_local_full():
+            tier = self._remote
+        url = tier._get_spill_url(object_refs)
+        with tier._open(url, "wb") as f:
+            return self._write_multiple_objects(f, object_refs, owner_addresses, url)
+
+    def restore_spilled_objects(
+        self, object_refs: List[ObjectRef], url_with_offset_list: List[str]
+    ):
+        def open_file(url):
+            tier = self._local if self._is_local_url(url) else self._remote
+            return tier._open(url, "rb")
+
+        return self._read_multiple_objects(open_file, object_refs, url_with_offset_list)
+
+    def delete_spilled_objects(self, urls: List[str]):
+        local_urls, remote_urls = [], []
+        for url in urls:
+            if self._is_local_url(parse_url_with_offset(url.decode()).base_url):
+                local_urls.append(url)
+            else:
+                remote_urls.append(url)
+        self._local.delete_spilled_objects(local_urls)
+        if self._remote is not None:
+            self._remote.delete_spilled_objects(remote_urls)
+
+    def destroy_external_storage(self):
+        self._local.destroy_external_storage()
+        if self._remote is not None:
+            self._remote.destroy_external_storage()
+
+
 _external_storage = NullStorage()
 
 
@@ -641,6 +911,8 @@ def setup_external_storage(config, node_id, session_name):
             _external_storage = ExternalStorageSmartOpenImpl(
                 node_id, **config["params"]
             )
+        elif storage_type == "tiered":
+            _external_storage = TieredStorage(node_id, **config["params"])
         elif storage_type == "mock_distributed_fs":
             # This storage is used to unit test distributed external storages.
             # TODO(sang): Delete it after introducing the mock S3 test.
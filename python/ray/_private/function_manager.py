@@ -9,7 +9,7 @@ import os
 import threading
 import time
 import traceback
-from collections import defaultdict, namedtuple
+from collections import OrderedDict, defaultdict, namedtuple
 from typing import Optional, Callable
 
 import ray
@@ -40,13 +40,25 @@ FunctionExecutionInfo = namedtuple(
 )
 ImportedFunctionInfo = namedtuple(
     "ImportedFunctionInfo",
-    ["job_id", "function_id", "function_name", "function", "module", "max_calls"],
+    [
+        "job_id",
+        "function_id",
+        "function_name",
+        "function",
+        "module",
+        "max_calls",
+        "content_hash",
+        "definition_key",
+    ],
 )
 
 """FunctionExecutionInfo: A named tuple storing remote function information."""
 
 logger = logging.getLogger(__name__)
 
+# The maximum number of definitions whose first export each process remembers.
+MAX_EXPORTED_DEFINITIONS = 1000
+
 
 def make_function_table_key(key_type: bytes, job_id: JobID, key: Optional[bytes]):
     if key is None:
@@ -55,6 +67,15 @@ def make_function_table_key(key_type: bytes, job_id: JobID, key: Optional[bytes]
         return b":".join([key_type, job_id.hex().encode(), key])
 
 
+def compute_content_hash(pickled_definition: bytes, module: str) -> bytes:
+    """Hash of a pickled function or class and the module it's loaded into.
+
+    Definitions with the same content hash have the same pickled bytes, so
+    they only need to be stored in the GCS and fetched by each worker once.
+    """
+    return hashlib.sha1(pickled_definition + b":" + module.encode()).digest()
+
+
 class FunctionActorManager:
     """A class used to export/load remote functions and actors.
     Attributes:
@@ -69,6 +90,11 @@ class FunctionActorManager:
             execution times.
         imported_actor_classes: The set of actor classes keys (format:
             ActorClass:function_id) that are already in GCS.
+        _exported_definitions: The content hash of the functions and actor
+            classes exported by this process, and the key of their first export.
+        _pickled_definitions: The content hash of the small functions and
+            actor classes fetched by this worker, and the pickled definition,
+            in least recently used order.
     """
 
     def __init__(self, worker):
@@ -85,6 +111,15 @@ class FunctionActorManager:
         # these types.
         self.imported_actor_classes = set()
         self._loaded_actor_classes = {}
+        # Remote functions that are created repeatedly from the same definition
+        # (e.g., by libraries that call `ray.remote` dynamically) get a new
+        # function ID each time, but the pickled definition only needs to be
+        # stored and fetched once. It's still unpickled for each function ID,
+        # so that state set on one of them isn't shared with the others.
+        self._exported_definitions = OrderedDict()
+        self._exported_definitions_cluster_and_job = None
+        self._pickled_definitions = OrderedDict()
+        self._pickled_definitions_bytes = 0
         # Deserialize an ActorHandle will call load_actor_class(). If a
         # function closure captured an ActorHandle, the deserialization of the
         # function will be:
@@ -133,6 +168,86 @@ class FunctionActorManager:
         # Return a hash of the identifier in case it is too large.
         return hashlib.sha1(collision_identifier.encode("utf-8")).digest()
 
+    def _get_definition_key(self, key: bytes, content_hash: bytes) -> Optional[bytes]:
+        """Get the key of the first export of a definition by this process.
+
+        If the definition wasn't exported before, `key` is recorded as its
+        first export and None is returned.
+        """
+        with self._export_lock:
+            # The function table is per cluster and job.
+            if (
+                self._exported_definitions_cluster_and_job
+                != self._worker.current_cluster_and_job
+            ):
+                self._exported_definitions.clear()
+                self._exported_definitions_cluster_and_job = (
+                    self._worker.current_cluster_and_job
+                )
+
+            definition_key = self._exported_definitions.get(content_hash)
+            if definition_key is not None:
+                self._exported_definitions.move_to_end(content_hash)
+                # The first export may be exported again under the same key.
+                return definition_key if definition_key != key else None
+
+            self._exported_definitions[content_hash] = key
+            if len(self._exported_definitions) > MAX_EXPORTED_DEFINITIONS:
+                self._exported_definitions.popitem(last=False)
+            return None
+
+    def _cache_pickled_definition(self, content_hash: bytes, pickled: bytes):
+        # Only small definitions are kept, as those are the ones that are
+        # typically re-exported, e.g., closures that libraries pass to
+        # `ray.remote` dynamically.
+        if len(pickled) > ray_constants.PICKLED_DEFINITION_CACHE_MAX_BYTES // 16:
+            return
+
+        with self.lock:
+            if content_hash in self._pickled_definitions:
+                self._pickled_definitions.move_to_end(content_hash)
+                return
+
+            self._pickled_definitions[content_hash] = pickled
+            self._pickled_definitions_bytes += len(pickled)
+            while (
+                self._pickled_definitions_bytes
+                > ray_constants.PICKLED_DEFINITION_CACHE_MAX_BYTES
+            ):
+                _, evicted = self._pickled_definitions.popitem(last=False)
+                self._pickled_definitions_bytes -= len(evicted)
+
+    def _get_pickled_definition(
+        self,
+        pickled: Optional[bytes],
+        content_hash: Optional[bytes],
+        definition_key: Optional[bytes],
+        field: str,
+    ) -> Optional[bytes]:
+        """Get the pickled function or class of a function table entry.
+
+        Entries of definitions that were exported before by the same process
+        only hold the key of the first export's entry, which holds the pickled
+        definition in `field`. `content_hash` is None for entries exported by
+        older versions.
+        """
+        if content_hash is None:
+            return pickled
+
+        if pickled is None:
+            with self.lock:
+                pickled = self._pickled_definitions.get(content_hash)
+            if pickled is None and definition_key is not None:
+                vals = self._worker.gcs_client.internal_kv_get(
+                    definition_key, KV_NAMESPACE_FUNCTION_TABLE
+                )
+                if vals is not None:
+                    pickled = pickle.loads(vals).get(field)
+
+        if pickled is not None:
+            self._cache_pickled_definition(content_hash, pickled)
+        return pickled
+
     def load_function_or_class_from_local(self, module_name, function_or_class_name):
         """Try to load a function or class in the module from local."""
         module = importlib.import_module(module_name)
@@ -227,15 +342,21 @@ class FunctionActorManager:
         )
         if self._worker.gcs_client.internal_kv_exists(key, KV_NAMESPACE_FUNCTION_TABLE):
             return
+        content_hash = compute_content_hash(pickled_function, function.__module__)
+        definition_key = self._get_definition_key(key, content_hash)
         val = pickle.dumps(
             {
                 "job_id": self._worker.current_job_id.binary(),
                 "function_id": remote_function._function_descriptor.function_id.binary(),  # noqa: E501
                 "function_name": remote_function._function_name,
                 "module": function.__module__,
-                "function": pickled_function,
+                # Only the first export of the definition holds the pickled
+                # function. The other exports refer to it.
+                "function": pickled_function if definition_key is None else None,
+                "definition_key": definition_key,
                 "collision_identifier": self.compute_collision_identifier(function),
                 "max_calls": remote_function._max_calls,
+                "content_hash": content_hash,
             }
         )
         self._worker.gcs_client.internal_kv_put(
@@ -259,6 +380,8 @@ class FunctionActorManager:
                 "function",
                 "module",
                 "max_calls",
+                "content_hash",
+                "definition_key",
             ]
             return ImportedFunctionInfo._make(vals.get(field) for field in fields)
 
@@ -274,11 +397,16 @@ class FunctionActorManager:
             serialized_function,
             module,
             max_calls,
+            content_hash,
+            definition_key,
         ) = remote_function_info
 
         function_id = ray.FunctionID(function_id_str)
         job_id = ray.JobID(job_id_str)
         max_calls = int(max_calls)
+        serialized_function = self._get_pickled_definition(
+            serialized_function, content_hash, definition_key, "function"
+        )
 
         # This function is called by ImportThread. This operation needs to be
         # atomic. Otherwise, there is race condition. Another thread may use
@@ -496,15 +624,25 @@ class FunctionActorManager:
             "job_id": job_id.binary(),
             "collision_identifier": self.compute_collision_identifier(Class),
             "actor_method_names": json.dumps(list(actor_method_names)),
+            "content_hash": compute_content_hash(
+                serialized_actor_class, actor_creation_function_descriptor.module_name
+            ),
         }
 
         check_oversized_function(
-            actor_class_info["class"],
+            serialized_actor_class,
             actor_class_info["class_name"],
             "actor",
             self._worker,
         )
 
+        # Only the first export of the definition holds the pickled class. The
+        # other exports refer to it.
+        definition_key = self._get_definition_key(key, actor_class_info["content_hash"])
+        if definition_key is not None:
+            actor_class_info["class"] = None
+            actor_class_info["definition_key"] = definition_key
+
         self._worker.gcs_client.internal_kv_put(
             key, pickle.dumps(actor_class_info), True, KV_NAMESPACE_FUNCTION_TABLE
         )
@@ -627,20 +765,38 @@ class FunctionActorManager:
 
         # Fetch raw data from GCS.
         vals = self._worker.gcs_client.internal_kv_get(key, KV_NAMESPACE_FUNCTION_TABLE)
-        fields = ["job_id", "class_name", "module", "class", "actor_method_names"]
+        fields = [
+            "job_id",
+            "class_name",
+            "module",
+            "class",
+            "actor_method_names",
+            "content_hash",
+            "definition_key",
+        ]
         if vals is None:
             vals = {}
         else:
             vals = pickle.loads(vals)
-        (job_id_str, class_name, module, pickled_class, actor_method_names) = (
-            vals.get(field) for field in fields
-        )
+        (
+            job_id_str,
+            class_name,
+            module,
+            pickled_class,
+            actor_method_names,
+            content_hash,
+            definition_key,
+        ) = (vals.get(field) for field in fields)
 
         class_name = ensure_str(class_name)
         module_name = ensure_str(module)
         job_id = ray.JobID(job_id_str)
         actor_method_names = json.loads(ensure_str(actor_method_names))
 
+        pickled_class = self._get_pickled_definition(
+            pickled_class, content_hash, definition_key, "class"
+        )
+
         actor_class = None
         try:
             with self.lock:
@@ -1,15 +1,21 @@
 import argparse
+import ctypes
+import ctypes.util
 import errno
+import fnmatch
 import glob
 import logging
 import logging.handlers
 import os
 import platform
 import re
+import select
 import shutil
+import struct
+import sys
 import time
 import traceback
-from typing import Callable, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set
 
 from ray._raylet import GcsClient
 import ray._private.ray_constants as ray_constants
@@ -30,6 +36,10 @@ RUNTIME_ENV_SETUP_PATTERN = re.compile(".*runtime_env_setup-(\d+).log")
 # We need it because log name update is CPU intensive and uses 100%
 # of cpu when there are many log files.
 LOG_NAME_UPDATE_INTERVAL_S = float(os.getenv("LOG_NAME_UPDATE_INTERVAL_S", 0.5))
+# Log name update interval when watching the log directory for changes. New
+# files are found through change events, so this only catches files that were
+# created before their directory was watched.
+LOG_NAME_RESCAN_INTERVAL_S = float(os.getenv("LOG_NAME_RESCAN_INTERVAL_S", 5))
 # Once there are more files than this threshold,
 # log monitor start giving backpressure to lower cpu usages.
 RAY_LOG_MONITOR_MANY_FILES_THRESHOLD = int(
@@ -65,6 +75,14 @@ class LogFileInfo:
         self.worker_pid = worker_pid
         self.actor_name = None
         self.task_name = None
+        # The last time new lines were read from the file.
+        self.last_active_time = 0.0
+        # True if the file wasn't opened because too many files were open.
+        self.deferred = False
+        # Lines read from the file that haven't been published yet.
+        self.pending_lines: List[str] = []
+        self.pending_bytes = 0
+        self.pending_since: Optional[float] = None
 
     def reopen_if_necessary(self):
         """Check if the file's inode has changed and reopen it if necessary.
@@ -100,6 +118,97 @@ class LogFileInfo:
         )
 
 
+class _InotifyWatcher:
+    """Watches directories for changes to their files using Linux inotify."""
+
+    IN_MODIFY = 0x00000002
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    WATCH_MASK = IN_MODIFY | IN_MOVED_TO | IN_CREATE
+    # struct inotify_event without the trailing name.
+    EVENT_HEADER = struct.Struct("iIII")
+    READ_SIZE = 64 * 1024
+
+    def __init__(self, libc: ctypes.CDLL, fd: int):
+        self._libc = libc
+        self._fd = fd
+        self._dirs_by_wd: Dict[int, str] = {}
+        self._watched_dirs: Set[str] = set()
+
+    @classmethod
+    def create(cls) -> Optional["_InotifyWatcher"]:
+        """Returns a new watcher, or None if inotify isn't available."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(
+                ctypes.util.find_library("c") or "libc.so.6", use_errno=True
+            )
+            fd = libc.inotify_init1(cls.IN_NONBLOCK | cls.IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            logger.warning(
+                f"Failed to initialize inotify: {os.strerror(ctypes.get_errno())}"
+            )
+            return None
+        return cls(libc, fd)
+
+    def watch(self, directory: str) -> bool:
+        """Watches the directory for changes. Returns False on failure."""
+        if directory in self._watched_dirs:
+            return True
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), self.WATCH_MASK
+        )
+        if wd < 0:
+            logger.warning(
+                f"Failed to watch {directory}: {os.strerror(ctypes.get_errno())}"
+            )
+            return False
+        self._dirs_by_wd[wd] = directory
+        self._watched_dirs.add(directory)
+        return True
+
+    def read_events(self, timeout: float) -> Optional[Set[str]]:
+        """Waits up to timeout seconds for the watched files to change.
+
+        Returns:
+            The paths of the files that changed, or None if some events were
+            lost and any file may have changed.
+        """
+        changed_paths = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return changed_paths
+
+        overflowed = False
+        while True:
+            try:
+                buf = os.read(self._fd, self.READ_SIZE)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _, name_len = self.EVENT_HEADER.unpack_from(buf, offset)
+                offset += self.EVENT_HEADER.size
+                name = buf[offset : offset + name_len].rstrip(b"\0")
+                offset += name_len
+                if mask & self.IN_Q_OVERFLOW:
+                    overflowed = True
+                elif name and wd in self._dirs_by_wd:
+                    changed_paths.add(
+                        os.path.join(self._dirs_by_wd[wd], os.fsdecode(name))
+                    )
+        return None if overflowed else changed_paths
+
+    def close(self):
+        os.close(self._fd)
+
+
 class LogMonitor:
     """A monitor process for monitoring Ray log files.
 
@@ -118,6 +227,11 @@ class LogMonitor:
     4. Then we will loop through the open files and see if there are any new
        lines in the file. If so, we will publish them to Ray pubsub.
 
+    Closed files are opened in order of how recently they had new lines. If
+    RAY_LOG_MONITOR_EVENT_DRIVEN is set, the log directory is watched for
+    changes with inotify, and only the files that changed are checked for new
+    lines.
+
     Attributes:
         ip: The hostname of this machine, for grouping log messages.
         logs_dir: The directory that the log files are in.
@@ -151,10 +265,25 @@ class LogMonitor:
         self.max_files_open: int = max_files_open
         self.is_proc_alive_fn: Callable[[int], bool] = is_proc_alive_fn
         self.is_autoscaler_v2: bool = self.get_is_autoscaler_v2(gcs_address)
+        self._watcher: Optional[_InotifyWatcher] = None
+        if ray_constants.LOG_MONITOR_EVENT_DRIVEN:
+            self._watcher = _InotifyWatcher.create()
+            if self._watcher is None:
+                logger.warning("inotify isn't available, polling the log files.")
+        # Files that changed since they were last read. Only used if the log
+        # directory is watched for changes.
+        self._updated_filenames: Set[str] = set()
+        self._file_infos_by_filename: Dict[str, LogFileInfo] = {}
+        # True if the log directory must be scanned for new files, because it
+        # wasn't scanned yet or some change events were lost.
+        self._rescan_needed: bool = True
+        # Files with lines that haven't been published yet.
+        self._file_infos_with_pending_lines: Dict[str, LogFileInfo] = {}
 
         logger.info(
             f"Starting log monitor with [max open files={max_files_open}],"
-            f" [is_autoscaler_v2={self.is_autoscaler_v2}]"
+            f" [is_autoscaler_v2={self.is_autoscaler_v2}],"
+            f" [event_driven={self._watcher is not None}]"
         )
 
     def get_is_autoscaler_v2(self, gcs_address: Optional[str]) -> bool:
@@ -173,6 +302,7 @@ class LogMonitor:
         """Close all open files (so that we can open more)."""
         while len(self.open_file_infos) > 0:
             file_info = self.open_file_infos.pop(0)
+            self._publish_pending_lines(file_info)
             file_info.file_handle.close()
             file_info.file_handle = None
 
@@ -210,67 +340,117 @@ class LogMonitor:
 
             if proc_alive:
                 self.closed_file_infos.append(file_info)
+            else:
+                self._untrack_file(file_info.filename)
 
         self.can_open_more_files = True
 
-    def update_log_filenames(self):
-        """Update the list of log files to monitor."""
-        monitor_log_paths = []
+    def _get_monitor_log_patterns(self) -> List[str]:
+        """Returns the glob patterns of the log files to monitor."""
         # output of user code is written here
-        monitor_log_paths += glob.glob(
-            f"{self.logs_dir}/worker*[.out|.err]"
-        ) + glob.glob(f"{self.logs_dir}/java-worker*.log")
+        patterns = [
+            f"{self.logs_dir}/worker*[.out|.err]",
+            f"{self.logs_dir}/java-worker*.log",
+        ]
         # segfaults and other serious errors are logged here
-        monitor_log_paths += glob.glob(f"{self.logs_dir}/raylet*.err")
+        patterns.append(f"{self.logs_dir}/raylet*.err")
         # monitor logs are needed to report autoscaler events
         # TODO(rickyx): remove this after migration.
         if not self.is_autoscaler_v2:
             # We publish monitor logs in autoscaler v1
-            monitor_log_paths += glob.glob(f"{self.logs_dir}/monitor.log")
+            patterns.append(f"{self.logs_dir}/monitor.log")
         else:
             # We publish autoscaler events directly in autoscaler v2
-            monitor_log_paths += glob.glob(
-                f"{self.logs_dir}/events/event_AUTOSCALER.log"
-            )
+            patterns.append(f"{self.logs_dir}/events/event_AUTOSCALER.log")
 
         # If gcs server restarts, there can be multiple log files.
-        monitor_log_paths += glob.glob(f"{self.logs_dir}/gcs_server*.err")
+        patterns.append(f"{self.logs_dir}/gcs_server*.err")
 
         # runtime_env setup process is logged here
         if RAY_RUNTIME_ENV_LOG_TO_DRIVER_ENABLED:
-            monitor_log_paths += glob.glob(f"{self.logs_dir}/runtime_env*.log")
+            patterns.append(f"{self.logs_dir}/runtime_env*.log")
+        return patterns
+
+    def update_log_filenames(self):
+        """Update the list of log files to monitor."""
+        monitor_log_paths = []
+        for pattern in self._get_monitor_log_patterns():
+            monitor_log_paths += glob.glob(pattern)
         for file_path in monitor_log_paths:
             if os.path.isfile(file_path) and file_path not in self.log_filenames:
-                worker_match = WORKER_LOG_PATTERN.match(file_path)
-                if worker_match:
-                    worker_pid = int(worker_match.group(2))
-                else:
-                    worker_pid = None
-                job_id = None
-
-                # Perform existence check first because most file will not be
-                # including runtime_env. This saves some cpu cycle.
-                if "runtime_env" in file_path:
-                    runtime_env_job_match = RUNTIME_ENV_SETUP_PATTERN.match(file_path)
-                    if runtime_env_job_match:
-                        job_id = runtime_env_job_match.group(1)
-
-                is_err_file = file_path.endswith("err")
-
-                self.log_filenames.add(file_path)
-                self.closed_file_infos.append(
-                    LogFileInfo(
-                        filename=file_path,
-                        size_when_last_opened=0,
-                        file_position=0,
-                        file_handle=None,
-                        is_err_file=is_err_file,
-                        job_id=job_id,
-                        worker_pid=worker_pid,
-                    )
-                )
-                log_filename = os.path.basename(file_path)
-                logger.info(f"Beginning to track file {log_filename}")
+                self._track_file(file_path)
+        self._rescan_needed = False
+
+    def _track_file(self, file_path: str):
+        """Start monitoring a new log file."""
+        worker_match = WORKER_LOG_PATTERN.match(file_path)
+        if worker_match:
+            worker_pid = int(worker_match.group(2))
+        else:
+            worker_pid = None
+        job_id = None
+
+        # Perform existence check first because most file will not be
+        # including runtime_env. This saves some cpu cycle.
+        if "runtime_env" in file_path:
+            runtime_env_job_match = RUNTIME_ENV_SETUP_PATTERN.match(file_path)
+            if runtime_env_job_match:
+                job_id = runtime_env_job_match.group(1)
+
+        is_err_file = file_path.endswith("err")
+
+        self.log_filenames.add(file_path)
+        file_info = LogFileInfo(
+            filename=file_path,
+            size_when_last_opened=0,
+            file_position=0,
+            file_handle=None,
+            is_err_file=is_err_file,
+            job_id=job_id,
+            worker_pid=worker_pid,
+        )
+        self.closed_file_infos.append(file_info)
+        log_filename = os.path.basename(file_path)
+        logger.info(f"Beginning to track file {log_filename}")
+
+        if self._watcher is not None:
+            self._file_infos_by_filename[file_path] = file_info
+            # The file may have been written before its directory was watched.
+            self._updated_filenames.add(file_path)
+            if not self._watcher.watch(os.path.dirname(file_path)):
+                logger.warning("Falling back to polling the log files.")
+                self._watcher.close()
+                self._watcher = None
+                self._updated_filenames.clear()
+                self._file_infos_by_filename.clear()
+
+    def _untrack_file(self, filename: str):
+        """Stop watching a log file for changes."""
+        self._updated_filenames.discard(filename)
+        self._file_infos_by_filename.pop(filename, None)
+
+    def _process_file_events(self, timeout: float):
+        """Wait up to timeout seconds for the log files to change."""
+        changed_paths = self._watcher.read_events(timeout)
+        if changed_paths is None:
+            # Any file may have changed, including new ones.
+            self._updated_filenames.update(self._file_infos_by_filename)
+            self._rescan_needed = True
+            return
+
+        patterns = None
+        for path in changed_paths:
+            if path in self._file_infos_by_filename:
+                self._updated_filenames.add(path)
+                continue
+            if path in self.log_filenames:
+                continue
+            if patterns is None:
+                patterns = self._get_monitor_log_patterns()
+            if os.path.isfile(path) and any(
+                fnmatch.fnmatchcase(path, pattern) for pattern in patterns
+            ):
+                self._track_file(path)
 
     def open_closed_files(self):
         """Open some closed files if they may have new lines.
@@ -283,12 +463,38 @@ class LogMonitor:
             self._close_all_files()
 
         files_with_no_updates = []
-        while len(self.closed_file_infos) > 0:
+        if self._watcher is None:
+            candidates = self.closed_file_infos
+            self.closed_file_infos = []
+        else:
+            # Files without change events can't have new lines, so there's no
+            # need to go through all of the closed files.
+            candidates = [
+                self._file_infos_by_filename[filename]
+                for filename in self._updated_filenames
+                if self._file_infos_by_filename[filename].file_handle is None
+            ]
+            if len(candidates) > 0:
+                self.closed_file_infos = [
+                    file_info
+                    for file_info in self.closed_file_infos
+                    if file_info.filename not in self._updated_filenames
+                ]
+        # Open the files that didn't fit last time first, so that no file is
+        # starved, and then the files that had new lines most recently.
+        candidates.sort(
+            key=lambda file_info: (not file_info.deferred, -file_info.last_active_time)
+        )
+
+        for i, file_info in enumerate(candidates):
             if len(self.open_file_infos) >= self.max_files_open:
                 self.can_open_more_files = False
+                for deferred_file_info in candidates[i:]:
+                    deferred_file_info.deferred = True
+                files_with_no_updates += candidates[i:]
                 break
 
-            file_info = self.closed_file_infos.pop(0)
+            file_info.deferred = False
             assert file_info.file_handle is None
             # Get the file size to see if it has gotten bigger since we last
             # opened it.
@@ -301,6 +507,7 @@ class LogMonitor:
                         f"Warning: The file {file_info.filename} was not found."
                     )
                     self.log_filenames.remove(file_info.filename)
+                    self._untrack_file(file_info.filename)
                     continue
                 raise e
 
@@ -315,6 +522,7 @@ class LogMonitor:
                             f"Warning: The file {file_info.filename} was not found."
                         )
                         self.log_filenames.remove(file_info.filename)
+                        self._untrack_file(file_info.filename)
                         continue
                     else:
                         raise e
@@ -325,45 +533,65 @@ class LogMonitor:
                 self.open_file_infos.append(file_info)
             else:
                 files_with_no_updates.append(file_info)
+                self._updated_filenames.discard(file_info.filename)
 
         if len(self.open_file_infos) >= self.max_files_open:
             self.can_open_more_files = False
         # Add the files with no changes back to the list of closed files.
         self.closed_file_infos += files_with_no_updates
 
+    def _publish_pending_lines(self, file_info: LogFileInfo):
+        """Publish the lines read from the file that weren't published yet."""
+        if len(file_info.pending_lines) == 0:
+            return
+        data = {
+            "ip": self.ip,
+            "pid": file_info.worker_pid,
+            "job": file_info.job_id,
+            "is_err": file_info.is_err_file,
+            "lines": file_info.pending_lines,
+            "actor_name": file_info.actor_name,
+            "task_name": file_info.task_name,
+        }
+        file_info.pending_lines = []
+        file_info.pending_bytes = 0
+        file_info.pending_since = None
+        del self._file_infos_with_pending_lines[file_info.filename]
+        try:
+            self.publisher.publish_logs(data)
+        except Exception:
+            logger.exception(f"Failed to publish log messages {data}")
+
+    def _should_publish_pending_lines(self, file_info: LogFileInfo, now: float):
+        return (
+            file_info.pending_bytes >= ray_constants.LOG_MONITOR_PUBLISH_BATCH_BYTES
+            or now - file_info.pending_since
+            >= ray_constants.LOG_MONITOR_PUBLISH_BATCH_INTERVAL_S
+        )
+
     def check_log_files_and_publish_updates(self):
         """Gets updates to the log files and publishes them.
 
+        New lines may be buffered and published in a later call, see
+        LOG_MONITOR_PUBLISH_BATCH_INTERVAL_S.
+
         Returns:
-            True if anything was published and false otherwise.
+            True if anything was published or buffered and false otherwise.
         """
         anything_published = False
-        lines_to_publish = []
-
-        def flush():
-            nonlocal lines_to_publish
-            nonlocal anything_published
-            if len(lines_to_publish) > 0:
-                data = {
-                    "ip": self.ip,
-                    "pid": file_info.worker_pid,
-                    "job": file_info.job_id,
-                    "is_err": file_info.is_err_file,
-                    "lines": lines_to_publish,
-                    "actor_name": file_info.actor_name,
-                    "task_name": file_info.task_name,
-                }
-                try:
-                    self.publisher.publish_logs(data)
-                except Exception:
-                    logger.exception(f"Failed to publish log messages {data}")
-                anything_published = True
-                lines_to_publish = []
+        now = time.time()
 
         for file_info in self.open_file_infos:
             assert not file_info.file_handle.closed
+            if (
+                self._watcher is not None
+                and file_info.filename not in self._updated_filenames
+            ):
+                # The file hasn't changed since it was last read.
+                continue
             file_info.reopen_if_necessary()
 
+            reached_end = False
             max_num_lines_to_read = ray_constants.LOG_MONITOR_NUM_LINES_TO_READ
             for _ in range(max_num_lines_to_read):
                 try:
@@ -373,17 +601,21 @@ class LogMonitor:
                     # https://stackoverflow.com/a/38565489/10891801
                     next_line = next_line.decode("utf-8", "replace")
                     if next_line == "":
+                        reached_end = True
                         break
                     next_line = next_line.rstrip("\r\n")
+                    file_info.last_active_time = now
 
                     if next_line.startswith(ray_constants.LOG_PREFIX_ACTOR_NAME):
-                        flush()  # Possible change of task/actor name.
+                        # Possible change of task/actor name.
+                        self._publish_pending_lines(file_info)
                         file_info.actor_name = next_line.split(
                             ray_constants.LOG_PREFIX_ACTOR_NAME, 1
                         )[1]
                         file_info.task_name = None
                     elif next_line.startswith(ray_constants.LOG_PREFIX_TASK_NAME):
-                        flush()  # Possible change of task/actor name.
+                        # Possible change of task/actor name.
+                        self._publish_pending_lines(file_info)
                         file_info.task_name = next_line.split(
                             ray_constants.LOG_PREFIX_TASK_NAME, 1
                         )[1]
@@ -406,7 +638,14 @@ class LogMonitor:
                         # empty line.
                         file_info.file_handle.readline()
                     else:
-                        lines_to_publish.append(next_line)
+                        if file_info.pending_since is None:
+                            file_info.pending_since = now
+                            self._file_infos_with_pending_lines[
+                                file_info.filename
+                            ] = file_info
+                        file_info.pending_lines.append(next_line)
+                        file_info.pending_bytes += len(next_line)
+                        anything_published = True
                 except Exception:
                     logger.error(
                         f"Error: Reading file: {file_info.filename}, "
@@ -429,10 +668,31 @@ class LogMonitor:
 
             # Record the current position in the file.
             file_info.file_position = file_info.file_handle.tell()
-            flush()
+            if reached_end:
+                self._updated_filenames.discard(file_info.filename)
+
+        # Publish the lines that were buffered for long enough, including
+        # those of files without new lines.
+        for file_info in list(self._file_infos_with_pending_lines.values()):
+            if self._should_publish_pending_lines(file_info, now):
+                self._publish_pending_lines(file_info)
 
         return anything_published
 
+    def _get_wait_timeout(self) -> float:
+        """Return how long to wait for new lines before checking again."""
+        timeout = 0.1
+        if len(self._file_infos_with_pending_lines) > 0:
+            publish_time = (
+                min(
+                    file_info.pending_since
+                    for file_info in self._file_infos_with_pending_lines.values()
+                )
+                + ray_constants.LOG_MONITOR_PUBLISH_BATCH_INTERVAL_S
+            )
+            timeout = max(0, min(timeout, publish_time - time.time()))
+        return timeout
+
     def should_update_filenames(self, last_file_updated_time: float) -> bool:
         """Return true if filenames should be updated.
 
@@ -446,6 +706,8 @@ class LogMonitor:
             True if filenames should be updated. False otherwise.
         """
         elapsed_seconds = float(time.time() - last_file_updated_time)
+        if self._watcher is not None:
+            return self._rescan_needed or elapsed_seconds > LOG_NAME_RESCAN_INTERVAL_S
         return (
             len(self.log_filenames) < RAY_LOG_MONITOR_MANY_FILES_THRESHOLD
             or elapsed_seconds > LOG_NAME_UPDATE_INTERVAL_S
@@ -456,7 +718,8 @@ class LogMonitor:
 
         This will scan the file system once every LOG_NAME_UPDATE_INTERVAL_S to
         check if there are new log files to monitor. It will also publish new
-        log lines.
+        log lines. If the log directory is watched for changes, it will wake up
+        as soon as a log file changes instead.
         """
         last_updated = time.time()
         while True:
@@ -466,10 +729,15 @@ class LogMonitor:
 
             self.open_closed_files()
             anything_published = self.check_log_files_and_publish_updates()
+            if self._watcher is not None:
+                # Don't wait if there may be more lines to read right away.
+                self._process_file_events(
+                    0 if anything_published else self._get_wait_timeout()
+                )
             # If nothing was published, then wait a little bit before checking
             # for logs to avoid using too much CPU.
-            if not anything_published:
-                time.sleep(0.1)
+            elif not anything_published:
+                time.sleep(self._get_wait_timeout())
 
 
 def is_proc_alive(pid):
@@ -5,8 +5,9 @@ import re
 import threading
 import time
 import traceback
-from collections import namedtuple
-from typing import List, Tuple, Any, Dict, Set
+from collections import OrderedDict, namedtuple
+from functools import partial
+from typing import List, Tuple, Any, Callable, Dict, Optional, Set
 
 from prometheus_client.core import (
     CounterMetricFamily,
@@ -36,7 +37,7 @@ import ray
 from ray._raylet import GcsClient
 
 from ray.core.generated.metrics_pb2 import Metric
-from ray._private.ray_constants import env_bool
+from ray._private.ray_constants import env_bool, env_integer
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,15 @@ logger = logging.getLogger(__name__)
 RAY_WORKER_TIMEOUT_S = "RAY_WORKER_TIMEOUT_S"
 GLOBAL_COMPONENT_KEY = "CORE"
 RE_NON_ALPHANUMS = re.compile(r"[^a-zA-Z0-9]")
+# Env var key for the maximum number of series (label value combinations)
+# exported per metric. The rest are merged into a single series whose label
+# values are all OVERFLOW_LABEL_VALUE. 0 means no limit.
+# Each component also keeps the latest values of at most this many series over
+# the limit per metric. The values of the least recently reported ones are
+# folded into a fixed aggregate, which counts them again if they are reported
+# again later.
+RAY_METRICS_MAX_SERIES_PER_METRIC = "RAY_METRICS_MAX_SERIES_PER_METRIC"
+OVERFLOW_LABEL_VALUE = "__overflow__"
 
 
 class Gauge(View):
@@ -116,8 +126,58 @@ def fix_grpc_metric(metric: Metric):
                     bucket_bounds[0] = 0.000_000_1
 
 
+def _aggregation_data_value(data: Any) -> Any:
+    """Return the value of the aggregation data, to check if it changed."""
+    if isinstance(data, CountAggregationData):
+        return data.count_data
+    if isinstance(data, SumAggregationData):
+        return data.sum_data
+    if isinstance(data, LastValueAggregationData):
+        return data.value
+    return (data.count_data, data.mean_data, tuple(data.counts_per_bucket))
+
+
+def _merge_aggregation_data(data: Optional[Any], other: Any) -> Any:
+    """Merge the aggregation data of two series of the same metric.
+
+    Counts, sums and histograms are added up. Gauges keep the value of
+    `other`, which should be the one reported last. If the data can't be
+    merged, `other` is returned.
+    """
+    if data is None or type(data) is not type(other):
+        return other
+    if isinstance(data, CountAggregationData):
+        return CountAggregationData(data.count_data + other.count_data)
+    if isinstance(data, SumAggregationData):
+        return SumAggregationData(ValueDouble, data.sum_data + other.sum_data)
+    if isinstance(data, LastValueAggregationData):
+        return other
+    if list(data.bounds) != list(other.bounds):
+        return other
+    count = data.count_data + other.count_data
+    if count == 0:
+        return other
+    delta = other.mean_data - data.mean_data
+    return DistributionAggregationData(
+        (data.sum + other.sum) / count,
+        count,
+        data.sum_of_sqd_deviations
+        + other.sum_of_sqd_deviations
+        + delta * delta * data.count_data * other.count_data / count,
+        [a + b for a, b in zip(data.counts_per_bucket, other.counts_per_bucket)],
+        data.bounds,
+    )
+
+
 class OpencensusProxyMetric:
-    def __init__(self, name: str, desc: str, unit: str, label_keys: List[str]):
+    def __init__(
+        self,
+        name: str,
+        desc: str,
+        unit: str,
+        label_keys: List[str],
+        max_overflow_series: int = 0,
+    ):
         """Represents the OpenCensus metrics that will be proxy exported."""
         self._name = name
         self._desc = desc
@@ -127,6 +187,17 @@ class OpencensusProxyMetric:
         # -- The data that needs to be proxy exported --
         # tuple of label values -> data (OpenCesnsus Aggregation data)
         self._data = {}
+        # -- The data of the series over the cardinality limit --
+        # hash of the tuple of label values -> data, least recently reported
+        # first. The label values aren't kept because these series are
+        # exported as a single overflow series. The reported values are
+        # cumulative, so the latest data of each series is kept to avoid
+        # counting its earlier reports again.
+        self._overflow_data = OrderedDict()
+        # -- The maximum number of series in `_overflow_data` --
+        self._max_overflow_series = max_overflow_series
+        # -- The merged data of the series evicted from `_overflow_data` --
+        self._evicted_overflow_data = None
 
     @property
     def name(self):
@@ -148,19 +219,59 @@ class OpencensusProxyMetric:
     def data(self):
         return self._data
 
-    def record(self, metric: Metric):
+    def get_overflow_data(self) -> Optional[Any]:
+        """Return the merged data of the series over the cardinality limit."""
+        merged_data = self._evicted_overflow_data
+        for data in self._overflow_data.values():
+            merged_data = _merge_aggregation_data(merged_data, data)
+        return merged_data
+
+    def _evict_overflow_data(self):
+        """Fold the least recently reported series over the cardinality limit
+        into a fixed aggregate, until at most `_max_overflow_series` are left.
+        """
+        while len(self._overflow_data) > self._max_overflow_series:
+            _, data = self._overflow_data.popitem(last=False)
+            self._evicted_overflow_data = _merge_aggregation_data(
+                self._evicted_overflow_data, data
+            )
+
+    def record(
+        self,
+        metric: Metric,
+        admit_series: Optional[Callable[[Tuple[str, ...]], bool]] = None,
+    ) -> bool:
         """Parse the Opencensus Protobuf and store the data.
 
         The data can be accessed via `data` API once recorded.
+
+        Args:
+            metric: The Opencensus protobuf to record.
+            admit_series: Called with the label values of a new series. If it
+                returns False, the series is exported as part of the overflow
+                series instead (see `get_overflow_data`).
+
+        Returns:
+            True if any of the data changed.
         """
         timeseries = metric.timeseries
 
         if len(timeseries) == 0:
-            return
+            return False
 
+        changed = False
         # Create the aggregation and fill it in the our stats
         for series in timeseries:
             labels = tuple(val.value for val in series.label_values)
+            if labels in self._data:
+                series_data = self._data
+            elif admit_series is None or admit_series(labels):
+                series_data = self._data
+                # The series may have been over the limit before.
+                self._overflow_data.pop(hash(labels), None)
+            else:
+                series_data = self._overflow_data
+                labels = hash(labels)
 
             # Aggregate points.
             for point in series.points:
@@ -192,17 +303,30 @@ class OpencensusProxyMetric:
                     )
                 else:
                     raise ValueError("Summary is not supported")
-                self._data[labels] = data
+                old_data = series_data.get(labels)
+                if old_data is None or _aggregation_data_value(
+                    old_data
+                ) != _aggregation_data_value(data):
+                    changed = True
+                series_data[labels] = data
+
+            if series_data is self._overflow_data and labels in series_data:
+                series_data.move_to_end(labels)
+                self._evict_overflow_data()
+        return changed
 
 
 class Component:
-    def __init__(self, id: str):
+    def __init__(self, id: str, max_overflow_series: int = 0):
         """Represent a component that requests to proxy export metrics
 
         Args:
             id: Id of this component.
+            max_overflow_series: The maximum number of series over the
+                cardinality limit whose latest data is kept per metric.
         """
         self.id = id
+        self._max_overflow_series = max_overflow_series
         # -- The time this component reported its metrics last time --
         # It is used to figure out if this component is stale.
         self._last_reported_time = time.monotonic()
@@ -219,15 +343,26 @@ class Component:
     def last_reported_time(self):
         return self._last_reported_time
 
-    def record(self, metrics: List[Metric]):
+    def record(
+        self,
+        metrics: List[Metric],
+        admit_series: Optional[Callable[[str, Tuple[str, ...]], bool]] = None,
+    ) -> Set[str]:
         """Parse the Opencensus protobuf and store metrics.
 
         Metrics can be accessed via `metrics` API for proxy export.
 
         Args:
             metrics: A list of Opencensus protobuf for proxy export.
+            admit_series: Called with the metric name and the label values of
+                a new series. If it returns False, the series is over the
+                cardinality limit of the metric.
+
+        Returns:
+            The names of the metrics whose data changed.
         """
         self._last_reported_time = time.monotonic()
+        changed_metric_names = set()
         for metric in metrics:
             fix_grpc_metric(metric)
             descriptor = metric.metric_descriptor
@@ -236,9 +371,17 @@ class Component:
 
             if name not in self._metrics:
                 self._metrics[name] = OpencensusProxyMetric(
-                    name, descriptor.description, descriptor.unit, label_keys
+                    name,
+                    descriptor.description,
+                    descriptor.unit,
+                    label_keys,
+                    self._max_overflow_series,
                 )
-            self._metrics[name].record(metric)
+            if self._metrics[name].record(
+                metric, partial(admit_series, name) if admit_series else None
+            ):
+                changed_metric_names.add(name)
+        return changed_metric_names
 
 
 class OpenCensusProxyCollector:
@@ -248,6 +391,12 @@ class OpenCensusProxyCollector:
         Prometheus collector requires to implement `collect` which is
         invoked whenever Prometheus queries the endpoint.
 
+        Series of a metric with the same label values are merged into one
+        series, even if they are reported by different components. Gauges
+        take the value of the component that reported last. The
+        converted Prometheus metrics are cached until the metric changes, so
+        only the changed metrics are converted on each query.
+
         The class is thread-safe.
 
         Args:
@@ -272,6 +421,19 @@ class OpenCensusProxyCollector:
         # This is for bug compatibility.
         # See https://github.com/ray-project/ray/pull/43795.
         self._export_counter_as_gauge = env_bool("RAY_EXPORT_COUNTER_AS_GAUGE", True)
+        # -- The maximum number of series exported per metric --
+        self._max_series_per_metric = env_integer(RAY_METRICS_MAX_SERIES_PER_METRIC, 0)
+        # -- The series under the cardinality limit --
+        # metric name -> label values -> number of components that report it
+        self._series_refcounts: Dict[str, Dict[Tuple[str, ...], int]] = {}
+        # -- Components that report each metric --
+        # metric name -> component ids
+        self._metric_component_ids: Dict[str, Set[str]] = {}
+        # -- The converted Prometheus metrics --
+        # metric name -> Prometheus metrics
+        self._prometheus_metrics: Dict[str, List[PrometheusMetric]] = {}
+        # -- Metrics that changed since they were converted --
+        self._changed_metric_names: Set[str] = set()
 
     def record(self, metrics: List[Metric], worker_id_hex: str = None):
         """Record the metrics reported from the component that reports it.
@@ -284,8 +446,53 @@ class OpenCensusProxyCollector:
         key = GLOBAL_COMPONENT_KEY if not worker_id_hex else worker_id_hex
         with self._components_lock:
             if key not in self._components:
-                self._components[key] = Component(key)
-            self._components[key].record(metrics)
+                self._components[key] = Component(key, self._max_series_per_metric)
+            changed_metric_names = self._components[key].record(
+                metrics,
+                self._admit_series if self._max_series_per_metric > 0 else None,
+            )
+            for name in changed_metric_names:
+                self._metric_component_ids.setdefault(name, set()).add(key)
+            self._changed_metric_names.update(changed_metric_names)
+
+    def _admit_series(self, metric_name: str, label_values: Tuple[str, ...]) -> bool:
+        """Return True if a new series of a component is under the limit."""
+        assert self._components_lock.locked()
+        refcounts = self._series_refcounts.setdefault(metric_name, {})
+        if label_values in refcounts:
+            refcounts[label_values] += 1
+            return True
+        if len(refcounts) >= self._max_series_per_metric:
+            return False
+        refcounts[label_values] = 1
+        if len(refcounts) == self._max_series_per_metric:
+            logger.warning(
+                f"Metric {metric_name} reached the limit of "
+                f"{self._max_series_per_metric} series. New series are exported "
+                f"with the label values {OVERFLOW_LABEL_VALUE}. Set "
+                f"{RAY_METRICS_MAX_SERIES_PER_METRIC} to change the limit."
+            )
+        return True
+
+    def _remove_component(self, component: Component):
+        """Stop exporting the metrics of the component."""
+        assert self._components_lock.locked()
+        for name, metric in component.metrics.items():
+            component_ids = self._metric_component_ids.get(name, set())
+            component_ids.discard(component.id)
+            if not component_ids:
+                self._metric_component_ids.pop(name, None)
+            self._changed_metric_names.add(name)
+
+            refcounts = self._series_refcounts.get(name)
+            if refcounts is None:
+                continue
+            for label_values in metric.data:
+                if label_values not in refcounts:
+                    continue
+                refcounts[label_values] -= 1
+                if refcounts[label_values] == 0:
+                    del refcounts[label_values]
 
     def clean_stale_components(self):
         """Clean up stale components.
@@ -307,6 +514,7 @@ class OpenCensusProxyCollector:
                     )
             for id in stale_component_ids:
                 stale_components.append(self._components.pop(id))
+                self._remove_component(stale_components[-1])
             return stale_components
 
     # TODO(sang): add start and end timestamp
@@ -461,24 +669,72 @@ class OpenCensusProxyCollector:
         This method is required as a Prometheus Collector.
         """
         with self._components_lock:
-            metrics_map = {}
-            for component in self._components.values():
-                for metric in component.metrics.values():
-                    for label_values, data in metric.data.items():
-                        self.to_metrics(
-                            metric.name,
-                            metric.desc,
-                            metric.label_keys,
-                            metric.unit,
-                            label_values,
-                            data,
-                            metrics_map,
-                        )
-
-        for metrics in metrics_map.values():
+            for name in self._changed_metric_names:
+                prometheus_metrics = self._to_prometheus_metrics(name)
+                if prometheus_metrics:
+                    self._prometheus_metrics[name] = prometheus_metrics
+                else:
+                    self._prometheus_metrics.pop(name, None)
+            self._changed_metric_names.clear()
+            prometheus_metrics = list(self._prometheus_metrics.values())
+
+        for metrics in prometheus_metrics:
             for metric in metrics:
                 yield metric
 
+    def _to_prometheus_metrics(self, metric_name: str) -> List[PrometheusMetric]:
+        """Merge the series of the metric from all components and convert them."""
+        assert self._components_lock.locked()
+        metric = None
+        merged_data = {}
+        overflow_data = None
+        # Merge the components that reported last at the end, so gauges keep
+        # their values.
+        components = sorted(
+            (
+                self._components[component_id]
+                for component_id in self._metric_component_ids.get(metric_name, ())
+            ),
+            key=lambda component: component.last_reported_time,
+        )
+        for component in components:
+            component_metric = component.metrics[metric_name]
+            if metric is None:
+                metric = component_metric
+            for label_values, data in component_metric.data.items():
+                merged_data[label_values] = _merge_aggregation_data(
+                    merged_data.get(label_values), data
+                )
+            component_overflow_data = component_metric.get_overflow_data()
+            if component_overflow_data is not None:
+                overflow_data = _merge_aggregation_data(
+                    overflow_data, component_overflow_data
+                )
+        if metric is None:
+            return []
+        if overflow_data is not None:
+            overflow_label_values = (OVERFLOW_LABEL_VALUE,) * len(metric.label_keys)
+            merged_data[overflow_label_values] = _merge_aggregation_data(
+                merged_data.get(overflow_label_values), overflow_data
+            )
+
+        metrics_map = {}
+        for label_values, data in merged_data.items():
+            self.to_metrics(
+                metric.name,
+                metric.desc,
+                metric.label_keys,
+                metric.unit,
+                label_values,
+                data,
+                metrics_map,
+            )
+        return [
+            prometheus_metric
+            for prometheus_metrics in metrics_map.values()
+            for prometheus_metric in prometheus_metrics
+        ]
+
 
 class MetricsAgent:
     def __init__(
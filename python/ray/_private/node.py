@@ -1775,6 +1775,15 @@ class Node:
             "is_external_storage_type_fs"
         ] = is_external_storage_type_fs
         self._config["is_external_storage_type_fs"] = is_external_storage_type_fs
+        # Objects spilled to the local tier of the tiered storage are only on the
+        # local disk, but the raylet can't read them directly.
+        is_external_storage_type_tiered = deserialized_config["type"] == "tiered"
+        self._ray_params._system_config[
+            "is_external_storage_type_tiered"
+        ] = is_external_storage_type_tiered
+        self._config[
+            "is_external_storage_type_tiered"
+        ] = is_external_storage_type_tiered
 
         # Validate external storage usage.
         from ray._private import external_storage
@@ -125,6 +125,17 @@ RAY_RUNTIME_ENV_URI_PIN_EXPIRATION_S_DEFAULT = 10 * 60
 # If set to 1, then `.gitignore` files will not be parsed and loaded into "excludes"
 # when using a local working_dir or py_modules.
 RAY_RUNTIME_ENV_IGNORE_GITIGNORE = "RAY_RUNTIME_ENV_IGNORE_GITIGNORE"
+# If set to 1, local working_dir and py_modules packages include a manifest of the
+# content hashes of their files. Uploads through the job submission server then only
+# send files the cluster doesn't have yet, and nodes materialize the packages from a
+# shared store of deduplicated files if the file system supports copy-on-write clones.
+RAY_RUNTIME_ENV_CONTENT_ADDRESSED_PACKAGES = (
+    "RAY_RUNTIME_ENV_CONTENT_ADDRESSED_PACKAGES"
+)
+# If set to a file path, the hashes of the files of local working_dir and py_modules
+# packages are cached in this file, keyed by the path, modification time and size
+# of each file, so unchanged files aren't hashed again on the next upload.
+RAY_RUNTIME_ENV_HASH_CACHE_PATH = "RAY_RUNTIME_ENV_HASH_CACHE_PATH"
 RAY_STORAGE_ENVIRONMENT_VARIABLE = "RAY_STORAGE"
 # Hook for running a user-specified runtime-env hook. This hook will be called
 # unconditionally given the runtime_env dict passed for ray.init. It must return
@@ -164,6 +175,13 @@ DEFAULT_CLIENT_RECONNECT_GRACE_PERIOD = 30
 # greater than this quantity, print an warning.
 FUNCTION_SIZE_WARN_THRESHOLD = 10**7
 FUNCTION_SIZE_ERROR_THRESHOLD = env_integer("FUNCTION_SIZE_ERROR_THRESHOLD", (10**8))
+# The maximum total size of the pickled remote functions and actor classes that
+# each worker keeps, so that definitions exported again under new function IDs
+# don't need to be fetched from the GCS again. Definitions larger than 1/16 of it
+# aren't kept. If 0, no definitions are kept.
+PICKLED_DEFINITION_CACHE_MAX_BYTES = env_integer(
+    "RAY_PICKLED_DEFINITION_CACHE_MAX_BYTES", 1024**2
+)
 
 # If remote functions with the same source are imported this many times, then
 # print a warning.
@@ -314,6 +332,23 @@ LOG_MONITOR_NUM_LINES_TO_READ = int(
     os.environ.get("RAY_LOG_MONITOR_NUM_LINES_TO_READ", "1000")
 )
 
+# If set, the log monitor waits for the log files to change using inotify
+# instead of polling all of them. It falls back to polling where inotify isn't
+# available.
+LOG_MONITOR_EVENT_DRIVEN = env_bool("RAY_LOG_MONITOR_EVENT_DRIVEN", False)
+
+# Lines read from a log file are buffered for up to this many seconds so that
+# lines written in quick succession are published together. If 0, the lines are
+# published as soon as they are read.
+LOG_MONITOR_PUBLISH_BATCH_INTERVAL_S = env_float(
+    "RAY_LOG_MONITOR_PUBLISH_BATCH_INTERVAL_S", 0
+)
+
+# Buffered lines of a log file are published early once they reach this size.
+LOG_MONITOR_PUBLISH_BATCH_BYTES = env_integer(
+    "RAY_LOG_MONITOR_PUBLISH_BATCH_BYTES", 256 * 1024
+)
+
 # Autoscaler events are denoted by the ":event_summary:" magic token.
 LOG_PREFIX_EVENT_SUMMARY = ":event_summary:"
 # Cluster-level info events are denoted by the ":info_message:" magic token. These may
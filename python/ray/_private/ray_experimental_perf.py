@@ -148,6 +148,44 @@ def main(results=None):
     for reader, _ in reader_and_node_list:
         ray.kill(reader)
 
+    # The writer can run ahead of the reader by up to num_shm_buffers values
+    # with a buffered channel, instead of waiting for each value to be read.
+    num_shm_buffers = 8
+    reader = ChannelReader.remote()
+    reader_node = get_actor_node_id(reader)
+    chans = [
+        ray_channel.BufferedSharedMemoryChannel(
+            None, [(reader, reader_node)], num_shm_buffers, 1000
+        )
+    ]
+    ray.get(reader.ready.remote())
+    reader.read.remote(chans)
+    results += timeit(
+        "[unstable] local put:1 remote get, buffered channel calls",
+        lambda: put_channel_small(chans),
+    )
+    ray.kill(reader)
+
+    reader_and_node_list = []
+    for _ in range(n_cpu):
+        reader = ChannelReader.remote()
+        reader_node = get_actor_node_id(reader)
+        reader_and_node_list.append((reader, reader_node))
+    chans = [
+        ray_channel.BufferedSharedMemoryChannel(
+            None, reader_and_node_list, num_shm_buffers, 1000
+        )
+    ]
+    ray.get([reader.ready.remote() for reader, _ in reader_and_node_list])
+    for reader, _ in reader_and_node_list:
+        reader.read.remote(chans)
+    results += timeit(
+        "[unstable] local put:n remote get, buffered channel calls",
+        lambda: put_channel_small(chans),
+    )
+    for reader, _ in reader_and_node_list:
+        ray.kill(reader)
+
     # Tests for compiled DAGs.
 
     def _exec(dag, num_args=1, payload_size=1):
@@ -240,6 +278,32 @@ def main(results=None):
         lambda: _exec(compiled_dag),
     )
 
+    # Pipelined chain DAG calls. Several executions are submitted before their
+    # results are read. With more shared memory buffers per channel, each actor
+    # can run ahead of the next one instead of waiting for it to read each value.
+
+    def _exec_pipelined(dag, num_executions):
+        ray.get([dag.execute(b"x") for _ in range(num_executions)])
+
+    num_inflight = 8
+    for num_shm_buffers in [1, num_inflight]:
+        actors = [DAGActor.remote() for _ in range(n_cpu)]
+        with InputNode() as inp:
+            dag = inp
+            for a in actors:
+                dag = a.echo.bind(dag)
+        compiled_dag = dag.experimental_compile(
+            _max_inflight_executions=num_inflight,
+            _num_shm_buffers=num_shm_buffers,
+        )
+        results += timeit(
+            f"[unstable] compiled pipelined chain DAG calls, n={n_cpu} actors, "
+            f"num_shm_buffers={num_shm_buffers}",
+            lambda dag=compiled_dag: _exec_pipelined(dag, num_inflight),
+            num_inflight,
+        )
+        compiled_dag.teardown()
+
     # Chain asyncio DAG calls
 
     actors = [DAGActor.remote() for _ in range(n_cpu)]
@@ -128,6 +128,30 @@ def main(results=None):
 
     results += timeit("single client put gigabytes", put_large, 8 * 0.1)
 
+    context = ray._private.worker.global_worker.get_serialization_context()
+    fast_path_enabled = context._fast_path_enabled
+    small_objs = {
+        "small tuple": (1, 2, "a", 3.5),
+        "small dict": {"a": (1, 2), "b": np.float32(1.5)},
+        "small array": np.arange(32, dtype=np.float32),
+    }
+    for use_fast_path in [False, True]:
+        context._fast_path_enabled = use_fast_path
+        suffix = " (fast path)" if use_fast_path else ""
+        for name, small_obj in small_objs.items():
+
+            def serialize_small(obj=small_obj):
+                context.serialize(obj)
+
+            def put_get_small(obj=small_obj):
+                ray.get(ray.put(obj))
+
+            results += timeit(
+                f"single client serialize {name}{suffix}", serialize_small
+            )
+            results += timeit(f"single client put/get {name}{suffix}", put_get_small)
+    context._fast_path_enabled = fast_path_enabled
+
     def small_value_batch():
         submitted = [small_value.remote() for _ in range(1000)]
         ray.get(submitted)
@@ -178,6 +202,22 @@ def main(results=None):
 
     results += timeit("single client tasks async", small_task_async, 1000)
 
+    def small_task_map_remote():
+        ray.get(small_value.map_remote([()] * 1000))
+
+    results += timeit(
+        "single client tasks async (map_remote)", small_task_map_remote, 1000
+    )
+
+    def small_task_map_remote_chunked():
+        ray.get(small_value.map_remote([()] * 1000, chunksize=100))
+
+    results += timeit(
+        "single client tasks async (map_remote, chunksize=100)",
+        small_task_map_remote_chunked,
+        1000,
+    )
+
     n = 10000
     m = 4
     actors = [Actor.remote() for _ in range(m)]
@@ -1,13 +1,16 @@
 import time
 import asyncio
 import hashlib
+import json
 import logging
 import os
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Callable, List, Optional, Tuple
+from tempfile import TemporaryDirectory, TemporaryFile, mkstemp
+from typing import BinaryIO, Callable, Dict, List, Optional, Set, Tuple, Union
 from urllib.parse import urlparse
 from zipfile import ZipFile
 
@@ -18,10 +21,13 @@ from ray._private.ray_constants import (
     RAY_RUNTIME_ENV_URI_PIN_EXPIRATION_S_DEFAULT,
     RAY_RUNTIME_ENV_URI_PIN_EXPIRATION_S_ENV_VAR,
     RAY_RUNTIME_ENV_IGNORE_GITIGNORE,
+    RAY_RUNTIME_ENV_CONTENT_ADDRESSED_PACKAGES,
+    RAY_RUNTIME_ENV_HASH_CACHE_PATH,
 )
 from ray._private.runtime_env.conda_utils import exec_cmd_stream_to_logger
 from ray._private.thirdparty.pathspec import PathSpec
 from ray.experimental.internal_kv import (
+    _internal_kv_del,
     _internal_kv_exists,
     _internal_kv_put,
     _pin_runtime_env_uri,
@@ -36,7 +42,14 @@ FILE_SIZE_WARNING = 10 * 1024 * 1024  # 10MiB
 GCS_STORAGE_MAX_SIZE = int(
     os.environ.get("RAY_max_grpc_message_size", 500 * 1024 * 1024)
 )
+# Packages larger than this are stored in the GCS in chunks of this size.
+GCS_STORAGE_CHUNK_SIZE = min(64 * 1024 * 1024, GCS_STORAGE_MAX_SIZE // 2)
+# The value stored under the URI of a chunked package, followed by the number
+# of chunks. The chunks are stored under "{uri}/{index}".
+CHUNKED_PACKAGE_PREFIX = b"_ray_chunked_pkg:"
 RAY_PKG_PREFIX = "_ray_pkg_"
+# The number of threads used to hash the files of a package.
+HASH_THREADS = min(32, (os.cpu_count() or 1) + 4)
 
 RAY_RUNTIME_ENV_FAIL_UPLOAD_FOR_TESTING_ENV_VAR = (
     "RAY_RUNTIME_ENV_FAIL_UPLOAD_FOR_TESTING"
@@ -49,6 +62,16 @@ RAY_RUNTIME_ENV_FAIL_DOWNLOAD_FOR_TESTING_ENV_VAR = (
 # zipped on MacOS.
 MAC_OS_ZIP_HIDDEN_DIR_NAME = "__MACOSX"
 
+# The name of the zip member that maps the files of a content-addressed package
+# to the hashes of their contents.
+PACKAGE_MANIFEST_NAME = ".ray_pkg_manifest.json"
+# The name of the directory (under the runtime resources directory) of the
+# per-node store of files shared by content-addressed packages.
+PACKAGE_BLOB_STORE_DIR_NAME = "package_blobs"
+# The ioctl request that clones a file on Linux file systems that support
+# copy-on-write (e.g., Btrfs and XFS).
+_FICLONE = 0x40049409
+
 
 def _mib_string(num_bytes: float) -> str:
     size_mib = float(num_bytes / 1024**2)
@@ -73,6 +96,244 @@ class _AsyncFileLock:
         self.file.release()
 
 
+class _BlobStore:
+    """A directory of files named by the SHA-1 hash of their contents.
+
+    Package directories are materialized with copies of the files, so the
+    packages can modify them without affecting the store or other packages.
+    The copies are copy-on-write clones that share the storage of the files
+    until they are modified. Where the file system doesn't support clones,
+    packages shouldn't be materialized from the store, since every file
+    would be stored twice (see `supports_clones`).
+
+    The store also records which files each package directory uses, so files
+    can be deleted once no package uses them.
+    """
+
+    BUF_SIZE = 4096 * 1024
+    # Whether clones are supported, by store directory.
+    _supports_clones: Dict[str, bool] = {}
+
+    def __init__(self, directory: str):
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self.lock = FileLock(str(self._directory) + ".lock")
+
+    def supports_clones(self) -> bool:
+        """Whether files in the store can be cloned within its file system."""
+        key = str(self._directory.resolve())
+        if key not in self._supports_clones:
+            self._supports_clones[key] = self._probe_clones()
+        return self._supports_clones[key]
+
+    def _probe_clones(self) -> bool:
+        if sys.platform != "linux":
+            return False
+        import fcntl
+
+        tmp_dir = self._directory / "tmp"
+        tmp_dir.mkdir(exist_ok=True)
+        with TemporaryFile(dir=tmp_dir) as src, TemporaryFile(dir=tmp_dir) as dst:
+            src.write(b"0")
+            src.flush()
+            try:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            except OSError:
+                return False
+        return True
+
+    def get_path(self, content_hash: str) -> Path:
+        return self._directory / content_hash[:2] / content_hash
+
+    def contains(self, content_hash: str) -> bool:
+        path = self.get_path(content_hash)
+        if not path.exists():
+            return False
+        # Mark the file as recently used for `evict`.
+        os.utime(path)
+        return True
+
+    def add(self, f: BinaryIO) -> Tuple[str, int]:
+        """Add the contents of the file object to the store.
+
+        Returns:
+            The hash of the contents and the number of bytes written, which is
+            0 if the contents were already in the store.
+        """
+        self._directory.joinpath("tmp").mkdir(exist_ok=True)
+        fd, tmp_path = mkstemp(dir=self._directory / "tmp")
+        tmp_path = Path(tmp_path)
+        sha1 = hashlib.sha1()
+        size = 0
+        with os.fdopen(fd, "wb") as out:
+            data = f.read(self.BUF_SIZE)
+            while len(data) != 0:
+                sha1.update(data)
+                out.write(data)
+                size += len(data)
+                data = f.read(self.BUF_SIZE)
+
+        content_hash = sha1.hexdigest()
+        if self.contains(content_hash):
+            tmp_path.unlink()
+            return content_hash, 0
+
+        path = self.get_path(content_hash)
+        path.parent.mkdir(exist_ok=True)
+        tmp_path.chmod(0o444)
+        os.replace(tmp_path, path)
+        return content_hash, size
+
+    def copy(self, content_hash: str, target_path: Path) -> None:
+        """Write a writable copy of the file with the given hash to target_path."""
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        target_path.unlink(missing_ok=True)
+        source_path = self.get_path(content_hash)
+        with open(source_path, "rb") as src, open(target_path, "wb") as dst:
+            if sys.platform == "linux":
+                import fcntl
+
+                try:
+                    fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                    return
+                except OSError:
+                    # E.g., the file system doesn't support clones, or the
+                    # store is on another file system.
+                    pass
+            shutil.copyfileobj(src, dst, self.BUF_SIZE)
+
+    def _get_references_path(self, package_dir: str) -> Path:
+        package_dir = str(Path(package_dir).resolve())
+        return self._directory / "refs" / hashlib.sha1(package_dir.encode()).hexdigest()
+
+    def add_references(self, package_dir: str, content_hashes: List[str]) -> None:
+        """Record that the package directory uses the files with the given hashes."""
+        path = self._get_references_path(package_dir)
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(json.dumps(sorted(set(content_hashes))))
+
+    def _list(self) -> List[Tuple[Path, os.stat_result]]:
+        return [
+            (path, path.stat())
+            for subdir in self._directory.iterdir()
+            if subdir.name not in ("tmp", "refs")
+            for path in subdir.iterdir()
+        ]
+
+    def remove_unreferenced(self, package_dir: str) -> int:
+        """Remove the references of the package directory, and delete the
+        files that no other package directory uses.
+
+        Returns:
+            The number of bytes deleted.
+        """
+        self._get_references_path(package_dir).unlink(missing_ok=True)
+        referenced = set()
+        refs_dir = self._directory / "refs"
+        if refs_dir.exists():
+            for path in refs_dir.iterdir():
+                referenced.update(json.loads(path.read_text()))
+
+        num_bytes_deleted = 0
+        for path, stat in self._list():
+            if path.name not in referenced:
+                path.unlink()
+                num_bytes_deleted += stat.st_size
+        return num_bytes_deleted
+
+    def evict(self, max_total_size_bytes: int) -> int:
+        """Delete the least recently used files until the store fits the size.
+
+        Returns:
+            The number of bytes deleted.
+        """
+        files = sorted(self._list(), key=lambda item: item[1].st_mtime)
+        total_size_bytes = sum(stat.st_size for _, stat in files)
+        num_bytes_deleted = 0
+        for path, stat in files:
+            if total_size_bytes - num_bytes_deleted <= max_total_size_bytes:
+                break
+            path.unlink()
+            num_bytes_deleted += stat.st_size
+        return num_bytes_deleted
+
+
+class _FileHashCache:
+    """Persistent cache of file hashes, keyed by the file's path, mtime and size.
+
+    The cache is loaded from and saved to the file at
+    RAY_RUNTIME_ENV_HASH_CACHE_PATH. If it isn't set, nothing is cached.
+    """
+
+    MAX_ENTRIES = 100_000
+    # Files modified more recently than this aren't cached, because another
+    # modification within the resolution of the mtime wouldn't be noticed.
+    MIN_AGE_NS = 2 * 10**9
+
+    def __init__(self, path: Optional[str] = None):
+        self._path = path
+        self._entries: Dict[str, List] = {}
+        self._dirty = False
+        if path is not None:
+            try:
+                with open(path) as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                pass
+
+    @classmethod
+    def from_env(cls) -> "_FileHashCache":
+        return cls(os.environ.get(RAY_RUNTIME_ENV_HASH_CACHE_PATH))
+
+    def get(self, key: str, filepath: Path, hash_fn: Callable[[Path], str]) -> str:
+        """Returns the cached hash of the file, computing it if needed.
+
+        The key identifies the hash function and its arguments other than the
+        file's contents.
+        """
+        if self._path is None:
+            return hash_fn(filepath)
+
+        key = f"{key}:{filepath}"
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return hash_fn(filepath)
+
+        # Re-insert the entry to keep the most recently used entries last.
+        entry = self._entries.pop(key, None)
+        if entry is None or entry[:2] != [stat.st_mtime_ns, stat.st_size]:
+            entry = [stat.st_mtime_ns, stat.st_size, hash_fn(filepath)]
+            if time.time_ns() - stat.st_mtime_ns < self.MIN_AGE_NS:
+                return entry[2]
+            self._dirty = True
+        self._entries[key] = entry
+        return entry[2]
+
+    def save(self):
+        if self._path is None or not self._dirty:
+            return
+
+        entries = dict(list(self._entries.items())[-self.MAX_ENTRIES :])
+        Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{self._path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self._path)
+        self._dirty = False
+
+
+def _hash_files(
+    paths: List[Path], key: str, hash_fn: Callable[[Path], str]
+) -> List[str]:
+    """Hashes the files in parallel, using the persistent hash cache."""
+    cache = _FileHashCache.from_env()
+    with ThreadPoolExecutor(max_workers=HASH_THREADS) as executor:
+        hashes = list(executor.map(lambda path: cache.get(key, path, hash_fn), paths))
+    cache.save()
+    return hashes
+
+
 class Protocol(Enum):
     """A enum for supported storage backends."""
 
@@ -199,15 +460,19 @@ def _hash_directory(
     """
     hash_val = b"0" * 8
 
-    def handler(path: Path):
-        file_hash = _hash_file_content_or_directory_name(
-            path, relative_path, logger=logger
-        )
-        nonlocal hash_val
-        hash_val = _xor_bytes(hash_val, file_hash)
-
+    paths = []
     excludes = [] if excludes is None else [excludes]
-    _dir_travel(root, excludes, handler, logger=logger)
+    _dir_travel(root, excludes, paths.append, logger=logger)
+
+    file_hashes = _hash_files(
+        paths,
+        f"package:{relative_path}",
+        lambda path: _hash_file_content_or_directory_name(
+            path, relative_path, logger=logger
+        ).hex(),
+    )
+    for file_hash in file_hashes:
+        hash_val = _xor_bytes(hash_val, bytes.fromhex(file_hash))
     return hash_val
 
 
@@ -407,53 +672,319 @@ def _store_package_in_gcs(
     return len(data)
 
 
+class GcsPackageWriter:
+    """A file-like object that stores the data written to it as a GCS package.
+
+    The data is uploaded in chunks of GCS_STORAGE_CHUNK_SIZE while it's
+    written, so packages don't need to fit in memory or in a single gRPC
+    message. A package that fits in one chunk is stored as is. The package is
+    only visible under its URI once `close` is called.
+    """
+
+    def __init__(self, pkg_uri: str, logger: Optional[logging.Logger] = default_logger):
+        protocol, _ = parse_uri(pkg_uri)
+        if protocol != Protocol.GCS:
+            raise ValueError(f"Only GCS packages can be written, got {pkg_uri}.")
+        self._pkg_uri = pkg_uri
+        self._logger = logger
+        self._buffer = bytearray()
+        self._num_chunks = 0
+        self._size = 0
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        self._size += len(data)
+        while len(self._buffer) >= GCS_STORAGE_CHUNK_SIZE:
+            self._put_chunk(bytes(self._buffer[:GCS_STORAGE_CHUNK_SIZE]))
+            del self._buffer[:GCS_STORAGE_CHUNK_SIZE]
+        return len(data)
+
+    def tell(self) -> int:
+        return self._size
+
+    def flush(self):
+        pass
+
+    def _put_chunk(self, data: bytes):
+        key = f"{self._pkg_uri}/{self._num_chunks}"
+        try:
+            if os.environ.get(RAY_RUNTIME_ENV_FAIL_UPLOAD_FOR_TESTING_ENV_VAR):
+                raise RuntimeError(
+                    "Simulating failure to upload package for testing purposes."
+                )
+            _internal_kv_put(key, data)
+        except Exception as e:
+            raise RuntimeError(
+                "Failed to store package in the GCS.\n"
+                f"  - GCS URI: {key}\n"
+                f"  - Chunk size: {_mib_string(len(data))}\n"
+            ) from e
+        self._num_chunks += 1
+
+    def close(self) -> int:
+        """Finishes the upload and returns the size of the package."""
+        if self._num_chunks == 0:
+            return _store_package_in_gcs(
+                self._pkg_uri, bytes(self._buffer), logger=self._logger
+            )
+
+        if self._buffer:
+            self._put_chunk(bytes(self._buffer))
+            self._buffer = bytearray()
+        _store_package_in_gcs(
+            self._pkg_uri,
+            CHUNKED_PACKAGE_PREFIX + str(self._num_chunks).encode(),
+            logger=self._logger,
+        )
+        self._logger.info(
+            f"Pushed {_mib_string(self._size)} of file package '{self._pkg_uri}' "
+            f"in {self._num_chunks} chunks."
+        )
+        return self._size
+
+    def abort(self):
+        """Deletes the chunks uploaded so far."""
+        if self._num_chunks > 0:
+            _internal_kv_del(f"{self._pkg_uri}/", del_by_prefix=True)
+
+
 def _get_local_path(base_directory: str, pkg_uri: str) -> str:
     _, pkg_name = parse_uri(pkg_uri)
     return os.path.join(base_directory, pkg_name)
 
 
+def _travel_package_files(
+    path_str: str,
+    excludes: List[str],
+    handler: Callable[[Path, Path], None],
+    include_parent_dir: bool = False,
+    logger: Optional[logging.Logger] = default_logger,
+) -> None:
+    """Calls the handler with each file and empty directory of a package.
+
+    The handler is given the path and its path inside the package.
+    """
+    file_path = Path(path_str).absolute()
+    dir_path = file_path
+    if file_path.is_file():
+        dir_path = file_path.parent
+
+    def path_handler(path: Path):
+        # Pack this path if it's an empty directory or it's a file.
+        if path.is_dir() and next(path.iterdir(), None) is None or path.is_file():
+            to_path = path.relative_to(dir_path)
+            if include_parent_dir:
+                to_path = dir_path.name / to_path
+            handler(path, to_path)
+
+    excludes = [_get_excludes(file_path, excludes)]
+    _dir_travel(file_path, excludes, path_handler, logger=logger)
+
+
 def _zip_files(
     path_str: str,
     excludes: List[str],
-    output_path: str,
+    output_path: Union[str, BinaryIO],
     include_parent_dir: bool = False,
     logger: Optional[logging.Logger] = default_logger,
+    manifest: Optional[Dict[str, str]] = None,
+    missing_hashes: Optional[Set[str]] = None,
 ) -> None:
     """Zip the target file or directory and write it to the output_path.
 
     path_str: The file or directory to zip.
     excludes (List(str)): The directories or file to be excluded.
-    output_path: The output path for the zip file.
+    output_path: The output path for the zip file, or a writable file object.
     include_parent_dir: If true, includes the top-level directory as a
         directory inside the zip file.
+    manifest: If given, it's included in the zip file, see
+        `get_package_manifest`.
+    missing_hashes: If given, only one file for each of these content hashes
+        is put into the zip file. The rest can be restored from the manifest.
     """
-    pkg_file = Path(output_path).absolute()
+    if missing_hashes is not None:
+        missing_hashes = set(missing_hashes)
+
+    pkg_file = output_path
+    if isinstance(output_path, str):
+        pkg_file = Path(output_path).absolute()
     with ZipFile(pkg_file, "w", strict_timestamps=False) as zip_handler:
+        if manifest is not None:
+            zip_handler.writestr(PACKAGE_MANIFEST_NAME, json.dumps(manifest))
+
         # Put all files in the directory into the zip file.
-        file_path = Path(path_str).absolute()
-        dir_path = file_path
-        if file_path.is_file():
-            dir_path = file_path.parent
-
-        def handler(path: Path):
-            # Pack this path if it's an empty directory or it's a file.
-            if path.is_dir() and next(path.iterdir(), None) is None or path.is_file():
-                file_size = path.stat().st_size
-                if file_size >= FILE_SIZE_WARNING:
-                    logger.warning(
-                        f"File {path} is very large "
-                        f"({_mib_string(file_size)}). Consider adding this "
-                        "file to the 'excludes' list to skip uploading it: "
-                        "`ray.init(..., "
-                        f"runtime_env={{'excludes': ['{path}']}})`"
+        def handler(path: Path, to_path: Path):
+            if missing_hashes is not None and path.is_file():
+                content_hash = manifest[to_path.as_posix()]
+                if content_hash not in missing_hashes:
+                    return
+                missing_hashes.discard(content_hash)
+
+            file_size = path.stat().st_size
+            if file_size >= FILE_SIZE_WARNING:
+                logger.warning(
+                    f"File {path} is very large "
+                    f"({_mib_string(file_size)}). Consider adding this "
+                    "file to the 'excludes' list to skip uploading it: "
+                    "`ray.init(..., "
+                    f"runtime_env={{'excludes': ['{path}']}})`"
+                )
+            zip_handler.write(path, to_path)
+
+        _travel_package_files(
+            path_str,
+            excludes,
+            handler,
+            include_parent_dir=include_parent_dir,
+            logger=logger,
+        )
+
+
+def _content_addressed_packages_enabled() -> bool:
+    return os.environ.get(RAY_RUNTIME_ENV_CONTENT_ADDRESSED_PACKAGES, "0") == "1"
+
+
+def get_package_manifest(
+    module_path: str,
+    include_parent_dir: bool = False,
+    excludes: Optional[List[str]] = None,
+    logger: Optional[logging.Logger] = default_logger,
+) -> Dict[str, str]:
+    """Get the manifest of a content-addressed package.
+
+    The manifest maps the path of each file in the package to the SHA-1 hash
+    of its contents, so files the cluster already has needn't be uploaded,
+    and nodes can share the files between packages.
+    """
+    if excludes is None:
+        excludes = []
+
+    files = {}
+
+    def handler(path: Path, to_path: Path):
+        if path.is_file():
+            files[to_path.as_posix()] = path
+
+    def hash_fn(path: Path) -> str:
+        sha1 = hashlib.sha1()
+        with path.open("rb") as f:
+            data = f.read(_BlobStore.BUF_SIZE)
+            while len(data) != 0:
+                sha1.update(data)
+                data = f.read(_BlobStore.BUF_SIZE)
+        return sha1.hexdigest()
+
+    _travel_package_files(
+        module_path,
+        excludes,
+        handler,
+        include_parent_dir=include_parent_dir,
+        logger=logger,
+    )
+    return dict(zip(files, _hash_files(list(files.values()), "content", hash_fn)))
+
+
+def _read_package_manifest(zip_ref: ZipFile) -> Optional[Dict[str, str]]:
+    try:
+        return json.loads(zip_ref.read(PACKAGE_MANIFEST_NAME))
+    except KeyError:
+        return None
+
+
+def get_missing_package_files(
+    content_hashes: List[str], blob_store_dir: str
+) -> List[str]:
+    """Returns the content hashes that aren't in the store."""
+    blob_store = _BlobStore(blob_store_dir)
+    return [h for h in content_hashes if not blob_store.contains(h)]
+
+
+def complete_package(
+    package_path: str,
+    output: BinaryIO,
+    blob_store_dir: str,
+    max_blob_store_size_bytes: Optional[int] = None,
+) -> None:
+    """Complete a content-addressed package that only has the missing files.
+
+    The files in the package are added to the store, and the files that were
+    left out of it are taken from the store. The complete package is written
+    to output. Packages without a manifest are written as is.
+
+    Raises:
+        ValueError: If a file doesn't match the hash in the manifest.
+        FileNotFoundError: If a file is neither in the package nor in the store.
+    """
+    blob_store = _BlobStore(blob_store_dir)
+    with blob_store.lock:
+        with ZipFile(package_path, "r") as zip_ref:
+            manifest = _read_package_manifest(zip_ref)
+            if manifest is None:
+                with open(package_path, "rb") as f:
+                    shutil.copyfileobj(f, output)
+                return
+
+            for info in zip_ref.infolist():
+                if info.is_dir() or info.filename == PACKAGE_MANIFEST_NAME:
+                    continue
+                with zip_ref.open(info) as f:
+                    content_hash, _ = blob_store.add(f)
+                if manifest.get(info.filename) != content_hash:
+                    raise ValueError(
+                        f"The contents of {info.filename} don't match the "
+                        "package manifest. Was the file modified during the upload?"
                     )
-                to_path = path.relative_to(dir_path)
-                if include_parent_dir:
-                    to_path = dir_path.name / to_path
-                zip_handler.write(path, to_path)
 
-        excludes = [_get_excludes(file_path, excludes)]
-        _dir_travel(file_path, excludes, handler, logger=logger)
+            missing = get_missing_package_files(
+                list(set(manifest.values())), blob_store_dir
+            )
+            if missing:
+                raise FileNotFoundError(
+                    f"{len(missing)} files of the package are missing from the "
+                    "upload and the cluster."
+                )
+
+            with ZipFile(output, "w", strict_timestamps=False) as out:
+                for info in zip_ref.infolist():
+                    if info.is_dir() or info.filename == PACKAGE_MANIFEST_NAME:
+                        out.writestr(info, zip_ref.read(info))
+                for name, content_hash in manifest.items():
+                    out.write(blob_store.get_path(content_hash), name)
+
+        if max_blob_store_size_bytes is not None:
+            blob_store.evict(max_blob_store_size_bytes)
+
+
+def _materialize_package(
+    zip_ref: ZipFile,
+    manifest: Dict[str, str],
+    target_dir: str,
+    blob_store_dir: str,
+) -> None:
+    """Unpack the package by copying its files from the store.
+
+    Only the files that aren't in the store yet are extracted from the zip.
+    """
+    target_dir = Path(target_dir).resolve()
+    blob_store = _BlobStore(blob_store_dir)
+    with blob_store.lock:
+        blob_store.add_references(str(target_dir), list(manifest.values()))
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                zip_ref.extract(info, target_dir)
+
+        for name, content_hash in manifest.items():
+            target_path = target_dir.joinpath(name).resolve()
+            if target_dir not in target_path.parents:
+                raise ValueError(f"Invalid path in package manifest: {name}.")
+            if not blob_store.contains(content_hash):
+                with zip_ref.open(name) as f:
+                    if blob_store.add(f)[0] != content_hash:
+                        raise ValueError(
+                            f"The contents of {name} don't match the package "
+                            "manifest."
+                        )
+            blob_store.copy(content_hash, target_path)
 
 
 def package_exists(pkg_uri: str) -> bool:
@@ -590,6 +1121,8 @@ def create_package(
     include_parent_dir: bool = False,
     excludes: Optional[List[str]] = None,
     logger: Optional[logging.Logger] = default_logger,
+    manifest: Optional[Dict[str, str]] = None,
+    missing_hashes: Optional[Set[str]] = None,
 ):
     if excludes is None:
         excludes = []
@@ -605,6 +1138,8 @@ def create_package(
             str(target_path),
             include_parent_dir=include_parent_dir,
             logger=logger,
+            manifest=manifest,
+            missing_hashes=missing_hashes,
         )
 
 
@@ -618,14 +1153,14 @@ def upload_package_if_needed(
 ) -> bool:
     """Upload the contents of the directory under the given URI.
 
-    This will first create a temporary zip file under the passed
-    base_directory.
+    The contents are zipped and uploaded to the GCS in chunks while they're
+    read, so the package is never held in memory or written to disk as a whole.
 
     If the package already exists in storage, this is a no-op.
 
     Args:
         pkg_uri: URI of the package to upload.
-        base_directory: Directory where package files are stored.
+        base_directory: Unused, kept for backwards compatibility.
         module_path: The module to be uploaded, either a single .py file or a directory.
         include_parent_dir: If true, includes the top-level directory as a
             directory inside the zip file.
@@ -648,24 +1183,29 @@ def upload_package_if_needed(
     if package_exists(pkg_uri):
         return False
 
-    package_file = Path(_get_local_path(base_directory, pkg_uri))
-    # Make the temporary zip file name unique so that it doesn't conflict with
-    # concurrent upload_package_if_needed calls with the same pkg_uri.
-    # See https://github.com/ray-project/ray/issues/47471.
-    package_file = package_file.with_name(
-        f"{time.time_ns()}_{os.getpid()}_{package_file.name}"
-    )
-    create_package(
-        module_path,
-        package_file,
-        include_parent_dir=include_parent_dir,
-        excludes=excludes,
-    )
-    package_file_bytes = package_file.read_bytes()
-    # Remove the local file to avoid accumulating temporary zip files.
-    package_file.unlink()
+    manifest = None
+    if _content_addressed_packages_enabled():
+        manifest = get_package_manifest(
+            module_path, include_parent_dir=include_parent_dir, excludes=excludes
+        )
 
-    upload_package_to_gcs(pkg_uri, package_file_bytes)
+    logger.info(f"Creating a file package for local module '{module_path}'.")
+    # Stream the zip file to the GCS instead of writing it to disk and reading
+    # it into memory first.
+    writer = GcsPackageWriter(pkg_uri, logger=logger)
+    try:
+        _zip_files(
+            module_path,
+            excludes,
+            writer,
+            include_parent_dir=include_parent_dir,
+            logger=logger,
+            manifest=manifest,
+        )
+        writer.close()
+    except Exception:
+        writer.abort()
+        raise
 
     return True
 
@@ -677,12 +1217,35 @@ def get_local_dir_from_uri(uri: str, base_directory: str) -> Path:
     return local_dir
 
 
+async def _download_package_chunks(
+    pkg_uri: str,
+    header: bytes,
+    pkg_file: Path,
+    gcs_aio_client: "GcsAioClient",  # noqa: F821
+) -> bool:
+    """Writes the chunks of a chunked package to pkg_file one at a time.
+
+    Returns False if a chunk is missing.
+    """
+    num_chunks = int(header[len(CHUNKED_PACKAGE_PREFIX) :])
+    with pkg_file.open("wb") as f:
+        for i in range(num_chunks):
+            chunk = await gcs_aio_client.internal_kv_get(
+                f"{pkg_uri}/{i}".encode(), namespace=None, timeout=None
+            )
+            if chunk is None:
+                return False
+            f.write(chunk)
+    return True
+
+
 @DeveloperAPI
 async def download_and_unpack_package(
     pkg_uri: str,
     base_directory: str,
     gcs_aio_client: Optional["GcsAioClient"] = None,  # noqa: F821
     logger: Optional[logging.Logger] = default_logger,
+    blob_store_dir: Optional[str] = None,
 ) -> str:
     """Download the package corresponding to this URI and unpack it if zipped.
 
@@ -695,6 +1258,8 @@ async def download_and_unpack_package(
             directory for the unpacked files.
         gcs_aio_client: Client to use for downloading from the GCS.
         logger: The logger to use.
+        blob_store_dir: Directory of the store that content-addressed packages
+            from the GCS are materialized from.
 
     Returns:
         Path to the local directory containing the unpacked package files.
@@ -738,6 +1303,12 @@ async def download_and_unpack_package(
                 )
                 if os.environ.get(RAY_RUNTIME_ENV_FAIL_DOWNLOAD_FOR_TESTING_ENV_VAR):
                     code = None
+                # The chunks of chunked packages are written to pkg_file directly.
+                chunked = code is not None and code.startswith(CHUNKED_PACKAGE_PREFIX)
+                if chunked and not await _download_package_chunks(
+                    pkg_uri, code, pkg_file, gcs_aio_client
+                ):
+                    code = None
                 if code is None:
                     raise IOError(
                         f"Failed to download runtime_env file package {pkg_uri} "
@@ -752,8 +1323,8 @@ async def download_and_unpack_package(
                         "If this fails, try re-running "
                         "after making any change to a file in the file package."
                     )
-                code = code or b""
-                pkg_file.write_bytes(code)
+                if not chunked:
+                    pkg_file.write_bytes(code)
 
                 if is_zip_uri(pkg_uri):
                     unzip_package(
@@ -762,6 +1333,7 @@ async def download_and_unpack_package(
                         remove_top_level_directory=False,
                         unlink_zip=True,
                         logger=logger,
+                        blob_store_dir=blob_store_dir,
                     )
                 else:
                     return str(pkg_file)
@@ -912,6 +1484,7 @@ def unzip_package(
     remove_top_level_directory: bool,
     unlink_zip: bool,
     logger: Optional[logging.Logger] = default_logger,
+    blob_store_dir: Optional[str] = None,
 ) -> None:
     """
     Unzip the compressed package contained at package_path to target_dir.
@@ -933,6 +1506,9 @@ def unzip_package(
             from the zip contents.
         unlink_zip: Whether to unlink the zip file stored at package_path.
         logger: Optional logger to use for logging.
+        blob_store_dir: If given, the files of content-addressed packages are
+            cloned from the store in this directory instead of extracted. It
+            is ignored if the file system doesn't support clones.
 
     """
     try:
@@ -943,7 +1519,18 @@ def unzip_package(
     logger.debug(f"Unpacking {package_path} to {target_dir}")
 
     with ZipFile(str(package_path), "r") as zip_ref:
-        zip_ref.extractall(target_dir)
+        manifest = _read_package_manifest(zip_ref)
+        if manifest is None:
+            zip_ref.extractall(target_dir)
+        elif (
+            blob_store_dir is not None and _BlobStore(blob_store_dir).supports_clones()
+        ):
+            _materialize_package(zip_ref, manifest, target_dir, blob_store_dir)
+        else:
+            zip_ref.extractall(
+                target_dir,
+                [name for name in zip_ref.namelist() if name != PACKAGE_MANIFEST_NAME],
+            )
     if remove_top_level_directory:
         top_level_directory = get_top_level_dir_from_compressed_package(package_path)
         if top_level_directory is not None:
@@ -958,11 +1545,15 @@ def unzip_package(
         Path(package_path).unlink()
 
 
-def delete_package(pkg_uri: str, base_directory: str) -> Tuple[bool, int]:
+def delete_package(
+    pkg_uri: str, base_directory: str, blob_store_dir: Optional[str] = None
+) -> Tuple[bool, int]:
     """Deletes a specific URI from the local filesystem.
 
     Args:
         pkg_uri: URI to delete.
+        blob_store_dir: If given, files in this store that are no longer used
+            by any package are deleted too.
 
     Returns:
         bool: True if the URI was successfully deleted, else False.
@@ -979,6 +1570,11 @@ def delete_package(pkg_uri: str, base_directory: str) -> Tuple[bool, int]:
                 path.unlink()
             deleted = True
 
+    if deleted and blob_store_dir is not None:
+        blob_store = _BlobStore(blob_store_dir)
+        with blob_store.lock:
+            blob_store.remove_unreferenced(str(path))
+
     return deleted
 
 
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 
 from ray._private.runtime_env.context import RuntimeEnvContext
 from ray._private.runtime_env.packaging import (
+    PACKAGE_BLOB_STORE_DIR_NAME,
     Protocol,
     delete_package,
     download_and_unpack_package,
@@ -168,6 +169,8 @@ class PyModulesPlugin(RuntimeEnvPlugin):
         self, resources_dir: str, gcs_aio_client: "GcsAioClient"  # noqa: F821
     ):
         self._resources_dir = os.path.join(resources_dir, "py_modules_files")
+        # Shared by the working_dir and py_modules plugins.
+        self._blob_store_dir = os.path.join(resources_dir, PACKAGE_BLOB_STORE_DIR_NAME)
         self._gcs_aio_client = gcs_aio_client
         try_to_create_directory(self._resources_dir)
 
@@ -182,7 +185,9 @@ class PyModulesPlugin(RuntimeEnvPlugin):
         local_dir = get_local_dir_from_uri(uri, self._resources_dir)
         local_dir_size = get_directory_size_bytes(local_dir)
 
-        deleted = delete_package(uri, self._resources_dir)
+        deleted = delete_package(
+            uri, self._resources_dir, blob_store_dir=self._blob_store_dir
+        )
         if not deleted:
             logger.warning(f"Tried to delete nonexistent URI: {uri}.")
             return 0
@@ -201,7 +206,11 @@ class PyModulesPlugin(RuntimeEnvPlugin):
     ) -> int:
 
         module_dir = await download_and_unpack_package(
-            uri, self._resources_dir, self._gcs_aio_client, logger=logger
+            uri,
+            self._resources_dir,
+            self._gcs_aio_client,
+            logger=logger,
+            blob_store_dir=self._blob_store_dir,
         )
 
         if is_whl_uri(uri):
@@ -7,6 +7,7 @@ from contextlib import contextmanager
 import ray._private.ray_constants as ray_constants
 from ray._private.runtime_env.context import RuntimeEnvContext
 from ray._private.runtime_env.packaging import (
+    PACKAGE_BLOB_STORE_DIR_NAME,
     Protocol,
     delete_package,
     download_and_unpack_package,
@@ -129,6 +130,8 @@ class WorkingDirPlugin(RuntimeEnvPlugin):
         self, resources_dir: str, gcs_aio_client: "GcsAioClient"  # noqa: F821
     ):
         self._resources_dir = os.path.join(resources_dir, "working_dir_files")
+        # Shared by the working_dir and py_modules plugins.
+        self._blob_store_dir = os.path.join(resources_dir, PACKAGE_BLOB_STORE_DIR_NAME)
         self._gcs_aio_client = gcs_aio_client
         try_to_create_directory(self._resources_dir)
 
@@ -140,7 +143,9 @@ class WorkingDirPlugin(RuntimeEnvPlugin):
         local_dir = get_local_dir_from_uri(uri, self._resources_dir)
         local_dir_size = get_directory_size_bytes(local_dir)
 
-        deleted = delete_package(uri, self._resources_dir)
+        deleted = delete_package(
+            uri, self._resources_dir, blob_store_dir=self._blob_store_dir
+        )
         if not deleted:
             logger.warning(f"Tried to delete nonexistent URI: {uri}.")
             return 0
@@ -161,7 +166,11 @@ class WorkingDirPlugin(RuntimeEnvPlugin):
         logger: logging.Logger = default_logger,
     ) -> int:
         local_dir = await download_and_unpack_package(
-            uri, self._resources_dir, self._gcs_aio_client, logger=logger
+            uri,
+            self._resources_dir,
+            self._gcs_aio_client,
+            logger=logger,
+            blob_store_dir=self._blob_store_dir,
         )
         return get_directory_size_bytes(local_dir)
 
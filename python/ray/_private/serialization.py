@@ -1,8 +1,9 @@
 import io
 import logging
+import sys
 import threading
 import traceback
-from typing import Any, Optional
+from typing import Any, Callable, List, Optional
 
 
 import google.protobuf.message
@@ -58,12 +59,87 @@ logger = logging.getLogger(__name__)
 ALLOW_OUT_OF_BAND_OBJECT_REF_SERIALIZATION = ray_constants.env_bool(
     "RAY_allow_out_of_band_object_ref_serialization", True
 )
+# Whether to encode tuples, NumPy scalars and small NumPy arrays directly with
+# msgpack instead of pickling them. Decoding is always supported. Like lists and
+# dicts, which are always encoded with msgpack, objects shared between these
+# tuples are copied rather than shared after deserialization.
+SERIALIZATION_FAST_PATH_ENABLED = ray_constants.env_bool(
+    "RAY_enable_serialization_fast_path", False
+)
+# NumPy arrays larger than this are pickled, so their data is zero-copy.
+SERIALIZATION_FAST_PATH_MAX_ARRAY_BYTES = ray_constants.env_integer(
+    "RAY_serialization_fast_path_max_array_bytes", 1024
+)
+# Values with tuples nested deeper than this are pickled.
+_FAST_PATH_MAX_DEPTH = 16
+
+# Tags of the values encoded by the fast path. Pickled values are encoded as
+# their index into the pickled objects instead.
+_FAST_PATH_TUPLE = 0
+_FAST_PATH_NUMPY_SCALAR = 1
+_FAST_PATH_NUMPY_ARRAY = 2
+# NumPy dtype kinds that can be rebuilt from the dtype string and raw bytes:
+# bool, signed and unsigned integers, floats, and complex numbers.
+_FAST_PATH_NUMPY_KINDS = "biufc"
 
 
 class DeserializationError(Exception):
     pass
 
 
+def _encode_fast_path(
+    obj: Any, python_serializer: Callable[[Any], Any]
+) -> Optional[List[Any]]:
+    """Encode the object as a tagged msgpack list, or return None to pickle it.
+
+    Elements of tuples that msgpack can't encode are passed to
+    `python_serializer`, so they can be encoded by the fast path or pickled.
+    """
+    if type(obj) is tuple:
+        return [
+            _FAST_PATH_TUPLE,
+            MessagePackSerializer.dumps(list(obj), python_serializer),
+        ]
+
+    # Don't import NumPy here: if it wasn't imported, the object isn't from NumPy.
+    np = sys.modules.get("numpy")
+    if np is None:
+        return None
+
+    if isinstance(obj, np.generic):
+        if obj.dtype.kind in _FAST_PATH_NUMPY_KINDS:
+            return [_FAST_PATH_NUMPY_SCALAR, obj.dtype.str, obj.tobytes()]
+    elif (
+        type(obj) is np.ndarray
+        and obj.dtype.kind in _FAST_PATH_NUMPY_KINDS
+        and obj.flags.c_contiguous
+        and obj.nbytes <= SERIALIZATION_FAST_PATH_MAX_ARRAY_BYTES
+    ):
+        return [_FAST_PATH_NUMPY_ARRAY, obj.dtype.str, obj.shape, obj.tobytes()]
+
+    return None
+
+
+def _decode_fast_path(
+    encoded: List[Any], python_deserializer: Callable[[Any], Any]
+) -> Any:
+    """Decode an object encoded by `_encode_fast_path`."""
+    tag = encoded[0]
+    if tag == _FAST_PATH_TUPLE:
+        return tuple(MessagePackSerializer.loads(encoded[1], python_deserializer))
+
+    import numpy as np
+
+    if tag == _FAST_PATH_NUMPY_SCALAR:
+        return np.frombuffer(encoded[2], dtype=encoded[1])[0]
+    elif tag == _FAST_PATH_NUMPY_ARRAY:
+        # Like pickled arrays, the array is read-only since it's backed by the
+        # serialized data.
+        return np.frombuffer(encoded[3], dtype=encoded[1]).reshape(encoded[2])
+
+    raise DeserializationError(f"Unknown fast path serialization tag {tag}.")
+
+
 def pickle_dumps(obj: Any, error_msg: str):
     """Wrap cloudpickle.dumps to provide better error message
     when the object is not serializable.
@@ -129,6 +205,7 @@ class SerializationContext:
     def __init__(self, worker):
         self.worker = worker
         self._thread_local = threading.local()
+        self._fast_path_enabled = SERIALIZATION_FAST_PATH_ENABLED
 
         def actor_handle_reducer(obj):
             ray._private.worker.global_worker.check_connected()
@@ -268,7 +345,11 @@ class SerializationContext:
     def _deserialize_msgpack_data(self, data, metadata_fields):
         msgpack_data, pickle5_data = split_buffer(data)
 
-        if metadata_fields[0] == ray_constants.OBJECT_METADATA_TYPE_PYTHON:
+        # Objects encoded only by the fast path have no pickled data.
+        if (
+            metadata_fields[0] == ray_constants.OBJECT_METADATA_TYPE_PYTHON
+            and len(pickle5_data) > 0
+        ):
             python_objects = self._deserialize_pickle5_data(pickle5_data)
         else:
             python_objects = []
@@ -276,6 +357,8 @@ class SerializationContext:
         try:
 
             def _python_deserializer(index):
+                if isinstance(index, list):
+                    return _decode_fast_path(index, _python_deserializer)
                 return python_objects[index]
 
             obj = MessagePackSerializer.loads(msgpack_data, _python_deserializer)
@@ -486,6 +569,45 @@ class SerializationContext:
             metadata, inband, writer, self.get_and_clear_contained_object_refs()
         )
 
+    def _dumps_msgpack(self, value, use_fast_path: bool):
+        """Encode the value with msgpack.
+
+        Returns the msgpack data, the objects that need to be pickled, and
+        whether any objects were encoded by the fast path.
+        """
+        python_objects = []
+        # IDs of the objects currently being encoded by the fast path.
+        encoding_ids = set()
+        used_fast_path = False
+        needs_fallback = False
+
+        def _python_serializer(o):
+            nonlocal used_fast_path, needs_fallback
+            if use_fast_path and not needs_fallback:
+                if id(o) in encoding_ids or len(encoding_ids) >= _FAST_PATH_MAX_DEPTH:
+                    needs_fallback = True
+                else:
+                    encoding_ids.add(id(o))
+                    try:
+                        encoded = _encode_fast_path(o, _python_serializer)
+                    finally:
+                        encoding_ids.discard(id(o))
+                    if encoded is not None:
+                        used_fast_path = True
+                        return encoded
+
+            index = len(python_objects)
+            python_objects.append(o)
+            return index
+
+        msgpack_data = MessagePackSerializer.dumps(value, _python_serializer)
+        if needs_fallback:
+            # Self-referencing or deeply nested tuples are pickled as a whole, so
+            # the references between them are preserved.
+            return self._dumps_msgpack(value, use_fast_path=False)
+
+        return msgpack_data, python_objects, used_fast_path
+
     def _serialize_to_msgpack(self, value):
         # Only RayTaskError is possible to be serialized here. We don't
         # need to deal with other exception types here.
@@ -520,17 +642,13 @@ class SerializationContext:
         else:
             metadata = ray_constants.OBJECT_METADATA_TYPE_CROSS_LANGUAGE
 
-        python_objects = []
-
-        def _python_serializer(o):
-            index = len(python_objects)
-            python_objects.append(o)
-            return index
-
-        msgpack_data = MessagePackSerializer.dumps(value, _python_serializer)
+        msgpack_data, python_objects, used_fast_path = self._dumps_msgpack(
+            value, self._fast_path_enabled
+        )
 
-        if python_objects:
+        if used_fast_path or python_objects:
             metadata = ray_constants.OBJECT_METADATA_TYPE_PYTHON
+        if python_objects:
             pickle5_serialized_object = self._serialize_to_pickle5(
                 metadata, python_objects
             )
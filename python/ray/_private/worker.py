@@ -13,6 +13,7 @@ import traceback
 import urllib
 import warnings
 from abc import ABCMeta, abstractmethod
+from collections import deque
 from collections.abc import Mapping
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -3005,6 +3006,151 @@ def wait(
         return ready_ids, remaining_ids
 
 
+class _AsCompletedIterator:
+    """Iterator over the values of objects in the order they complete.
+
+    Readiness is tracked with batched ``ray.wait`` calls, and the values of at
+    most `batch_size` completed objects are fetched and held at a time. Unlike
+    a generator, it can still be iterated after raising the error of a failed
+    object.
+    """
+
+    def __init__(
+        self,
+        object_refs: Sequence[ObjectRef],
+        batch_size: int,
+        fetch_local: bool,
+        timeout: Optional[float],
+    ):
+        self._pending = list(object_refs)
+        # Refs of completed objects whose values haven't been fetched yet, in
+        # the order they completed.
+        self._ready = deque()
+        # (value, error) of fetched objects that haven't been yielded yet.
+        self._fetched = deque()
+        self._batch_size = batch_size
+        self._fetch_local = fetch_local
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Any:
+        if not self._fetched:
+            if not self._ready:
+                self._wait_for_ready()
+            self._fetch_ready()
+
+        value, error = self._fetched.popleft()
+        if error is not None:
+            raise error
+        return value
+
+    def _wait_for_ready(self):
+        if not self._pending:
+            raise StopIteration
+
+        wait_s = None
+        if self._deadline is not None:
+            wait_s = max(0, self._deadline - time.monotonic())
+        ready, self._pending = wait(
+            self._pending,
+            num_returns=min(self._batch_size, len(self._pending)),
+            timeout=wait_s,
+            fetch_local=self._fetch_local,
+        )
+        if not ready:
+            raise ray.exceptions.GetTimeoutError(
+                "as_completed timed out waiting for objects to complete."
+            )
+        if self._pending:
+            # Collect all the objects that completed in the meantime without
+            # blocking, so they don't each need their own pass over the
+            # pending objects.
+            also_ready, self._pending = wait(
+                self._pending,
+                num_returns=len(self._pending),
+                timeout=0,
+                fetch_local=self._fetch_local,
+            )
+            ready.extend(also_ready)
+        self._ready.extend(ready)
+
+    def _fetch_ready(self):
+        batch = [
+            self._ready.popleft()
+            for _ in range(min(self._batch_size, len(self._ready)))
+        ]
+        try:
+            self._fetched.extend((value, None) for value in get(batch))
+        except RayError:
+            # Fetch the objects one by one so that only the failed ones raise.
+            for object_ref in batch:
+                try:
+                    self._fetched.append((get(object_ref), None))
+                except RayError as e:
+                    self._fetched.append((None, e))
+
+
+@PublicAPI(stability="alpha")
+def as_completed(
+    object_refs: Sequence[ObjectRef],
+    *,
+    batch_size: int = 1,
+    fetch_local: bool = True,
+    timeout: Optional[float] = None,
+) -> Iterator[Any]:
+    """Yield the values of the given object refs in the order they complete.
+
+    This is a more efficient alternative to draining a list of object refs with
+    repeated ``ray.wait(refs, num_returns=1)`` calls, which each go over all of
+    the pending objects. Here, each ``ray.wait`` call also collects every other
+    object that has already completed, so objects that complete together share
+    a single pass. Values are fetched with one ``ray.get`` call per batch of
+    `batch_size` objects, and only the values of the current batch are held.
+
+    Examples:
+
+    .. code-block:: python
+
+        @ray.remote
+        def f(x):
+            return x
+
+        for value in ray.as_completed([f.remote(i) for i in range(100)]):
+            print(value)
+
+    Args:
+        object_refs: Object refs to wait for. Note that these must be unique.
+        batch_size: The number of completed objects whose values are fetched
+            and held at a time, and the minimum number of objects to wait for
+            before yielding values, except for the final batch. Larger batches
+            reduce the per-object overhead but delay yielding values that are
+            already available and use more memory.
+        fetch_local: If True, objects are downloaded onto the local node in the
+            background while waiting, so their values are available once they
+            are yielded. If False, objects are only downloaded when their
+            values are fetched.
+        timeout: The maximum amount of time in seconds to wait for all of the
+            objects to complete. By default, there is no timeout.
+
+    Returns:
+        An iterator over the value of each object, in the order the objects
+        complete.
+
+    Raises:
+        RayTaskError: If the task that created the next completed object
+            failed. The values of the other objects can still be retrieved by
+            continuing to iterate.
+        GetTimeoutError: If `timeout` is set and not all of the objects
+            completed in time.
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}.")
+
+    return _AsCompletedIterator(object_refs, batch_size, fetch_local, timeout)
+
+
 @PublicAPI
 @client_mode_hook
 def get_actor(name: str, namespace: Optional[str] = None) -> "ray.actor.ActorHandle":
@@ -845,10 +845,12 @@ cdef prepare_args_and_increment_put_refs(
         CoreWorker core_worker,
         Language language, args,
         c_vector[unique_ptr[CTaskArg]] *args_vector, function_descriptor,
-        c_vector[CObjectID] *incremented_put_arg_ids):
+        c_vector[CObjectID] *incremented_put_arg_ids,
+        serialization_context=None):
     try:
         prepare_args_internal(core_worker, language, args, args_vector,
-                              function_descriptor, incremented_put_arg_ids)
+                              function_descriptor, incremented_put_arg_ids,
+                              serialization_context)
     except Exception as e:
         # An error occurred during arg serialization. We must remove the
         # initial local ref for all args that were successfully put into the
@@ -862,7 +864,8 @@ cdef prepare_args_internal(
         CoreWorker core_worker,
         Language language, args,
         c_vector[unique_ptr[CTaskArg]] *args_vector, function_descriptor,
-        c_vector[CObjectID] *incremented_put_arg_ids):
+        c_vector[CObjectID] *incremented_put_arg_ids,
+        serialization_context=None):
     cdef:
         size_t size
         int64_t put_threshold
@@ -875,12 +878,15 @@ cdef prepare_args_internal(
         CAddress c_owner_address
         CRayStatus op_status
 
-    worker = ray._private.worker.global_worker
+    from ray.experimental.compiled_dag_ref import CompiledDAGRef
+
+    if serialization_context is None:
+        serialization_context = (
+            ray._private.worker.global_worker.get_serialization_context())
     put_threshold = RayConfig.instance().max_direct_call_object_size()
     total_inlined = 0
     rpc_inline_threshold = RayConfig.instance().task_rpc_inlined_bytes_limit()
     for arg in args:
-        from ray.experimental.compiled_dag_ref import CompiledDAGRef
         if isinstance(arg, CompiledDAGRef):
             raise TypeError("CompiledDAGRef cannot be used as Ray task/actor argument.")
         if isinstance(arg, ObjectRef):
@@ -896,8 +902,7 @@ cdef prepare_args_internal(
 
         else:
             try:
-                serialized_arg = worker.get_serialization_context(
-                ).serialize(arg)
+                serialized_arg = serialization_context.serialize(arg)
             except TypeError as e:
                 sio = io.StringIO()
                 ray.util.inspect_serializability(arg, print_file=sio)
@@ -3777,6 +3782,97 @@ cdef class CoreWorker:
             # adding the pending task.
             return VectorToObjectRefs(return_refs, skip_adding_local_ref=True)
 
+    def submit_tasks(self,
+                     Language language,
+                     FunctionDescriptor function_descriptor,
+                     args_list,
+                     c_string name,
+                     int num_returns,
+                     resources,
+                     int max_retries,
+                     c_bool retry_exceptions,
+                     retry_exception_allowlist,
+                     scheduling_strategy,
+                     c_string debugger_breakpoint,
+                     c_string serialized_runtime_env_info,
+                     int64_t generator_backpressure_num_objects,
+                     c_bool enable_task_events,
+                     labels,
+                     ):
+        """Submit a task with the same options for each item of `args_list`.
+
+        The options are converted once and the arguments of all tasks are
+        serialized before the whole batch is submitted in one core worker call.
+        Returns the list of return refs of each task.
+        """
+        cdef:
+            unordered_map[c_string, double] c_resources
+            unordered_map[c_string, c_string] c_labels
+            CRayFunction ray_function
+            CTaskOptions task_options
+            c_vector[c_vector[unique_ptr[CTaskArg]]] args_vectors
+            c_vector[c_vector[CObjectReference]] return_refs
+            CSchedulingStrategy c_scheduling_strategy
+            c_vector[CObjectID] incremented_put_arg_ids
+            c_string serialized_retry_exception_allowlist
+            CTaskID current_c_task_id
+            TaskID current_task = self.get_current_task_id()
+            size_t i
+
+        self.python_scheduling_strategy_to_c(
+            scheduling_strategy, &c_scheduling_strategy)
+
+        serialized_retry_exception_allowlist = serialize_retry_exception_allowlist(
+            retry_exception_allowlist,
+            function_descriptor)
+
+        with self.profile_event(b"submit_tasks"):
+            prepare_resources(resources, &c_resources)
+            prepare_labels(labels, &c_labels)
+            ray_function = CRayFunction(
+                language.lang, function_descriptor.descriptor)
+            serialization_context = (
+                ray._private.worker.global_worker.get_serialization_context())
+            args_vectors.resize(len(args_list))
+            for i, args in enumerate(args_list):
+                # On failure, this releases the put args of all prior tasks
+                # too, as none of the batch has been submitted yet.
+                prepare_args_and_increment_put_refs(
+                    self, language, args, &args_vectors[i], function_descriptor,
+                    &incremented_put_arg_ids, serialization_context)
+
+            task_options = CTaskOptions(
+                name, num_returns, c_resources,
+                b"",
+                generator_backpressure_num_objects,
+                serialized_runtime_env_info,
+                enable_task_events,
+                c_labels,
+                )
+
+            current_c_task_id = current_task.native()
+
+            with nogil:
+                return_refs = CCoreWorkerProcess.GetCoreWorker().SubmitTasks(
+                    ray_function, args_vectors, task_options,
+                    max_retries, retry_exceptions,
+                    c_scheduling_strategy,
+                    debugger_breakpoint,
+                    serialized_retry_exception_allowlist,
+                    current_c_task_id,
+                )
+
+            # See submit_task.
+            for put_arg_id in incremented_put_arg_ids:
+                CCoreWorkerProcess.GetCoreWorker().RemoveLocalReference(
+                    put_arg_id)
+
+            result = []
+            for i in range(return_refs.size()):
+                result.append(VectorToObjectRefs(
+                    return_refs[i], skip_adding_local_ref=True))
+            return result
+
     def create_actor(self,
                      Language language,
                      FunctionDescriptor function_descriptor,
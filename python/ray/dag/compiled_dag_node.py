@@ -62,10 +62,13 @@ from ray.dag.dag_node_operation import (
     _DAGNodeOperation,
     _DAGNodeOperationType,
     _DAGOperationGraphNode,
+    _ScheduleEstimate,
     _build_dag_node_operation_graph,
+    _estimate_operation_durations,
     _extract_execution_schedule,
     _generate_actor_to_execution_schedule,
     _generate_overlapped_execution_schedule,
+    _generate_profile_guided_execution_schedule,
     _visualize_execution_schedule,
 )
 
@@ -209,6 +212,7 @@ def do_profile_tasks(
                         actor_id=ray.get_runtime_context().get_actor_id(),
                         method_name=task.method_name,
                         bind_index=task.bind_index,
+                        exec_task_idx=operation.exec_task_idx,
                         operation=operation.type.value,
                         start_t=start_t,
                         end_t=end_t,
@@ -222,6 +226,10 @@ def do_profile_tasks(
         raise
 
 
+def _get_profile_events(self) -> List["_ExecutableTaskRecord"]:
+    return getattr(self, "__ray_adag_events", [])
+
+
 @DeveloperAPI
 def do_cancel_executable_tasks(self, tasks: List["ExecutableTask"]) -> None:
     for task in tasks:
@@ -682,6 +690,7 @@ class _ExecutableTaskRecord:
     actor_id: str
     method_name: str
     bind_index: int
+    exec_task_idx: int
     operation: str
     start_t: float
     end_t: float
@@ -727,6 +736,8 @@ class CompiledDAG:
         max_buffered_results: Optional[int] = None,
         max_inflight_executions: Optional[int] = None,
         overlap_gpu_communication: Optional[bool] = None,
+        operation_profile: Optional[List[_ExecutableTaskRecord]] = None,
+        num_shm_buffers: Optional[int] = None,
     ):
         """
         Args:
@@ -764,6 +775,16 @@ class CompiledDAG:
                 and computation can be overlapped, which can improve the
                 performance of the DAG execution. If None, the default value
                 will be used.
+            operation_profile: The operation timings recorded by a previous
+                execution of the same DAG with profiling enabled, as returned by
+                `get_operation_profile`. If set, the operations of each actor
+                are reordered to reduce the time that actors spend blocked on
+                reads and writes, based on the recorded timings.
+            num_shm_buffers: The number of shared memory buffers of each channel
+                between tasks in the DAG. With more than one buffer, writers can
+                run ahead of their slowest reader by up to this many executions
+                instead of waiting for every reader to read each value. None
+                means using the default (DAGContext.num_shm_buffers).
 
         Returns:
             Channel: A wrapper around ray.ObjectRef.
@@ -792,19 +813,33 @@ class CompiledDAG:
         self._overlap_gpu_communication: Optional[bool] = overlap_gpu_communication
         if self._overlap_gpu_communication is None:
             self._overlap_gpu_communication = ctx.overlap_gpu_communication
+        self._operation_profile: Optional[
+            List[_ExecutableTaskRecord]
+        ] = operation_profile
+        # The estimated timings of an execution, set if operation_profile is.
+        self._schedule_estimate: Optional[_ScheduleEstimate] = None
+
+        self._num_shm_buffers: Optional[int] = num_shm_buffers
+        if self._num_shm_buffers is None:
+            self._num_shm_buffers = ctx.num_shm_buffers
 
         self._default_type_hint: ChannelOutputType = SharedMemoryType(
             buffer_size_bytes=self._buffer_size_bytes,
-            # We conservatively set num_shm_buffers to _max_inflight_executions.
-            # It means that the DAG can be underutilized, but it guarantees there's
-            # no false positive timeouts.
-            num_shm_buffers=1,
+            # Each buffer allocates buffer_size_bytes of shared memory, so only one
+            # is used by default. More buffers let writers run ahead of slow
+            # readers, which helps when executions are pipelined.
+            num_shm_buffers=self._num_shm_buffers,
         )
         if not isinstance(self._buffer_size_bytes, int) or self._buffer_size_bytes <= 0:
             raise ValueError(
                 "`buffer_size_bytes` must be a positive integer, found "
                 f"{self._buffer_size_bytes}"
             )
+        if not isinstance(self._num_shm_buffers, int) or self._num_shm_buffers <= 0:
+            raise ValueError(
+                "`num_shm_buffers` must be a positive integer, found "
+                f"{self._num_shm_buffers}"
+            )
 
         # Used to ensure that the future returned to the
         # caller corresponds to the correct DAG output. I.e.
@@ -1774,6 +1809,30 @@ class CompiledDAG:
                 actor_to_execution_schedule
             )
 
+        # Step 4: Reorder the operations based on their profiled durations if a
+        # profile is given. Step 2 consumes the graph, so build a new one.
+        if self._operation_profile is not None and actor_to_overlapped_schedule is None:
+            profile_graph = _build_dag_node_operation_graph(
+                self.idx_to_task, self._generate_dag_operation_graph_node()
+            )
+            (
+                actor_to_overlapped_schedule,
+                self._schedule_estimate,
+            ) = _generate_profile_guided_execution_schedule(
+                actor_to_execution_schedule,
+                profile_graph,
+                self._get_operation_durations(self._operation_profile),
+            )
+            logger.info(
+                "Estimated compiled graph execution time: "
+                f"{self._schedule_estimate.default_makespan_s * 1000:.3f}ms with "
+                "the default schedule, "
+                f"{self._schedule_estimate.optimized_makespan_s * 1000:.3f}ms with "
+                "the profile-guided schedule, "
+                f"{self._schedule_estimate.critical_path_s * 1000:.3f}ms on the "
+                "critical path."
+            )
+
         if RAY_ADAG_VISUALIZE_SCHEDULE:
             _visualize_execution_schedule(
                 actor_to_execution_schedule, actor_to_overlapped_schedule, graph
@@ -1784,6 +1843,32 @@ class CompiledDAG:
         else:
             return _extract_execution_schedule(actor_to_execution_schedule)
 
+    def _get_operation_durations(
+        self, operation_profile: List[_ExecutableTaskRecord]
+    ) -> Dict[Tuple[int, _DAGNodeOperationType], float]:
+        """
+        Estimate the duration of each operation from the recorded timings. Records
+        of operations that are not part of this DAG are ignored.
+        """
+        actor_id_to_tasks = {
+            actor_handle._actor_id.hex(): executable_tasks
+            for actor_handle, executable_tasks in self.actor_to_executable_tasks.items()
+        }
+        operation_to_samples: Dict[
+            Tuple[int, _DAGNodeOperationType], List[float]
+        ] = defaultdict(list)
+        for record in operation_profile:
+            executable_tasks = actor_id_to_tasks.get(record.actor_id, [])
+            if record.exec_task_idx >= len(executable_tasks):
+                continue
+            task = executable_tasks[record.exec_task_idx]
+            if task.method_name != record.method_name:
+                continue
+            operation_to_samples[
+                (task.task_idx, _DAGNodeOperationType(record.operation))
+            ].append(record.end_t - record.start_t)
+        return _estimate_operation_durations(operation_to_samples)
+
     def _detect_deadlock(self) -> bool:
         """
         Check whether the DAG will deadlock on NCCL calls.
@@ -2569,6 +2654,31 @@ class CompiledDAG:
 
         return ascii_visualization
 
+    def get_operation_profile(self) -> List[_ExecutableTaskRecord]:
+        """
+        Get the operation timings recorded by the actors of this DAG so far. The
+        timings are only recorded if the DAG was compiled with the
+        RAY_ADAG_ENABLE_PROFILING environment variable set to 1.
+
+        The result can be passed as `_operation_profile` when compiling the same
+        DAG again, to generate an execution schedule based on the timings.
+        """
+        events = ray.get(
+            [
+                actor_handle.__ray_call__.remote(_get_profile_events)
+                for actor_handle in self.actor_to_executable_tasks
+            ]
+        )
+        return [event for actor_events in events for event in actor_events]
+
+    def get_schedule_estimate(self) -> Optional[_ScheduleEstimate]:
+        """
+        Get the estimated execution time of the DAG with the default and the
+        profile-guided execution schedule, and of its critical path. Only
+        available if the DAG was compiled with an `_operation_profile`.
+        """
+        return self._schedule_estimate
+
     def get_channel_details(
         self, channel: ChannelInterface, downstream_actor_id: str
     ) -> str:
@@ -2813,6 +2923,8 @@ def build_compiled_dag_from_ray_dag(
     max_buffered_results: Optional[int] = None,
     max_inflight_executions: Optional[int] = None,
     overlap_gpu_communication: Optional[bool] = None,
+    operation_profile: Optional[List[_ExecutableTaskRecord]] = None,
+    num_shm_buffers: Optional[int] = None,
 ) -> "CompiledDAG":
     compiled_dag = CompiledDAG(
         execution_timeout,
@@ -2822,6 +2934,8 @@ def build_compiled_dag_from_ray_dag(
         max_buffered_results,
         max_inflight_executions,
         overlap_gpu_communication,
+        operation_profile,
+        num_shm_buffers,
     )
 
     def _build_compiled_dag(node):
@@ -26,6 +26,10 @@ DEFAULT_MAX_INFLIGHT_EXECUTIONS = int(
     os.environ.get("RAY_DAG_max_inflight_executions", 10)
 )
 
+# The default number of shared memory buffers per channel. With more than one
+# buffer, a writer can run ahead of its slowest reader by up to that many values.
+DEFAULT_NUM_SHM_BUFFERS = int(os.environ.get("RAY_DAG_num_shm_buffers", 1))
+
 DEFAULT_OVERLAP_GPU_COMMUNICATION = bool(
     os.environ.get("RAY_DAG_overlap_gpu_communication", 0)
 )
@@ -67,6 +71,12 @@ class DAGContext:
             enforced when it is smaller than the DAG capacity.
         max_inflight_executions: The maximum number of in-flight executions
             that can be submitted before consuming the output.
+        num_shm_buffers: The number of shared memory buffers of each channel
+            between tasks in the DAG. With more than one buffer, a task can
+            write the results of later executions before all readers have read
+            the earlier ones, up to this many, so pipelined executions aren't
+            held back by the slowest reader. Each buffer takes
+            `buffer_size_bytes` of shared memory.
         overlap_gpu_communication: Whether to overlap GPU communication with
             computation during DAG execution. If True, the communication
             and computation can be overlapped, which can improve the
@@ -80,6 +90,7 @@ class DAGContext:
     asyncio_max_queue_size: int = DEFAULT_ASYNCIO_MAX_QUEUE_SIZE
     max_buffered_results: int = DEFAULT_MAX_BUFFERED_RESULTS
     max_inflight_executions: int = DEFAULT_MAX_INFLIGHT_EXECUTIONS
+    num_shm_buffers: int = DEFAULT_NUM_SHM_BUFFERS
     overlap_gpu_communication: bool = DEFAULT_OVERLAP_GPU_COMMUNICATION
 
     @staticmethod
@@ -19,7 +19,10 @@ from typing import (
 import uuid
 import asyncio
 
-from ray.dag.compiled_dag_node import build_compiled_dag_from_ray_dag
+from ray.dag.compiled_dag_node import (
+    _ExecutableTaskRecord,
+    build_compiled_dag_from_ray_dag,
+)
 from ray.experimental.channel import ChannelOutputType
 
 T = TypeVar("T")
@@ -190,6 +193,8 @@ class DAGNode(DAGNodeBase):
         _max_buffered_results: Optional[int] = None,
         _max_inflight_executions: Optional[int] = None,
         _overlap_gpu_communication: Optional[bool] = None,
+        _operation_profile: Optional[List[_ExecutableTaskRecord]] = None,
+        _num_shm_buffers: Optional[int] = None,
     ) -> "ray.dag.CompiledDAG":
         """Compile an accelerated execution path for this DAG.
 
@@ -219,6 +224,16 @@ class DAGNode(DAGNodeBase):
                 and computation can be overlapped, which can improve the
                 performance of the DAG execution. If None, the default value
                 will be used.
+            _operation_profile: The operation timings recorded by a previous
+                execution of the same DAG on the same actors, as returned by
+                `CompiledDAG.get_operation_profile`. If set, the operations of
+                each actor are reordered based on the timings to reduce the time
+                spent blocked on reads and writes.
+            _num_shm_buffers: The number of shared memory buffers of each channel
+                between tasks in the DAG. With more than one buffer, writers can
+                run ahead of their slowest reader by up to this many executions.
+                There's no benefit in setting it higher than
+                `_max_inflight_executions`. If None, the default value is used.
 
         Returns:
             A compiled DAG.
@@ -253,6 +268,8 @@ class DAGNode(DAGNodeBase):
             _max_buffered_results,
             _max_inflight_executions,
             _overlap_gpu_communication,
+            _operation_profile,
+            _num_shm_buffers,
         )
 
     def execute(
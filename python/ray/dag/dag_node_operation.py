@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from functools import total_ordering
 from enum import Enum
 from typing import Set, Tuple, List, Dict, Optional
@@ -787,3 +788,262 @@ def _extract_execution_schedule(
         actor: [node.operation for node in nodes]
         for actor, nodes in actor_to_execution_schedule.items()
     }
+
+
+# An operation in the DAG operation graph, identified by its task_idx and type.
+_OperationKey = Tuple[int, _DAGNodeOperationType]
+
+
+@dataclass
+class _ScheduleEstimate:
+    """
+    The estimated timings of one execution of a compiled DAG, based on the
+    profiled durations of its operations.
+    """
+
+    # The estimated time of an execution with the default execution schedule.
+    default_makespan_s: float
+    # The estimated time of an execution with the profile-guided schedule.
+    optimized_makespan_s: float
+    # The total duration of the longest chain of dependent operations. No
+    # schedule can execute the DAG faster than this.
+    critical_path_s: float
+    # The operations on the critical path, in execution order.
+    critical_path: List[_OperationKey]
+
+
+def _estimate_operation_durations(
+    operation_to_samples: Dict[_OperationKey, List[float]]
+) -> Dict[_OperationKey, float]:
+    """
+    Estimate the duration of each operation from its profiled durations.
+
+    READ and WRITE operations block until the channel is ready, so their
+    profiled durations include the time spent waiting on other actors. The
+    shortest sample is used as the estimate of the cost of the operation itself.
+    COMPUTE operations only depend on the actor, so the mean is used.
+    """
+    durations = {}
+    for key, samples in operation_to_samples.items():
+        if not samples:
+            continue
+        _, op_type = key
+        if op_type == _DAGNodeOperationType.COMPUTE:
+            durations[key] = sum(samples) / len(samples)
+        else:
+            durations[key] = min(samples)
+    return durations
+
+
+def _get_predecessors(
+    graph: Dict[int, Dict[_DAGNodeOperationType, _DAGOperationGraphNode]]
+) -> Dict[_OperationKey, List[_OperationKey]]:
+    """
+    Get the operations that each operation depends on from the `out_edges` of
+    the graph. Unlike `in_edges`, `out_edges` are not consumed when an execution
+    schedule is generated.
+    """
+    predecessors: Dict[_OperationKey, List[_OperationKey]] = {
+        (task_idx, op_type): []
+        for task_idx, nodes in graph.items()
+        for op_type in nodes
+    }
+    for task_idx, nodes in graph.items():
+        for op_type, node in nodes.items():
+            for out_key in node.out_edges:
+                predecessors[out_key].append((task_idx, op_type))
+    return predecessors
+
+
+def _get_topological_order(
+    graph: Dict[int, Dict[_DAGNodeOperationType, _DAGOperationGraphNode]],
+    predecessors: Dict[_OperationKey, List[_OperationKey]],
+) -> List[_OperationKey]:
+    num_unvisited_predecessors = {
+        key: len(preds) for key, preds in predecessors.items()
+    }
+    order = [key for key, num in num_unvisited_predecessors.items() if num == 0]
+    for key in order:
+        task_idx, op_type = key
+        for out_key in graph[task_idx][op_type].out_edges:
+            num_unvisited_predecessors[out_key] -= 1
+            if num_unvisited_predecessors[out_key] == 0:
+                order.append(out_key)
+    assert len(order) == len(predecessors), "Expected the graph to be acyclic"
+    return order
+
+
+def _simulate_execution_schedule(
+    actor_to_execution_schedule: Dict[
+        "ray.actor.ActorHandle", List[_DAGOperationGraphNode]
+    ],
+    predecessors: Dict[_OperationKey, List[_OperationKey]],
+    operation_durations: Dict[_OperationKey, float],
+) -> float:
+    """
+    Estimate the time to execute the DAG once with the given execution schedule.
+
+    Each actor executes its operations one at a time in the order of its
+    schedule, and an operation starts once the operations it depends on have
+    finished. Operations without a profiled duration are assumed to take no time.
+
+    Returns:
+        The estimated time until the last operation finishes.
+    """
+    actor_to_keys = {
+        actor: [(node.task_idx, node.operation.type) for node in nodes]
+        for actor, nodes in actor_to_execution_schedule.items()
+    }
+    actor_to_position = {actor: 0 for actor in actor_to_keys}
+    actor_to_free_time = {actor: 0.0 for actor in actor_to_keys}
+    finish_times: Dict[_OperationKey, float] = {}
+
+    made_progress = True
+    while made_progress:
+        made_progress = False
+        for actor, keys in actor_to_keys.items():
+            while actor_to_position[actor] < len(keys):
+                key = keys[actor_to_position[actor]]
+                if any(pred not in finish_times for pred in predecessors[key]):
+                    break
+                start_time = max(
+                    [actor_to_free_time[actor]]
+                    + [finish_times[pred] for pred in predecessors[key]]
+                )
+                finish_times[key] = start_time + operation_durations.get(key, 0.0)
+                actor_to_free_time[actor] = finish_times[key]
+                actor_to_position[actor] += 1
+                made_progress = True
+
+    assert len(finish_times) == sum(
+        len(keys) for keys in actor_to_keys.values()
+    ), "Expected the execution schedule to complete"
+    return max(finish_times.values(), default=0.0)
+
+
+def _generate_profile_guided_execution_schedule(
+    actor_to_execution_schedule: Dict[
+        "ray.actor.ActorHandle", List[_DAGOperationGraphNode]
+    ],
+    graph: Dict[int, Dict[_DAGNodeOperationType, _DAGOperationGraphNode]],
+    operation_durations: Dict[_OperationKey, float],
+) -> Tuple[
+    Optional[Dict["ray.actor.ActorHandle", List[_DAGOperationGraphNode]]],
+    _ScheduleEstimate,
+]:
+    """
+    Generate a new execution schedule by reordering the operations of each actor
+    based on their profiled durations, so that an actor doesn't block on a READ
+    or delay a WRITE that other actors are waiting for while it has other work
+    that is ready.
+
+    The algorithm is a list scheduler: it repeatedly picks, among the operations
+    whose dependencies have all been scheduled, the one that can start the
+    earliest on its actor. Ties are broken by preferring the operation with the
+    longest remaining path to the end of the DAG, then by the order of the
+    default schedule. Like `_generate_actor_to_execution_schedule`, it picks one
+    operation at a time across all actors, so the schedule is a topological order
+    of the graph. COMPUTE operations of the same actor keep their order because
+    of the control dependencies between them.
+
+    NCCL operations must be executed in the same order by all the actors of a
+    NCCL group, so DAGs with NCCL operations are not reordered.
+
+    Args:
+        actor_to_execution_schedule: The default execution schedule generated by
+            `_generate_actor_to_execution_schedule`, used as the baseline.
+        graph: A graph generated by `_build_dag_node_operation_graph` that has
+            not been used to generate an execution schedule yet.
+        operation_durations: The estimated duration of each operation in
+            seconds, keyed by its task_idx and type.
+
+    Returns:
+        A tuple of the profile-guided execution schedule and the estimated timings.
+        The schedule is None if the DAG has NCCL operations or if the schedule is
+        not estimated to be faster than the default one.
+    """
+    predecessors = _get_predecessors(graph)
+    topological_order = _get_topological_order(graph, predecessors)
+
+    def duration(key: _OperationKey) -> float:
+        return operation_durations.get(key, 0.0)
+
+    # The length of the longest path from the start of each operation to the end
+    # of the DAG, ignoring contention for actors.
+    remaining_path_s: Dict[_OperationKey, float] = {}
+    for key in reversed(topological_order):
+        task_idx, op_type = key
+        out_keys = graph[task_idx][op_type].out_edges
+        remaining_path_s[key] = duration(key) + max(
+            (remaining_path_s[out_key] for out_key in out_keys), default=0.0
+        )
+
+    # The longest chain of dependent operations.
+    critical_path = []
+    if topological_order:
+        key = max(
+            (key for key in topological_order if not predecessors[key]),
+            key=remaining_path_s.__getitem__,
+        )
+        critical_path.append(key)
+        while graph[key[0]][key[1]].out_edges:
+            key = max(graph[key[0]][key[1]].out_edges, key=remaining_path_s.__getitem__)
+            critical_path.append(key)
+    critical_path_s = sum(duration(key) for key in critical_path)
+
+    default_makespan_s = _simulate_execution_schedule(
+        actor_to_execution_schedule, predecessors, operation_durations
+    )
+    estimate = _ScheduleEstimate(
+        default_makespan_s=default_makespan_s,
+        optimized_makespan_s=default_makespan_s,
+        critical_path_s=critical_path_s,
+        critical_path=critical_path,
+    )
+    if any(node.requires_nccl for nodes in graph.values() for node in nodes.values()):
+        return None, estimate
+
+    actor_to_optimized_schedule: Dict[
+        "ray.actor.ActorHandle", List[_DAGOperationGraphNode]
+    ] = defaultdict(list)
+    actor_to_free_time: Dict["ray.actor.ActorHandle", float] = defaultdict(float)
+    finish_times: Dict[_OperationKey, float] = {}
+    num_unscheduled_predecessors = {
+        key: len(preds) for key, preds in predecessors.items()
+    }
+    ready = [key for key, num in num_unscheduled_predecessors.items() if num == 0]
+
+    def earliest_start_time(key: _OperationKey) -> float:
+        node = graph[key[0]][key[1]]
+        return max(
+            [actor_to_free_time[node.actor_handle]]
+            + [finish_times[pred] for pred in predecessors[key]]
+        )
+
+    def priority(key: _OperationKey):
+        node = graph[key[0]][key[1]]
+        return (
+            earliest_start_time(key),
+            -remaining_path_s[key],
+            node.operation.exec_task_idx,
+            node.task_idx,
+        )
+
+    while ready:
+        key = min(ready, key=priority)
+        ready.remove(key)
+        node = graph[key[0]][key[1]]
+        finish_times[key] = earliest_start_time(key) + duration(key)
+        actor_to_free_time[node.actor_handle] = finish_times[key]
+        actor_to_optimized_schedule[node.actor_handle].append(node)
+        for out_key in node.out_edges:
+            num_unscheduled_predecessors[out_key] -= 1
+            if num_unscheduled_predecessors[out_key] == 0:
+                ready.append(out_key)
+    assert len(finish_times) == len(predecessors), "Expected all nodes to be visited"
+
+    optimized_makespan_s = max(finish_times.values(), default=0.0)
+    if optimized_makespan_s >= default_makespan_s:
+        return None, estimate
+    estimate.optimized_makespan_s = optimized_makespan_s
+    return actor_to_optimized_schedule, estimate
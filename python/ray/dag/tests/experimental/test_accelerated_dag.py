@@ -2118,7 +2118,6 @@ def test_driver_and_intraprocess_read(ray_start_cluster):
     assert ray.get(dag.execute(1)) == [1, 2]
 
 
-@pytest.mark.skip("Currently buffer size is set to 1 because of regression.")
 @pytest.mark.parametrize("temporary_change_timeout", [1], indirect=True)
 def test_buffered_inputs(shutdown_only, temporary_change_timeout):
     ray.init()
@@ -2147,7 +2146,10 @@ def test_buffered_inputs(shutdown_only, temporary_change_timeout):
         dag = actor1.fwd.bind(input_node)
 
     # With buffering it should work.
-    dag = dag.experimental_compile(_max_inflight_executions=MAX_INFLIGHT_EXECUTIONS)
+    dag = dag.experimental_compile(
+        _max_inflight_executions=MAX_INFLIGHT_EXECUTIONS,
+        _num_shm_buffers=MAX_INFLIGHT_EXECUTIONS,
+    )
 
     # Test the regular case.
     output_refs = []
@@ -2181,6 +2183,7 @@ def test_buffered_inputs(shutdown_only, temporary_change_timeout):
 
     async_dag = async_dag.experimental_compile(
         _max_inflight_executions=MAX_INFLIGHT_EXECUTIONS,
+        _num_shm_buffers=MAX_INFLIGHT_EXECUTIONS,
         enable_asyncio=True,
     )
 
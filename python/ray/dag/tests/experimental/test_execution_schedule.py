@@ -15,6 +15,8 @@ from ray.dag.dag_node_operation import (
     _build_dag_node_operation_graph,
     _add_edge,
     _generate_actor_to_execution_schedule,
+    _generate_profile_guided_execution_schedule,
+    _estimate_operation_durations,
 )
 from ray.dag.compiled_dag_node import CompiledTask
 from typing import List, Dict, Tuple
@@ -1132,6 +1134,158 @@ class TestGenerateActorToExecutionSchedule:
         ]
 
 
+class TestGenerateProfileGuidedExecutionSchedule:
+    """
+    Test whether `_generate_profile_guided_execution_schedule` reorders the
+    operations of each actor based on their profiled durations.
+    """
+
+    def build_graph(self, fake_actor_1, fake_actor_2, requires_nccl=False):
+        """
+        driver -> fake_actor_2.op (task_idx_1) -> fake_actor_1.op (task_idx_2)
+        driver -> fake_actor_1.op (task_idx_3)
+
+        task_idx_2 and task_idx_3 are bound to fake_actor_1 in this order.
+        """
+        task_idx_1, exec_task_idx_1 = 1, 0
+        task_idx_2, exec_task_idx_2 = 2, 0
+        task_idx_3, exec_task_idx_3 = 3, 1
+        graph = {
+            task_idx_1: generate_dag_graph_nodes(
+                exec_task_idx_1, task_idx_1, fake_actor_2, requires_nccl
+            ),
+            task_idx_2: generate_dag_graph_nodes(
+                exec_task_idx_2, task_idx_2, fake_actor_1, False
+            ),
+            task_idx_3: generate_dag_graph_nodes(
+                exec_task_idx_3, task_idx_3, fake_actor_1, False
+            ),
+        }
+        for operations in graph.values():
+            _add_edge(
+                operations[_DAGNodeOperationType.READ],
+                operations[_DAGNodeOperationType.COMPUTE],
+            )
+            _add_edge(
+                operations[_DAGNodeOperationType.COMPUTE],
+                operations[_DAGNodeOperationType.WRITE],
+            )
+        _add_edge(
+            graph[task_idx_1][_DAGNodeOperationType.WRITE],
+            graph[task_idx_2][_DAGNodeOperationType.READ],
+        )
+        _add_edge(
+            graph[task_idx_2][_DAGNodeOperationType.COMPUTE],
+            graph[task_idx_3][_DAGNodeOperationType.COMPUTE],
+        )
+        return graph
+
+    def get_operation_durations(self):
+        # fake_actor_2's COMPUTE is slow, and reading the input of task_idx_3
+        # takes a while, e.g., because it is large.
+        return {
+            (1, _DAGNodeOperationType.COMPUTE): 10.0,
+            (2, _DAGNodeOperationType.COMPUTE): 1.0,
+            (3, _DAGNodeOperationType.READ): 5.0,
+            (3, _DAGNodeOperationType.COMPUTE): 1.0,
+        }
+
+    def test_overlap_read_with_upstream_compute(self, monkeypatch):
+        """
+        With the default schedule, fake_actor_1 waits for fake_actor_2 before
+        reading the input of task_idx_3. The profile-guided schedule reads it
+        while fake_actor_2 is computing.
+        """
+        monkeypatch.setattr(ActorHandle, "__init__", mock_actor_handle_init)
+        fake_actor_1 = ActorHandle("fake_actor_1")
+        fake_actor_2 = ActorHandle("fake_actor_2")
+
+        default_schedule = _generate_actor_to_execution_schedule(
+            self.build_graph(fake_actor_1, fake_actor_2)
+        )
+        graph = self.build_graph(fake_actor_1, fake_actor_2)
+        schedule, estimate = _generate_profile_guided_execution_schedule(
+            default_schedule, graph, self.get_operation_durations()
+        )
+
+        assert estimate.default_makespan_s == 17.0
+        assert estimate.optimized_makespan_s == 12.0
+        assert estimate.critical_path_s == 12.0
+        assert estimate.critical_path == [
+            (1, _DAGNodeOperationType.READ),
+            (1, _DAGNodeOperationType.COMPUTE),
+            (1, _DAGNodeOperationType.WRITE),
+            (2, _DAGNodeOperationType.READ),
+            (2, _DAGNodeOperationType.COMPUTE),
+            (3, _DAGNodeOperationType.COMPUTE),
+            (3, _DAGNodeOperationType.WRITE),
+        ]
+        assert _extract_execution_schedule(schedule)[fake_actor_1] == [
+            graph[3][_DAGNodeOperationType.READ].operation,
+            graph[2][_DAGNodeOperationType.READ].operation,
+            graph[2][_DAGNodeOperationType.COMPUTE].operation,
+            graph[3][_DAGNodeOperationType.COMPUTE].operation,
+            graph[2][_DAGNodeOperationType.WRITE].operation,
+            graph[3][_DAGNodeOperationType.WRITE].operation,
+        ]
+
+    def test_no_reorder_with_nccl(self, monkeypatch):
+        """
+        NCCL operations must be executed in the same order by all the actors of
+        a NCCL group, so the DAG is not reordered.
+        """
+        monkeypatch.setattr(ActorHandle, "__init__", mock_actor_handle_init)
+        fake_actor_1 = ActorHandle("fake_actor_1")
+        fake_actor_2 = ActorHandle("fake_actor_2")
+
+        default_schedule = _generate_actor_to_execution_schedule(
+            self.build_graph(fake_actor_1, fake_actor_2, requires_nccl=True)
+        )
+        schedule, estimate = _generate_profile_guided_execution_schedule(
+            default_schedule,
+            self.build_graph(fake_actor_1, fake_actor_2, requires_nccl=True),
+            self.get_operation_durations(),
+        )
+        assert schedule is None
+        assert estimate.optimized_makespan_s == estimate.default_makespan_s
+
+    def test_no_reorder_without_improvement(self, monkeypatch):
+        """
+        If the default schedule is already optimal, it is kept.
+        """
+        monkeypatch.setattr(ActorHandle, "__init__", mock_actor_handle_init)
+        fake_actor_1 = ActorHandle("fake_actor_1")
+        fake_actor_2 = ActorHandle("fake_actor_2")
+
+        default_schedule = _generate_actor_to_execution_schedule(
+            self.build_graph(fake_actor_1, fake_actor_2)
+        )
+        schedule, estimate = _generate_profile_guided_execution_schedule(
+            default_schedule,
+            self.build_graph(fake_actor_1, fake_actor_2),
+            {(1, _DAGNodeOperationType.COMPUTE): 10.0},
+        )
+        assert schedule is None
+        assert estimate.default_makespan_s == 10.0
+
+    def test_estimate_operation_durations(self):
+        """
+        READ and WRITE durations include the time spent blocking on other
+        actors, so the shortest sample is used. COMPUTE uses the mean.
+        """
+        durations = _estimate_operation_durations(
+            {
+                (1, _DAGNodeOperationType.READ): [3.0, 1.0, 2.0],
+                (1, _DAGNodeOperationType.COMPUTE): [1.0, 2.0, 3.0],
+                (1, _DAGNodeOperationType.WRITE): [],
+            }
+        )
+        assert durations == {
+            (1, _DAGNodeOperationType.READ): 1.0,
+            (1, _DAGNodeOperationType.COMPUTE): 2.0,
+        }
+
+
 if __name__ == "__main__":
     if os.environ.get("PARALLEL_CI"):
         sys.exit(pytest.main(["-n", "auto", "--boxed", "-vs", __file__]))
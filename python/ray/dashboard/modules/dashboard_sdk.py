@@ -6,14 +6,16 @@ import os
 import ssl
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Union
 
 import packaging.version
 import yaml
 
 import ray
 from ray._private.runtime_env.packaging import (
+    _content_addressed_packages_enabled,
     create_package,
+    get_package_manifest,
     get_uri_for_directory,
     get_uri_for_package,
 )
@@ -289,7 +291,7 @@ class SubmissionClient:
         method: str,
         endpoint: str,
         *,
-        data: Optional[bytes] = None,
+        data: Optional[Union[bytes, BinaryIO]] = None,
         json_data: Optional[dict] = None,
         **kwargs,
     ) -> "requests.Response":
@@ -336,6 +338,15 @@ class SubmissionClient:
         is_file: bool = False,
     ) -> bool:
         logger.info(f"Uploading package {package_uri}.")
+        manifest, missing_hashes = None, None
+        if not is_file and _content_addressed_packages_enabled():
+            manifest = get_package_manifest(
+                package_path, include_parent_dir=include_parent_dir, excludes=excludes
+            )
+            missing_hashes = self._get_missing_package_files(
+                list(set(manifest.values()))
+            )
+
         with tempfile.TemporaryDirectory() as tmp_dir:
             protocol, package_name = uri_to_http_components(package_uri)
             if is_file:
@@ -347,13 +358,24 @@ class SubmissionClient:
                     package_file,
                     include_parent_dir=include_parent_dir,
                     excludes=excludes,
+                    manifest=manifest,
+                    missing_hashes=missing_hashes,
                 )
             try:
-                r = self._do_request(
-                    "PUT",
-                    f"/api/packages/{protocol}/{package_name}",
-                    data=package_file.read_bytes(),
-                )
+                r = self._put_package(protocol, package_name, package_file)
+                if r.status_code == 409 and missing_hashes is not None:
+                    # Some of the files that were left out of the package were
+                    # evicted from the server in the meantime; send all of them.
+                    logger.info(f"Uploading all files of package {package_uri}.")
+                    package_file.unlink()
+                    create_package(
+                        package_path,
+                        package_file,
+                        include_parent_dir=include_parent_dir,
+                        excludes=excludes,
+                        manifest=manifest,
+                    )
+                    r = self._put_package(protocol, package_name, package_file)
                 if r.status_code != 200:
                     self._raise_error(r)
             finally:
@@ -361,6 +383,37 @@ class SubmissionClient:
                 if not is_file:
                     package_file.unlink()
 
+    def _put_package(
+        self, protocol: str, package_name: str, package_file: Path
+    ) -> "requests.Response":
+        # Stream the file instead of reading it into memory.
+        with package_file.open("rb") as f:
+            return self._do_request(
+                "PUT", f"/api/packages/{protocol}/{package_name}", data=f
+            )
+
+    def _get_missing_package_files(self, content_hashes: List[str]) -> Optional[set]:
+        """Returns the content hashes of the files the server doesn't have.
+
+        Returns None if the server doesn't support content-addressed packages.
+        """
+        r = self._do_request(
+            "POST",
+            "/api/packages/missing_files",
+            json_data={"hashes": content_hashes},
+        )
+        if r.status_code == 404:
+            return None
+        elif r.status_code != 200:
+            self._raise_error(r)
+
+        missing = set(r.json()["missing"])
+        logger.info(
+            f"Uploading {len(missing)} of {len(content_hashes)} distinct files, "
+            "the rest are already on the cluster."
+        )
+        return missing
+
     def _upload_package_if_needed(
         self,
         package_path: str,
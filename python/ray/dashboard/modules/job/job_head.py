@@ -2,6 +2,8 @@ import asyncio
 import dataclasses
 import json
 import logging
+import os
+import tempfile
 import traceback
 from random import sample
 from typing import AsyncIterator, List, Optional
@@ -14,11 +16,14 @@ import ray
 import ray.dashboard.consts as dashboard_consts
 import ray.dashboard.optional_utils as optional_utils
 import ray.dashboard.utils as dashboard_utils
-from ray._private.ray_constants import env_bool
+from ray._private.ray_constants import env_bool, env_integer
 from ray._private.runtime_env.packaging import (
+    PACKAGE_BLOB_STORE_DIR_NAME,
+    GcsPackageWriter,
+    complete_package,
+    get_missing_package_files,
     package_exists,
     pin_runtime_env_uri,
-    upload_package_to_gcs,
 )
 from ray._private.utils import get_or_create_event_loop
 from ray.dashboard.datacenter import DataOrganizer
@@ -51,6 +56,14 @@ routes = optional_utils.DashboardHeadRouteTable
 # NOTE: This flag serves as a temporary kill-switch and should be eventually cleaned up
 RAY_JOB_AGENT_USE_HEAD_NODE_ONLY = env_bool("RAY_JOB_AGENT_USE_HEAD_NODE_ONLY", True)
 
+# Maximum size of the files the job server keeps to complete uploads of
+# content-addressed runtime env packages that only contain the files it's missing.
+RAY_JOB_PACKAGE_BLOB_STORE_MAX_SIZE_BYTES = env_integer(
+    "RAY_JOB_PACKAGE_BLOB_STORE_MAX_SIZE_BYTES", 10 * 1024**3
+)
+# Size of the chunks uploaded packages are read in.
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class JobAgentSubmissionClient:
     """A local client for submitting and interacting with jobs on a specific node
@@ -162,6 +175,9 @@ class JobHead(dashboard_utils.DashboardHeadModule):
         super().__init__(dashboard_head)
         self._gcs_aio_client = dashboard_head.gcs_aio_client
         self._job_info_client = None
+        self._package_blob_store_dir = os.path.join(
+            dashboard_head.session_dir, "job_" + PACKAGE_BLOB_STORE_DIR_NAME
+        )
 
         # It contains all `JobAgentSubmissionClient` that
         # `JobHead` has ever used, and will not be deleted
@@ -303,6 +319,41 @@ class JobHead(dashboard_utils.DashboardHeadModule):
 
         return Response()
 
+    @routes.post("/api/packages/missing_files")
+    async def get_missing_package_files(self, req: Request) -> Response:
+        content_hashes = (await req.json())["hashes"]
+        try:
+            missing = await get_or_create_event_loop().run_in_executor(
+                None,
+                get_missing_package_files,
+                content_hashes,
+                self._package_blob_store_dir,
+            )
+        except Exception:
+            return Response(
+                text=traceback.format_exc(),
+                status=aiohttp.web.HTTPInternalServerError.status_code,
+            )
+
+        return Response(
+            text=json.dumps({"missing": missing}),
+            content_type="application/json",
+        )
+
+    def _complete_and_upload_package(self, package_uri: str, package_path: str):
+        writer = GcsPackageWriter(package_uri)
+        try:
+            complete_package(
+                package_path,
+                writer,
+                self._package_blob_store_dir,
+                max_blob_store_size_bytes=RAY_JOB_PACKAGE_BLOB_STORE_MAX_SIZE_BYTES,
+            )
+            writer.close()
+        except Exception:
+            writer.abort()
+            raise
+
     @routes.put("/api/packages/{protocol}/{package_name}")
     async def upload_package(self, req: Request):
         package_uri = http_uri_components_to_uri(
@@ -311,12 +362,23 @@ class JobHead(dashboard_utils.DashboardHeadModule):
         )
         logger.info(f"Uploading package {package_uri} to the GCS.")
         try:
-            data = await req.read()
-            await get_or_create_event_loop().run_in_executor(
-                None,
-                upload_package_to_gcs,
-                package_uri,
-                data,
+            # Spool the package to disk rather than reading it into memory.
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                package_path = os.path.join(tmp_dir, "package.zip")
+                with open(package_path, "wb") as f:
+                    async for chunk in req.content.iter_chunked(UPLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                await get_or_create_event_loop().run_in_executor(
+                    None,
+                    self._complete_and_upload_package,
+                    package_uri,
+                    package_path,
+                )
+        except FileNotFoundError as e:
+            # Files were evicted from the store since the client checked for them.
+            return Response(
+                text=str(e),
+                status=aiohttp.web.HTTPConflict.status_code,
             )
         except Exception:
             return Response(
@@ -136,6 +136,40 @@ def create_serve_rest_api(
                 content_type="application/json",
             )
 
+        @dashboard_route_table.get("/api/serve/traces/")
+        @optional_utils.init_ray_and_catch_exceptions()
+        @validate_endpoint(log_deprecation_warning=log_deprecation_warning)
+        async def get_serve_request_traces(self, req: Request) -> Response:
+            """Returns the latency breakdowns of the most recent sampled requests.
+
+            Requests are only sampled if `RAY_SERVE_REQUEST_TRACE_SAMPLE_RATE` is set.
+            The traces can be filtered with the `app_name` and `deployment_name`
+            query parameters.
+            """
+            controller = await self.get_serve_controller()
+
+            if controller is None:
+                traces = []
+            else:
+                try:
+                    traces = await controller.get_request_traces.remote(
+                        app_name=req.query.get("app_name"),
+                        deployment_name=req.query.get("deployment_name"),
+                    )
+                except ray.exceptions.RayTaskError as e:
+                    return Response(
+                        status=503,
+                        text=(
+                            "Failed to get a response from the controller. "
+                            f"The GCS may be down, please retry later: {e}"
+                        ),
+                    )
+
+            return Response(
+                text=json.dumps({"traces": traces}),
+                content_type="application/json",
+            )
+
         @dashboard_route_table.delete("/api/serve/applications/")
         @optional_utils.init_ray_and_catch_exceptions()
         async def delete_serve_applications(self, req: Request) -> Response:
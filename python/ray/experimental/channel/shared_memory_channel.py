@@ -1,3 +1,4 @@
+import copy
 import io
 import logging
 import time
@@ -552,8 +553,14 @@ class BufferedSharedMemoryChannel(ChannelInterface):
         self._num_shm_buffers = num_shm_buffers
         self._buffers = [
             # We use Channel directly as a buffer implementation as
-            # channel only allows to have 1 shared memory buffer.
-            Channel(writer, reader_and_node_list, typ)
+            # channel only allows to have 1 shared memory buffer. Each buffer
+            # gets its own copy of the type, because a buffer that is resized
+            # for a larger value updates its type's buffer size.
+            Channel(
+                writer,
+                reader_and_node_list,
+                copy.copy(typ) if isinstance(typ, SharedMemoryType) else typ,
+            )
             for _ in range(num_shm_buffers)
         ]
         # The next index to write from self._buffers.
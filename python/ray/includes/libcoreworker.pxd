@@ -128,6 +128,16 @@ cdef extern from "ray/core_worker/core_worker.h" nogil:
             c_string debugger_breakpoint,
             c_string serialized_retry_exception_allowlist,
             const CTaskID current_task_id)
+        c_vector[c_vector[CObjectReference]] SubmitTasks(
+            const CRayFunction &function,
+            const c_vector[c_vector[unique_ptr[CTaskArg]]] &args_list,
+            const CTaskOptions &options,
+            int max_retries,
+            c_bool retry_exceptions,
+            const CSchedulingStrategy &scheduling_strategy,
+            c_string debugger_breakpoint,
+            c_string serialized_retry_exception_allowlist,
+            const CTaskID current_task_id)
         CRayStatus CreateActor(
             const CRayFunction &function,
             const c_vector[unique_ptr[CTaskArg]] &args,
@@ -4,7 +4,7 @@ import os
 import uuid
 from functools import wraps
 from threading import Lock
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import ray._private.signature
 from ray import Language, cross_language
@@ -27,6 +27,7 @@ from ray.util.placement_group import _configure_placement_group_based_on_context
 from ray.util.scheduling_strategies import PlacementGroupSchedulingStrategy
 from ray.util.tracing.tracing_helper import (
     _inject_tracing_into_function,
+    _is_tracing_enabled,
     _tracing_task_invocation,
 )
 
@@ -36,6 +37,20 @@ logger = logging.getLogger(__name__)
 # Hook to call with (fn, resources, strategy) on each local task submission.
 _task_launch_hook = None
 
+# Default number of tasks submitted to the core worker at once by `map_remote`.
+DEFAULT_MAP_CHUNKSIZE = 1000
+
+
+def _to_task_args(item: Any) -> tuple:
+    """Items passed to `map_remote` must be tuples of positional arguments."""
+    if not isinstance(item, tuple):
+        raise TypeError(
+            "Each item passed to map_remote must be a tuple of positional "
+            f"arguments, got {type(item).__name__}. Wrap a single argument "
+            "`x` as `(x,)`."
+        )
+    return item
+
 
 @PublicAPI
 class RemoteFunction:
@@ -162,6 +177,48 @@ class RemoteFunction:
 
         self.remote = _remote_proxy
 
+    @PublicAPI(stability="alpha")
+    def map_remote(
+        self, args_iterable: Iterable[Any], chunksize: int = DEFAULT_MAP_CHUNKSIZE
+    ) -> List[Any]:
+        """Submit a task for each item of `args_iterable`.
+
+        Each item is a tuple of positional arguments, like the items passed
+        to `itertools.starmap`. This is equivalent to calling `.remote(*item)`
+        for each item, but the task options are only resolved once, and the
+        tasks are serialized and submitted to the core worker in batches of
+        `chunksize` tasks, which makes submitting many small tasks cheaper.
+
+        Examples:
+
+        .. code-block:: python
+
+            @ray.remote
+            def add(x, y):
+                return x + y
+
+            refs = add.map_remote([(1, 2), (3, 4)])
+            assert ray.get(refs) == [3, 7]
+
+            refs = add.map_remote(((x, 1) for x in range(3)), chunksize=2)
+            assert ray.get(refs) == [1, 2, 3]
+
+        Args:
+            args_iterable: The positional arguments of each task.
+            chunksize: The maximum number of tasks to submit in a single batch.
+                The serialized arguments of a whole batch are held in memory
+                until it's submitted.
+
+        Returns:
+            The object refs returned by each task, in the order of the items.
+        """
+        return self._map_remote(
+            args_iterable,
+            chunksize=chunksize,
+            serialized_runtime_env_info=self._serialized_base_runtime_env_info,
+            **self._default_options,
+        )
+
     def __call__(self, *args, **kwargs):
         raise TypeError(
             "Remote functions cannot be called directly. Instead "
@@ -286,6 +343,14 @@ class RemoteFunction:
                     **updated_options,
                 )
 
+            def map_remote(self, args_iterable, chunksize=DEFAULT_MAP_CHUNKSIZE):
+                return func_cls._map_remote(
+                    args_iterable,
+                    chunksize=chunksize,
+                    serialized_runtime_env_info=serialized_runtime_env_info,
+                    **updated_options,
+                )
+
             @DeveloperAPI
             def bind(self, *args, **kwargs):
                 """
@@ -314,6 +379,69 @@ class RemoteFunction:
         if client_mode_should_convert():
             return client_mode_convert_function(self, args, kwargs, **task_options)
 
+        invocation = self._prepare_invocation(
+            serialized_runtime_env_info, task_options, caller_stacklevel=5
+        )
+
+        kwargs = {} if kwargs is None else kwargs
+        args = [] if args is None else args
+        return invocation(args, kwargs)
+
+    @wrap_auto_init
+    def _map_remote(
+        self,
+        args_iterable: Iterable[Any],
+        chunksize: int = DEFAULT_MAP_CHUNKSIZE,
+        serialized_runtime_env_info: Optional[str] = None,
+        **task_options,
+    ) -> List[Any]:
+        """Submit the remote function once for each item of `args_iterable`."""
+        if not isinstance(chunksize, int) or chunksize <= 0:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}.")
+
+        task_options.pop("max_calls", None)
+        # Check all of the items before submitting any tasks.
+        all_args = [_to_task_args(item) for item in args_iterable]
+        if (
+            client_mode_should_convert()
+            or (_is_tracing_enabled() and not self._is_cross_language)
+            or self._decorator is not None
+        ):
+            # Each task needs its own client call, tracing span or decorated
+            # invocation, so submit them one at a time.
+            return [
+                self._remote(
+                    args=args,
+                    kwargs={},
+                    serialized_runtime_env_info=serialized_runtime_env_info,
+                    **task_options,
+                )
+                for args in all_args
+            ]
+
+        batch_invocation = self._prepare_invocation(
+            serialized_runtime_env_info, task_options, caller_stacklevel=5, batch=True
+        )
+        results = []
+        for start in range(0, len(all_args), chunksize):
+            results.extend(batch_invocation(all_args[start : start + chunksize]))
+        return results
+
+    def _prepare_invocation(
+        self,
+        serialized_runtime_env_info: Optional[str],
+        task_options: Dict[str, Any],
+        caller_stacklevel: int,
+        batch: bool = False,
+    ) -> Callable:
+        """Resolve the task options and return a function that submits tasks.
+
+        The returned function can be called repeatedly to submit tasks with the
+        same options without resolving them again. It takes the args and kwargs
+        of a single task, or if `batch` is set, a list of the positional args of
+        each task to submit together. The decorator of the function isn't
+        applied to batches.
+        """
         worker = ray._private.worker.global_worker
         worker.check_connected()
 
@@ -352,9 +480,6 @@ class RemoteFunction:
             self._last_export_cluster_and_job = worker.current_cluster_and_job
             worker.function_actor_manager.export(self)
 
-        kwargs = {} if kwargs is None else kwargs
-        args = [] if args is None else args
-
         # fill task required options
         for k, v in ray_option_utils.task_options.items():
             if k == "max_retries":
@@ -409,7 +534,7 @@ class RemoteFunction:
         if scheduling_strategy is None or not isinstance(
             scheduling_strategy, PlacementGroupSchedulingStrategy
         ):
-            _warn_if_using_deprecated_placement_group(task_options, 4)
+            _warn_if_using_deprecated_placement_group(task_options, caller_stacklevel)
 
         resources = ray._private.utils.resources_from_ray_options(task_options)
 
@@ -446,31 +571,47 @@ class RemoteFunction:
             else:
                 scheduling_strategy = "DEFAULT"
 
-        if _task_launch_hook:
-            _task_launch_hook(self._function_descriptor, resources, scheduling_strategy)
-
         # Override enable_task_events to default for actor if not specified (i.e. None)
         enable_task_events = task_options.get("enable_task_events")
         labels = task_options.get("_labels")
 
-        def invocation(args, kwargs):
+        def flatten_args(args, kwargs):
             if self._is_cross_language:
-                list_args = cross_language._format_args(worker, args, kwargs)
+                return cross_language._format_args(worker, args, kwargs)
             elif not args and not kwargs and not self._function_signature:
-                list_args = []
+                return []
             else:
-                list_args = ray._private.signature.flatten_args(
+                return ray._private.signature.flatten_args(
                     self._function_signature, args, kwargs
                 )
 
-            if worker.mode == ray._private.worker.LOCAL_MODE:
-                assert (
-                    not self._is_cross_language
-                ), "Cross language remote function cannot be executed locally."
+        def to_return_value(object_refs):
+            if num_returns == STREAMING_GENERATOR_RETURN:
+                # Streaming generator will return a single ref
+                # that is for the generator task.
+                assert len(object_refs) == 1
+                generator_ref = object_refs[0]
+                return ObjectRefGenerator(generator_ref, worker)
+            if len(object_refs) == 1:
+                return object_refs[0]
+            elif len(object_refs) > 1:
+                return object_refs
+
+        if worker.mode == ray._private.worker.LOCAL_MODE:
+            assert (
+                not self._is_cross_language
+            ), "Cross language remote function cannot be executed locally."
+
+        def invocation(args, kwargs):
+            if _task_launch_hook:
+                _task_launch_hook(
+                    self._function_descriptor, resources, scheduling_strategy
+                )
+
             object_refs = worker.core_worker.submit_task(
                 self._language,
                 self._function_descriptor,
-                list_args,
+                flatten_args(args, kwargs),
                 name if name is not None else "",
                 num_returns,
                 resources,
@@ -487,21 +628,42 @@ class RemoteFunction:
             # Reset worker's debug context from the last "remote" command
             # (which applies only to this .remote call).
             worker.debugger_breakpoint = b""
-            if num_returns == STREAMING_GENERATOR_RETURN:
-                # Streaming generator will return a single ref
-                # that is for the generator task.
-                assert len(object_refs) == 1
-                generator_ref = object_refs[0]
-                return ObjectRefGenerator(generator_ref, worker)
-            if len(object_refs) == 1:
-                return object_refs[0]
-            elif len(object_refs) > 1:
-                return object_refs
+            return to_return_value(object_refs)
+
+        def batch_invocation(all_args):
+            if _task_launch_hook:
+                for _ in all_args:
+                    _task_launch_hook(
+                        self._function_descriptor, resources, scheduling_strategy
+                    )
+
+            object_refs_list = worker.core_worker.submit_tasks(
+                self._language,
+                self._function_descriptor,
+                [flatten_args(args, {}) for args in all_args],
+                name if name is not None else "",
+                num_returns,
+                resources,
+                max_retries,
+                retry_exceptions,
+                retry_exception_allowlist,
+                scheduling_strategy,
+                worker.debugger_breakpoint,
+                serialized_runtime_env_info or "{}",
+                generator_backpressure_num_objects,
+                enable_task_events,
+                labels,
+            )
+            worker.debugger_breakpoint = b""
+            return [to_return_value(object_refs) for object_refs in object_refs_list]
+
+        if batch:
+            return batch_invocation
 
         if self._decorator is not None:
             invocation = self._decorator(invocation)
 
-        return invocation(args, kwargs)
+        return invocation
 
     @DeveloperAPI
     def bind(self, *args, **kwargs):
@@ -0,0 +1,252 @@
+"""Benchmark for the controller's deployment reconciliation loop.
+
+Simulates thousands of deployments using mock replica actors, so it runs without
+a Ray cluster, and measures the latency of `DeploymentStateManager.update()` once
+all of the deployments are healthy.
+"""
+
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import Mock, patch
+
+import click
+import pandas as pd
+
+from ray.serve._private.autoscaling_state import AutoscalingStateManager
+from ray.serve._private.common import DeploymentID, DeploymentStatus, ReplicaID
+from ray.serve._private.config import DeploymentConfig, ReplicaConfig
+from ray.serve._private.deployment_info import DeploymentInfo
+from ray.serve._private.deployment_scheduler import ReplicaSchedulingRequest
+from ray.serve._private.deployment_state import (
+    DeploymentStateManager,
+    DeploymentVersion,
+    ReplicaStartupStatus,
+)
+from ray.serve._private.test_utils import (
+    MockActorHandle,
+    MockClusterNodeInfoCache,
+    MockKVStore,
+)
+
+NODE_ID = "node-id"
+
+
+class MockReplicaActorWrapper:
+    """Replica actor that starts immediately and always passes health checks."""
+
+    def __init__(self, replica_id: ReplicaID, version: DeploymentVersion):
+        self._replica_id = replica_id
+        self._version = version
+        self._actor_handle = MockActorHandle()
+        self._last_health_check_time = time.time()
+        self._health_check_period_jitter = random.uniform(0.9, 1.1)
+        self._stopped = False
+
+    @property
+    def replica_id(self) -> ReplicaID:
+        return self._replica_id
+
+    @property
+    def version(self) -> DeploymentVersion:
+        return self._version
+
+    @property
+    def is_cross_language(self) -> bool:
+        return False
+
+    @property
+    def actor_handle(self) -> MockActorHandle:
+        return self._actor_handle
+
+    @property
+    def max_ongoing_requests(self) -> int:
+        return self._version.deployment_config.max_ongoing_requests
+
+    @property
+    def graceful_shutdown_timeout_s(self) -> float:
+        return self._version.deployment_config.graceful_shutdown_timeout_s
+
+    @property
+    def health_check_period_s(self) -> float:
+        return self._version.deployment_config.health_check_period_s
+
+    @property
+    def next_health_check_time(self) -> float:
+        return (
+            self._last_health_check_time
+            + self.health_check_period_s * self._health_check_period_jitter
+        )
+
+    @property
+    def pid(self) -> Optional[int]:
+        return None
+
+    @property
+    def actor_id(self) -> Optional[str]:
+        return None
+
+    @property
+    def worker_id(self) -> Optional[str]:
+        return None
+
+    @property
+    def node_id(self) -> Optional[str]:
+        return NODE_ID
+
+    @property
+    def node_ip(self) -> Optional[str]:
+        return None
+
+    @property
+    def log_file_path(self) -> Optional[str]:
+        return None
+
+    @property
+    def initialization_latency_s(self) -> float:
+        return 0.0
+
+    @property
+    def placement_group_bundles(self) -> Optional[List[Dict[str, float]]]:
+        return None
+
+    @property
+    def actor_resources(self) -> Dict[str, float]:
+        return {"CPU": 0}
+
+    @property
+    def available_resources(self) -> Dict[str, float]:
+        return {}
+
+    def start(self, deployment_info: DeploymentInfo) -> ReplicaSchedulingRequest:
+        return ReplicaSchedulingRequest(
+            replica_id=self._replica_id,
+            actor_def=Mock(),
+            actor_resources={},
+            actor_options={"name": self._replica_id.to_full_id_str()},
+            actor_init_args=(),
+            on_scheduled=lambda *args, **kwargs: None,
+        )
+
+    def reconfigure(self, version: DeploymentVersion) -> bool:
+        updating = self._version.requires_actor_reconfigure(version)
+        self._version = version
+        return updating
+
+    def recover(self) -> bool:
+        return True
+
+    def check_ready(self) -> Tuple[ReplicaStartupStatus, Optional[str]]:
+        return ReplicaStartupStatus.SUCCEEDED, None
+
+    def resource_requirements(self) -> Tuple[str, str]:
+        return "{}", "{}"
+
+    def graceful_stop(self) -> float:
+        self._stopped = True
+        return self.graceful_shutdown_timeout_s
+
+    def check_stopped(self) -> bool:
+        return self._stopped
+
+    def force_stop(self):
+        self._stopped = True
+
+    def check_health(self) -> bool:
+        now = time.time()
+        if now > self.next_health_check_time:
+            self._last_health_check_time = now
+            self._health_check_period_jitter = random.uniform(0.9, 1.1)
+
+        return True
+
+
+def create_deployment_state_manager() -> DeploymentStateManager:
+    cluster_node_info_cache = MockClusterNodeInfoCache()
+    cluster_node_info_cache.add_node(NODE_ID)
+    return DeploymentStateManager(
+        MockKVStore(),
+        Mock(),
+        [],
+        [],
+        cluster_node_info_cache,
+        AutoscalingStateManager(),
+        head_node_id_override=NODE_ID,
+    )
+
+
+def deploy(
+    dsm: DeploymentStateManager, num_deployments: int, num_replicas_per_deployment: int
+):
+    replica_config = ReplicaConfig.create(lambda x: x)
+    for i in range(num_deployments):
+        info = DeploymentInfo(
+            version="1",
+            start_time_ms=0,
+            actor_name=f"deployment_{i}",
+            deployment_config=DeploymentConfig(
+                num_replicas=num_replicas_per_deployment
+            ),
+            replica_config=replica_config,
+            deployer_job_id="",
+        )
+        dsm.deploy(DeploymentID(name=f"deployment_{i}", app_name="app"), info)
+
+
+def run_benchmark(
+    num_deployments: int,
+    num_replicas_per_deployment: int,
+    num_iterations: int,
+    incremental_reconciliation: bool,
+) -> pd.Series:
+    with patch(
+        "ray.serve._private.deployment_state.ActorReplicaWrapper",
+        new=MockReplicaActorWrapper,
+    ):
+        dsm = create_deployment_state_manager()
+        dsm._incremental_reconciliation_enabled = incremental_reconciliation
+        deploy(dsm, num_deployments, num_replicas_per_deployment)
+
+        # Wait for all deployments to become healthy.
+        while any(
+            status.status != DeploymentStatus.HEALTHY
+            for status in dsm.get_deployment_statuses()
+        ):
+            dsm.update()
+
+        latencies = []
+        for _ in range(num_iterations):
+            start = time.perf_counter()
+            dsm.update()
+            latencies.append(1000 * (time.perf_counter() - start))
+
+        return pd.Series(latencies)
+
+
+@click.command(help="Benchmark the controller's deployment reconciliation loop.")
+@click.option("--num-deployments", type=int, default=1000)
+@click.option("--num-replicas-per-deployment", type=int, default=2)
+@click.option("--num-iterations", type=int, default=100)
+def main(
+    num_deployments: int,
+    num_replicas_per_deployment: int,
+    num_iterations: int,
+):
+    for incremental_reconciliation in [False, True]:
+        latencies = run_benchmark(
+            num_deployments,
+            num_replicas_per_deployment,
+            num_iterations,
+            incremental_reconciliation,
+        )
+        print(
+            "Latency (ms) for DeploymentStateManager.update() "
+            f"(num_deployments={num_deployments},"
+            f"num_replicas_per_deployment={num_replicas_per_deployment},"
+            f"incremental_reconciliation={incremental_reconciliation}):"
+        )
+        print(latencies.describe(percentiles=[0.5, 0.9, 0.95, 0.99]))
+
+
+if __name__ == "__main__":
+    main()
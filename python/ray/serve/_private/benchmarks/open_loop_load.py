@@ -0,0 +1,310 @@
+"""Open-loop load test against a local Serve application with stub replicas.
+
+Unlike the closed-loop benchmarks, which only send a new request once a previous
+one finishes, requests are sent on a fixed arrival schedule regardless of how
+long earlier requests take. This exposes queueing collapse in the proxy, router,
+and replicas when the offered load approaches their capacity.
+
+Latencies are measured from the time each request was *scheduled* to be sent,
+not from when it was actually sent, so stalls in the load generator itself
+aren't hidden (i.e., they're corrected for coordinated omission). The results
+are written as a JSON report that can be compared against a baseline report.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import aiohttp
+import click
+import numpy as np
+from starlette.requests import Request
+
+from ray import serve
+from ray.serve.handle import DeploymentHandle
+
+LATENCY_PERCENTILES = [50, 90, 99, 99.9]
+
+# Latency stats that are compared against the baseline report.
+GATED_LATENCY_STATS = ["p50", "p99"]
+
+
+@serve.deployment
+class StubReplica:
+    """Replica that simulates a fixed service time and response size."""
+
+    def __init__(self, service_time_ms: float, response_size: int, max_batch_size: int):
+        logging.getLogger("ray.serve").setLevel(logging.WARNING)
+        self._service_time_s = service_time_ms / 1000
+        self._response = b"x" * response_size
+        self._max_batch_size = max_batch_size
+        self.handle_batch.set_max_batch_size(max_batch_size)
+
+    async def _handle_request(self):
+        if self._service_time_s > 0:
+            await asyncio.sleep(self._service_time_s)
+
+        return self._response
+
+    @serve.batch(max_batch_size=1, batch_wait_timeout_s=0.001)
+    async def handle_batch(self, payloads: List[Any]) -> List[bytes]:
+        response = await self._handle_request()
+        return [response] * len(payloads)
+
+    async def __call__(self, payload: Any):
+        if isinstance(payload, Request):
+            payload = await payload.body()
+
+        if self._max_batch_size > 1:
+            return await self.handle_batch(payload)
+
+        return await self._handle_request()
+
+
+def poisson_arrivals(rate: float, duration_s: float, seed: int) -> List[float]:
+    """Returns the send times of a Poisson process, as offsets in seconds."""
+    rng = random.Random(seed)
+    arrivals = []
+    t = rng.expovariate(rate)
+    while t < duration_s:
+        arrivals.append(t)
+        t += rng.expovariate(rate)
+
+    return arrivals
+
+
+def recorded_arrivals(path: str, time_scale: float = 1.0) -> List[float]:
+    """Reads recorded request arrival timestamps (in seconds, one per line).
+
+    Returns the send times relative to the first arrival. They can be
+    compressed or stretched by `time_scale`.
+    """
+    with open(path) as f:
+        timestamps = sorted(float(line) for line in f if line.strip())
+
+    if len(timestamps) == 0:
+        return []
+
+    return [(t - timestamps[0]) * time_scale for t in timestamps]
+
+
+def summarize_latencies(latencies_ms: List[float]) -> Dict[str, float]:
+    if len(latencies_ms) == 0:
+        return {}
+
+    summary = {
+        f"p{p:g}": float(v)
+        for p, v in zip(
+            LATENCY_PERCENTILES, np.percentile(latencies_ms, LATENCY_PERCENTILES)
+        )
+    }
+    summary["mean"] = float(np.mean(latencies_ms))
+    summary["max"] = float(np.max(latencies_ms))
+    return summary
+
+
+async def run_open_loop_load(
+    send_request: Callable[[], Awaitable[Any]],
+    arrivals: List[float],
+) -> Dict[str, Any]:
+    """Sends a request at each arrival time without waiting for earlier ones.
+
+    Returns the latency stats, both measured from the scheduled send time
+    (`latency_ms`) and from the actual send time (`service_latency_ms`).
+    """
+    latencies_ms = []
+    service_latencies_ms = []
+    send_lags_ms = []
+    num_errors = 0
+
+    async def do_request(scheduled_time: float):
+        nonlocal num_errors
+
+        send_time = time.perf_counter()
+        try:
+            await send_request()
+        except Exception:
+            num_errors += 1
+            return
+
+        end_time = time.perf_counter()
+        latencies_ms.append(1000 * (end_time - scheduled_time))
+        service_latencies_ms.append(1000 * (end_time - send_time))
+        send_lags_ms.append(1000 * (send_time - scheduled_time))
+
+    tasks = []
+    start_time = time.perf_counter()
+    for arrival in arrivals:
+        scheduled_time = start_time + arrival
+        delay_s = scheduled_time - time.perf_counter()
+        if delay_s > 0:
+            await asyncio.sleep(delay_s)
+
+        tasks.append(asyncio.ensure_future(do_request(scheduled_time)))
+
+    await asyncio.gather(*tasks)
+    duration_s = time.perf_counter() - start_time
+
+    return {
+        "num_requests": len(arrivals),
+        "num_errors": num_errors,
+        "duration_s": duration_s,
+        "offered_rate": len(arrivals) / arrivals[-1] if len(arrivals) > 1 else 0,
+        "throughput": len(latencies_ms) / duration_s,
+        "latency_ms": summarize_latencies(latencies_ms),
+        "service_latency_ms": summarize_latencies(service_latencies_ms),
+        "max_send_lag_ms": max(send_lags_ms, default=0),
+    }
+
+
+def check_regressions(
+    report: Dict[str, Any], baseline: Dict[str, Any], max_regression: float
+) -> List[str]:
+    """Returns the gated latency stats that regressed compared to the baseline."""
+    regressions = []
+    for stat in GATED_LATENCY_STATS:
+        value = report["latency_ms"].get(stat)
+        baseline_value = baseline["latency_ms"].get(stat)
+        if value is None or baseline_value is None:
+            continue
+
+        if value > baseline_value * (1 + max_regression):
+            regressions.append(
+                f"{stat} latency regressed from {baseline_value:.2f}ms to "
+                f"{value:.2f}ms (more than {100 * max_regression:g}%)."
+            )
+
+    return regressions
+
+
+@click.command(help="Run an open-loop load test against stub Serve replicas.")
+@click.option(
+    "--target",
+    type=click.Choice(["handle", "http"]),
+    default="http",
+    help="Send requests through a deployment handle or the HTTP proxy.",
+)
+@click.option("--rate", type=float, default=100, help="Poisson arrival rate (req/s).")
+@click.option("--duration-s", type=float, default=30)
+@click.option(
+    "--arrivals-file",
+    type=str,
+    default=None,
+    help=(
+        "File of recorded arrival timestamps (in seconds, one per line) to replay "
+        "instead of Poisson arrivals."
+    ),
+)
+@click.option(
+    "--time-scale",
+    type=float,
+    default=1.0,
+    help="Factor to stretch (>1) or compress (<1) recorded arrivals by.",
+)
+@click.option("--payload-size", type=int, default=100, help="Request size (bytes).")
+@click.option("--response-size", type=int, default=100, help="Response size (bytes).")
+@click.option("--service-time-ms", type=float, default=1)
+@click.option("--num-replicas", type=int, default=1)
+@click.option("--max-ongoing-requests", type=int, default=5)
+@click.option("--max-batch-size", type=int, default=1)
+@click.option("--seed", type=int, default=0)
+@click.option("--output", type=str, default=None, help="Path to write the report.")
+@click.option(
+    "--baseline",
+    type=str,
+    default=None,
+    help="Report to compare against. Exits with an error if latency regressed.",
+)
+@click.option(
+    "--max-regression",
+    type=float,
+    default=0.1,
+    help="Allowed latency regression compared to the baseline (as a fraction).",
+)
+def main(
+    target: str,
+    rate: float,
+    duration_s: float,
+    arrivals_file: Optional[str],
+    time_scale: float,
+    payload_size: int,
+    response_size: int,
+    service_time_ms: float,
+    num_replicas: int,
+    max_ongoing_requests: int,
+    max_batch_size: int,
+    seed: int,
+    output: Optional[str],
+    baseline: Optional[str],
+    max_regression: float,
+):
+    config = {
+        "target": target,
+        "arrivals": arrivals_file or "poisson",
+        "rate": rate,
+        "duration_s": duration_s,
+        "time_scale": time_scale,
+        "payload_size": payload_size,
+        "response_size": response_size,
+        "service_time_ms": service_time_ms,
+        "num_replicas": num_replicas,
+        "max_ongoing_requests": max_ongoing_requests,
+        "max_batch_size": max_batch_size,
+        "seed": seed,
+    }
+
+    handle: DeploymentHandle = serve.run(
+        StubReplica.options(
+            num_replicas=num_replicas,
+            max_ongoing_requests=max_ongoing_requests,
+            ray_actor_options={"num_cpus": 0},
+        ).bind(service_time_ms, response_size, max_batch_size)
+    )
+
+    if arrivals_file is not None:
+        arrivals = recorded_arrivals(arrivals_file, time_scale)
+    else:
+        arrivals = poisson_arrivals(rate, duration_s, seed)
+
+    payload = b"x" * payload_size
+
+    async def run() -> Dict[str, Any]:
+        if target == "handle":
+            return await run_open_loop_load(lambda: handle.remote(payload), arrivals)
+
+        # Don't limit the number of connections, it would make the load closed-loop.
+        connector = aiohttp.TCPConnector(limit=0)
+        async with aiohttp.ClientSession(
+            connector=connector, raise_for_status=True
+        ) as session:
+
+            async def send_request():
+                async with session.post("http://localhost:8000", data=payload) as r:
+                    await r.read()
+
+            return await run_open_loop_load(send_request, arrivals)
+
+    report = {"config": config, **asyncio.new_event_loop().run_until_complete(run())}
+    print(json.dumps(report, indent=2))
+
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if baseline is not None:
+        with open(baseline) as f:
+            regressions = check_regressions(report, json.load(f), max_regression)
+
+        for regression in regressions:
+            print(regression)
+
+        if len(regressions) > 0:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -134,14 +134,24 @@ async def run_grpc_benchmark(
 
         mean, stddev = await ca.run_benchmark.remote()
 
+        config = (
+            f"(num_replicas={num_replicas}, "
+            f"tokens_per_request={tokens_per_request}, "
+            f"batch_size={batch_size})"
+        )
         print(
             "gRPC streaming throughput ({}) {}: {} +- {} tokens/s".format(
+                io_mode.upper(), config, mean, stddev
+            )
+        )
+        # Each request streams `tokens_per_request` tokens, so the request
+        # throughput is derived from the token throughput.
+        print(
+            "gRPC streaming throughput ({}) {}: {} +- {} requests/s".format(
                 io_mode.upper(),
-                f"(num_replicas={num_replicas}, "
-                f"tokens_per_request={tokens_per_request}, "
-                f"batch_size={batch_size})",
-                mean,
-                stddev,
+                config,
+                mean / tokens_per_request,
+                stddev / tokens_per_request,
             )
         )
 
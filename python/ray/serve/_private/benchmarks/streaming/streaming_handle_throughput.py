@@ -11,9 +11,14 @@ class EndpointDeployment(Endpoint):
 
 @serve.deployment
 class CallerDeployment(Caller):
+    def __init__(self, *args, coalesce_stream_results: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._coalesce_stream_results = coalesce_stream_results
+
     async def _consume_single_stream(self):
         method = self._get_remote_method().options(
             stream=True,
+            _coalesce_stream_results=self._coalesce_stream_results,
         )
 
         async for r in method.remote():
@@ -59,6 +64,15 @@ class CallerDeployment(Caller):
     default="async",
     help="Controls mode of the streaming generation (either 'sync' or 'async')",
 )
+@click.option(
+    "--coalesce-stream-results",
+    is_flag=True,
+    default=False,
+    help=(
+        "Coalesce streamed results into batches in the replica. The batching window "
+        "is set by the RAY_SERVE_STREAMING_COALESCE_WINDOW_S env var."
+    ),
+)
 def main(
     tokens_per_request: int,
     batch_size: int,
@@ -66,6 +80,7 @@ def main(
     num_trials: int,
     trial_runtime: float,
     io_mode: str,
+    coalesce_stream_results: bool,
 ):
     app = CallerDeployment.bind(
         EndpointDeployment.options(num_replicas=num_replicas).bind(tokens_per_request),
@@ -74,6 +89,7 @@ def main(
         batch_size=batch_size,
         num_trials=num_trials,
         trial_runtime=trial_runtime,
+        coalesce_stream_results=coalesce_stream_results,
     )
     h = serve.run(app)
 
@@ -83,7 +99,8 @@ def main(
             io_mode.upper(),
             f"(num_replicas={num_replicas}, "
             f"tokens_per_request={tokens_per_request}, "
-            f"batch_size={batch_size})",
+            f"batch_size={batch_size}, "
+            f"coalesce_stream_results={coalesce_stream_results})",
             mean,
             stddev,
         )
@@ -8,6 +8,7 @@ from starlette.types import Scope
 
 from ray.actor import ActorHandle
 from ray.serve._private.constants import SERVE_DEFAULT_APP_NAME
+from ray.serve._private.request_tracing import RequestTrace
 from ray.serve.generated.serve_pb2 import DeploymentStatus as DeploymentStatusProto
 from ray.serve.generated.serve_pb2 import (
     DeploymentStatusInfo as DeploymentStatusInfoProto,
@@ -532,9 +533,20 @@ class MultiplexedReplicaInfo:
 
 @dataclass
 class gRPCRequest:
-    """Sent from the GRPC proxy to replicas on both unary and streaming codepaths."""
+    """Sent from the GRPC proxy to replicas on both unary and streaming codepaths.
+
+    If `request_deserializer` is set, `grpc_user_request` contains the raw protobuf
+    bytes of the request. Otherwise, it contains the pickled request protobuf.
+    """
 
     grpc_user_request: bytes
+    request_deserializer: Optional[Callable[[bytes], Any]] = None
+
+    def deserialize_user_request(self) -> Any:
+        if self.request_deserializer is not None:
+            return self.request_deserializer(self.grpc_user_request)
+
+        return pickle.loads(self.grpc_user_request)
 
 
 class RequestProtocol(str, Enum):
@@ -574,12 +586,23 @@ class RequestMetadata:
     # If this request expects a streaming response.
     is_streaming: bool = False
 
+    # Scheduling priority of the request. Higher priority requests are scheduled
+    # first, and requests with a negative priority may be shed under overload.
+    priority: int = 0
+
+    # If the replica may coalesce multiple results of a streaming request into a
+    # single `StreamingResultBatch`.
+    coalesce_stream_results: bool = False
+
     # The protocol to serve this request
     _request_protocol: RequestProtocol = RequestProtocol.UNDEFINED
 
     # Serve's gRPC context associated with this request for getting and setting metadata
     grpc_context: Optional[RayServegRPCContext] = None
 
+    # Latency breakdown of the request, only set if the request is sampled for tracing.
+    _trace: Optional[RequestTrace] = None
+
     @property
     def is_http_request(self) -> bool:
         return self._request_protocol == RequestProtocol.HTTP
@@ -589,6 +612,17 @@ class RequestMetadata:
         return self._request_protocol == RequestProtocol.GRPC
 
 
+@dataclass
+class StreamingResultBatch:
+    """Results of a streaming request coalesced by the replica into one object.
+
+    This reduces the number of objects (and RPCs) for streams that yield many small
+    results. It is split back into the individual results by the caller.
+    """
+
+    results: List[Any]
+
+
 @dataclass
 class StreamingHTTPRequest:
     """Sent from the HTTP proxy to replicas on the streaming codepath."""
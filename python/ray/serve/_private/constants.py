@@ -213,6 +213,11 @@ SERVE_LOG_EXTRA_FIELDS = "ray_serve_extra_fields"
 # Serve HTTP request header key for routing requests.
 SERVE_MULTIPLEXED_MODEL_ID = "serve_multiplexed_model_id"
 
+# Serve HTTP request header key for the request priority. Requests with a higher
+# priority are scheduled first, and requests with a negative priority are shed
+# first when the deployment is overloaded.
+SERVE_REQUEST_PRIORITY = "serve_request_priority"
+
 # Feature flag to turn on node locality routing for proxies. On by default.
 RAY_SERVE_PROXY_PREFER_LOCAL_NODE_ROUTING = (
     os.environ.get("RAY_SERVE_PROXY_PREFER_LOCAL_NODE_ROUTING", "1") == "1"
@@ -301,6 +306,40 @@ RAY_SERVE_QUEUE_LENGTH_CACHE_TIMEOUT_S = float(
     os.environ.get("RAY_SERVE_QUEUE_LENGTH_CACHE_TIMEOUT_S", 10.0)
 )
 
+# Feature flag for replicas to push queue length updates to the routers that send
+# them requests. This keeps the queue length cache fresh so active probing on the
+# scheduling path is only needed as a fallback. Requires the queue length cache.
+RAY_SERVE_ENABLE_QUEUE_LENGTH_PUSH = (
+    os.environ.get("RAY_SERVE_ENABLE_QUEUE_LENGTH_PUSH", "0") == "1"
+)
+
+# Minimum interval between queue length updates pushed by a replica to each
+# subscribed router. Changes within this interval are coalesced.
+RAY_SERVE_QUEUE_LENGTH_PUSH_MIN_INTERVAL_S = float(
+    os.environ.get("RAY_SERVE_QUEUE_LENGTH_PUSH_MIN_INTERVAL_S", 0.01)
+)
+
+# Estimated queueing delay in the router above which requests with a negative
+# priority are rejected. The delay is estimated from the number of queued requests,
+# the capacity of the running replicas, and the average request latency.
+# Disabled (-1) by default.
+RAY_SERVE_LOW_PRIORITY_MAX_QUEUEING_DELAY_S = float(
+    os.environ.get("RAY_SERVE_LOW_PRIORITY_MAX_QUEUEING_DELAY_S", -1)
+)
+
+# Time window in which a replica waits for more results of a streaming request
+# before sending them to the caller in a single batch. This applies to HTTP
+# responses and to handle calls made with `_coalesce_stream_results=True`. If 0,
+# only the results that are already available are batched.
+RAY_SERVE_STREAMING_COALESCE_WINDOW_S = float(
+    os.environ.get("RAY_SERVE_STREAMING_COALESCE_WINDOW_S", 0)
+)
+
+# Maximum number of streaming results coalesced into a single batch.
+RAY_SERVE_STREAMING_COALESCE_MAX_ITEMS = int(
+    os.environ.get("RAY_SERVE_STREAMING_COALESCE_MAX_ITEMS", 1000)
+)
+
 # The default autoscaling policy to use if none is specified.
 DEFAULT_AUTOSCALING_POLICY = "ray.serve.autoscaling_policy:default_autoscaling_policy"
 
@@ -331,6 +370,13 @@ SERVE_GRPC_OPTIONS = [
     ("grpc.max_receive_message_length", RAY_SERVE_GRPC_MAX_MESSAGE_SIZE),
 ]
 
+# Feature flag to pass the raw protobuf bytes of gRPC requests through the proxy
+# to the replica, which deserializes them, instead of deserializing the request in
+# the proxy and pickling it again.
+RAY_SERVE_ENABLE_GRPC_FAST_PATH = (
+    os.environ.get("RAY_SERVE_ENABLE_GRPC_FAST_PATH", "0") == "1"
+)
+
 # Feature flag to eagerly start replacement replicas. This means new
 # replicas will start before waiting for old replicas to fully stop.
 RAY_SERVE_EAGERLY_START_REPLACEMENT_REPLICAS = (
@@ -350,6 +396,67 @@ RAY_SERVE_USE_COMPACT_SCHEDULING_STRATEGY = (
     os.environ.get("RAY_SERVE_USE_COMPACT_SCHEDULING_STRATEGY", "0") == "1"
 )
 
+# Minimum interval between compactions of nodes when using the compact scheduling
+# strategy. During a compaction, the replicas on a node are migrated to other
+# nodes so the node can be downscaled.
+RAY_SERVE_COMPACTION_INTERVAL_S = float(
+    os.environ.get("RAY_SERVE_COMPACTION_INTERVAL_S", 60.0)
+)
+
+# Deadline for migrating all replicas off of a node being compacted.
+RAY_SERVE_COMPACTION_TIMEOUT_S = float(
+    os.environ.get("RAY_SERVE_COMPACTION_TIMEOUT_S", 600.0)
+)
+
+# Feature flag for the controller to only reconcile deployments with pending work
+# (target updates, replica state transitions, or due health checks) on each
+# iteration of the control loop instead of walking every deployment and replica.
+RAY_SERVE_ENABLE_INCREMENTAL_RECONCILIATION = (
+    os.environ.get("RAY_SERVE_ENABLE_INCREMENTAL_RECONCILIATION", "0") == "1"
+)
+
+# Interval at which all deployments are reconciled when incremental reconciliation
+# is enabled. This is a safety net in case a state change isn't tracked.
+RAY_SERVE_FULL_RECONCILIATION_INTERVAL_S = float(
+    os.environ.get("RAY_SERVE_FULL_RECONCILIATION_INTERVAL_S", 30.0)
+)
+
+# Serialize each long poll snapshot once per update and share the serialized
+# bytes across all listeners, instead of serializing it once per listener.
+RAY_SERVE_LONG_POLL_SERIALIZE_SNAPSHOTS_ONCE = (
+    os.environ.get("RAY_SERVE_LONG_POLL_SERIALIZE_SNAPSHOTS_ONCE", "0") == "1"
+)
+
+# Feature flag to send long poll updates of list objects (e.g., running replicas)
+# as deltas from the previous snapshot when the client has it.
+RAY_SERVE_ENABLE_LONG_POLL_DELTAS = (
+    os.environ.get("RAY_SERVE_ENABLE_LONG_POLL_DELTAS", "0") == "1"
+)
+
+# Feature flag for proxies to relay long poll updates from the controller to the
+# deployment handles on their node, so the controller only has one long poll
+# client per node instead of one per handle.
+RAY_SERVE_ENABLE_LONG_POLL_RELAY = (
+    os.environ.get("RAY_SERVE_ENABLE_LONG_POLL_RELAY", "0") == "1"
+)
+
+# The long poll relay stops polling the controller for a key once none of its
+# clients have listened to the key for this long (e.g., after the deployment is
+# deleted or its handles are garbage collected).
+RAY_SERVE_LONG_POLL_RELAY_UNSUBSCRIBE_AFTER_S = float(
+    os.environ.get("RAY_SERVE_LONG_POLL_RELAY_UNSUBSCRIBE_AFTER_S", 60.0)
+)
+
+# Fraction of requests for which a per-stage latency breakdown is traced. Traced
+# requests record a histogram of the latency of each stage and are kept by the
+# controller so they can be fetched through the dashboard. Disabled if 0.
+RAY_SERVE_REQUEST_TRACE_SAMPLE_RATE = float(
+    os.environ.get("RAY_SERVE_REQUEST_TRACE_SAMPLE_RATE", "0")
+)
+
+# Maximum number of the most recent traced requests kept by the controller.
+RAY_SERVE_MAX_REQUEST_TRACES = int(os.environ.get("RAY_SERVE_MAX_REQUEST_TRACES", 100))
+
 # Feature flag to always override local_testing_mode to True in serve.run.
 # This is used for internal testing to avoid passing the flag to every invocation.
 RAY_SERVE_FORCE_LOCAL_TESTING_MODE = (
@@ -4,7 +4,8 @@ import marshal
 import os
 import pickle
 import time
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, Union
 
 import ray
 from ray._private.resource_spec import HEAD_NODE_RESOURCE_NAME
@@ -26,6 +27,7 @@ from ray.serve._private.constants import (
     CONTROLLER_MAX_CONCURRENCY,
     RAY_SERVE_CONTROLLER_CALLBACK_IMPORT_PATH,
     RAY_SERVE_ENABLE_TASK_EVENTS,
+    RAY_SERVE_MAX_REQUEST_TRACES,
     RECOVERING_LONG_POLL_BROADCAST_TIMEOUT_S,
     SERVE_CONTROLLER_NAME,
     SERVE_DEFAULT_APP_NAME,
@@ -45,6 +47,7 @@ from ray.serve._private.logging_utils import (
 )
 from ray.serve._private.long_poll import LongPollHost, LongPollNamespace
 from ray.serve._private.proxy_state import ProxyStateManager
+from ray.serve._private.request_tracing import RequestTrace
 from ray.serve._private.storage.kv_store import RayInternalKVStore
 from ray.serve._private.usage import ServeUsageTag
 from ray.serve._private.utils import (
@@ -172,6 +175,10 @@ class ServeController:
         ]
 
         self.autoscaling_state_manager = AutoscalingStateManager()
+        # Most recent requests sampled for tracing.
+        self._request_traces: Deque[RequestTrace] = deque(
+            maxlen=RAY_SERVE_MAX_REQUEST_TRACES
+        )
         self.deployment_state_manager = DeploymentStateManager(
             self.kv_store,
             self.long_poll_host,
@@ -284,6 +291,26 @@ class ServeController:
             send_timestamp=send_timestamp,
         )
 
+    def record_request_trace(self, trace: RequestTrace):
+        self._request_traces.append(trace)
+
+    def get_request_traces(
+        self, app_name: Optional[str] = None, deployment_name: Optional[str] = None
+    ) -> List[Dict]:
+        """Gets the most recent traces of sampled requests, newest first.
+
+        Args:
+            app_name: If set, only return traces of requests to this application.
+            deployment_name: If set, only return traces of requests to this
+                deployment.
+        """
+        return [
+            trace.to_dict()
+            for trace in reversed(self._request_traces)
+            if (app_name is None or trace.application == app_name)
+            and (deployment_name is None or trace.deployment == deployment_name)
+        ]
+
     def _dump_autoscaling_metrics_for_testing(self):
         return self.autoscaling_state_manager.get_metrics()
 
@@ -294,19 +321,26 @@ class ServeController:
         self.deployment_state_manager._deployment_states[
             deployment_id
         ]._stop_one_running_replica_for_testing()
+        self.deployment_state_manager._mark_dirty(deployment_id)
 
-    async def listen_for_change(self, keys_to_snapshot_ids: Dict[str, int]):
+    async def listen_for_change(
+        self, keys_to_snapshot_ids: Dict[str, int], accept_deltas: bool = False
+    ):
         """Proxy long pull client's listen request.
 
         Args:
             keys_to_snapshot_ids (Dict[str, int]): Snapshot IDs are used to
               determine whether or not the host should immediately return the
               data or wait for the value to be changed.
+            accept_deltas: Whether updates can be sent as deltas from the
+              client's snapshots.
         """
         if not self.done_recovering_event.is_set():
             await self.done_recovering_event.wait()
 
-        return await self.long_poll_host.listen_for_change(keys_to_snapshot_ids)
+        return await self.long_poll_host.listen_for_change(
+            keys_to_snapshot_ids, accept_deltas=accept_deltas
+        )
 
     async def listen_for_change_java(self, keys_to_snapshot_ids_bytes: bytes):
         """Proxy long pull client's listen request.
@@ -9,6 +9,7 @@ from ray.serve._private.cluster_node_info_cache import (
 from ray.serve._private.common import DeploymentHandleSource, DeploymentID, EndpointInfo
 from ray.serve._private.constants import (
     RAY_SERVE_ENABLE_QUEUE_LENGTH_CACHE,
+    RAY_SERVE_ENABLE_QUEUE_LENGTH_PUSH,
     RAY_SERVE_ENABLE_STRICT_MAX_ONGOING_REQUESTS,
     RAY_SERVE_PROXY_PREFER_LOCAL_AZ_ROUTING,
     RAY_SERVE_PROXY_PREFER_LOCAL_NODE_ROUTING,
@@ -116,6 +117,7 @@ def create_router(
         use_replica_queue_len_cache=(
             not is_inside_ray_client_context and RAY_SERVE_ENABLE_QUEUE_LENGTH_CACHE
         ),
+        subscribe_to_replica_queue_len_updates=RAY_SERVE_ENABLE_QUEUE_LENGTH_PUSH,
         create_replica_wrapper_func=lambda r: ActorReplicaWrapper(r),
     )
 
@@ -1,6 +1,7 @@
 import copy
 import logging
 import sys
+import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass
@@ -13,6 +14,8 @@ from ray.serve._private.cluster_node_info_cache import ClusterNodeInfoCache
 from ray.serve._private.common import DeploymentID, ReplicaID
 from ray.serve._private.config import ReplicaConfig
 from ray.serve._private.constants import (
+    RAY_SERVE_COMPACTION_INTERVAL_S,
+    RAY_SERVE_COMPACTION_TIMEOUT_S,
     RAY_SERVE_USE_COMPACT_SCHEDULING_STRATEGY,
     SERVE_LOGGER_NAME,
 )
@@ -629,6 +632,17 @@ class DeploymentScheduler(ABC):
 
 
 class DefaultDeploymentScheduler(DeploymentScheduler):
+    USE_COMPACT_SCHEDULING_STRATEGY = RAY_SERVE_USE_COMPACT_SCHEDULING_STRATEGY
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._compaction_interval_s = RAY_SERVE_COMPACTION_INTERVAL_S
+        self._compaction_timeout_s = RAY_SERVE_COMPACTION_TIMEOUT_S
+        self._last_compaction_start_time: float = 0.0
+        # The node being compacted and its deadline (timestamp in ms).
+        self._compacting_node: Optional[Tuple[str, float]] = None
+
     def schedule(
         self,
         upscales: Dict[DeploymentID, List[ReplicaSchedulingRequest]],
@@ -653,7 +667,7 @@ class DefaultDeploymentScheduler(DeploymentScheduler):
             d.is_non_strict_pack_pg() for d in self._deployments.values()
         )
         # Schedule replicas using compact strategy.
-        if RAY_SERVE_USE_COMPACT_SCHEDULING_STRATEGY and not non_strict_pack_pgs_exist:
+        if self.USE_COMPACT_SCHEDULING_STRATEGY and not non_strict_pack_pgs_exist:
             # Flatten dict of deployment replicas into all replicas,
             # then sort by decreasing resource size
             all_scheduling_requests = sorted(
@@ -664,9 +678,14 @@ class DefaultDeploymentScheduler(DeploymentScheduler):
 
             # Schedule each replica
             for scheduling_request in all_scheduling_requests:
+                available_resources_per_node = self._get_available_resources_per_node()
+                # Replicas are being migrated off of the node being compacted.
+                if self._compacting_node is not None:
+                    available_resources_per_node.pop(self._compacting_node[0], None)
+
                 target_node = self._find_best_available_node(
                     scheduling_request.required_resources,
-                    self._get_available_resources_per_node(),
+                    available_resources_per_node,
                 )
 
                 self._schedule_replica(
@@ -794,4 +813,118 @@ class DefaultDeploymentScheduler(DeploymentScheduler):
     def get_node_to_compact(
         self, allow_new_compaction: bool
     ) -> Optional[Tuple[str, float]]:
+        """Returns a node ID to be compacted and a compaction deadline.
+
+        Replicas on the returned node are migrated to other nodes by
+        starting replacement replicas before stopping the old ones, so the
+        node can be downscaled once it's idle. At most one node is compacted
+        at a time, and new compactions are started at most once every
+        `RAY_SERVE_COMPACTION_INTERVAL_S`.
+        """
+
+        if self._compacting_node is not None:
+            node_id, deadline = self._compacting_node
+            if self._is_compaction_complete(node_id):
+                logger.info(f"Finished compacting node '{node_id}'.")
+                self._compacting_node = None
+            elif time.time() * 1000 >= deadline:
+                logger.warning(
+                    f"Compaction of node '{node_id}' didn't complete before its "
+                    "deadline."
+                )
+                self._compacting_node = None
+            else:
+                return self._compacting_node
+
+        if (
+            not allow_new_compaction
+            or time.time() - self._last_compaction_start_time
+            < self._compaction_interval_s
+            or any(d.is_non_strict_pack_pg() for d in self._deployments.values())
+        ):
+            return None
+
+        node_id = self._find_node_to_compact()
+        if node_id is None:
+            return None
+
+        self._last_compaction_start_time = time.time()
+        deadline = (
+            self._last_compaction_start_time + self._compaction_timeout_s
+        ) * 1000
+        self._compacting_node = (node_id, deadline)
+        logger.info(
+            f"Compacting node '{node_id}'. Its replicas will be migrated to other "
+            "nodes."
+        )
+        return self._compacting_node
+
+    def _is_compaction_complete(self, node_id: str) -> bool:
+        if node_id not in self._cluster_node_info_cache.get_alive_node_ids():
+            return True
+
+        if self._get_node_to_running_replicas().get(node_id):
+            return False
+
+        return not any(
+            info.target_node_id == node_id
+            for replicas in self._launching_replicas.values()
+            for info in replicas.values()
+        )
+
+    def _find_node_to_compact(self) -> Optional[str]:
+        """Finds a node whose replicas can all be moved onto other nodes.
+
+        Only nodes that are already running replicas are considered as
+        targets, so that a compaction always reduces the number of nodes in
+        use. Nodes running the fewest resources are tried first since they
+        are the cheapest to migrate.
+        """
+
+        available_resources_per_node = self._get_available_resources_per_node()
+        node_to_running_replicas = self._get_node_to_running_replicas()
+
+        def get_required_resources(replica_id: ReplicaID) -> Resources:
+            return self._deployments[replica_id.deployment_id].required_resources
+
+        candidates = []
+        for node_id in available_resources_per_node:
+            if node_id == self._head_node_id or not node_to_running_replicas.get(
+                node_id
+            ):
+                continue
+
+            used_resources = sum(
+                [
+                    get_required_resources(replica_id)
+                    for replica_id in node_to_running_replicas[node_id]
+                ],
+                Resources(),
+            )
+            candidates.append((used_resources, node_id))
+
+        for _, node_id in sorted(candidates):
+            remaining_resources_per_node = {
+                other_node_id: Resources(resources)
+                for other_node_id, resources in available_resources_per_node.items()
+                if other_node_id != node_id
+                and node_to_running_replicas.get(other_node_id)
+            }
+            for required_resources in sorted(
+                [
+                    get_required_resources(replica_id)
+                    for replica_id in node_to_running_replicas[node_id]
+                ],
+                reverse=True,
+            ):
+                target_node_id = self._best_fit_node(
+                    required_resources, remaining_resources_per_node
+                )
+                if target_node_id is None:
+                    break
+
+                remaining_resources_per_node[target_node_id] -= required_resources
+            else:
+                return node_id
+
         return None
@@ -36,8 +36,10 @@ from ray.serve._private.config import DeploymentConfig
 from ray.serve._private.constants import (
     MAX_DEPLOYMENT_CONSTRUCTOR_RETRY_COUNT,
     RAY_SERVE_EAGERLY_START_REPLACEMENT_REPLICAS,
+    RAY_SERVE_ENABLE_INCREMENTAL_RECONCILIATION,
     RAY_SERVE_ENABLE_TASK_EVENTS,
     RAY_SERVE_FORCE_STOP_UNHEALTHY_REPLICAS,
+    RAY_SERVE_FULL_RECONCILIATION_INTERVAL_S,
     RAY_SERVE_USE_COMPACT_SCHEDULING_STRATEGY,
     REPLICA_HEALTH_CHECK_UNHEALTHY_THRESHOLD,
     SERVE_LOGGER_NAME,
@@ -241,6 +243,9 @@ class ActorReplicaWrapper:
         self._healthy: bool = True
         self._health_check_ref: Optional[ObjectRef] = None
         self._last_health_check_time: float = 0.0
+        # Randomize the health check period to avoid synchronizing health checks
+        # across all replicas. Resampled each time a health check is started.
+        self._health_check_period_jitter: float = random.uniform(0.9, 1.1)
         self._consecutive_health_check_failures = 0
         self._initialization_latency_s: Optional[float] = None
         self._port: Optional[int] = None
@@ -825,11 +830,23 @@ class ActorReplicaWrapper:
 
         # If there's no active health check, kick off another and reset
         # the timer if it's been long enough since the last health
-        # check. Add some randomness to avoid synchronizing across all
-        # replicas.
-        time_since_last = time.time() - self._last_health_check_time
-        randomized_period = self.health_check_period_s * random.uniform(0.9, 1.1)
-        return time_since_last > randomized_period
+        # check.
+        return time.time() > self.next_health_check_time
+
+    @property
+    def next_health_check_time(self) -> float:
+        """Time at which `check_health` next needs to be called.
+
+        If there's an active health check, it should be checked for a result
+        right away so this returns 0.
+        """
+        if self._health_check_ref is not None:
+            return 0.0
+
+        return (
+            self._last_health_check_time
+            + self.health_check_period_s * self._health_check_period_jitter
+        )
 
     def check_health(self) -> bool:
         """Check if the actor is healthy.
@@ -881,6 +898,7 @@ class ActorReplicaWrapper:
 
         if self._should_start_new_health_check():
             self._last_health_check_time = time.time()
+            self._health_check_period_jitter = random.uniform(0.9, 1.1)
             self._health_check_ref = self._actor_handle.check_health.remote()
 
         return self._healthy
@@ -1073,6 +1091,10 @@ class DeploymentReplica:
         """
         return self._actor.check_health()
 
+    @property
+    def next_health_check_time(self) -> float:
+        return self._actor.next_health_check_time
+
     def update_state(self, state: ReplicaState) -> None:
         """Updates state in actor details."""
         self.update_actor_details(state=state)
@@ -1303,6 +1325,42 @@ class DeploymentState:
         """
         return self._id in self._autoscaling_state_manager._autoscaling_states
 
+    def get_next_reconcile_time(self) -> Optional[float]:
+        """Returns the time at which this deployment next needs to be reconciled.
+
+        A deployment is settled if it's healthy, isn't autoscaling, and all of its
+        replicas are RUNNING at the target version. Settled deployments only need
+        to be reconciled when one of their replicas is due for a health check.
+
+        Returns None if the deployment isn't settled, in which case it should be
+        reconciled on every iteration of the control loop.
+        """
+        if (
+            self._target_state.deleting
+            or self._multiplexed_model_ids_updated
+            or self._curr_status_info.status != DeploymentStatus.HEALTHY
+            or self.should_autoscale()
+        ):
+            return None
+
+        running_replicas = self._replicas.get([ReplicaState.RUNNING])
+        num_running = len(running_replicas)
+        if num_running != self._target_state.target_num_replicas:
+            return None
+        if self._replicas.count() != num_running:
+            return None
+
+        next_reconcile_time = math.inf
+        for replica in running_replicas:
+            if replica.version != self._target_state.version:
+                return None
+
+            next_reconcile_time = min(
+                next_reconcile_time, replica.next_health_check_time
+            )
+
+        return next_reconcile_time
+
     def get_checkpoint_data(self) -> DeploymentTargetState:
         """
         Return deployment's target state submitted by user's deployment call.
@@ -2370,6 +2428,15 @@ class DeploymentStateManager:
 
         self._deployment_states: Dict[DeploymentID, DeploymentState] = dict()
 
+        # Used for incremental reconciliation. Settled deployments are mapped to
+        # the time at which they next need to be reconciled; all other
+        # deployments are reconciled on every iteration of the control loop.
+        self._incremental_reconciliation_enabled = (
+            RAY_SERVE_ENABLE_INCREMENTAL_RECONCILIATION
+        )
+        self._next_reconcile_times: Dict[DeploymentID, float] = dict()
+        self._last_full_reconcile_time: float = 0.0
+
         self._recover_from_checkpoint(
             all_current_actor_names, all_current_placement_group_names
         )
@@ -2545,6 +2612,9 @@ class DeploymentStateManager:
 
         if writeahead_checkpoints is not None:
             deployment_state_info.update(writeahead_checkpoints)
+            # The target state of these deployments is being updated.
+            for deployment_id in writeahead_checkpoints:
+                self._mark_dirty(deployment_id)
 
         self._kv_store.put(
             CHECKPOINT_KEY,
@@ -2662,9 +2732,42 @@ class DeploymentStateManager:
         if id in self._deployment_states:
             self._deployment_states[id].delete()
 
+    def _mark_dirty(self, deployment_id: DeploymentID):
+        """Reconcile the deployment on the next iteration of the control loop."""
+        self._next_reconcile_times.pop(deployment_id, None)
+
+    def _get_deployment_states_to_reconcile(
+        self,
+    ) -> Dict[DeploymentID, DeploymentState]:
+        """Get the deployments to reconcile in this iteration of the control loop.
+
+        If incremental reconciliation is disabled, this is all deployments.
+        Otherwise, settled deployments are skipped until one of their replicas is
+        due for a health check. All deployments are still periodically reconciled
+        in case a state change wasn't tracked.
+        """
+        now = time.time()
+        if (
+            not self._incremental_reconciliation_enabled
+            or now - self._last_full_reconcile_time
+            >= RAY_SERVE_FULL_RECONCILIATION_INTERVAL_S
+        ):
+            self._last_full_reconcile_time = now
+            self._next_reconcile_times.clear()
+            return self._deployment_states
+
+        return {
+            deployment_id: deployment_state
+            for deployment_id, deployment_state in self._deployment_states.items()
+            if self._next_reconcile_times.get(deployment_id, 0) <= now
+        }
+
     def update(self) -> bool:
         """Updates the state of all deployments to match their goal state.
 
+        If incremental reconciliation is enabled, only deployments with pending
+        work are updated (see `_get_deployment_states_to_reconcile`).
+
         Returns True if any of the deployments have replicas in the RECOVERING state.
         """
 
@@ -2672,32 +2775,34 @@ class DeploymentStateManager:
         any_recovering = False
         upscales: Dict[DeploymentID, List[ReplicaSchedulingRequest]] = {}
         downscales: Dict[DeploymentID, DeploymentDownscaleRequest] = {}
+        deployment_states = self._get_deployment_states_to_reconcile()
 
         # STEP 1: Update current state
-        for deployment_state in self._deployment_states.values():
+        for deployment_state in deployment_states.values():
             if deployment_state.should_autoscale():
                 deployment_state.autoscale()
 
             deployment_state.check_and_update_replicas()
 
         # STEP 2: Check current status
-        for deployment_state in self._deployment_states.values():
+        for deployment_state in deployment_states.values():
             deployment_state.check_curr_status()
 
         # STEP 3: Drain nodes
         draining_nodes = self._cluster_node_info_cache.get_draining_nodes()
-        allow_new_compaction = len(draining_nodes) == 0 and all(
-            ds.curr_status_info.status == DeploymentStatus.HEALTHY
-            # TODO(zcin): Make sure that status should never be healthy if
-            # the number of running replicas at target version is not at
-            # target number, so we can remove this defensive check.
-            and ds.get_num_running_replicas(ds.target_version) == ds.target_num_replicas
-            # To be extra conservative, only actively compact if there
-            # are no non-running replicas
-            and len(ds._replicas.get()) == ds.target_num_replicas
-            for ds in self._deployment_states.values()
-        )
         if RAY_SERVE_USE_COMPACT_SCHEDULING_STRATEGY:
+            allow_new_compaction = len(draining_nodes) == 0 and all(
+                ds.curr_status_info.status == DeploymentStatus.HEALTHY
+                # TODO(zcin): Make sure that status should never be healthy if
+                # the number of running replicas at target version is not at
+                # target number, so we can remove this defensive check.
+                and ds.get_num_running_replicas(ds.target_version)
+                == ds.target_num_replicas
+                # To be extra conservative, only actively compact if there
+                # are no non-running replicas
+                and len(ds._replicas.get()) == ds.target_num_replicas
+                for ds in self._deployment_states.values()
+            )
             # Tuple of target node to compact, and its draining deadline
             node_info: Optional[
                 Tuple[str, float]
@@ -2708,11 +2813,15 @@ class DeploymentStateManager:
                 target_node_id, deadline = node_info
                 draining_nodes = {target_node_id: deadline}
 
-        for deployment_id, deployment_state in self._deployment_states.items():
+        if draining_nodes:
+            # Any deployment may have replicas on the draining nodes.
+            deployment_states = self._deployment_states
+
+        for deployment_id, deployment_state in deployment_states.items():
             deployment_state.migrate_replicas_on_draining_nodes(draining_nodes)
 
         # STEP 4: Scale replicas
-        for deployment_id, deployment_state in self._deployment_states.items():
+        for deployment_id, deployment_state in deployment_states.items():
             upscale, downscale = deployment_state.scale_deployment_replicas()
 
             if upscale:
@@ -2721,7 +2830,7 @@ class DeploymentStateManager:
                 downscales[deployment_id] = downscale
 
         # STEP 5: Update status
-        for deployment_id, deployment_state in self._deployment_states.items():
+        for deployment_id, deployment_state in deployment_states.items():
             deleted, any_replicas_recovering = deployment_state.check_curr_status()
 
             if deleted:
@@ -2738,7 +2847,7 @@ class DeploymentStateManager:
             self._handle_scheduling_request_failures(deployment_id, scheduling_requests)
 
         # STEP 7: Broadcast long poll information
-        for deployment_id, deployment_state in self._deployment_states.items():
+        for deployment_id, deployment_state in deployment_states.items():
             deployment_state.broadcast_running_replicas_if_changed()
             deployment_state.broadcast_deployment_config_if_changed()
             if deployment_state.should_autoscale():
@@ -2752,6 +2861,19 @@ class DeploymentStateManager:
             self._deployment_scheduler.on_deployment_deleted(deployment_id)
             self._autoscaling_state_manager.deregister_deployment(deployment_id)
             del self._deployment_states[deployment_id]
+            self._mark_dirty(deployment_id)
+
+        # STEP 9: Record when settled deployments next need to be reconciled
+        if self._incremental_reconciliation_enabled:
+            for deployment_id, deployment_state in deployment_states.items():
+                if deployment_id in deleted_ids:
+                    continue
+
+                next_reconcile_time = deployment_state.get_next_reconcile_time()
+                if next_reconcile_time is None:
+                    self._mark_dirty(deployment_id)
+                else:
+                    self._next_reconcile_times[deployment_id] = next_reconcile_time
 
         if len(deleted_ids):
             self._record_deployment_usage()
@@ -2829,6 +2951,7 @@ class DeploymentStateManager:
         self._deployment_states[deployment_id].record_multiplexed_model_ids(
             info.replica_id, info.model_ids
         )
+        self._mark_dirty(deployment_id)
 
     def get_active_node_ids(self) -> Set[str]:
         """Return set of node ids with running replicas of any deployment.
@@ -3,7 +3,10 @@ from typing import Sequence
 import grpc
 from grpc.aio._server import Server
 
-from ray.serve._private.constants import SERVE_GRPC_OPTIONS
+from ray.serve._private.constants import (
+    RAY_SERVE_ENABLE_GRPC_FAST_PATH,
+    SERVE_GRPC_OPTIONS,
+)
 
 
 class gRPCServer(Server):
@@ -13,9 +16,16 @@ class gRPCServer(Server):
         60c1701f87cacf359aa1ad785728549eeef1a4b0/src/python/grpcio/grpc/aio/_server.py
     """
 
-    def __init__(self, service_handler_factory, *args, **kwargs):
+    def __init__(
+        self,
+        service_handler_factory,
+        *args,
+        pass_through_request_bytes: bool = False,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.service_handler_factory = service_handler_factory
+        self.pass_through_request_bytes = pass_through_request_bytes
         self.generic_rpc_handlers = []
 
     def add_generic_rpc_handlers(
@@ -30,19 +40,32 @@ class gRPCServer(Server):
             `self.service_handler_factory`
             3. `unary_stream` is always calling the streaming function generated via
             `self.service_handler_factory`
+
+        If `pass_through_request_bytes` is set, the `request_deserializer` is also
+        overridden to None so the server passes the raw request bytes to the
+        handlers. The original deserializer is passed to the factory instead.
         """
         serve_rpc_handlers = {}
         rpc_handler = generic_rpc_handlers[0]
         for service_method, method_handler in rpc_handler._method_handlers.items():
+            factory_kwargs = {}
+            request_deserializer = method_handler.request_deserializer
+            if self.pass_through_request_bytes and request_deserializer is not None:
+                factory_kwargs["request_deserializer"] = request_deserializer
+                request_deserializer = None
+
             serve_method_handler = method_handler._replace(
+                request_deserializer=request_deserializer,
                 response_serializer=None,
                 unary_unary=self.service_handler_factory(
                     service_method=service_method,
                     stream=False,
+                    **factory_kwargs,
                 ),
                 unary_stream=self.service_handler_factory(
                     service_method=service_method,
                     stream=True,
+                    **factory_kwargs,
                 ),
             )
             serve_rpc_handlers[service_method] = serve_method_handler
@@ -51,7 +74,10 @@ class gRPCServer(Server):
         super().add_generic_rpc_handlers(generic_rpc_handlers)
 
 
-def create_serve_grpc_server(service_handler_factory):
+def create_serve_grpc_server(
+    service_handler_factory,
+    pass_through_request_bytes: bool = RAY_SERVE_ENABLE_GRPC_FAST_PATH,
+):
     """Custom function to create Serve's gRPC server.
 
     This function works similar to `grpc.server()`, but it creates a Serve defined
@@ -67,6 +93,7 @@ def create_serve_grpc_server(service_handler_factory):
         maximum_concurrent_rpcs=None,
         compression=None,
         service_handler_factory=service_handler_factory,
+        pass_through_request_bytes=pass_through_request_bytes,
     )
 
 
@@ -2,16 +2,34 @@ import asyncio
 import logging
 import os
 import random
+import time
 from asyncio.events import AbstractEventLoop
 from collections import defaultdict
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Callable, DefaultDict, Dict, Optional, Set, Tuple, Union
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import ray
+from ray import cloudpickle
 from ray._private.utils import get_or_create_event_loop
-from ray.serve._private.constants import SERVE_LOGGER_NAME
+from ray.serve._private.constants import (
+    RAY_SERVE_ENABLE_LONG_POLL_DELTAS,
+    RAY_SERVE_LONG_POLL_RELAY_UNSUBSCRIBE_AFTER_S,
+    RAY_SERVE_LONG_POLL_SERIALIZE_SNAPSHOTS_ONCE,
+    SERVE_LOGGER_NAME,
+)
 from ray.serve.generated.serve_pb2 import ActorNameList
 from ray.serve.generated.serve_pb2 import EndpointInfo as EndpointInfoProto
 from ray.serve.generated.serve_pb2 import EndpointSet, LongPollRequest, LongPollResult
@@ -43,12 +61,86 @@ class LongPollNamespace(Enum):
     DEPLOYMENT_CONFIG = auto()
 
 
+@dataclass
+class ListSnapshotDelta:
+    """Delta between two snapshots of a list object.
+
+    The new snapshot consists of the items of the base snapshot that weren't
+    removed, in order, followed by the added items.
+    """
+
+    base_snapshot_id: int
+    removed_indices: List[int]
+    added: List[Any]
+
+    def apply(self, base_snapshot: List[Any]) -> List[Any]:
+        removed_indices = set(self.removed_indices)
+        return [
+            item for i, item in enumerate(base_snapshot) if i not in removed_indices
+        ] + list(self.added)
+
+    @classmethod
+    def compute(
+        cls, base_snapshot_id: int, base_snapshot: Any, new_snapshot: Any
+    ) -> Optional["ListSnapshotDelta"]:
+        """Computes the delta between two snapshots.
+
+        Returns None if the snapshots aren't lists of hashable items, or if the
+        delta wouldn't be smaller than the new snapshot.
+        """
+        if not isinstance(base_snapshot, list) or not isinstance(new_snapshot, list):
+            return None
+
+        try:
+            new_items = set(new_snapshot)
+        except TypeError:
+            return None
+
+        removed_indices = [
+            i for i, item in enumerate(base_snapshot) if item not in new_items
+        ]
+        num_kept = len(base_snapshot) - len(removed_indices)
+        delta = cls(base_snapshot_id, removed_indices, new_snapshot[num_kept:])
+        if len(removed_indices) + len(delta.added) >= len(new_snapshot):
+            return None
+
+        # The delta doesn't preserve the order of the new snapshot.
+        if delta.apply(base_snapshot) != new_snapshot:
+            return None
+
+        return delta
+
+
+def _deserialize_updated_object(serialized: bytes) -> "UpdatedObject":
+    return UpdatedObject(*cloudpickle.loads(serialized))
+
+
 @dataclass
 class UpdatedObject:
     object_snapshot: Any
     # The identifier for the object's version. There is not sequential relation
     # among different object's snapshot_ids.
     snapshot_id: int
+    # If set, `object_snapshot` is None and the snapshot is computed by applying
+    # the delta to the client's snapshot with ID `delta.base_snapshot_id`.
+    delta: Optional[ListSnapshotDelta] = None
+    # If set, the object is only serialized the first time it's sent, and the
+    # serialized bytes are reused when it's sent to other clients.
+    serialize_once: bool = field(default=False, compare=False, repr=False)
+
+    def __post_init__(self):
+        self._serialized: Optional[bytes] = None
+
+    def __reduce__(self):
+        if self.serialize_once:
+            if self._serialized is None:
+                self._serialized = cloudpickle.dumps(
+                    (self.object_snapshot, self.snapshot_id, self.delta)
+                )
+
+            return _deserialize_updated_object, (self._serialized,)
+
+        return UpdatedObject, (self.object_snapshot, self.snapshot_id, self.delta)
 
 
 # Type signature for the update state callbacks. E.g.
@@ -71,6 +163,10 @@ class LongPollClient:
           callbacks to be called on state update for the corresponding keys.
         call_in_event_loop: an asyncio event loop
           to post the callback into.
+        accept_deltas: whether to ask the host to send updates of list
+          objects as deltas from the client's current snapshot.
+        fallback_host_actor: handle to actor embedding LongPollHost to
+          poll if `host_actor` dies (e.g., if `host_actor` is a relay).
     """
 
     def __init__(
@@ -78,6 +174,9 @@ class LongPollClient:
         host_actor,
         key_listeners: Dict[KeyType, UpdateStateCallable],
         call_in_event_loop: AbstractEventLoop,
+        *,
+        accept_deltas: bool = RAY_SERVE_ENABLE_LONG_POLL_DELTAS,
+        fallback_host_actor=None,
     ) -> None:
         assert len(key_listeners) > 0
         # We used to allow this to be optional, but due to Ray Client issue
@@ -97,8 +196,20 @@ class LongPollClient:
         }
         self.is_running = True
 
+        self._accept_deltas = accept_deltas
+        # The latest snapshot for each key, used to apply deltas.
+        self._object_snapshots: Dict[KeyType, Any] = {}
+        self._fallback_host_actor = fallback_host_actor
+
         self._poll_next()
 
+    def stop(self):
+        """Stop polling the host.
+
+        Updates returned by the in-flight poll, if any, are dropped.
+        """
+        self.is_running = False
+
     def _on_callback_completed(self, trigger_at: int):
         """Called after a single callback is completed.
 
@@ -115,10 +226,31 @@ class LongPollClient:
         """Poll the update. The callback is expected to scheduler another
         _poll_next call.
         """
+        if not self.is_running:
+            return
+
         self._callbacks_processed_count = 0
-        self._current_ref = self.host_actor.listen_for_change.remote(self.snapshot_ids)
+        if self._accept_deltas:
+            self._current_ref = self.host_actor.listen_for_change.remote(
+                self.snapshot_ids, accept_deltas=True
+            )
+        else:
+            self._current_ref = self.host_actor.listen_for_change.remote(
+                self.snapshot_ids
+            )
         self._current_ref._on_completed(lambda update: self._process_update(update))
 
+    def _switch_to_fallback_host(self):
+        logger.info(
+            "LongPollClient failed to connect to host. Falling back to "
+            f"{self._fallback_host_actor}."
+        )
+        self.host_actor = self._fallback_host_actor
+        self._fallback_host_actor = None
+        # Snapshot IDs aren't comparable across hosts.
+        self.snapshot_ids = {key: -1 for key in self.key_listeners.keys()}
+        self._object_snapshots.clear()
+
     def _schedule_to_event_loop(self, callback):
         # Schedule the next iteration only if the loop is running.
         # The event loop might not be running if users used a cached
@@ -130,7 +262,15 @@ class LongPollClient:
             self.is_running = False
 
     def _process_update(self, updates: Dict[str, UpdatedObject]):
+        if not self.is_running:
+            return
+
         if isinstance(updates, (ray.exceptions.RayActorError)):
+            if self._fallback_host_actor is not None:
+                self._switch_to_fallback_host()
+                self._schedule_to_event_loop(self._poll_next)
+                return
+
             # This can happen during shutdown where the controller is
             # intentionally killed, the client should just gracefully
             # exit.
@@ -163,13 +303,35 @@ class LongPollClient:
             extra={"log_to_stderr": False},
         )
         for key, update in updates.items():
-            self.snapshot_ids[key] = update.snapshot_id
             callback = self.key_listeners[key]
+            object_snapshot = update.object_snapshot
+            if update.delta is not None:
+                if (
+                    key not in self._object_snapshots
+                    or update.delta.base_snapshot_id != self.snapshot_ids[key]
+                ):
+                    # The host only sends a delta from the snapshot that the
+                    # client has, so this shouldn't happen. Request the full
+                    # snapshot in the next poll.
+                    logger.warning(
+                        f"LongPollClient received a delta for key {key} that "
+                        "doesn't apply to its snapshot."
+                    )
+                    self.snapshot_ids[key] = -1
+                    callback = None
+                else:
+                    object_snapshot = update.delta.apply(self._object_snapshots[key])
+
+            if callback is not None:
+                self.snapshot_ids[key] = update.snapshot_id
+                if self._accept_deltas:
+                    self._object_snapshots[key] = object_snapshot
 
             # Bind the parameters because closures are late-binding.
             # https://docs.python-guide.org/writing/gotchas/#late-binding-closures # noqa: E501
-            def chained(callback=callback, arg=update.object_snapshot):
-                callback(arg)
+            def chained(callback=callback, arg=object_snapshot):
+                if callback is not None:
+                    callback(arg)
                 self._on_callback_completed(trigger_at=len(updates))
 
             self._schedule_to_event_loop(chained)
@@ -187,6 +349,11 @@ class LongPollHost:
     outdated object and immediately return the result. If the client has the
     up-to-date version, then the listen_for_change call will only return when
     the object is updated.
+
+    The update sent for each snapshot is created once in notify_changed and
+    shared by all clients. If `serialize_snapshots_once` is set, it's also only
+    serialized once. If `enable_deltas` is set, clients that have the previous
+    snapshot of a list object are sent the delta from it instead.
     """
 
     def __init__(
@@ -194,11 +361,21 @@ class LongPollHost:
         listen_for_change_request_timeout_s: Tuple[
             int, int
         ] = LISTEN_FOR_CHANGE_REQUEST_TIMEOUT_S,
+        *,
+        serialize_snapshots_once: bool = RAY_SERVE_LONG_POLL_SERIALIZE_SNAPSHOTS_ONCE,
+        enable_deltas: bool = RAY_SERVE_ENABLE_LONG_POLL_DELTAS,
     ):
         # Map object_key -> int
         self.snapshot_ids: Dict[KeyType, int] = {}
         # Map object_key -> object
         self.object_snapshots: Dict[KeyType, Any] = {}
+        # Map object_key -> update sent to clients for the current snapshot.
+        self._updated_objects: Dict[KeyType, UpdatedObject] = {}
+        # Map object_key -> update containing the delta from the previous
+        # snapshot, if any.
+        self._updated_object_deltas: Dict[KeyType, UpdatedObject] = {}
+        self._serialize_snapshots_once = serialize_snapshots_once
+        self._enable_deltas = enable_deltas
         # Map object_key -> set(asyncio.Event waiting for updates)
         self.notifier_events: DefaultDict[KeyType, Set[asyncio.Event]] = defaultdict(
             set
@@ -240,15 +417,32 @@ class LongPollHost:
                     value=1, tags={"namespace_or_state": str(key)}
                 )
 
+    def _get_updated_object(
+        self, key: KeyType, client_snapshot_id: int, accept_deltas: bool
+    ) -> UpdatedObject:
+        if accept_deltas:
+            updated_object_delta = self._updated_object_deltas.get(key)
+            if (
+                updated_object_delta is not None
+                and updated_object_delta.delta.base_snapshot_id == client_snapshot_id
+            ):
+                return updated_object_delta
+
+        return self._updated_objects[key]
+
     async def listen_for_change(
         self,
         keys_to_snapshot_ids: Dict[KeyType, int],
+        accept_deltas: bool = False,
     ) -> Union[LongPollState, Dict[KeyType, UpdatedObject]]:
         """Listen for changed objects.
 
         This method will returns a dictionary of updated objects. It returns
         immediately if the snapshot_ids are outdated, otherwise it will block
         until there's an update.
+
+        If `accept_deltas` is set, updates of list objects may be sent as
+        deltas from the client's snapshot.
         """
         # If there are any keys with outdated snapshot ids,
         # return their updated values immediately.
@@ -265,8 +459,8 @@ class LongPollHost:
                 continue
 
             if existing_id != client_snapshot_id:
-                updated_objects[key] = UpdatedObject(
-                    self.object_snapshots[key], existing_id
+                updated_objects[key] = self._get_updated_object(
+                    key, client_snapshot_id, accept_deltas
                 )
         if len(updated_objects) > 0:
             self._count_send(updated_objects)
@@ -310,9 +504,10 @@ class LongPollHost:
             updated_objects = {}
             for task in done:
                 updated_object_key = async_task_to_watched_keys[task]
-                updated_objects[updated_object_key] = UpdatedObject(
-                    self.object_snapshots[updated_object_key],
-                    self.snapshot_ids[updated_object_key],
+                updated_objects[updated_object_key] = self._get_updated_object(
+                    updated_object_key,
+                    keys_to_snapshot_ids[updated_object_key],
+                    accept_deltas,
                 )
             self._count_send(updated_objects)
             return updated_objects
@@ -410,6 +605,8 @@ class LongPollHost:
         and notify any long poll clients.
         """
         for object_key, updated_object in updates.items():
+            prev_snapshot_id = self.snapshot_ids.get(object_key)
+            prev_snapshot = self.object_snapshots.get(object_key)
             try:
                 self.snapshot_ids[object_key] += 1
             except KeyError:
@@ -419,7 +616,134 @@ class LongPollHost:
                 # https://github.com/ray-project/ray/pull/45881#discussion_r1645243485
                 self.snapshot_ids[object_key] = random.randint(0, 1_000_000)
             self.object_snapshots[object_key] = updated_object
+
+            snapshot_id = self.snapshot_ids[object_key]
+            self._updated_objects[object_key] = UpdatedObject(
+                updated_object,
+                snapshot_id,
+                serialize_once=self._serialize_snapshots_once,
+            )
+            self._updated_object_deltas.pop(object_key, None)
+            if self._enable_deltas and prev_snapshot_id is not None:
+                delta = ListSnapshotDelta.compute(
+                    prev_snapshot_id, prev_snapshot, updated_object
+                )
+                if delta is not None:
+                    self._updated_object_deltas[object_key] = UpdatedObject(
+                        None,
+                        snapshot_id,
+                        delta=delta,
+                        serialize_once=self._serialize_snapshots_once,
+                    )
             logger.debug(f"LongPollHost: Notify change for key {object_key}.")
 
             for event in self.notifier_events.pop(object_key, set()):
                 event.set()
+
+    def remove_key(self, object_key: KeyType) -> None:
+        """Remove the snapshot of an object that's no longer listened to.
+
+        Clients listening to the key aren't notified.
+        """
+        self.snapshot_ids.pop(object_key, None)
+        self.object_snapshots.pop(object_key, None)
+        self._updated_objects.pop(object_key, None)
+        self._updated_object_deltas.pop(object_key, None)
+
+
+class LongPollRelay:
+    """Relays long poll updates from a host to clients on the same node.
+
+    The relay is embedded in an actor on each node, and clients on that node
+    call the actor's `listen_for_change` instead of the upstream host's. The
+    relay only polls the upstream host once for each key that its clients
+    listen to, so the upstream host has one client per node instead of one per
+    client process.
+
+    Once none of its clients have listened to a key for `unsubscribe_after_s`,
+    the relay stops polling the upstream host for it.
+
+    Args:
+        upstream_host_actor: handle to actor embedding the upstream LongPollHost.
+        call_in_event_loop: the event loop that the relay runs in.
+        unsubscribe_after_s: how long a key can go without listeners before the
+            relay unsubscribes from it.
+    """
+
+    def __init__(
+        self,
+        upstream_host_actor,
+        call_in_event_loop: AbstractEventLoop,
+        unsubscribe_after_s: float = RAY_SERVE_LONG_POLL_RELAY_UNSUBSCRIBE_AFTER_S,
+    ):
+        self._upstream_host_actor = upstream_host_actor
+        self._event_loop = call_in_event_loop
+        self._unsubscribe_after_s = unsubscribe_after_s
+        self._host = LongPollHost()
+        self._upstream_clients: Dict[KeyType, LongPollClient] = {}
+        # Map key -> number of in-flight listen_for_change calls for the key.
+        self._num_listeners: DefaultDict[KeyType, int] = defaultdict(int)
+        # Map key -> time the last listen_for_change call for the key returned.
+        self._last_listened_s: Dict[KeyType, float] = {}
+
+        self._event_loop.call_soon_threadsafe(self._unsubscribe_unused_keys)
+
+    def _subscribe(self, key: KeyType):
+        client = self._upstream_clients.get(key)
+        if client is not None and client.is_running:
+            return
+
+        self._upstream_clients[key] = LongPollClient(
+            self._upstream_host_actor,
+            {key: partial(self._on_update, key)},
+            call_in_event_loop=self._event_loop,
+        )
+
+    def _unsubscribe(self, key: KeyType):
+        logger.debug(f"LongPollRelay: Unsubscribing from key {key}.")
+        self._upstream_clients.pop(key).stop()
+        self._last_listened_s.pop(key, None)
+        self._host.remove_key(key)
+
+    def _unsubscribe_unused_keys(self):
+        """Unsubscribe from keys that haven't had listeners for a while.
+
+        Reschedules itself to run periodically on the relay's event loop.
+        """
+        now = time.time()
+        for key in list(self._upstream_clients.keys()):
+            if (
+                self._num_listeners[key] == 0
+                and now - self._last_listened_s.get(key, now)
+                >= self._unsubscribe_after_s
+            ):
+                self._unsubscribe(key)
+
+        # Drop the counters of keys without listeners.
+        for key in [k for k, n in self._num_listeners.items() if n == 0]:
+            del self._num_listeners[key]
+
+        check_interval_s = min(max(self._unsubscribe_after_s, 0.1), 10)
+        self._event_loop.call_later(check_interval_s, self._unsubscribe_unused_keys)
+
+    def _on_update(self, key: KeyType, object_snapshot: Any):
+        self._host.notify_changed({key: object_snapshot})
+
+    async def listen_for_change(
+        self,
+        keys_to_snapshot_ids: Dict[KeyType, int],
+        accept_deltas: bool = False,
+    ) -> Union[LongPollState, Dict[KeyType, UpdatedObject]]:
+        for key in keys_to_snapshot_ids.keys():
+            self._subscribe(key)
+            self._num_listeners[key] += 1
+
+        try:
+            return await self._host.listen_for_change(
+                keys_to_snapshot_ids, accept_deltas=accept_deltas
+            )
+        finally:
+            now = time.time()
+            for key in keys_to_snapshot_ids.keys():
+                self._num_listeners[key] -= 1
+                self._last_listened_s[key] = now
@@ -33,11 +33,14 @@ from ray.serve._private.constants import (
     DEFAULT_LATENCY_BUCKET_MS,
     DEFAULT_UVICORN_KEEP_ALIVE_TIMEOUT_S,
     PROXY_MIN_DRAINING_PERIOD_S,
+    RAY_SERVE_ENABLE_GRPC_FAST_PATH,
+    RAY_SERVE_ENABLE_LONG_POLL_RELAY,
     RAY_SERVE_HTTP_PROXY_CALLBACK_IMPORT_PATH,
     SERVE_CONTROLLER_NAME,
     SERVE_LOGGER_NAME,
     SERVE_MULTIPLEXED_MODEL_ID,
     SERVE_NAMESPACE,
+    SERVE_REQUEST_PRIORITY,
 )
 from ray.serve._private.default_impl import add_grpc_address, get_proxy_handle
 from ray.serve._private.grpc_util import DummyServicer, create_serve_grpc_server
@@ -55,7 +58,11 @@ from ray.serve._private.logging_utils import (
     configure_component_memory_profiler,
     get_component_logger_file_path,
 )
-from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
+from ray.serve._private.long_poll import (
+    LongPollClient,
+    LongPollNamespace,
+    LongPollRelay,
+)
 from ray.serve._private.proxy_request_response import (
     ASGIProxyRequest,
     HandlerMetadata,
@@ -67,8 +74,10 @@ from ray.serve._private.proxy_request_response import (
 )
 from ray.serve._private.proxy_response_generator import ProxyResponseGenerator
 from ray.serve._private.proxy_router import ProxyRouter
+from ray.serve._private.request_tracing import should_sample_request
 from ray.serve._private.usage import ServeUsageTag
 from ray.serve._private.utils import (
+    DEFAULT,
     call_function_from_import_path,
     generate_request_id,
     get_head_node_id,
@@ -345,7 +354,7 @@ class GenericProxy(ABC):
         )
 
     def _get_response_handler_info(
-        self, proxy_request: ProxyRequest
+        self, proxy_request: ProxyRequest, proxy_received_s: Optional[float] = None
     ) -> ResponseHandlerInfo:
         if proxy_request.is_health_request or proxy_request.is_route_request:
             return self._get_health_or_routes_reponse(proxy_request)
@@ -400,6 +409,7 @@ class GenericProxy(ABC):
                 route=logs_and_metrics_route,
                 proxy_request=proxy_request,
                 internal_request_id=internal_request_id,
+                proxy_received_s=proxy_received_s,
             )
 
             response_generator = self.send_request_to_replica(
@@ -430,7 +440,12 @@ class GenericProxy(ABC):
         """
         assert proxy_request.request_type in {"http", "websocket", "grpc"}
 
-        response_handler_info = self._get_response_handler_info(proxy_request)
+        # Sample the request for tracing before routing it, so the traced proxy
+        # stage includes the time spent routing the request.
+        proxy_received_s = time.time() if should_sample_request() else None
+        response_handler_info = self._get_response_handler_info(
+            proxy_request, proxy_received_s=proxy_received_s
+        )
 
         start_time = time.time()
         if response_handler_info.should_increment_ongoing_requests:
@@ -510,6 +525,7 @@ class GenericProxy(ABC):
         route: str,
         proxy_request: ProxyRequest,
         internal_request_id: str,
+        proxy_received_s: Optional[float] = None,
     ) -> Tuple[DeploymentHandle, str]:
         """Setup the request context and handle for the request.
 
@@ -543,6 +559,29 @@ class gRPCProxy(GenericProxy):
     point for streaming gRPC request.
     """
 
+    def __init__(
+        self,
+        node_id: NodeId,
+        node_ip_address: str,
+        is_head: bool,
+        proxy_router: ProxyRouter,
+        request_timeout_s: Optional[float] = None,
+    ):
+        super().__init__(
+            node_id,
+            node_ip_address,
+            is_head,
+            proxy_router,
+            request_timeout_s=request_timeout_s,
+        )
+        # Handles with the options for each (deployment, method name, stream) set.
+        # Used on the fast path to avoid copying the handle for every request. Each
+        # entry also holds the handle it was created from, so it can be invalidated
+        # when the route table replaces the handle.
+        self._handle_options_cache: Dict[
+            Tuple[DeploymentID, str, bool], Tuple[DeploymentHandle, DeploymentHandle]
+        ] = dict()
+
     @property
     def protocol(self) -> RequestProtocol:
         return RequestProtocol.GRPC
@@ -588,7 +627,18 @@ class gRPCProxy(GenericProxy):
             is_error=not healthy,
         )
 
-    def service_handler_factory(self, service_method: str, stream: bool) -> Callable:
+    def service_handler_factory(
+        self,
+        service_method: str,
+        stream: bool,
+        request_deserializer: Optional[Callable[[bytes], Any]] = None,
+    ) -> Callable:
+        """Create the entrypoint for a gRPC method.
+
+        If `request_deserializer` is passed, the entrypoint receives the raw request
+        bytes, which are sent to the replica as-is and deserialized there.
+        """
+
         def set_grpc_code_and_details(
             context: grpc._cython.cygrpc._ServicerContext, status: ResponseStatus
         ):
@@ -617,6 +667,7 @@ class gRPCProxy(GenericProxy):
                 context=context,
                 service_method=service_method,
                 stream=False,
+                request_deserializer=request_deserializer,
             )
 
             status = None
@@ -646,6 +697,7 @@ class gRPCProxy(GenericProxy):
                 context=context,
                 service_method=service_method,
                 stream=True,
+                request_deserializer=request_deserializer,
             )
 
             status = None
@@ -659,6 +711,17 @@ class gRPCProxy(GenericProxy):
 
         return unary_stream if stream else unary_unary
 
+    def _get_handle_with_options(
+        self, handle: DeploymentHandle, method_name: str, stream: bool
+    ) -> DeploymentHandle:
+        key = (handle.deployment_id, method_name, stream)
+        cached = self._handle_options_cache.get(key)
+        if cached is None or cached[0] is not handle:
+            cached = (handle, handle.options(stream=stream, method_name=method_name))
+            self._handle_options_cache[key] = cached
+
+        return cached[1]
+
     def setup_request_context_and_handle(
         self,
         app_name: str,
@@ -666,6 +729,7 @@ class gRPCProxy(GenericProxy):
         route: str,
         proxy_request: ProxyRequest,
         internal_request_id: str,
+        proxy_received_s: Optional[float] = None,
     ) -> Tuple[DeploymentHandle, str]:
         """Setup request context and handle for the request.
 
@@ -678,11 +742,21 @@ class gRPCProxy(GenericProxy):
             request_id = generate_request_id()
             proxy_request.request_id = request_id
 
-        handle = handle.options(
-            stream=proxy_request.stream,
-            multiplexed_model_id=multiplexed_model_id,
-            method_name=proxy_request.method_name,
-        )
+        if (
+            RAY_SERVE_ENABLE_GRPC_FAST_PATH
+            and multiplexed_model_id is DEFAULT.VALUE
+            and proxy_request.priority is DEFAULT.VALUE
+        ):
+            handle = self._get_handle_with_options(
+                handle, proxy_request.method_name, proxy_request.stream
+            )
+        else:
+            handle = handle.options(
+                stream=proxy_request.stream,
+                multiplexed_model_id=multiplexed_model_id,
+                method_name=proxy_request.method_name,
+                _priority=proxy_request.priority,
+            )
 
         request_context_info = {
             "route": route,
@@ -691,6 +765,7 @@ class gRPCProxy(GenericProxy):
             "app_name": app_name,
             "multiplexed_model_id": multiplexed_model_id,
             "grpc_context": proxy_request.ray_serve_grpc_context,
+            "_proxy_received_s": proxy_received_s,
         }
         ray.serve.context._serve_request_context.set(
             ray.serve.context._RequestContext(**request_context_info)
@@ -894,6 +969,7 @@ class HTTPProxy(GenericProxy):
         route: str,
         proxy_request: ProxyRequest,
         internal_request_id: str,
+        proxy_received_s: Optional[float] = None,
     ) -> Tuple[DeploymentHandle, str]:
         """Setup request context and handle for the request.
 
@@ -905,12 +981,21 @@ class HTTPProxy(GenericProxy):
             "app_name": app_name,
             "_internal_request_id": internal_request_id,
             "is_http_request": True,
+            "_proxy_received_s": proxy_received_s,
         }
         for key, value in proxy_request.headers:
             if key.decode() == SERVE_MULTIPLEXED_MODEL_ID:
                 multiplexed_model_id = value.decode()
                 handle = handle.options(multiplexed_model_id=multiplexed_model_id)
                 request_context_info["multiplexed_model_id"] = multiplexed_model_id
+            if key.decode() == SERVE_REQUEST_PRIORITY:
+                try:
+                    handle = handle.options(_priority=int(value.decode()))
+                except ValueError:
+                    logger.warning(
+                        f"Ignoring invalid '{SERVE_REQUEST_PRIORITY}' header "
+                        f"'{value.decode()}', it must be an integer."
+                    )
             if key.decode() == "x-request-id":
                 request_context_info["request_id"] = value.decode()
         ray.serve.context._serve_request_context.set(
@@ -1170,6 +1255,15 @@ class ProxyActor:
             call_in_event_loop=get_or_create_event_loop(),
         )
 
+        # Relays long poll updates from the controller to deployment handles
+        # on this node.
+        self.long_poll_relay: Optional[LongPollRelay] = None
+        if RAY_SERVE_ENABLE_LONG_POLL_RELAY:
+            self.long_poll_relay = LongPollRelay(
+                ray.get_actor(SERVE_CONTROLLER_NAME, namespace=SERVE_NAMESPACE),
+                call_in_event_loop=get_or_create_event_loop(),
+            )
+
         configure_component_logger(
             component_name="proxy",
             component_id=node_ip_address,
@@ -1287,6 +1381,20 @@ class ProxyActor:
         _, handle, _ = self.http_proxy.proxy_router.match_route(route)
         return handle._router._asyncio_router._replica_scheduler._replica_id_set
 
+    async def listen_for_change(
+        self, keys_to_snapshot_ids: Dict[str, int], accept_deltas: bool = False
+    ):
+        """Relay long poll requests from deployment handles on this node.
+
+        Only available if the long poll relay is enabled.
+        """
+        if self.long_poll_relay is None:
+            raise RuntimeError("The long poll relay isn't enabled on this proxy.")
+
+        return await self.long_poll_relay.listen_for_change(
+            keys_to_snapshot_ids, accept_deltas=accept_deltas
+        )
+
     def should_start_grpc_service(self) -> bool:
         """Determine whether gRPC service should be started.
 
@@ -2,7 +2,16 @@ import logging
 import pickle
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, Awaitable, Callable, List, Tuple, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import grpc
 from starlette.types import Receive, Scope, Send
@@ -113,15 +122,20 @@ class gRPCProxyRequest(ProxyRequest):
         context: grpc._cython.cygrpc._ServicerContext,
         service_method: str,
         stream: bool,
+        request_deserializer: Optional[Callable[[bytes], Any]] = None,
     ):
+        # If `request_deserializer` is set, `request_proto` contains the raw
+        # protobuf bytes, which are passed through to the replica as-is.
         self.request = request_proto
         self.context = context
         self.service_method = service_method
         self.stream = stream
+        self.request_deserializer = request_deserializer
         self.app_name = ""
         self.request_id = None
         self.method_name = "__call__"
         self.multiplexed_model_id = DEFAULT.VALUE
+        self.priority = DEFAULT.VALUE
         # ray_serve_grpc_context is a class implemented by us to be able to serialize
         # the object and pass it into the deployment.
         self.ray_serve_grpc_context = RayServegRPCContext(context)
@@ -130,7 +144,8 @@ class gRPCProxyRequest(ProxyRequest):
     def setup_variables(self):
         if not self.is_route_request and not self.is_health_request:
             service_method_split = self.service_method.split("/")
-            self.request = pickle.dumps(self.request)
+            if self.request_deserializer is None:
+                self.request = pickle.dumps(self.request)
             self.method_name = service_method_split[-1]
             for key, value in self.context.invocation_metadata():
                 if key == "application":
@@ -139,6 +154,14 @@ class gRPCProxyRequest(ProxyRequest):
                     self.request_id = value
                 elif key == "multiplexed_model_id":
                     self.multiplexed_model_id = value
+                elif key == "request_priority":
+                    try:
+                        self.priority = int(value)
+                    except ValueError:
+                        logger.warning(
+                            f"Ignoring invalid 'request_priority' metadata '{value}', "
+                            "it must be an integer."
+                        )
 
     @property
     def request_type(self) -> str:
@@ -173,6 +196,7 @@ class gRPCProxyRequest(ProxyRequest):
     def request_object(self) -> gRPCRequest:
         return gRPCRequest(
             grpc_user_request=self.user_request,
+            request_deserializer=self.request_deserializer,
         )
 
 
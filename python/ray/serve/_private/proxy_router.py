@@ -37,6 +37,8 @@ class ProxyRouter:
         # Info used for gRPC proxy
         # Endpoints info associated with endpoints.
         self.endpoints: Dict[DeploymentID, EndpointInfo] = dict()
+        # Map of application name to its ingress endpoint.
+        self.app_to_endpoint: Dict[ApplicationName, DeploymentID] = dict()
 
     def ready_for_traffic(self, is_head: bool) -> Tuple[bool, str]:
         """Whether the proxy router is ready to serve traffic.
@@ -80,10 +82,12 @@ class ProxyRouter:
         routes = []
         route_info = {}
         app_to_is_cross_language = {}
+        app_to_endpoint = {}
         for endpoint, info in endpoints.items():
             routes.append(info.route)
             route_info[info.route] = endpoint
             app_to_is_cross_language[endpoint.app_name] = info.app_is_cross_language
+            app_to_endpoint[endpoint.app_name] = endpoint
             if endpoint in self.handles:
                 existing_handles.remove(endpoint)
             else:
@@ -103,6 +107,7 @@ class ProxyRouter:
         self.sorted_routes = sorted(routes, key=lambda x: len(x), reverse=True)
         self.route_info = route_info
         self.app_to_is_cross_language = app_to_is_cross_language
+        self.app_to_endpoint = app_to_endpoint
 
     def match_route(
         self, target_route: str
@@ -151,15 +156,17 @@ class ProxyRouter:
             (route, handle, is_cross_language) for the single app if there
             is only one, else find the app and handle for exact match. Else return None.
         """
-        for endpoint_tag, handle in self.handles.items():
-            # If the target_app_name matches with the endpoint or if
-            # there is only one endpoint.
-            if target_app_name == endpoint_tag.app_name or len(self.handles) == 1:
-                endpoint_info = self.endpoints[endpoint_tag]
-                return (
-                    endpoint_info.route,
-                    handle,
-                    endpoint_info.app_is_cross_language,
-                )
-
-        return None
+        if len(self.handles) == 1:
+            # If there is only one endpoint, it matches any target_app_name.
+            endpoint_tag = next(iter(self.handles))
+        else:
+            endpoint_tag = self.app_to_endpoint.get(target_app_name)
+            if endpoint_tag not in self.handles:
+                return None
+
+        endpoint_info = self.endpoints[endpoint_tag]
+        return (
+            endpoint_info.route,
+            self.handles[endpoint_tag],
+            endpoint_info.app_is_cross_language,
+        )
@@ -18,7 +18,9 @@ from typing import (
     Callable,
     Dict,
     Generator,
+    List,
     Optional,
+    Set,
     Tuple,
     Union,
 )
@@ -40,6 +42,7 @@ from ray.serve._private.common import (
     RequestMetadata,
     ServeComponentType,
     StreamingHTTPRequest,
+    StreamingResultBatch,
     gRPCRequest,
 )
 from ray.serve._private.config import DeploymentConfig
@@ -51,6 +54,8 @@ from ray.serve._private.constants import (
     RAY_SERVE_REPLICA_AUTOSCALING_METRIC_RECORD_PERIOD_S,
     RAY_SERVE_RUN_SYNC_IN_THREADPOOL,
     RAY_SERVE_RUN_SYNC_IN_THREADPOOL_WARNING,
+    RAY_SERVE_STREAMING_COALESCE_MAX_ITEMS,
+    RAY_SERVE_STREAMING_COALESCE_WINDOW_S,
     RECONFIGURE_METHOD,
     SERVE_CONTROLLER_NAME,
     SERVE_LOGGER_NAME,
@@ -72,6 +77,12 @@ from ray.serve._private.logging_utils import (
     get_component_logger_file_path,
 )
 from ray.serve._private.metrics_utils import InMemoryMetricsStore, MetricsPusher
+from ray.serve._private.request_tracing import (
+    REPLICA_STAGES,
+    RequestTrace,
+    create_stage_latency_histogram,
+    record_stage_latencies,
+)
 from ray.serve._private.thirdparty.get_asgi_route_name import get_asgi_route_name
 from ray.serve._private.utils import get_component_file_name  # noqa: F401
 from ray.serve._private.utils import parse_import_path
@@ -133,6 +144,10 @@ class ReplicaMetricsManager:
         )
         self._num_ongoing_requests = 0
 
+        # Events for routers subscribed to queue length updates via
+        # `listen_for_num_ongoing_requests`. Set when the queue length changes.
+        self._num_ongoing_requests_listeners: Set[asyncio.Event] = set()
+
         # Request counter (only set on replica startup).
         self._restart_counter = metrics.Counter(
             "serve_deployment_replica_starts",
@@ -171,6 +186,9 @@ class ReplicaMetricsManager:
             description="The current number of queries being processed.",
         )
 
+        # Created lazily when the first request sampled for tracing finishes.
+        self._stage_latency_histogram: Optional[metrics.Histogram] = None
+
         self.set_autoscaling_config(autoscaling_config)
 
     async def shutdown(self):
@@ -209,16 +227,53 @@ class ReplicaMetricsManager:
         """Increment the current total queue length of requests for this replica."""
         self._num_ongoing_requests += 1
         self._num_ongoing_requests_gauge.set(self._num_ongoing_requests)
+        self._notify_num_ongoing_requests_listeners()
 
     def dec_num_ongoing_requests(self) -> int:
         """Decrement the current total queue length of requests for this replica."""
         self._num_ongoing_requests -= 1
         self._num_ongoing_requests_gauge.set(self._num_ongoing_requests)
+        self._notify_num_ongoing_requests_listeners()
 
     def get_num_ongoing_requests(self) -> int:
         """Get current total queue length of requests for this replica."""
         return self._num_ongoing_requests
 
+    def _notify_num_ongoing_requests_listeners(self):
+        for event in self._num_ongoing_requests_listeners:
+            event.set()
+
+    async def listen_for_num_ongoing_requests(
+        self, *, min_interval_s: float, keepalive_interval_s: float
+    ) -> AsyncGenerator[int, None]:
+        """Yields the queue length of this replica each time it changes.
+
+        Changes that happen within `min_interval_s` of the previous update are
+        coalesced into a single update. If the queue length doesn't change for
+        `keepalive_interval_s`, the current value is re-sent so the subscriber can
+        keep its cached entry fresh.
+        """
+        changed_event = asyncio.Event()
+        self._num_ongoing_requests_listeners.add(changed_event)
+        try:
+            while True:
+                # Clear the event *before* reading the value so that changes made
+                # while the update is in flight are not missed.
+                changed_event.clear()
+                yield self._num_ongoing_requests
+
+                if min_interval_s > 0:
+                    await asyncio.sleep(min_interval_s)
+
+                try:
+                    await asyncio.wait_for(
+                        changed_event.wait(), timeout=keepalive_interval_s
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._num_ongoing_requests_listeners.discard(changed_event)
+
     def record_request_metrics(
         self, *, route: str, status_str: str, latency_ms: float, was_error: bool
     ):
@@ -229,6 +284,18 @@ class ReplicaMetricsManager:
         else:
             self._request_counter.inc(tags={"route": route})
 
+    def record_request_trace(self, trace: RequestTrace):
+        """Records the latency of the replica stages of a traced request.
+
+        The full trace is sent to the controller so it can be fetched later.
+        """
+        trace.replica_id = self._replica_id.unique_id
+        if self._stage_latency_histogram is None:
+            self._stage_latency_histogram = create_stage_latency_histogram()
+
+        record_stage_latencies(self._stage_latency_histogram, trace, REPLICA_STAGES)
+        self._controller_handle.record_request_trace.remote(trace)
+
     def _push_autoscaling_metrics(self) -> Dict[str, Any]:
         look_back_period = self._autoscaling_config.look_back_period_s
         self._controller_handle.record_autoscaling_metrics.remote(
@@ -338,6 +405,17 @@ class ReplicaBase(ABC):
     def get_num_ongoing_requests(self):
         return self._metrics_manager.get_num_ongoing_requests()
 
+    async def listen_for_num_ongoing_requests(
+        self, *, min_interval_s: float, keepalive_interval_s: float
+    ) -> AsyncGenerator[int, None]:
+        async for num_ongoing_requests in (
+            self._metrics_manager.listen_for_num_ongoing_requests(
+                min_interval_s=min_interval_s,
+                keepalive_interval_s=keepalive_interval_s,
+            )
+        ):
+            yield num_ongoing_requests
+
     def _maybe_get_http_route(
         self, request_metadata: RequestMetadata, request_args: Tuple[Any]
     ) -> Optional[str]:
@@ -411,7 +489,8 @@ class ReplicaBase(ABC):
         finally:
             self._metrics_manager.dec_num_ongoing_requests()
 
-        latency_ms = (time.time() - start_time) * 1000
+        end_time = time.time()
+        latency_ms = (end_time - start_time) * 1000
         if user_exception is None:
             status_str = "OK"
         elif isinstance(user_exception, asyncio.CancelledError):
@@ -438,10 +517,48 @@ class ReplicaBase(ABC):
             latency_ms=latency_ms,
             was_error=user_exception is not None,
         )
+        if request_metadata._trace is not None:
+            request_metadata._trace.user_code_started_s = start_time
+            request_metadata._trace.user_code_finished_s = end_time
+            self._metrics_manager.record_request_trace(request_metadata._trace)
 
         if user_exception is not None:
             raise user_exception from None
 
+    async def _wait_for_more_messages(
+        self,
+        result_queue: MessageQueue,
+        call_user_method_future: asyncio.Future,
+        messages: List[Any],
+    ):
+        """Add messages that arrive within the coalescing window to `messages`.
+
+        Returns early if the batch is full or the user method has finished.
+        """
+        deadline_s = time.time() + RAY_SERVE_STREAMING_COALESCE_WINDOW_S
+        while (
+            len(messages) < RAY_SERVE_STREAMING_COALESCE_MAX_ITEMS
+            and not call_user_method_future.done()
+        ):
+            remaining_s = deadline_s - time.time()
+            if remaining_s <= 0:
+                break
+
+            wait_for_message_task = self._event_loop.create_task(
+                result_queue.wait_for_message()
+            )
+            try:
+                await asyncio.wait(
+                    [call_user_method_future, wait_for_message_task],
+                    timeout=remaining_s,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                if not wait_for_message_task.done():
+                    wait_for_message_task.cancel()
+
+            messages.extend(result_queue.get_messages_nowait())
+
     async def _call_user_generator(
         self,
         request_metadata: RequestMetadata,
@@ -453,7 +570,14 @@ class ReplicaBase(ABC):
 
         The user method is called in an asyncio `Task` and places its results on a
         `result_queue`. This method pulls and yields from the `result_queue`.
+
+        For HTTP requests and requests with `coalesce_stream_results` set, the results
+        available in the queue (plus any that arrive within the configured coalescing
+        window) are yielded as a single batch.
         """
+        coalesce_results = (
+            request_metadata.is_http_request or request_metadata.coalesce_stream_results
+        )
         call_user_method_future = None
         wait_for_message_task = None
         try:
@@ -485,6 +609,16 @@ class ReplicaBase(ABC):
 
                 # Consume and yield all available messages in the queue.
                 messages = result_queue.get_messages_nowait()
+                if (
+                    messages
+                    and coalesce_results
+                    and RAY_SERVE_STREAMING_COALESCE_WINDOW_S > 0
+                    and call_user_method_future not in done
+                ):
+                    await self._wait_for_more_messages(
+                        result_queue, call_user_method_future, messages
+                    )
+
                 if messages:
                     # HTTP (ASGI) messages are only consumed by the proxy so batch them
                     # and use vanilla pickle (we know it's safe because these messages
@@ -501,6 +635,8 @@ class ReplicaBase(ABC):
                                 status_code_callback(str(msg["status"]))
 
                         yield pickle.dumps(messages)
+                    elif request_metadata.coalesce_stream_results and len(messages) > 1:
+                        yield StreamingResultBatch(messages)
                     else:
                         for msg in messages:
                             yield msg
@@ -850,6 +986,23 @@ class ReplicaActor:
         """
         return self._replica_impl.get_num_ongoing_requests()
 
+    async def listen_for_num_ongoing_requests(
+        self, min_interval_s: float, keepalive_interval_s: float
+    ) -> AsyncGenerator[int, None]:
+        """Stream the number of ongoing requests at this replica to a router.
+
+        The current value is sent immediately, then again each time it changes.
+        This is used by routers to keep their queue length cache up to date
+        without actively probing the replica on the scheduling path.
+        """
+        async for num_ongoing_requests in (
+            self._replica_impl.listen_for_num_ongoing_requests(
+                min_interval_s=min_interval_s,
+                keepalive_interval_s=keepalive_interval_s,
+            )
+        ):
+            yield num_ongoing_requests
+
     async def is_allocated(self) -> str:
         """poke the replica to check whether it's alive.
 
@@ -896,6 +1049,15 @@ class ReplicaActor:
         await self._replica_impl.reconfigure(deployment_config)
         return self._replica_impl.get_metadata()
 
+    def _load_request_metadata(
+        self, pickled_request_metadata: bytes
+    ) -> RequestMetadata:
+        request_metadata: RequestMetadata = pickle.loads(pickled_request_metadata)
+        if request_metadata._trace is not None:
+            request_metadata._trace.replica_received_s = time.time()
+
+        return request_metadata
+
     async def handle_request(
         self,
         pickled_request_metadata: bytes,
@@ -903,7 +1065,7 @@ class ReplicaActor:
         **request_kwargs,
     ) -> Tuple[bytes, Any]:
         """Entrypoint for `stream=False` calls."""
-        request_metadata = pickle.loads(pickled_request_metadata)
+        request_metadata = self._load_request_metadata(pickled_request_metadata)
         return await self._replica_impl.handle_request(
             request_metadata, *request_args, **request_kwargs
         )
@@ -915,7 +1077,7 @@ class ReplicaActor:
         **request_kwargs,
     ) -> AsyncGenerator[Any, None]:
         """Generator that is the entrypoint for all `stream=True` handle calls."""
-        request_metadata = pickle.loads(pickled_request_metadata)
+        request_metadata = self._load_request_metadata(pickled_request_metadata)
         async for result in self._replica_impl.handle_request_streaming(
             request_metadata, *request_args, **request_kwargs
         ):
@@ -939,7 +1101,7 @@ class ReplicaActor:
         For streaming requests, the subsequent messages will be the results of the
         user request handler (which must be a generator).
         """
-        request_metadata = pickle.loads(pickled_request_metadata)
+        request_metadata = self._load_request_metadata(pickled_request_metadata)
         async for result in self._replica_impl.handle_request_with_rejection(
             request_metadata, *request_args, **request_kwargs
         ):
@@ -1348,7 +1510,7 @@ class UserCallableWrapper:
 
         Returns (request_args, request_kwargs).
         """
-        request_args = (pickle.loads(request.grpc_user_request),)
+        request_args = (request.deserialize_user_request(),)
         if GRPC_CONTEXT_ARG_NAME in user_method_params:
             request_kwargs = {GRPC_CONTEXT_ARG_NAME: request_metadata.grpc_context}
         else:
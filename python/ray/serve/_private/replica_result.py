@@ -2,10 +2,12 @@ import inspect
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from functools import wraps
-from typing import Callable, Coroutine, Optional, Union
+from typing import Any, Callable, Coroutine, Deque, Optional, Union
 
 import ray
+from ray.serve._private.common import StreamingResultBatch
 from ray.serve._private.utils import calculate_remaining_timeout
 from ray.serve.exceptions import RequestCancelledError
 
@@ -56,6 +58,7 @@ class ActorReplicaResult(ReplicaResult):
         obj_ref_or_gen: Union[ray.ObjectRef, ray.ObjectRefGenerator],
         is_streaming: bool,
         request_id: str,
+        coalesce_stream_results: bool = False,
     ):
         self._obj_ref: Optional[ray.ObjectRef] = None
         self._obj_ref_gen: Optional[ray.ObjectRefGenerator] = None
@@ -63,6 +66,10 @@ class ActorReplicaResult(ReplicaResult):
         self._request_id: str = request_id
         self._object_ref_or_gen_sync_lock = threading.Lock()
 
+        # Results from a `StreamingResultBatch` that haven't been returned yet.
+        self._coalesce_stream_results: bool = coalesce_stream_results
+        self._buffered_stream_results: Deque[Any] = deque()
+
         if isinstance(obj_ref_or_gen, ray.ObjectRefGenerator):
             self._obj_ref_gen = obj_ref_or_gen
         else:
@@ -122,8 +129,11 @@ class ActorReplicaResult(ReplicaResult):
             self._is_streaming
         ), "next() can only be called on a streaming ActorReplicaResult."
 
+        if len(self._buffered_stream_results) > 0:
+            return self._buffered_stream_results.popleft()
+
         next_obj_ref = self._obj_ref_gen.__next__()
-        return ray.get(next_obj_ref)
+        return self._unbatch_stream_result(ray.get(next_obj_ref))
 
     @_process_response
     async def __anext__(self):
@@ -131,8 +141,19 @@ class ActorReplicaResult(ReplicaResult):
             self._is_streaming
         ), "__anext__() can only be called on a streaming ActorReplicaResult."
 
+        if len(self._buffered_stream_results) > 0:
+            return self._buffered_stream_results.popleft()
+
         next_obj_ref = await self._obj_ref_gen.__anext__()
-        return await next_obj_ref
+        return self._unbatch_stream_result(await next_obj_ref)
+
+    def _unbatch_stream_result(self, result: Any) -> Any:
+        """Return the first result of a batch and buffer the rest."""
+        if not isinstance(result, StreamingResultBatch):
+            return result
+
+        self._buffered_stream_results.extend(result.results[1:])
+        return result.results[0]
 
     def add_done_callback(self, callback: Callable):
         if self._obj_ref_gen is not None:
@@ -184,5 +205,9 @@ class ActorReplicaResult(ReplicaResult):
         assert (
             self._is_streaming
         ), "to_object_ref_gen can only be called on a streaming ReplicaActorResult."
+        assert not self._coalesce_stream_results, (
+            "to_object_ref_gen cannot be called on a ReplicaActorResult with "
+            "coalesced stream results."
+        )
 
         return self._obj_ref_gen
@@ -45,6 +45,10 @@ class ReplicaQueueLengthCache:
             get_curr_time_s if get_curr_time_s is not None else time.time
         )
 
+    @property
+    def staleness_timeout_s(self) -> float:
+        return self._staleness_timeout_s
+
     def _is_timed_out(self, timestamp_s: int) -> bool:
         return self._get_curr_time_s() - timestamp_s > self._staleness_timeout_s
 
@@ -30,6 +30,7 @@ from ray.serve._private.common import (
 from ray.serve._private.constants import (
     RAY_SERVE_MAX_QUEUE_LENGTH_RESPONSE_DEADLINE_S,
     RAY_SERVE_MULTIPLEXED_MODEL_ID_MATCHING_TIMEOUT_S,
+    RAY_SERVE_QUEUE_LENGTH_PUSH_MIN_INTERVAL_S,
     RAY_SERVE_QUEUE_LENGTH_RESPONSE_DEADLINE_S,
     SERVE_LOGGER_NAME,
 )
@@ -52,7 +53,8 @@ class LocalityScope(str, enum.Enum):
 class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
     """Chooses a replica for each request using the "power of two choices" procedure.
 
-    Requests are scheduled in FIFO order.
+    Requests are scheduled in priority order (`RequestMetadata.priority`, highest
+    first) and in FIFO order within the same priority.
 
     When a request comes in, two candidate replicas are chosen randomly. Each replica
     is sent a control message to fetch its queue length.
@@ -70,6 +72,11 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
     procedure concurrently. This task will not necessarily satisfy the request that
     started it (in order to maintain the FIFO order). The total number of tasks is
     capped at (2 * num_replicas).
+
+    If `subscribe_to_replica_queue_len_updates` is set, the scheduler subscribes to
+    queue length updates pushed by each replica. This keeps the queue length cache
+    fresh, so replicas only need to be actively probed as a fallback (e.g., when the
+    subscription has failed).
     """
 
     # The sequence of backoff timeouts to use when all replicas' queues are full.
@@ -88,6 +95,10 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
     # and many too requests in flight to fetch replicas' queue lengths.
     max_num_scheduling_tasks_cap = 50
 
+    # Minimum interval between queue length updates pushed by each replica when
+    # subscribed. Changes within this interval are coalesced by the replica.
+    queue_len_push_min_interval_s = RAY_SERVE_QUEUE_LENGTH_PUSH_MIN_INTERVAL_S
+
     def __init__(
         self,
         deployment_id: DeploymentID,
@@ -99,6 +110,7 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         self_actor_handle: Optional[ActorHandle] = None,
         self_availability_zone: Optional[str] = None,
         use_replica_queue_len_cache: bool = False,
+        subscribe_to_replica_queue_len_updates: bool = False,
         get_curr_time_s: Optional[Callable[[], float]] = None,
         create_replica_wrapper_func: Optional[
             Callable[[RunningReplicaInfo], ReplicaWrapper]
@@ -112,6 +124,10 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         self._self_actor_handle = self_actor_handle
         self._self_availability_zone = self_availability_zone
         self._use_replica_queue_len_cache = use_replica_queue_len_cache
+        # Pushed updates are only useful to populate the queue length cache.
+        self._subscribe_to_replica_queue_len_updates = (
+            use_replica_queue_len_cache and subscribe_to_replica_queue_len_updates
+        )
         self._create_replica_wrapper_func = create_replica_wrapper_func
 
         # Current replicas available to be scheduled.
@@ -122,6 +138,10 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
             get_curr_time_s=get_curr_time_s,
         )
 
+        # Tasks consuming the queue length updates pushed by each replica.
+        # Only populated if `subscribe_to_replica_queue_len_updates` is set.
+        self._queue_len_subscription_tasks: Dict[ReplicaID, asyncio.Task] = {}
+
         # NOTE(edoakes): Python 3.10 removed the `loop` parameter to `asyncio.Event`.
         # Now, the `asyncio.Event` will call `get_running_loop` in its constructor to
         # determine the loop to attach to. This class can be constructed for the handle
@@ -149,9 +169,10 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         # added, but it will not exceed self.max_num_scheduling_tasks.
         self._scheduling_tasks: Set[asyncio.Task] = set()
 
-        # We keep two separate queues of pending requests:
+        # We keep two separate queues of pending requests, both ordered by priority
+        # and then by creation time:
         # - self._pending_requests_to_fulfill is a queue that will be used to fulfill
-        # requests in FIFO order by scheduling tasks once they've acquired a replica.
+        # requests in order by scheduling tasks once they've acquired a replica.
         # To avoid long tail latencies due to backoff, the scheduling task started by
         # a given request may not be the one to fulfill it.
         # - self._pending_requests_to_schedule is a queue that is used for tasks to
@@ -258,6 +279,7 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         self._replica_id_set.discard(replica_id)
         for id_set in self._colocated_replica_ids.values():
             id_set.discard(replica_id)
+        self._stop_queue_len_subscription(replica_id)
 
     def on_replica_actor_unavailable(self, replica_id: ReplicaID):
         """Invalidate cache entry so active probing is required for the next request."""
@@ -272,6 +294,62 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
                 replica_id, queue_len_info.num_ongoing_requests
             )
 
+    def _is_subscribed_to_queue_len_updates(self, replica_id: ReplicaID) -> bool:
+        return replica_id in self._queue_len_subscription_tasks
+
+    def _start_queue_len_subscription(self, replica: ReplicaWrapper):
+        self._queue_len_subscription_tasks[
+            replica.replica_id
+        ] = self._event_loop.create_task(self._listen_for_queue_len_updates(replica))
+
+    def _stop_queue_len_subscription(self, replica_id: ReplicaID):
+        task = self._queue_len_subscription_tasks.pop(replica_id, None)
+        if task is not None:
+            task.cancel()
+
+    async def _listen_for_queue_len_updates(self, replica: ReplicaWrapper):
+        """Update the queue length cache with updates pushed by the replica.
+
+        If the subscription fails, the cache entry is invalidated (so the replica
+        will be actively probed) and the subscription is retried with backoff.
+
+        The task is cancelled when the replica is removed from the scheduler.
+        """
+        backoff_index = 0
+        while True:
+            try:
+                async for queue_len in replica.listen_for_queue_len_updates(
+                    min_interval_s=self.queue_len_push_min_interval_s,
+                    # Send keepalives often enough that cache entries don't expire.
+                    keepalive_interval_s=(
+                        self._replica_queue_len_cache.staleness_timeout_s / 2
+                    ),
+                ):
+                    backoff_index = 0
+                    self._replica_queue_len_cache.update(replica.replica_id, queue_len)
+            except ActorDiedError:
+                # Pop our own entry so `on_replica_actor_died` doesn't cancel us.
+                self._queue_len_subscription_tasks.pop(replica.replica_id, None)
+                self.on_replica_actor_died(replica.replica_id)
+                logger.warning(
+                    f"Replica {replica.replica_id} died while subscribed to its "
+                    "queue length updates. This replica will no longer be "
+                    "considered for requests."
+                )
+                return
+            except Exception as e:
+                logger.warning(
+                    "Subscription to queue length updates from "
+                    f"{replica.replica_id} failed: '{e}'. Retrying.",
+                    extra={"log_to_stderr": False},
+                )
+
+            # The subscription ended; fall back to active probing until it's
+            # re-established.
+            self.on_replica_actor_unavailable(replica.replica_id)
+            await asyncio.sleep(self.backoff_sequence_s[backoff_index])
+            backoff_index = min(backoff_index + 1, len(self.backoff_sequence_s) - 1)
+
     def update_replicas(self, replicas: List[ReplicaWrapper]):
         """Update the set of available replicas to be considered for scheduling.
 
@@ -317,7 +395,17 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
 
         # Get list of new replicas
         new_ids = new_replica_id_set - self._replica_id_set
-        replicas_to_ping = [new_replicas.get(id) for id in new_ids]
+        replicas_to_ping = []
+        for new_id in new_ids:
+            r = new_replicas[new_id]
+            if self._subscribe_to_replica_queue_len_updates and not r.is_cross_language:
+                # The first pushed update will populate the cache.
+                self._start_queue_len_subscription(r)
+            else:
+                replicas_to_ping.append(r)
+
+        for removed_id in self._replica_id_set - new_replica_id_set:
+            self._stop_queue_len_subscription(removed_id)
 
         self._replicas = new_replicas
         self._replica_id_set = new_replica_id_set
@@ -638,11 +726,16 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
             # Populate available queue lens from the cache.
             for r in candidates:
                 queue_len = self._replica_queue_len_cache.get(r.replica_id)
-                # Include replicas whose queues are full as not in the cache so we will
-                # actively probe them. Otherwise we may end up in "deadlock" until their
-                # cache entries expire.
-                if queue_len is None or queue_len >= r.max_ongoing_requests:
+                if queue_len is None:
                     not_in_cache.append(r)
+                elif queue_len >= r.max_ongoing_requests:
+                    # Include replicas whose queues are full as not in the cache so we
+                    # will actively probe them. Otherwise we may end up in "deadlock"
+                    # until their cache entries expire. This isn't necessary if the
+                    # replica pushes updates, because it will do so when its queue
+                    # drains.
+                    if not self._is_subscribed_to_queue_len_updates(r.replica_id):
+                        not_in_cache.append(r)
                 elif queue_len < lowest_queue_len:
                     lowest_queue_len = queue_len
                     chosen_replica_id = r.replica_id
@@ -696,7 +789,7 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         replica: ReplicaWrapper,
         request_metadata: Optional[RequestMetadata] = None,
     ):
-        """Assign the replica to the next pending request in FIFO order.
+        """Assign the replica to the next pending request in priority order.
 
         If a pending request has been cancelled, it will be popped from the queue
         and not assigned.
@@ -810,43 +903,60 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         if tasks_to_start > 0:
             self.num_scheduling_tasks_gauge.set(self.curr_num_scheduling_tasks)
 
+    @staticmethod
+    def _insert_pending_request(
+        queue: Deque[PendingRequest],
+        pending_request: PendingRequest,
+        *,
+        is_retry: bool,
+    ):
+        """Insert the request into the queue ordered by priority.
+
+        Within the same priority, new requests are placed at the back of the queue and
+        retried requests are placed according to their creation time. The common case
+        is a new request with the same priority as the back of the queue, so search
+        from the back.
+        """
+        priority = pending_request.metadata.priority
+        created_at = pending_request.created_at
+        index = len(queue)
+        while index > 0:
+            pr = queue[index - 1]
+            if pr.metadata.priority > priority or (
+                pr.metadata.priority == priority
+                and (not is_retry or pr.created_at <= created_at)
+            ):
+                break
+
+            index -= 1
+
+        queue.insert(index, pending_request)
+
     async def choose_replica_for_request(
         self, pending_request: PendingRequest, *, is_retry: bool = False
     ) -> ReplicaWrapper:
         """Chooses a replica to send the provided request to.
 
-        By default, requests are scheduled in FIFO order, so this places a future on the
-        back of an internal queue that will be popped when a replica is available.
+        Requests are scheduled in priority order and in FIFO order within the same
+        priority, so this places a future in an internal queue that will be popped
+        when a replica is available.
 
-        If `emplace_front` is passed, the request will be placed at the front of the
-        queue.
+        If `is_retry` is passed, the request keeps its original position in the queue
+        (based on its creation time) to avoid tail latencies.
 
         Upon cancellation (by the caller), the future is cancelled and will be passed
         over when a replica becomes available.
         """
         try:
-            if not is_retry:
-                self._pending_requests_to_fulfill.append(pending_request)
-                self._pending_requests_to_schedule.append(pending_request)
-            else:
+            if is_retry:
                 pending_request.reset_future()
-                index = 0
-                for pr in self._pending_requests_to_fulfill:
-                    if pending_request.created_at < pr.created_at:
-                        break
-
-                    index += 1
-
-                self._pending_requests_to_fulfill.insert(index, pending_request)
-
-                index = 0
-                for pr in self._pending_requests_to_schedule:
-                    if pending_request.created_at < pr.created_at:
-                        break
-
-                    index += 1
 
-                self._pending_requests_to_schedule.insert(index, pending_request)
+            self._insert_pending_request(
+                self._pending_requests_to_fulfill, pending_request, is_retry=is_retry
+            )
+            self._insert_pending_request(
+                self._pending_requests_to_schedule, pending_request, is_retry=is_retry
+            )
 
             self.maybe_start_scheduling_tasks()
             replica = await pending_request.future
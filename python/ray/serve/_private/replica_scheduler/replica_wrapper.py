@@ -1,7 +1,7 @@
 import asyncio
 import pickle
 from abc import ABC, abstractmethod
-from typing import Optional, Set, Tuple, Union
+from typing import AsyncIterator, Optional, Set, Tuple, Union
 
 import ray
 from ray import ObjectRef, ObjectRefGenerator
@@ -71,6 +71,18 @@ class ReplicaWrapper(ABC):
         """
         raise NotImplementedError
 
+    def listen_for_queue_len_updates(
+        self, *, min_interval_s: float, keepalive_interval_s: float
+    ) -> AsyncIterator[int]:
+        """Subscribe to queue length updates pushed by the replica.
+
+        Yields the current queue length, then a new value each time it changes
+        (at most once per `min_interval_s`) or every `keepalive_interval_s`.
+
+        Only supported for Python replicas.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def send_request(self, pr: PendingRequest) -> ReplicaResult:
         """Send request to this replica."""
@@ -105,6 +117,24 @@ class ActorReplicaWrapper(ReplicaWrapper):
             ray.cancel(obj_ref)
             raise
 
+    async def listen_for_queue_len_updates(
+        self, *, min_interval_s: float, keepalive_interval_s: float
+    ) -> AsyncIterator[int]:
+        assert (
+            not self._replica_info.is_cross_language
+        ), "Queue length updates not supported for Java."
+
+        obj_ref_gen = self._actor_handle.listen_for_num_ongoing_requests.options(
+            num_returns="streaming"
+        ).remote(min_interval_s, keepalive_interval_s)
+        try:
+            async for obj_ref in obj_ref_gen:
+                yield await obj_ref
+        finally:
+            # The subscription was dropped (e.g., the replica was removed from the
+            # scheduler), so stop the generator running on the replica.
+            ray.cancel(obj_ref_gen)
+
     def _send_request_java(self, pr: PendingRequest) -> ObjectRef:
         """Send the request to a Java replica.
 
@@ -159,6 +189,7 @@ class ActorReplicaWrapper(ReplicaWrapper):
                 self._send_request_python(pr, with_rejection=False),
                 is_streaming=pr.metadata.is_streaming,
                 request_id=pr.metadata.request_id,
+                coalesce_stream_results=pr.metadata.coalesce_stream_results,
             )
 
     async def send_request_with_rejection(
@@ -181,6 +212,7 @@ class ActorReplicaWrapper(ReplicaWrapper):
                         obj_ref_gen,
                         is_streaming=pr.metadata.is_streaming,
                         request_id=pr.metadata.request_id,
+                        coalesce_stream_results=pr.metadata.coalesce_stream_results,
                     ),
                     queue_len_info,
                 )
@@ -0,0 +1,104 @@
+import random
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from ray.serve._private.constants import (
+    DEFAULT_LATENCY_BUCKET_MS,
+    RAY_SERVE_REQUEST_TRACE_SAMPLE_RATE,
+)
+from ray.util import metrics
+
+# Stages of a request and the timestamps of the `RequestTrace` they span.
+PROXY_STAGE = "proxy"
+ROUTER_STAGE = "router"
+RPC_STAGE = "rpc"
+REPLICA_QUEUE_STAGE = "replica_queue"
+USER_CODE_STAGE = "user_code"
+STAGE_BOUNDARIES = {
+    PROXY_STAGE: ("proxy_received_s", "router_received_s"),
+    ROUTER_STAGE: ("router_received_s", "router_sent_s"),
+    RPC_STAGE: ("router_sent_s", "replica_received_s"),
+    REPLICA_QUEUE_STAGE: ("replica_received_s", "user_code_started_s"),
+    USER_CODE_STAGE: ("user_code_started_s", "user_code_finished_s"),
+}
+ROUTER_STAGES = (PROXY_STAGE, ROUTER_STAGE)
+REPLICA_STAGES = (RPC_STAGE, REPLICA_QUEUE_STAGE, USER_CODE_STAGE)
+
+
+@dataclass
+class RequestTrace:
+    """Timestamps recorded at each hop of a sampled request.
+
+    The trace is sent along with the `RequestMetadata`, so each component fills in
+    the timestamps of its hop. Timestamps are in seconds since the epoch. Note that
+    stages that cross nodes (e.g., `rpc`) are subject to clock skew.
+    """
+
+    request_id: str
+    deployment: str
+    application: str
+    replica_id: str = ""
+    # Set by the proxy when it receives the request. Not set for requests that
+    # don't come from a proxy.
+    proxy_received_s: Optional[float] = None
+    # Set by the router when the request is assigned to it.
+    router_received_s: Optional[float] = None
+    # Set by the router when the request is sent to the chosen replica.
+    router_sent_s: Optional[float] = None
+    # Set by the replica when the request is received.
+    replica_received_s: Optional[float] = None
+    # Set by the replica when user code starts and finishes handling the request.
+    user_code_started_s: Optional[float] = None
+    user_code_finished_s: Optional[float] = None
+
+    def get_stage_latencies_ms(self) -> Dict[str, float]:
+        """Returns the latency of each stage that has both timestamps set."""
+        stage_latencies_ms = {}
+        for stage, (start_field, end_field) in STAGE_BOUNDARIES.items():
+            start_s = getattr(self, start_field)
+            end_s = getattr(self, end_field)
+            if start_s is not None and end_s is not None:
+                stage_latencies_ms[stage] = (end_s - start_s) * 1000
+
+        return stage_latencies_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        trace_dict = asdict(self)
+        trace_dict["stage_latencies_ms"] = self.get_stage_latencies_ms()
+        return trace_dict
+
+
+def should_sample_request() -> bool:
+    return (
+        RAY_SERVE_REQUEST_TRACE_SAMPLE_RATE > 0
+        and random.random() < RAY_SERVE_REQUEST_TRACE_SAMPLE_RATE
+    )
+
+
+def create_stage_latency_histogram() -> metrics.Histogram:
+    return metrics.Histogram(
+        "serve_request_stage_latency_ms",
+        description=(
+            "The latency of each stage of sampled requests: proxy, router, "
+            "rpc, replica_queue, and user_code."
+        ),
+        boundaries=DEFAULT_LATENCY_BUCKET_MS,
+        tag_keys=("deployment", "application", "stage"),
+    )
+
+
+def record_stage_latencies(
+    histogram: metrics.Histogram, trace: RequestTrace, stages: Tuple[str, ...]
+):
+    """Observes the latency of the given stages of the trace, if they're set."""
+    stage_latencies_ms = trace.get_stage_latencies_ms()
+    for stage in stages:
+        if stage in stage_latencies_ms:
+            histogram.observe(
+                stage_latencies_ms[stage],
+                tags={
+                    "deployment": trace.deployment,
+                    "application": trace.application,
+                    "stage": stage,
+                },
+            )
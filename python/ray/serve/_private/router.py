@@ -24,16 +24,26 @@ from ray.serve._private.config import DeploymentConfig
 from ray.serve._private.constants import (
     HANDLE_METRIC_PUSH_INTERVAL_S,
     RAY_SERVE_COLLECT_AUTOSCALING_METRICS_ON_HANDLE,
+    RAY_SERVE_ENABLE_LONG_POLL_RELAY,
     RAY_SERVE_HANDLE_AUTOSCALING_METRIC_RECORD_PERIOD_S,
+    RAY_SERVE_LOW_PRIORITY_MAX_QUEUEING_DELAY_S,
     SERVE_LOGGER_NAME,
+    SERVE_NAMESPACE,
+    SERVE_PROXY_NAME,
 )
 from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
 from ray.serve._private.metrics_utils import InMemoryMetricsStore, MetricsPusher
 from ray.serve._private.replica_result import ReplicaResult
 from ray.serve._private.replica_scheduler import PendingRequest, ReplicaScheduler
-from ray.serve._private.utils import resolve_deployment_response
+from ray.serve._private.request_tracing import (
+    ROUTER_STAGES,
+    RequestTrace,
+    create_stage_latency_histogram,
+    record_stage_latencies,
+)
+from ray.serve._private.utils import format_actor_name, resolve_deployment_response
 from ray.serve.config import AutoscalingConfig
-from ray.serve.exceptions import BackPressureError
+from ray.serve.exceptions import BackPressureError, LoadSheddingError
 from ray.util import metrics
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
@@ -48,6 +58,13 @@ class RouterMetricsManager:
     PUSH_METRICS_TO_CONTROLLER_TASK_NAME = "push_metrics_to_controller"
     RECORD_METRICS_TASK_NAME = "record_metrics"
 
+    # Estimated queueing delay above which requests with a negative priority are
+    # rejected. A negative value disables load shedding.
+    low_priority_max_queueing_delay_s = RAY_SERVE_LOW_PRIORITY_MAX_QUEUEING_DELAY_S
+
+    # Smoothing factor for the moving average of request latencies.
+    request_latency_ewma_alpha = 0.1
+
     def __init__(
         self,
         deployment_id: DeploymentID,
@@ -114,6 +131,57 @@ class RouterMetricsManager:
         # Track whether the metrics manager has been shutdown
         self._shutdown: bool = False
 
+        # Used to estimate the queueing delay for admission control.
+        self._num_running_replicas: int = 0
+        self._avg_request_latency_s: Optional[float] = None
+
+        # Created lazily when the first request sampled for tracing finishes routing.
+        self._stage_latency_histogram: Optional[metrics.Histogram] = None
+
+    @property
+    def load_shedding_enabled(self) -> bool:
+        return self.low_priority_max_queueing_delay_s >= 0
+
+    def record_request_latency(self, latency_s: float):
+        """Update the moving average of latencies of requests sent to replicas.
+
+        This may be called from a different thread via object ref callbacks.
+        """
+        with self._queries_lock:
+            if self._avg_request_latency_s is None:
+                self._avg_request_latency_s = latency_s
+            else:
+                self._avg_request_latency_s += self.request_latency_ewma_alpha * (
+                    latency_s - self._avg_request_latency_s
+                )
+
+    def record_request_trace(self, trace: RequestTrace):
+        """Records the latency of the stages of a traced request up to routing."""
+        if self._stage_latency_histogram is None:
+            self._stage_latency_histogram = create_stage_latency_histogram()
+
+        record_stage_latencies(self._stage_latency_histogram, trace, ROUTER_STAGES)
+
+    def estimate_queueing_delay_s(self) -> Optional[float]:
+        """Estimate how long a new request would wait to be assigned to a replica.
+
+        Assumes queued requests are drained by all running replicas in parallel, each
+        processing up to `max_ongoing_requests` requests at the average latency.
+
+        Returns `None` if there isn't enough information to make an estimate.
+        """
+        if (
+            self.deployment_config is None
+            or self._avg_request_latency_s is None
+            or self._num_running_replicas == 0
+        ):
+            return None
+
+        capacity = (
+            self._num_running_replicas * self.deployment_config.max_ongoing_requests
+        )
+        return self.num_queued_requests / capacity * self._avg_request_latency_s
+
     @contextmanager
     def wrap_request_assignment(self, request_meta: RequestMetadata):
         max_queued_requests = (
@@ -132,6 +200,20 @@ class RouterMetricsManager:
             logger.warning(e.message)
             raise e
 
+        if self.load_shedding_enabled and request_meta.priority < 0:
+            estimated_queueing_delay_s = self.estimate_queueing_delay_s()
+            if (
+                estimated_queueing_delay_s is not None
+                and estimated_queueing_delay_s > self.low_priority_max_queueing_delay_s
+            ):
+                e = LoadSheddingError(
+                    priority=request_meta.priority,
+                    estimated_queueing_delay_s=estimated_queueing_delay_s,
+                    max_queueing_delay_s=self.low_priority_max_queueing_delay_s,
+                )
+                logger.warning(e.message)
+                raise e
+
         try:
             self.inc_num_total_requests(request_meta.route)
             self.inc_num_queued_requests()
@@ -151,6 +233,7 @@ class RouterMetricsManager:
         in memory as the deployment upscales and downscales over time.
         """
 
+        self._num_running_replicas = len(running_replicas)
         running_replica_set = {replica.replica_id for replica in running_replicas}
         with self._queries_lock:
             self.num_requests_sent_to_replicas = defaultdict(
@@ -331,6 +414,17 @@ class Router(ABC):
         pass
 
 
+def _get_local_long_poll_relay() -> Optional[ActorHandle]:
+    """Get the proxy on this node, which relays long poll updates, if any."""
+    node_id = ray.get_runtime_context().get_node_id()
+    try:
+        return ray.get_actor(
+            format_actor_name(SERVE_PROXY_NAME, node_id), namespace=SERVE_NAMESPACE
+        )
+    except ValueError:
+        return None
+
+
 class AsyncioRouter:
     def __init__(
         self,
@@ -398,21 +492,60 @@ class AsyncioRouter:
             ),
         )
 
-        self.long_poll_client = LongPollClient(
-            controller_handle,
+        # Poll the proxy on this node for updates if it's relaying them. Fall
+        # back to the controller if there's no proxy or it dies.
+        self.long_poll_client: Optional[LongPollClient] = None
+        if (
+            RAY_SERVE_ENABLE_LONG_POLL_RELAY
+            and handle_source != DeploymentHandleSource.PROXY
+        ):
+            # Looking up the proxy blocks, so the long poll client is started
+            # on the event loop once the lookup is done in a background thread.
+            self._start_long_poll_client_task = None
+            self._event_loop.call_soon_threadsafe(
+                self._start_long_poll_client_with_relay, controller_handle
+            )
+        else:
+            self.long_poll_client = self._create_long_poll_client(controller_handle)
+
+    def _create_long_poll_client(
+        self, host_actor: ActorHandle, fallback_host_actor: Optional[ActorHandle] = None
+    ) -> LongPollClient:
+        return LongPollClient(
+            host_actor,
             {
                 (
                     LongPollNamespace.RUNNING_REPLICAS,
-                    deployment_id,
+                    self.deployment_id,
                 ): self.update_running_replicas,
                 (
                     LongPollNamespace.DEPLOYMENT_CONFIG,
-                    deployment_id,
+                    self.deployment_id,
                 ): self.update_deployment_config,
             },
             call_in_event_loop=self._event_loop,
+            fallback_host_actor=fallback_host_actor,
         )
 
+    def _start_long_poll_client_with_relay(self, controller_handle: ActorHandle):
+        async def start():
+            try:
+                local_relay = await self._event_loop.run_in_executor(
+                    None, _get_local_long_poll_relay
+                )
+            except Exception:
+                logger.exception("Failed to look up the long poll relay.")
+                local_relay = None
+
+            if local_relay is None:
+                self.long_poll_client = self._create_long_poll_client(controller_handle)
+            else:
+                self.long_poll_client = self._create_long_poll_client(
+                    local_relay, fallback_host_actor=controller_handle
+                )
+
+        self._start_long_poll_client_task = self._event_loop.create_task(start())
+
     def running_replicas_populated(self) -> bool:
         return self._running_replicas_populated
 
@@ -503,6 +636,8 @@ class AsyncioRouter:
         request, so it's up to the caller to time out or cancel the request.
         """
         replica = await self._replica_scheduler.choose_replica_for_request(pr)
+        if pr.metadata._trace is not None:
+            pr.metadata._trace.router_sent_s = time.time()
 
         # If the queue len cache is disabled or we're sending a request to Java,
         # then directly send the query and hand the response back. The replica will
@@ -555,6 +690,8 @@ class AsyncioRouter:
             replica = await self._replica_scheduler.choose_replica_for_request(
                 pr, is_retry=True
             )
+            if pr.metadata._trace is not None:
+                pr.metadata._trace.router_sent_s = time.time()
 
     async def assign_request(
         self,
@@ -563,6 +700,8 @@ class AsyncioRouter:
         **request_kwargs,
     ) -> ReplicaResult:
         """Assign a request to a replica and return the resulting object_ref."""
+        if request_meta._trace is not None:
+            request_meta._trace.router_received_s = time.time()
 
         response_id = uuid.uuid4()
         assign_request_task = asyncio.current_task()
@@ -595,6 +734,8 @@ class AsyncioRouter:
                         metadata=request_meta,
                     ),
                 )
+                if request_meta._trace is not None:
+                    self._metrics_manager.record_request_trace(request_meta._trace)
 
                 # Keep track of requests that have been sent out to replicas
                 if RAY_SERVE_COLLECT_AUTOSCALING_METRICS_ON_HANDLE:
@@ -611,6 +752,14 @@ class AsyncioRouter:
                     )
                     replica_result.add_done_callback(callback)
 
+                if self._metrics_manager.load_shedding_enabled:
+                    sent_at = time.time()
+                    replica_result.add_done_callback(
+                        lambda _: self._metrics_manager.record_request_latency(
+                            time.time() - sent_at
+                        )
+                    )
+
                 return replica_result
             except asyncio.CancelledError:
                 # NOTE(edoakes): this is not strictly necessary because
@@ -5,7 +5,7 @@ import threading
 import time
 from contextlib import asynccontextmanager
 from copy import copy, deepcopy
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import grpc
 import requests
@@ -16,8 +16,21 @@ import ray.util.state as state_api
 from ray import serve
 from ray.actor import ActorHandle
 from ray.serve._private.client import ServeControllerClient
-from ray.serve._private.common import DeploymentID, DeploymentStatus, RequestProtocol
+from ray.serve._private.common import (
+    DeploymentID,
+    DeploymentStatus,
+    ReplicaID,
+    RequestProtocol,
+)
+from ray.serve._private.config import ReplicaConfig
 from ray.serve._private.constants import SERVE_DEFAULT_APP_NAME, SERVE_NAMESPACE
+from ray.serve._private.deployment_scheduler import (
+    DefaultDeploymentScheduler,
+    DeploymentDownscaleRequest,
+    ReplicaSchedulingRequest,
+    Resources,
+    SpreadDeploymentSchedulingPolicy,
+)
 from ray.serve._private.deployment_state import ALL_REPLICA_STATES, ReplicaState
 from ray.serve._private.proxy import DRAINING_MESSAGE
 from ray.serve._private.usage import ServeUsageTag
@@ -199,6 +212,203 @@ class MockPlacementGroup:
         self._soft_target_node_id = _soft_target_node_id
 
 
+class DeploymentSchedulerSimulator:
+    """Simulates replica placement by the deployment scheduler on a synthetic cluster.
+
+    Replicas are placed on the node targeted by the scheduler if it fits,
+    otherwise on the node with the most available CPUs that fits (mimicking
+    the spread strategy). Placed replicas start running immediately.
+
+    Example:
+        sim = DeploymentSchedulerSimulator({"node1": {"CPU": 4}})
+        sim.add_deployment("A", {"CPU": 1})
+        sim.scale("A", 3)
+        sim.compact()
+    """
+
+    def __init__(
+        self,
+        node_resources: Dict[str, Dict[str, float]],
+        *,
+        use_compact_scheduling_strategy: bool = True,
+        head_node_id: str = "head-node-id",
+    ):
+        self._cluster_node_info_cache = MockClusterNodeInfoCache()
+        self._total_resources = {
+            node_id: Resources(resources)
+            for node_id, resources in node_resources.items()
+        }
+        self._available_resources = deepcopy(self._total_resources)
+        for node_id, resources in node_resources.items():
+            self._cluster_node_info_cache.add_node(node_id, resources)
+
+        self.scheduler = DefaultDeploymentScheduler(
+            self._cluster_node_info_cache, head_node_id, None
+        )
+        self.scheduler.USE_COMPACT_SCHEDULING_STRATEGY = use_compact_scheduling_strategy
+        # Simulated time doesn't advance, so don't rate limit compactions.
+        self.scheduler._compaction_interval_s = 0
+
+        self._deployment_resources: Dict[DeploymentID, Resources] = dict()
+        # {deployment_id: {replica_id: node_id}}
+        self._replicas: Dict[DeploymentID, Dict[ReplicaID, str]] = dict()
+        self._next_replica_index = 0
+        self.num_failed_placements = 0
+
+    def add_deployment(self, name: str, resources: Dict[str, float]):
+        deployment_id = DeploymentID(name=name)
+        resources = copy(resources)
+        ray_actor_options = {
+            "num_cpus": resources.pop("CPU", 0),
+            "num_gpus": resources.pop("GPU", 0),
+        }
+        if resources:
+            ray_actor_options["resources"] = resources
+
+        self.scheduler.on_deployment_created(
+            deployment_id, SpreadDeploymentSchedulingPolicy()
+        )
+        self.scheduler.on_deployment_deployed(
+            deployment_id,
+            ReplicaConfig.create(lambda: None, ray_actor_options=ray_actor_options),
+        )
+        self._deployment_resources[deployment_id] = Resources(
+            self.scheduler._deployments[deployment_id].required_resources
+        )
+        self._replicas[deployment_id] = dict()
+
+    def scale(self, name: str, num_replicas: int):
+        """Scales a deployment up or down to `num_replicas` replicas."""
+        deployment_id = DeploymentID(name=name)
+        delta = num_replicas - len(self._replicas[deployment_id])
+        upscales, downscales = {}, {}
+        if delta > 0:
+            upscales[deployment_id] = [
+                self._make_scheduling_request(deployment_id) for _ in range(delta)
+            ]
+        elif delta < 0:
+            downscales[deployment_id] = DeploymentDownscaleRequest(
+                deployment_id=deployment_id, num_to_stop=-delta
+            )
+
+        self._schedule(upscales, downscales)
+
+    def compact(self) -> Optional[str]:
+        """Runs a single compaction, returning the compacted node if any.
+
+        Replicas are migrated by starting a replacement replica before
+        stopping the replica on the compacted node.
+        """
+        node_info = self.scheduler.get_node_to_compact(allow_new_compaction=True)
+        if node_info is None:
+            return None
+
+        node_id, _ = node_info
+        for deployment_id, replicas in self._replicas.items():
+            to_migrate = [r for r, n in replicas.items() if n == node_id]
+            if not to_migrate:
+                continue
+
+            self._schedule(
+                {
+                    deployment_id: [
+                        self._make_scheduling_request(deployment_id) for _ in to_migrate
+                    ]
+                },
+                {},
+            )
+            for replica_id in to_migrate:
+                self._stop_replica(replica_id)
+
+        # Marks the compaction as complete.
+        self.scheduler.get_node_to_compact(allow_new_compaction=False)
+        return node_id
+
+    def can_place(self, resources: Dict[str, float]) -> bool:
+        """Whether a replica with the given resources fits on any node."""
+        return any(
+            available.can_fit(Resources(resources))
+            for available in self._available_resources.values()
+        )
+
+    @property
+    def nodes_in_use(self) -> Set[str]:
+        return {
+            node_id
+            for replicas in self._replicas.values()
+            for node_id in replicas.values()
+        }
+
+    def _make_scheduling_request(
+        self, deployment_id: DeploymentID
+    ) -> ReplicaSchedulingRequest:
+        replica_id = ReplicaID(
+            unique_id=f"replica-{self._next_replica_index}",
+            deployment_id=deployment_id,
+        )
+        self._next_replica_index += 1
+
+        def on_scheduled(actor_handle, placement_group):
+            self._place_replica(
+                replica_id, actor_handle._options["scheduling_strategy"]
+            )
+
+        return ReplicaSchedulingRequest(
+            replica_id=replica_id,
+            actor_def=MockActorClass(),
+            actor_resources=dict(self._deployment_resources[deployment_id]),
+            actor_options={"name": replica_id.unique_id},
+            actor_init_args=(),
+            on_scheduled=on_scheduled,
+        )
+
+    def _schedule(
+        self,
+        upscales: Dict[DeploymentID, List[ReplicaSchedulingRequest]],
+        downscales: Dict[DeploymentID, DeploymentDownscaleRequest],
+    ):
+        to_stop = self.scheduler.schedule(upscales, downscales)
+        for replica_ids in to_stop.values():
+            for replica_id in replica_ids:
+                self._stop_replica(replica_id)
+
+    def _place_replica(self, replica_id: ReplicaID, scheduling_strategy: Any):
+        required = self._deployment_resources[replica_id.deployment_id]
+        node_id = getattr(scheduling_strategy, "node_id", None)
+        if node_id is None or not self._available_resources[node_id].can_fit(required):
+            candidates = [
+                n
+                for n, available in self._available_resources.items()
+                if available.can_fit(required)
+            ]
+            if not candidates:
+                self.num_failed_placements += 1
+                self.scheduler.on_replica_stopping(replica_id)
+                return
+
+            node_id = max(
+                candidates, key=lambda n: self._available_resources[n].get("CPU")
+            )
+
+        self._available_resources[node_id] -= required
+        self._cluster_node_info_cache.set_available_resources_per_node(
+            node_id, self._available_resources[node_id]
+        )
+        self._replicas[replica_id.deployment_id][replica_id] = node_id
+        self.scheduler.on_replica_running(replica_id, node_id)
+
+    def _stop_replica(self, replica_id: ReplicaID):
+        self.scheduler.on_replica_stopping(replica_id)
+        node_id = self._replicas[replica_id.deployment_id].pop(replica_id, None)
+        if node_id is not None:
+            self._available_resources[node_id] += self._deployment_resources[
+                replica_id.deployment_id
+            ]
+            self._cluster_node_info_cache.set_available_resources_per_node(
+                node_id, self._available_resources[node_id]
+            )
+
+
 class MockDeploymentHandle:
     def __init__(self, deployment_name: str, app_name: str = SERVE_DEFAULT_APP_NAME):
         self._deployment_name = deployment_name
@@ -557,7 +557,10 @@ def delete(name: str, _blocking: bool = True):
 
 @PublicAPI(stability="beta")
 def multiplexed(
-    func: Optional[Callable[..., Any]] = None, max_num_models_per_replica: int = 3
+    func: Optional[Callable[..., Any]] = None,
+    max_num_models_per_replica: int = 3,
+    max_model_memory_bytes_per_replica: Optional[int] = None,
+    enable_model_prefetch: bool = False,
 ):
     """Wrap a callable or method used to load multiplexed models in a replica.
 
@@ -573,7 +576,10 @@ def multiplexed(
     necessary.
 
     When the number of models in one replica is larger than max_num_models_per_replica,
-    the models will be unloaded using an LRU policy.
+    the models will be unloaded using an LRU policy. If
+    max_model_memory_bytes_per_replica is set, models will also be unloaded using an
+    LRU policy to keep their total memory footprint (measured as the growth of the
+    replica's memory usage while loading each model) within the limit.
 
     If you want to release resources after the model is loaded, you can define
     a `__del__` method in your model class. The `__del__` method will be called when
@@ -617,6 +623,14 @@ def multiplexed(
             set it to a larger number if you have enough memory on
             the node resource, in opposite, you can set it to a smaller
             number if you want to save memory on the node resource.
+        max_model_memory_bytes_per_replica: the maximum total memory footprint
+            in bytes of the models loaded on each replica. By default, there is
+            no memory limit and only max_num_models_per_replica applies.
+        enable_model_prefetch: if True, each replica tracks how frequently
+            each model ID is requested and loads the most frequently requested
+            model in the background when there is spare capacity, so that
+            subsequent requests don't pay the model loading latency. Prefetching
+            never unloads other models. Defaults to False.
     """
 
     if func is not None:
@@ -645,6 +659,15 @@ def multiplexed(
     if max_num_models_per_replica != -1 and max_num_models_per_replica <= 0:
         raise ValueError("max_num_models_per_replica must be positive.")
 
+    if max_model_memory_bytes_per_replica is not None:
+        if not isinstance(max_model_memory_bytes_per_replica, int):
+            raise TypeError("max_model_memory_bytes_per_replica must be an integer.")
+        if max_model_memory_bytes_per_replica <= 0:
+            raise ValueError("max_model_memory_bytes_per_replica must be positive.")
+
+    if not isinstance(enable_model_prefetch, bool):
+        raise TypeError("enable_model_prefetch must be a boolean.")
+
     def _multiplex_decorator(func: Callable):
         @wraps(func)
         async def _multiplex_wrapper(*args):
@@ -681,7 +704,13 @@ def multiplexed(
             # create a model multiplex wrapper and cache it in the multiplex object.
             if not hasattr(multiplex_object, multiplex_attr):
                 model_multiplex_wrapper = _ModelMultiplexWrapper(
-                    func, self, max_num_models_per_replica
+                    func,
+                    self,
+                    max_num_models_per_replica,
+                    max_model_memory_bytes_per_replica=(
+                        max_model_memory_bytes_per_replica
+                    ),
+                    enable_model_prefetch=enable_model_prefetch,
                 )
                 setattr(multiplex_object, multiplex_attr, model_multiplex_wrapper)
             else:
@@ -178,6 +178,8 @@ class _RequestContext:
     multiplexed_model_id: str = ""
     grpc_context: Optional[RayServegRPCContext] = None
     is_http_request: bool = False
+    # Time the proxy received the request, only set if it's sampled for tracing.
+    _proxy_received_s: Optional[float] = None
 
 
 _serve_request_context = contextvars.ContextVar(
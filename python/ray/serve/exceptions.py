@@ -26,6 +26,25 @@ class BackPressureError(RayServeException):
         return self._message
 
 
+@PublicAPI(stability="alpha")
+class LoadSheddingError(BackPressureError):
+    """Raised when a low priority request is shed because of overload."""
+
+    def __init__(
+        self,
+        *,
+        priority: int,
+        estimated_queueing_delay_s: float,
+        max_queueing_delay_s: float,
+    ):
+        self._message = (
+            f"Request with priority {priority} dropped due to overload "
+            f"(estimated_queueing_delay_s={estimated_queueing_delay_s:.3f}, "
+            f"max_queueing_delay_s={max_queueing_delay_s})."
+        )
+        RayServeException.__init__(self, self._message)
+
+
 @PublicAPI(stability="alpha")
 class RequestCancelledError(RayServeException, TaskCancelledError):
     """Raise when a Serve request is cancelled."""
@@ -25,6 +25,7 @@ from ray.serve._private.handle_options import (
     InitHandleOptionsBase,
 )
 from ray.serve._private.replica_result import ReplicaResult
+from ray.serve._private.request_tracing import RequestTrace, should_sample_request
 from ray.serve._private.router import Router
 from ray.serve._private.usage import ServeUsageTag
 from ray.serve._private.utils import (
@@ -583,6 +584,7 @@ class DeploymentResponseGenerator(_DeploymentResponseBase):
         """
 
         ServeUsageTag.DEPLOYMENT_HANDLE_TO_OBJECT_REF_API_USED.record("1")
+        self._check_not_coalesced()
 
         replica_result = await self._fetch_future_result_async()
         return replica_result.to_object_ref_gen()
@@ -610,10 +612,25 @@ class DeploymentResponseGenerator(_DeploymentResponseBase):
                 "Sync methods should not be called from within an `asyncio` event "
                 "loop. Use `await response._to_object_ref()` instead."
             )
+        self._check_not_coalesced()
 
         replica_result = self._fetch_future_result_sync(_timeout_s)
         return replica_result.to_object_ref_gen()
 
+    def _check_not_coalesced(self):
+        """Raise if the replica may batch results into a single object.
+
+        The objects in such a stream are `StreamingResultBatch`es rather than the
+        results yielded by the user method, so they can't be handed out directly.
+        """
+        if self._request_metadata.coalesce_stream_results:
+            raise RuntimeError(
+                "A `DeploymentResponseGenerator` from a handle with "
+                "`_coalesce_stream_results=True` cannot be converted to an "
+                "`ObjectRefGenerator` or passed to another deployment. Use "
+                "`handle.options(_coalesce_stream_results=False)` for this call."
+            )
+
 
 @PublicAPI(stability="beta")
 class DeploymentHandle(_DeploymentHandleBase):
@@ -661,6 +678,8 @@ class DeploymentHandle(_DeploymentHandleBase):
         stream: Union[bool, DEFAULT] = DEFAULT.VALUE,
         use_new_handle_api: Union[bool, DEFAULT] = DEFAULT.VALUE,
         _prefer_local_routing: Union[bool, DEFAULT] = DEFAULT.VALUE,
+        _priority: Union[int, DEFAULT] = DEFAULT.VALUE,
+        _coalesce_stream_results: Union[bool, DEFAULT] = DEFAULT.VALUE,
     ) -> "DeploymentHandle":
         """Set options for this handle and return an updated copy of it.
 
@@ -690,6 +709,8 @@ class DeploymentHandle(_DeploymentHandleBase):
             multiplexed_model_id=multiplexed_model_id,
             stream=stream,
             _prefer_local_routing=_prefer_local_routing,
+            _priority=_priority,
+            _coalesce_stream_results=_coalesce_stream_results,
         )
 
     def remote(
@@ -725,19 +746,36 @@ class DeploymentHandle(_DeploymentHandleBase):
         _request_context = ray.serve.context._serve_request_context.get()
 
         request_protocol = RequestProtocol.UNDEFINED
-        if (
+        is_proxy_handle = (
             self.init_options
             and self.init_options._source == DeploymentHandleSource.PROXY
-        ):
+        )
+        if is_proxy_handle:
             if _request_context.is_http_request:
                 request_protocol = RequestProtocol.HTTP
             elif _request_context.grpc_context:
                 request_protocol = RequestProtocol.GRPC
 
-        request_metadata = RequestMetadata(
-            request_id=_request_context.request_id
+        request_id = (
+            _request_context.request_id
             if _request_context.request_id
-            else generate_request_id(),
+            else generate_request_id()
+        )
+
+        # Requests from the proxy are sampled for tracing by the proxy.
+        trace = None
+        if _request_context._proxy_received_s is not None or (
+            not is_proxy_handle and should_sample_request()
+        ):
+            trace = RequestTrace(
+                request_id=request_id,
+                deployment=self.deployment_name,
+                application=self.app_name,
+                proxy_received_s=_request_context._proxy_received_s,
+            )
+
+        request_metadata = RequestMetadata(
+            request_id=request_id,
             internal_request_id=_request_context._internal_request_id
             if _request_context._internal_request_id
             else generate_request_id(),
@@ -746,8 +784,11 @@ class DeploymentHandle(_DeploymentHandleBase):
             app_name=self.app_name,
             multiplexed_model_id=self.handle_options.multiplexed_model_id,
             is_streaming=self.handle_options.stream,
+            priority=self.handle_options._priority,
+            coalesce_stream_results=self.handle_options._coalesce_stream_results,
             _request_protocol=request_protocol,
             grpc_context=_request_context.grpc_context,
+            _trace=trace,
         )
 
         future = self._remote(request_metadata, args, kwargs)
@@ -1,9 +1,12 @@
 import asyncio
+import heapq
 import inspect
 import logging
 import time
 from collections import OrderedDict
-from typing import Any, Callable, List, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import psutil
 
 from ray.serve import metrics
 from ray.serve._private.common import MultiplexedReplicaInfo
@@ -32,15 +35,32 @@ class _ModelMultiplexWrapper:
     The model will be unloaded in the LRU order, the model multiplexer will call the
     model's __del__ attribute if it exists to clean up the model resources eagerly.
 
+    If a memory budget is specified, the memory footprint of each model is measured
+    as the growth of the replica's memory usage while loading it, and models are also
+    unloaded in LRU order to keep the total footprint within the budget.
+
+    If prefetching is enabled, the multiplexer tracks how frequently each model ID is
+    requested and, when there is spare capacity, loads the most frequently requested
+    model that isn't loaded in the background so it's ready for the next request.
     """
 
     _PUSH_MULTIPLEXED_MODEL_IDS_TASK_NAME = "push_multiplexed_model_ids"
 
+    # Half-life of the decayed request counts used to pick models to prefetch.
+    _REQUEST_FREQUENCY_HALF_LIFE_S = 60.0
+    # Decayed request counts below this are dropped from the request stats.
+    _MIN_REQUEST_FREQUENCY = 0.01
+    # Maximum number of model IDs to keep request stats for.
+    _MAX_NUM_TRACKED_MODEL_IDS = 1000
+
     def __init__(
         self,
         model_load_func: Callable[[str], Any],
         self_arg: Any,
         max_num_models_per_replica: int,
+        max_model_memory_bytes_per_replica: Optional[int] = None,
+        enable_model_prefetch: bool = False,
+        get_memory_usage_bytes: Optional[Callable[[], int]] = None,
     ):
         """Initialize the model multiplexer.
         Args:
@@ -49,6 +69,14 @@ class _ModelMultiplexWrapper:
             max_num_models_per_replica: the maximum number of models to be loaded on the
                 current replica. If it is -1, there is no limit for the number of models
                 per replica.
+            max_model_memory_bytes_per_replica: the maximum total memory footprint
+                of the models loaded on the current replica. If it is None, there is
+                no memory limit.
+            enable_model_prefetch: whether to load frequently requested models in
+                the background when there is spare capacity.
+            get_memory_usage_bytes: function returning the current memory usage of
+                the replica, used to measure model footprints. Defaults to the
+                resident set size of the current process.
         """
 
         ServeUsageTag.MULTIPLEXED_API_USED.record("1")
@@ -57,6 +85,22 @@ class _ModelMultiplexWrapper:
         self._func: Callable = model_load_func
         self.self_arg: Any = self_arg
         self.max_num_models_per_replica: int = max_num_models_per_replica
+        self.max_model_memory_bytes_per_replica: Optional[
+            int
+        ] = max_model_memory_bytes_per_replica
+        self.enable_model_prefetch: bool = enable_model_prefetch
+        self._get_memory_usage_bytes: Callable[[], int] = (
+            get_memory_usage_bytes
+            if get_memory_usage_bytes is not None
+            else lambda: psutil.Process().memory_info().rss
+        )
+
+        # Measured memory footprint of each model. Entries are kept after the model
+        # is unloaded to estimate the footprint if it's loaded again.
+        self._model_size_bytes: Dict[str, int] = {}
+        # Exponentially decayed request count and last update time for each model.
+        self._model_request_frequency: Dict[str, Tuple[float, float]] = {}
+        self._prefetch_task: Optional[asyncio.Task] = None
 
         self.model_load_latency_ms = metrics.Histogram(
             "serve_multiplexed_model_load_latency_ms",
@@ -90,6 +134,16 @@ class _ModelMultiplexWrapper:
             "serve_multiplexed_models_load_counter",
             description="The counter for loaded models on the current replica.",
         )
+        self.models_prefetch_counter = metrics.Counter(
+            "serve_multiplexed_models_prefetch_counter",
+            description="The counter for prefetched models on the current replica.",
+        )
+        self.models_memory_bytes_gauge = metrics.Gauge(
+            "serve_multiplexed_models_memory_bytes",
+            description=(
+                "The total memory footprint of models loaded on the current replica."
+            ),
+        )
 
         context = _get_internal_replica_context()
         if context is None:
@@ -134,6 +188,7 @@ class _ModelMultiplexWrapper:
         """Push the multiplexed replica info to the controller."""
         try:
             self.num_models_gauge.set(len(self.models))
+            self.models_memory_bytes_gauge.set(self._get_total_model_size_bytes())
 
             for model_id in self.models:
                 self.registered_model_gauge.set(1, tags={"model_id": model_id})
@@ -152,8 +207,169 @@ class _ModelMultiplexWrapper:
                 f"to the controller. Error: {e}"
             )
 
+    def _get_total_model_size_bytes(self) -> int:
+        return sum(self._model_size_bytes.get(model_id, 0) for model_id in self.models)
+
+    def _estimate_model_size_bytes(self, model_id: str) -> int:
+        """Estimate the footprint of a model before it's loaded.
+
+        Uses the last measured footprint of the model if it was loaded before, else
+        the average footprint of all models measured so far.
+        """
+        if model_id in self._model_size_bytes:
+            return self._model_size_bytes[model_id]
+        if len(self._model_size_bytes) == 0:
+            return 0
+        return sum(self._model_size_bytes.values()) // len(self._model_size_bytes)
+
+    def _is_over_capacity(self, additional_bytes: int, additional_models: int) -> bool:
+        """Whether the model cache would exceed its limits with the additions."""
+        if (
+            self.max_num_models_per_replica > 0
+            and len(self.models) + additional_models > self.max_num_models_per_replica
+        ):
+            return True
+
+        return (
+            self.max_model_memory_bytes_per_replica is not None
+            and self._get_total_model_size_bytes() + additional_bytes
+            > self.max_model_memory_bytes_per_replica
+        )
+
+    def _get_decayed_request_count(self, model_id: str, now: float) -> float:
+        """Get the request count of the model decayed to `now`."""
+        count, last_updated = self._model_request_frequency[model_id]
+        return count * 0.5 ** (
+            (now - last_updated) / self._REQUEST_FREQUENCY_HALF_LIFE_S
+        )
+
+    def _record_model_request(self, model_id: str):
+        """Update the decayed request count for the model."""
+        now = time.time()
+        count = 0.0
+        if model_id in self._model_request_frequency:
+            count = self._get_decayed_request_count(model_id, now)
+        self._model_request_frequency[model_id] = (count + 1, now)
+
+        if len(self._model_request_frequency) > self._MAX_NUM_TRACKED_MODEL_IDS:
+            self._prune_model_request_frequency(now)
+
+    def _prune_model_request_frequency(self, now: float):
+        """Drop the request stats of rarely requested models.
+
+        Models whose decayed request count is negligible are dropped, then the
+        least frequently requested ones until at most half of
+        `_MAX_NUM_TRACKED_MODEL_IDS` are left, so pruning runs infrequently.
+        """
+        decayed_counts = {
+            model_id: self._get_decayed_request_count(model_id, now)
+            for model_id in self._model_request_frequency
+        }
+        model_ids = heapq.nlargest(
+            self._MAX_NUM_TRACKED_MODEL_IDS // 2,
+            (
+                model_id
+                for model_id, count in decayed_counts.items()
+                if count >= self._MIN_REQUEST_FREQUENCY
+            ),
+            key=decayed_counts.__getitem__,
+        )
+        self._model_request_frequency = {
+            model_id: (decayed_counts[model_id], now) for model_id in model_ids
+        }
+
+    def _get_model_id_to_prefetch(self) -> Optional[str]:
+        """Get the most frequently requested model that isn't loaded or loading.
+
+        Returns None if there's no such model or loading it would require unloading
+        another model.
+        """
+        now = time.time()
+        model_id = max(
+            (
+                model_id
+                for model_id in self._model_request_frequency
+                if model_id not in self.models
+                and model_id not in self._model_load_tasks
+            ),
+            key=lambda model_id: self._get_decayed_request_count(model_id, now),
+            default=None,
+        )
+        if model_id is None or (
+            self._get_decayed_request_count(model_id, now) < self._MIN_REQUEST_FREQUENCY
+        ):
+            return None
+
+        if self._is_over_capacity(
+            self._estimate_model_size_bytes(model_id), additional_models=1
+        ):
+            return None
+
+        return model_id
+
+    def _maybe_start_prefetch(self):
+        if not self.enable_model_prefetch or (
+            self._prefetch_task is not None and not self._prefetch_task.done()
+        ):
+            return
+
+        model_id = self._get_model_id_to_prefetch()
+        if model_id is not None:
+            self._prefetch_task = asyncio.get_running_loop().create_task(
+                self._prefetch_model(model_id)
+            )
+
+    async def _prefetch_model(self, model_id: str):
+        """Load the model in the background without unloading any other model."""
+        self._push_multiplexed_replica_info = True
+        self._model_load_tasks.add(model_id)
+        async with self._model_cache_lock:
+            try:
+                # Re-check as requests may have filled the cache in the meantime.
+                if model_id in self.models or self._is_over_capacity(
+                    self._estimate_model_size_bytes(model_id), additional_models=1
+                ):
+                    return
+
+                logger.info(f"Prefetching model '{model_id}'.")
+                self.models_prefetch_counter.inc()
+                await self._load_model_into_cache(model_id)
+            except Exception as e:
+                logger.warning(f"Failed to prefetch model '{model_id}'. Error: {e}")
+                self._model_request_frequency.pop(model_id, None)
+            finally:
+                self._model_load_tasks.discard(model_id)
+                self._push_multiplexed_replica_info = True
+
+    async def _load_model_into_cache(self, model_id: str) -> Any:
+        """Call the user load function and measure the model's footprint.
+
+        Must be called while holding `self._model_cache_lock`.
+        """
+        self.models_load_counter.inc()
+        load_start_time = time.time()
+        memory_before_load_bytes = self._get_memory_usage_bytes()
+        if self.self_arg is None:
+            model = await self._func(model_id)
+        else:
+            model = await self._func(self.self_arg, model_id)
+        self._model_size_bytes[model_id] = max(
+            0, self._get_memory_usage_bytes() - memory_before_load_bytes
+        )
+        self.models[model_id] = model
+        load_latency_ms = (time.time() - load_start_time) * 1000.0
+        logger.info(
+            f"Successfully loaded model '{model_id}' in "
+            f"{load_latency_ms:.1f}ms "
+            f"({self._model_size_bytes[model_id]} bytes)."
+        )
+        self.model_load_latency_ms.observe(load_latency_ms)
+        return model
+
     async def shutdown(self):
         """Unload all the models when the model multiplexer is deleted."""
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
         while len(self.models) > 0:
             try:
                 await self.unload_model_lru()
@@ -180,7 +396,15 @@ class _ModelMultiplexWrapper:
             raise ValueError("The model ID cannot be empty.")
 
         self.get_model_requests_counter.inc()
+        if self.enable_model_prefetch:
+            self._record_model_request(model_id)
+
+        try:
+            return await self._load_model(model_id)
+        finally:
+            self._maybe_start_prefetch()
 
+    async def _load_model(self, model_id: str) -> Any:
         if model_id in self.models:
             # Move the model to the end of the OrderedDict to ensure LRU caching.
             model = self.models.pop(model_id)
@@ -198,40 +422,35 @@ class _ModelMultiplexWrapper:
                 if model_id in self.models:
                     return self.models[model_id]
                 try:
-                    # If the number of models per replica is specified, check
-                    # if the number of models on the current replica has
-                    # reached the limit.
-                    if (
-                        self.max_num_models_per_replica > 0
-                        and len(self.models) >= self.max_num_models_per_replica
+                    # Unload the least recently used models until the model count
+                    # and estimated memory footprint are within the limits.
+                    expected_size_bytes = self._estimate_model_size_bytes(model_id)
+                    while len(self.models) > 0 and self._is_over_capacity(
+                        expected_size_bytes, additional_models=1
                     ):
-                        # Unload the least recently used model.
                         await self.unload_model_lru()
                         self._push_multiplexed_replica_info = True
 
                     # Load the model.
                     logger.info(f"Loading model '{model_id}'.")
-                    self.models_load_counter.inc()
-                    load_start_time = time.time()
-                    if self.self_arg is None:
-                        self.models[model_id] = await self._func(model_id)
-                    else:
-                        self.models[model_id] = await self._func(
-                            self.self_arg, model_id
-                        )
-                    load_latency_ms = (time.time() - load_start_time) * 1000.0
-                    logger.info(
-                        f"Successfully loaded model '{model_id}' in "
-                        f"{load_latency_ms:.1f}ms."
-                    )
+                    model = await self._load_model_into_cache(model_id)
+
+                    # The measured footprint may be larger than estimated.
+                    while len(self.models) > 1 and self._is_over_capacity(
+                        0, additional_models=0
+                    ):
+                        await self.unload_model_lru()
+                        self._push_multiplexed_replica_info = True
+
                     self._model_load_tasks.discard(model_id)
-                    self.model_load_latency_ms.observe(load_latency_ms)
-                    return self.models[model_id]
+                    return model
                 except Exception as e:
                     logger.error(
                         f"Failed to load model '{model_id}'. Error: {e}",
                     )
                     self._model_load_tasks.discard(model_id)
+                    # Don't retry a model that failed to load in the background.
+                    self._model_request_frequency.pop(model_id, None)
                     raise e
 
     async def unload_model_lru(self) -> None:
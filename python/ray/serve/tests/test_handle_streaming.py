@@ -133,6 +133,30 @@ class TestAppHandleStreaming:
         with pytest.raises(RuntimeError, match="oopsies"):
             next(gen)
 
+    def test_coalesce_stream_results(self, serve_instance, deployment: Deployment):
+        h = serve.run(deployment.bind()).options(
+            stream=True, _coalesce_stream_results=True
+        )
+
+        # Results may be batched by the replica but are returned individually.
+        gen = h.remote(1000)
+        assert list(gen) == list(range(1000))
+
+        # The stream can't be converted to an `ObjectRefGenerator`, but can still
+        # be iterated.
+        gen = h.remote(10)
+        with pytest.raises(RuntimeError, match="_coalesce_stream_results"):
+            gen._to_object_ref_gen_sync()
+        assert list(gen) == list(range(10))
+
+        gen = h.remote(0)
+        with pytest.raises(StopIteration):
+            next(gen)
+
+        gen = h.remote(0, should_error=True)
+        with pytest.raises(RuntimeError, match="oopsies"):
+            next(gen)
+
 
 @pytest.mark.parametrize("deployment", [AsyncStreamer, SyncStreamer])
 class TestDeploymentHandleStreaming:
@@ -15,10 +15,13 @@ from ray.serve._private.common import (
     ReplicaID,
     RunningReplicaInfo,
 )
+from ray import cloudpickle
 from ray.serve._private.long_poll import (
+    ListSnapshotDelta,
     LongPollClient,
     LongPollHost,
     LongPollNamespace,
+    LongPollRelay,
     LongPollState,
     UpdatedObject,
 )
@@ -259,5 +262,185 @@ def test_listen_for_change_java(serve_instance):
     ]
 
 
+def test_list_snapshot_delta():
+    base = list(range(10))
+
+    # Items removed and appended.
+    new = [0, 1, 3, 4, 5, 6, 7, 8, 10, 11]
+    delta = ListSnapshotDelta.compute(1, base, new)
+    assert delta.base_snapshot_id == 1
+    assert delta.removed_indices == [2, 9]
+    assert delta.added == [10, 11]
+    assert delta.apply(base) == new
+
+    # Order isn't preserved by the delta.
+    assert ListSnapshotDelta.compute(1, base, [1, 0] + base[2:]) is None
+    # The delta is larger than the new snapshot.
+    assert ListSnapshotDelta.compute(1, base, [10, 11]) is None
+    # Not lists of hashable items.
+    assert ListSnapshotDelta.compute(1, {"a": 1}, {"a": 2}) is None
+    assert ListSnapshotDelta.compute(1, [[0], [1]], [[0], [2]]) is None
+
+
+@pytest.mark.asyncio
+async def test_host_serialize_snapshots_once(serve_instance):
+    host = LongPollHost(serialize_snapshots_once=True)
+    host.notify_changed({"key_1": list(range(100))})
+
+    update_1 = (await host.listen_for_change({"key_1": -1}))["key_1"]
+    update_2 = (await host.listen_for_change({"key_1": -1}))["key_1"]
+    # The same update is shared by all listeners and only serialized once.
+    assert update_1 is update_2
+    serialized = cloudpickle.dumps(update_1)
+    assert update_1._serialized is not None
+    assert cloudpickle.dumps(update_2) == serialized
+
+    deserialized = cloudpickle.loads(serialized)
+    assert deserialized.object_snapshot == list(range(100))
+    assert deserialized.snapshot_id == update_1.snapshot_id
+
+
+@pytest.mark.asyncio
+async def test_client_delta_updates(serve_instance):
+    host = ray.remote(LongPollHost).remote(enable_deltas=True)
+    ray.get(host.notify_changed.remote({"key_1": list(range(10))}))
+
+    callback_results = dict()
+
+    def key_1_callback(result):
+        callback_results["key_1"] = result
+
+    client = LongPollClient(
+        host,
+        {"key_1": key_1_callback},
+        call_in_event_loop=get_or_create_event_loop(),
+        accept_deltas=True,
+    )
+
+    await async_wait_for_condition(
+        lambda: callback_results.get("key_1") == list(range(10)), timeout=1
+    )
+    snapshot_id = client.snapshot_ids["key_1"]
+
+    new_snapshot = list(range(1, 11))
+    ray.get(host.notify_changed.remote({"key_1": new_snapshot}))
+    await async_wait_for_condition(
+        lambda: callback_results.get("key_1") == new_snapshot, timeout=1
+    )
+
+    # Clients that have the previous snapshot get the delta from it.
+    update: UpdatedObject = ray.get(
+        host.listen_for_change.remote({"key_1": snapshot_id}, accept_deltas=True)
+    )["key_1"]
+    assert update.object_snapshot is None
+    assert update.delta.removed_indices == [0]
+    assert update.delta.added == [10]
+
+    # Other clients get the full snapshot.
+    update: UpdatedObject = ray.get(host.listen_for_change.remote({"key_1": -1}))[
+        "key_1"
+    ]
+    assert update.object_snapshot == new_snapshot
+    assert update.delta is None
+
+
+@pytest.mark.asyncio
+async def test_client_relay(serve_instance):
+    @ray.remote
+    class RelayActor:
+        def __init__(self, upstream_host):
+            self.relay = LongPollRelay(upstream_host, get_or_create_event_loop())
+
+        async def listen_for_change(self, keys_to_snapshot_ids, accept_deltas=False):
+            return await self.relay.listen_for_change(
+                keys_to_snapshot_ids, accept_deltas=accept_deltas
+            )
+
+    host = ray.remote(LongPollHost).remote()
+    relay = RelayActor.remote(host)
+    ray.get(host.notify_changed.remote({"key_1": 100}))
+
+    callback_results = dict()
+
+    def key_1_callback(result):
+        callback_results["key_1"] = result
+
+    client = LongPollClient(
+        relay,
+        {"key_1": key_1_callback},
+        call_in_event_loop=get_or_create_event_loop(),
+        fallback_host_actor=host,
+    )
+    await async_wait_for_condition(
+        lambda: callback_results.get("key_1") == 100, timeout=5
+    )
+
+    ray.get(host.notify_changed.remote({"key_1": 200}))
+    await async_wait_for_condition(
+        lambda: callback_results.get("key_1") == 200, timeout=5
+    )
+
+    # The client should fall back to polling the host if the relay dies.
+    ray.kill(relay)
+    ray.get(host.notify_changed.remote({"key_1": 300}))
+    await async_wait_for_condition(
+        lambda: callback_results.get("key_1") == 300, timeout=5
+    )
+    assert client.host_actor == host
+
+
+@pytest.mark.asyncio
+async def test_relay_unsubscribes_unused_keys(serve_instance):
+    @ray.remote
+    class RelayActor:
+        def __init__(self, upstream_host):
+            self.relay = LongPollRelay(
+                upstream_host, get_or_create_event_loop(), unsubscribe_after_s=0.5
+            )
+
+        async def listen_for_change(self, keys_to_snapshot_ids, accept_deltas=False):
+            return await self.relay.listen_for_change(
+                keys_to_snapshot_ids, accept_deltas=accept_deltas
+            )
+
+        def get_subscribed_keys(self):
+            return set(self.relay._upstream_clients.keys())
+
+    host = ray.remote(LongPollHost).remote()
+    relay = RelayActor.remote(host)
+    ray.get(host.notify_changed.remote({"key_1": 100, "key_2": 200}))
+
+    callback_results = dict()
+
+    client_1 = LongPollClient(
+        relay,
+        {"key_1": lambda result: callback_results.update(key_1=result)},
+        call_in_event_loop=get_or_create_event_loop(),
+    )
+    LongPollClient(
+        relay,
+        {"key_2": lambda result: callback_results.update(key_2=result)},
+        call_in_event_loop=get_or_create_event_loop(),
+    )
+    await async_wait_for_condition(
+        lambda: callback_results == {"key_1": 100, "key_2": 200}, timeout=5
+    )
+    assert ray.get(relay.get_subscribed_keys.remote()) == {"key_1", "key_2"}
+
+    # The relay stops polling the host for keys that aren't listened to anymore.
+    client_1.stop()
+    ray.get(host.notify_changed.remote({"key_1": 101}))
+    await async_wait_for_condition(
+        lambda: ray.get(relay.get_subscribed_keys.remote()) == {"key_2"}, timeout=5
+    )
+
+    # Keys that are still listened to keep being relayed.
+    ray.get(host.notify_changed.remote({"key_2": 201}))
+    await async_wait_for_condition(
+        lambda: callback_results.get("key_2") == 201, timeout=5
+    )
+    assert callback_results["key_1"] == 100
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", "-s", __file__]))
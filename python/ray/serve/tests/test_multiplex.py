@@ -1,5 +1,6 @@
 import asyncio
 import os
+import time
 from typing import List
 
 import pytest
@@ -219,6 +220,101 @@ class TestMultiplexWrapper:
         assert "3" in multiplexer.models
         assert len(multiplexer._model_load_tasks) == 0
 
+    async def test_memory_budget_eviction(self, start_serve_with_context):
+        """Test that models are unloaded to stay within the memory budget."""
+        memory_usage_bytes = 0
+        model_sizes = {"small": 10, "medium": 30, "large": 80}
+
+        async def model_load_func(model_id: str):
+            nonlocal memory_usage_bytes
+            memory_usage_bytes += model_sizes[model_id]
+            return model_id
+
+        multiplexer = _ModelMultiplexWrapper(
+            model_load_func,
+            None,
+            max_num_models_per_replica=-1,
+            max_model_memory_bytes_per_replica=100,
+            get_memory_usage_bytes=lambda: memory_usage_bytes,
+        )
+        await multiplexer.metrics_pusher.graceful_shutdown()
+
+        await multiplexer.load_model("small")
+        await multiplexer.load_model("medium")
+        assert multiplexer.models == {"small": "small", "medium": "medium"}
+        assert multiplexer._model_size_bytes == {"small": 10, "medium": 30}
+
+        # "large" is estimated from the average footprint, but goes over budget
+        # once measured, so the other models are unloaded in LRU order.
+        await multiplexer.load_model("large")
+        assert multiplexer.models == {"large": "large"}
+        assert multiplexer._get_total_model_size_bytes() == 80
+
+        # The measured footprint is used to evict ahead of reloading "small".
+        await multiplexer.load_model("medium")
+        await multiplexer.load_model("small")
+        assert "large" not in multiplexer.models
+        assert multiplexer._get_total_model_size_bytes() <= 100
+
+    async def test_prefetch_frequent_models(self, start_serve_with_context):
+        """Test that frequently requested models are prefetched into spare capacity."""
+
+        async def model_load_func(model_id: str):
+            return model_id
+
+        multiplexer = _ModelMultiplexWrapper(
+            model_load_func,
+            None,
+            max_num_models_per_replica=2,
+            enable_model_prefetch=True,
+        )
+        await multiplexer.metrics_pusher.graceful_shutdown()
+
+        await multiplexer.load_model("1")
+        await multiplexer.load_model("1")
+        await multiplexer.load_model("2")
+        # Evicts "1" even though it's requested more frequently.
+        await multiplexer.load_model("3")
+        assert set(multiplexer.models) == {"2", "3"}
+
+        # No spare capacity, so nothing should be prefetched.
+        await asyncio.sleep(0.1)
+        assert set(multiplexer.models) == {"2", "3"}
+
+        # Free up capacity; "1" is prefetched after the next request.
+        await multiplexer.unload_model_lru()
+        await multiplexer.load_model("3")
+        await multiplexer._prefetch_task
+        assert set(multiplexer.models) == {"1", "3"}
+
+    async def test_prefetch_decays_request_frequency(self, start_serve_with_context):
+        """Test that prefetching ranks models by request counts decayed to now."""
+
+        async def model_load_func(model_id: str):
+            return model_id
+
+        multiplexer = _ModelMultiplexWrapper(
+            model_load_func,
+            None,
+            max_num_models_per_replica=2,
+            enable_model_prefetch=True,
+        )
+        await multiplexer.metrics_pusher.graceful_shutdown()
+
+        # "old" was requested much more, but long ago.
+        now = time.time()
+        multiplexer._model_request_frequency["old"] = (100.0, now - 3600)
+        multiplexer._model_request_frequency["new"] = (2.0, now)
+        assert multiplexer._get_model_id_to_prefetch() == "new"
+
+        # Stale entries are dropped once too many model IDs are tracked.
+        multiplexer._MAX_NUM_TRACKED_MODEL_IDS = 4
+        for model_id in ["a", "b", "c"]:
+            multiplexer._record_model_request(model_id)
+        assert "old" not in multiplexer._model_request_frequency
+        assert "new" in multiplexer._model_request_frequency
+        assert len(multiplexer._model_request_frequency) <= 2
+
 
 class TestBasicAPI:
     def test_decorator_validation(self):
@@ -264,6 +360,20 @@ class TestBasicAPI:
             async def get_model4(model: str):
                 pass
 
+        # max_model_memory_bytes_per_replica must be positive
+        with pytest.raises(ValueError):
+
+            @serve.multiplexed(max_model_memory_bytes_per_replica=0)
+            async def get_model7(model: str):
+                pass
+
+        # enable_model_prefetch must be a boolean
+        with pytest.raises(TypeError):
+
+            @serve.multiplexed(enable_model_prefetch="yes")
+            async def get_model8(model: str):
+                pass
+
         # multiplexed function must be async def
         with pytest.raises(TypeError):
 
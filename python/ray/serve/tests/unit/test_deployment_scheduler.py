@@ -19,6 +19,7 @@ from ray.serve._private.deployment_scheduler import (
     SpreadDeploymentSchedulingPolicy,
 )
 from ray.serve._private.test_utils import (
+    DeploymentSchedulerSimulator,
     MockActorClass,
     MockClusterNodeInfoCache,
     MockPlacementGroup,
@@ -1137,5 +1138,96 @@ class TestCompactScheduling:
         )
 
 
+class TestCompaction:
+    def test_compact_fragmented_nodes(self):
+        """Replicas spread across nodes should be compacted to free up nodes."""
+
+        sim = DeploymentSchedulerSimulator(
+            {f"node{i}": {"CPU": 4} for i in range(3)},
+            use_compact_scheduling_strategy=False,
+        )
+        sim.add_deployment("A", {"CPU": 1})
+        sim.scale("A", 3)
+        assert sim.nodes_in_use == {"node0", "node1", "node2"}
+        # There's enough total capacity, but it's fragmented.
+        assert not sim.can_place({"CPU": 4})
+
+        sim.scheduler.USE_COMPACT_SCHEDULING_STRATEGY = True
+        assert sim.compact() == "node0"
+        assert sim.nodes_in_use == {"node1", "node2"}
+        assert sim.compact() == "node2"
+        assert sim.nodes_in_use == {"node1"}
+        assert sim.can_place({"CPU": 4})
+
+        # Nothing left to compact.
+        assert sim.compact() is None
+        assert sim.num_failed_placements == 0
+
+    def test_no_compaction_if_replicas_dont_fit(self):
+        sim = DeploymentSchedulerSimulator(
+            {"node0": {"CPU": 4}, "node1": {"CPU": 4, "GPU": 1}},
+            use_compact_scheduling_strategy=False,
+        )
+        sim.add_deployment("A", {"CPU": 3})
+        sim.add_deployment("B", {"CPU": 1, "GPU": 1})
+        sim.scale("A", 2)
+        sim.scale("B", 1)
+
+        sim.scheduler.USE_COMPACT_SCHEDULING_STRATEGY = True
+        assert sim.compact() is None
+        assert len(sim.nodes_in_use) == 2
+
+    def test_compaction_rate_limited(self):
+        sim = DeploymentSchedulerSimulator(
+            {f"node{i}": {"CPU": 4} for i in range(3)},
+            use_compact_scheduling_strategy=False,
+        )
+        sim.add_deployment("A", {"CPU": 1})
+        sim.scale("A", 3)
+
+        sim.scheduler.USE_COMPACT_SCHEDULING_STRATEGY = True
+        sim.scheduler._compaction_interval_s = 100
+        assert sim.compact() == "node0"
+        assert sim.compact() is None
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_autoscaling_churn(self, seed: int):
+        """Randomized autoscaling churn on a synthetic heterogeneous cluster."""
+
+        rng = random.Random(seed)
+        node_resources = {}
+        for i in range(8):
+            if rng.random() < 0.25:
+                node_resources[f"node{i}"] = {"CPU": 8, "GPU": 2}
+            else:
+                node_resources[f"node{i}"] = {"CPU": rng.choice([4, 8, 16])}
+
+        sim = DeploymentSchedulerSimulator(node_resources)
+        deployment_resources = {
+            "small": {"CPU": 1},
+            "medium": {"CPU": 2},
+            "large": {"CPU": 4},
+            "gpu": {"CPU": 1, "GPU": 1},
+        }
+        for name, resources in deployment_resources.items():
+            sim.add_deployment(name, resources)
+
+        for _ in range(50):
+            sim.scale(rng.choice(list(deployment_resources)), rng.randint(0, 4))
+
+            # Resources on a node should never be oversubscribed.
+            for available in sim._available_resources.values():
+                assert all(val >= 0 for val in available.values())
+
+        num_replicas = sum(len(replicas) for replicas in sim._replicas.values())
+        num_nodes_in_use = len(sim.nodes_in_use)
+        while sim.compact() is not None:
+            assert len(sim.nodes_in_use) < num_nodes_in_use
+            num_nodes_in_use = len(sim.nodes_in_use)
+
+        # Compaction shouldn't drop any replicas.
+        assert num_replicas == sum(len(r) for r in sim._replicas.values())
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", "-s", __file__]))
@@ -89,6 +89,8 @@ class MockReplicaActorWrapper:
         self.health_check_called = False
         # Returned by the health check.
         self.healthy = True
+        # Returned by `next_health_check_time`. Always due by default.
+        self._next_health_check_time = 0.0
         self._is_cross_language = False
         self._actor_handle = MockActorHandle()
         self._node_id = None
@@ -175,6 +177,10 @@ class MockReplicaActorWrapper:
     def initialization_latency_s(self) -> float:
         return self._initialization_latency_s
 
+    @property
+    def next_health_check_time(self) -> float:
+        return self._next_health_check_time
+
     def set_status(self, status: ReplicaStartupStatus):
         self.status = status
 
@@ -194,6 +200,9 @@ class MockReplicaActorWrapper:
     def set_unhealthy(self):
         self.healthy = False
 
+    def set_next_health_check_time(self, next_health_check_time: float):
+        self._next_health_check_time = next_health_check_time
+
     def set_starting_version(self, version: DeploymentVersion):
         """Mocked deployment_worker return version from reconfigure()"""
         self.starting_version = version
@@ -2084,6 +2093,60 @@ def test_health_check(
     assert ds.curr_status_info.status_trigger == DeploymentStatusTrigger.UNSPECIFIED
 
 
+def test_incremental_reconciliation(mock_deployment_state_manager):
+    """Settled deployments should only be reconciled when they have work to do."""
+    create_dsm, timer, _, _ = mock_deployment_state_manager
+    dsm: DeploymentStateManager = create_dsm()
+    dsm._incremental_reconciliation_enabled = True
+
+    info_1, v1 = deployment_info(num_replicas=1, version="1")
+    assert dsm.deploy(TEST_DEPLOYMENT_ID, info_1)
+    ds = dsm._deployment_states[TEST_DEPLOYMENT_ID]
+
+    dsm.update()
+    check_counts(ds, total=1, by_state=[(ReplicaState.STARTING, 1, v1)])
+    replica = ds._replicas.get()[0]
+    replica._actor.set_ready()
+    replica._actor.set_next_health_check_time(timer.time() + 10)
+
+    dsm.update()
+    check_counts(ds, total=1, by_state=[(ReplicaState.RUNNING, 1, v1)])
+    assert ds.curr_status_info.status == DeploymentStatus.HEALTHY
+    assert dsm._next_reconcile_times[TEST_DEPLOYMENT_ID] == timer.time() + 10
+
+    # The deployment is settled, so the replica shouldn't be health checked
+    # until its next health check is due.
+    replica._actor.health_check_called = False
+    replica._actor.set_unhealthy()
+    dsm.update()
+    assert not replica._actor.health_check_called
+    check_counts(ds, total=1, by_state=[(ReplicaState.RUNNING, 1, v1)])
+
+    timer.advance(10)
+    dsm.update()
+    assert replica._actor.health_check_called
+    check_counts(ds, by_state=[(ReplicaState.STOPPING, 1, v1)])
+    assert ds.curr_status_info.status == DeploymentStatus.UNHEALTHY
+    assert TEST_DEPLOYMENT_ID not in dsm._next_reconcile_times
+
+    replica._actor.set_done_stopping()
+    dsm.update()
+    for replica in ds._replicas.get():
+        replica._actor.set_ready()
+        replica._actor.set_next_health_check_time(timer.time() + 10)
+    dsm.update()
+    check_counts(ds, total=1, by_state=[(ReplicaState.RUNNING, 1, v1)])
+    assert ds.curr_status_info.status == DeploymentStatus.HEALTHY
+    assert TEST_DEPLOYMENT_ID in dsm._next_reconcile_times
+
+    # Updating the target state should mark the deployment for reconciliation.
+    info_2, _ = deployment_info(num_replicas=2, version="1")
+    assert dsm.deploy(TEST_DEPLOYMENT_ID, info_2)
+    assert TEST_DEPLOYMENT_ID not in dsm._next_reconcile_times
+    dsm.update()
+    check_counts(ds, total=2)
+
+
 def test_update_while_unhealthy(mock_deployment_state_manager):
     create_dsm, _, _, _ = mock_deployment_state_manager
     dsm: DeploymentStateManager = create_dsm()
@@ -1,5 +1,5 @@
 import pickle
-from typing import Callable
+from typing import Callable, Optional
 
 import grpc
 import pytest
@@ -24,10 +24,15 @@ class FakeGrpcServer:
         self.address = address
 
 
-def fake_service_handler_factory(service_method: str, stream: bool) -> Callable:
+def fake_service_handler_factory(
+    service_method: str,
+    stream: bool,
+    request_deserializer: Optional[Callable] = None,
+) -> Callable:
     def foo() -> bytes:
         return f"{'stream' if stream else 'unary'} call from {service_method}".encode()
 
+    foo.request_deserializer = request_deserializer
     return foo
 
 
@@ -117,6 +122,47 @@ def test_grpc_server():
     )
 
 
+@pytest.mark.parametrize("pass_through_request_bytes", [False, True])
+def test_grpc_server_pass_through_request_bytes(pass_through_request_bytes: bool):
+    """Test `gRPCServer` overrides the `request_deserializer` on the fast path.
+
+    When `pass_through_request_bytes` is set, the server's `request_deserializer`
+    should be None and the original one should be passed to the factory.
+    """
+    service_name = "ray.serve.ServeAPIService"
+    method_name = "ServeRoutes"
+
+    def add_test_servicer_to_server(servicer, server):
+        rpc_method_handlers = {
+            method_name: grpc.unary_unary_rpc_method_handler(
+                servicer.ServeRoutes,
+                request_deserializer=AnyProto.FromString,
+                response_serializer=AnyProto.SerializeToString,
+            ),
+        }
+        generic_handler = grpc.method_handlers_generic_handler(
+            service_name, rpc_method_handlers
+        )
+        server.add_generic_rpc_handlers((generic_handler,))
+
+    grpc_server = create_serve_grpc_server(
+        service_handler_factory=fake_service_handler_factory,
+        pass_through_request_bytes=pass_through_request_bytes,
+    )
+    add_test_servicer_to_server(DummyServicer(), grpc_server)
+
+    rpc_handler = grpc_server.generic_rpc_handlers[0][0]
+    method_handlers = rpc_handler._method_handlers.get(f"/{service_name}/{method_name}")
+    if pass_through_request_bytes:
+        assert method_handlers.request_deserializer is None
+        assert method_handlers.unary_unary.request_deserializer == AnyProto.FromString
+        assert method_handlers.unary_stream.request_deserializer == AnyProto.FromString
+    else:
+        assert method_handlers.request_deserializer == AnyProto.FromString
+        assert method_handlers.unary_unary.request_deserializer is None
+        assert method_handlers.unary_stream.request_deserializer is None
+
+
 def test_ray_serve_grpc_context_serializable():
     """RayServegRPCContext should be serializable."""
     context = RayServegRPCContext(FakeGrpcContext())
@@ -66,6 +66,10 @@ class FakeReplicaWrapper(ReplicaWrapper):
         self.queue_len_deadline_history = list()
         self.num_get_queue_len_calls = 0
 
+        self._pushed_queue_lens = asyncio.Queue()
+        self.num_queue_len_subscriptions = 0
+        self.queue_len_subscription_was_cancelled = False
+
     @property
     def replica_id(self) -> ReplicaID:
         return self._replica_id
@@ -86,6 +90,24 @@ class FakeReplicaWrapper(ReplicaWrapper):
     def max_ongoing_requests(self) -> int:
         return self._max_ongoing_requests
 
+    @property
+    def is_cross_language(self) -> bool:
+        return False
+
+    def push_queue_len(self, queue_len: int):
+        self._pushed_queue_lens.put_nowait(queue_len)
+
+    async def listen_for_queue_len_updates(
+        self, *, min_interval_s: float, keepalive_interval_s: float
+    ):
+        self.num_queue_len_subscriptions += 1
+        try:
+            while True:
+                yield await self._pushed_queue_lens.get()
+        except asyncio.CancelledError:
+            self.queue_len_subscription_was_cancelled = True
+            raise
+
     def set_queue_len_response(
         self,
         queue_len: int,
@@ -148,6 +170,9 @@ def pow_2_scheduler(request) -> PowerOfTwoChoicesReplicaScheduler:
             use_replica_queue_len_cache=request.param.get(
                 "use_replica_queue_len_cache", False
             ),
+            subscribe_to_replica_queue_len_updates=request.param.get(
+                "subscribe_to_replica_queue_len_updates", False
+            ),
             get_curr_time_s=TIMER.time,
         )
         scheduler.backoff_sequence_s = request.param.get(
@@ -177,7 +202,7 @@ def pow_2_scheduler(request) -> PowerOfTwoChoicesReplicaScheduler:
 
 
 def fake_pending_request(
-    *, created_at: Optional[float] = None, model_id: str = ""
+    *, created_at: Optional[float] = None, model_id: str = "", priority: int = 0
 ) -> PendingRequest:
     if created_at is not None:
         return PendingRequest(
@@ -187,6 +212,7 @@ def fake_pending_request(
                 request_id=str(uuid.uuid4()),
                 internal_request_id=str(uuid.uuid4()),
                 multiplexed_model_id=model_id,
+                priority=priority,
             ),
             created_at=created_at,
         )
@@ -198,10 +224,53 @@ def fake_pending_request(
                 request_id=str(uuid.uuid4()),
                 internal_request_id=str(uuid.uuid4()),
                 multiplexed_model_id=model_id,
+                priority=priority,
             ),
         )
 
 
+@pytest.mark.asyncio
+async def test_tasks_scheduled_in_priority_order(pow_2_scheduler):
+    """
+    Verify that pending requests are scheduled in priority order, and in fifo order
+    for requests with the same priority.
+    """
+    s = pow_2_scheduler
+    loop = get_or_create_event_loop()
+
+    priorities = [0, -1, 2, 0, 2, -1, 1]
+    # Expected order: highest priority first, then by arrival.
+    expected_order = sorted(range(len(priorities)), key=lambda i: -priorities[i])
+
+    tasks = []
+    for idx, priority in enumerate(priorities):
+        tasks.append(
+            loop.create_task(
+                s.choose_replica_for_request(fake_pending_request(priority=priority)),
+                name=f"request-{idx}",
+            )
+        )
+
+    done, _ = await asyncio.wait(tasks, timeout=0.01)
+    assert len(done) == 0
+
+    # Only a single request will be accepted at a time due to
+    # `reset_after_response=True`.
+    r1 = FakeReplicaWrapper("r1", reset_after_response=True)
+    r1.set_queue_len_response(0)
+    s.update_replicas([r1])
+    await async_wait_for_condition(lambda: not r1._has_queue_len_response.is_set())
+
+    for expected_idx in expected_order:
+        r1.set_queue_len_response(0)
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        assert len(done) == 1
+
+        t = done.pop()
+        assert t.get_name() == f"request-{expected_idx}"
+        tasks.remove(t)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "pow_2_scheduler",
@@ -1700,6 +1769,128 @@ async def test_queue_len_cache_entries_added_correctly(pow_2_scheduler):
         TIMER.advance(staleness_timeout_s + 1)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "pow_2_scheduler",
+    [
+        {
+            "use_replica_queue_len_cache": True,
+            "subscribe_to_replica_queue_len_updates": True,
+        },
+    ],
+    indirect=True,
+)
+async def test_queue_len_cache_pushed_updates(pow_2_scheduler):
+    """
+    Verify that queue lengths pushed by replicas populate the cache, so replicas
+    are not actively probed.
+    """
+    s = pow_2_scheduler
+    loop = get_or_create_event_loop()
+
+    r1 = FakeReplicaWrapper("r1")
+    s.update_replicas([r1])
+    r1.push_queue_len(3)
+
+    def cache_populated():
+        assert s.replica_queue_len_cache.get(r1.replica_id) == 3
+        return True
+
+    await async_wait_for_condition(cache_populated)
+
+    task = loop.create_task(s.choose_replica_for_request(fake_pending_request()))
+    done, _ = await asyncio.wait([task], timeout=0.1)
+    assert len(done) == 1
+    assert (await task) == r1
+
+    # No probes when the replica set was updated or from scheduling requests.
+    assert len(r1.queue_len_deadline_history) == 0
+    assert r1.num_queue_len_subscriptions == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "pow_2_scheduler",
+    [
+        {
+            "use_replica_queue_len_cache": True,
+            "subscribe_to_replica_queue_len_updates": True,
+        },
+    ],
+    indirect=True,
+)
+async def test_queue_len_cache_pushed_updates_replica_at_capacity(pow_2_scheduler):
+    """
+    Verify that a subscribed replica at capacity is not actively probed and is
+    scheduled once it pushes an update that it has capacity.
+    """
+    s = pow_2_scheduler
+    loop = get_or_create_event_loop()
+
+    r1 = FakeReplicaWrapper("r1")
+    s.update_replicas([r1])
+    r1.push_queue_len(DEFAULT_MAX_ONGOING_REQUESTS)
+
+    task = loop.create_task(s.choose_replica_for_request(fake_pending_request()))
+    done, _ = await asyncio.wait([task], timeout=0.1)
+    assert len(done) == 0
+    assert len(r1.queue_len_deadline_history) == 0
+
+    r1.push_queue_len(DEFAULT_MAX_ONGOING_REQUESTS - 1)
+    done, _ = await asyncio.wait([task], timeout=0.1)
+    assert len(done) == 1
+    assert (await task) == r1
+    assert len(r1.queue_len_deadline_history) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "pow_2_scheduler",
+    [
+        {
+            "use_replica_queue_len_cache": True,
+            "subscribe_to_replica_queue_len_updates": True,
+        },
+    ],
+    indirect=True,
+)
+async def test_queue_len_subscription_cancelled_on_removal(pow_2_scheduler):
+    """
+    Verify that the subscription to a replica's queue length updates is stopped
+    when it's removed from the replica set.
+    """
+    s = pow_2_scheduler
+
+    r1 = FakeReplicaWrapper("r1")
+    r2 = FakeReplicaWrapper("r2")
+    s.update_replicas([r1, r2])
+
+    def subscribed():
+        assert r1.num_queue_len_subscriptions == 1
+        assert r2.num_queue_len_subscriptions == 1
+        return True
+
+    await async_wait_for_condition(subscribed)
+
+    s.update_replicas([r2])
+
+    def r1_unsubscribed():
+        assert r1.queue_len_subscription_was_cancelled
+        assert not r2.queue_len_subscription_was_cancelled
+        return True
+
+    await async_wait_for_condition(r1_unsubscribed)
+
+    # Dying replicas are also unsubscribed.
+    s.on_replica_actor_died(r2.replica_id)
+
+    def r2_unsubscribed():
+        assert r2.queue_len_subscription_was_cancelled
+        return True
+
+    await async_wait_for_condition(r2_unsubscribed)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "pow_2_scheduler",
@@ -236,6 +236,39 @@ class TestgRPCProxyRequest:
         assert isinstance(request_object, gRPCRequest)
         assert pickle.loads(request_object.grpc_user_request) == request_proto
 
+    def test_pass_through_request_bytes(self):
+        """Test initialize gRPCProxyRequest with the raw request bytes.
+
+        When the gRPCProxyRequest is initialized with a `request_deserializer`, the
+        raw request bytes should be passed through to the gRPCRequest as-is and
+        deserialized with the `request_deserializer`.
+        """
+        request_proto = serve_pb2.UserDefinedMessage(name="foo", num=30, foo="bar")
+        request_bytes = request_proto.SerializeToString()
+        context = MagicMock()
+        context.invocation_metadata.return_value = (
+            ("application", "fake-application"),
+        )
+
+        proxy_request = gRPCProxyRequest(
+            request_proto=request_bytes,
+            context=context,
+            service_method="/custom.defined.Service/Method1",
+            stream=False,
+            request_deserializer=serve_pb2.UserDefinedMessage.FromString,
+        )
+        assert proxy_request.request == request_bytes
+        assert proxy_request.method_name == "Method1"
+
+        request_object = proxy_request.request_object()
+        assert isinstance(request_object, gRPCRequest)
+        assert request_object.grpc_user_request == request_bytes
+        assert request_object.deserialize_user_request() == request_proto
+
+        # The request should still be deserializable after a roundtrip.
+        request_object = pickle.loads(pickle.dumps(request_object))
+        assert request_object.deserialize_user_request() == request_proto
+
 
 if __name__ == "__main__":
     import sys
@@ -1,6 +1,16 @@
+import pickle
+
 import pytest
 
 from ray.serve._private.common import RequestMetadata, RequestProtocol
+from ray.serve._private.request_tracing import (
+    PROXY_STAGE,
+    REPLICA_QUEUE_STAGE,
+    ROUTER_STAGE,
+    RPC_STAGE,
+    USER_CODE_STAGE,
+    RequestTrace,
+)
 
 
 def test_request_metadata():
@@ -29,6 +39,7 @@ def test_request_metadata():
     assert request_metadata._request_protocol == RequestProtocol.UNDEFINED
     assert request_metadata.is_http_request is False
     assert request_metadata.is_grpc_request is False
+    assert request_metadata._trace is None
 
     # is_http_request and is_grpc_request returns the correct values when the
     # _request_protocol is set to HTTP.
@@ -43,6 +54,48 @@ def test_request_metadata():
     assert request_metadata.is_grpc_request is True
 
 
+def test_request_trace():
+    """Test the stage latencies of a RequestTrace.
+
+    Only stages that have both of their timestamps set should be included, and the
+    trace should be sent along with the RequestMetadata.
+    """
+    trace = RequestTrace(
+        request_id="request-id", deployment="deployment", application="app"
+    )
+    assert trace.get_stage_latencies_ms() == {}
+
+    trace.router_received_s = 10.0
+    trace.router_sent_s = 10.5
+    trace.replica_received_s = 10.75
+    trace.user_code_started_s = 11.0
+    trace.user_code_finished_s = 12.0
+    assert trace.get_stage_latencies_ms() == {
+        ROUTER_STAGE: 500,
+        RPC_STAGE: 250,
+        REPLICA_QUEUE_STAGE: 250,
+        USER_CODE_STAGE: 1000,
+    }
+
+    trace.proxy_received_s = 9.0
+    assert trace.get_stage_latencies_ms()[PROXY_STAGE] == 1000
+
+    trace_dict = trace.to_dict()
+    assert trace_dict["request_id"] == "request-id"
+    assert trace_dict["stage_latencies_ms"] == trace.get_stage_latencies_ms()
+
+    request_metadata = pickle.loads(
+        pickle.dumps(
+            RequestMetadata(
+                request_id="request-id",
+                internal_request_id="internal-request-id",
+                _trace=trace,
+            )
+        )
+    )
+    assert request_metadata._trace == trace
+
+
 if __name__ == "__main__":
     import sys
 
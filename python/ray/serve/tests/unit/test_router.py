@@ -1,6 +1,7 @@
 import asyncio
 import random
 import sys
+import time
 from collections import defaultdict
 from typing import Callable, Dict, List, Optional, Set, Tuple
 from unittest.mock import Mock, patch
@@ -28,6 +29,7 @@ from ray.serve._private.replica_scheduler import (
     ReplicaWrapper,
 )
 from ray.serve._private.replica_scheduler.pow_2_scheduler import ReplicaQueueLengthCache
+from ray.serve._private.request_tracing import PROXY_STAGE, ROUTER_STAGE, RequestTrace
 from ray.serve._private.router import (
     QUEUED_REQUESTS_KEY,
     AsyncioRouter,
@@ -36,7 +38,7 @@ from ray.serve._private.router import (
 from ray.serve._private.test_utils import FakeCounter, FakeGauge, MockTimer
 from ray.serve._private.utils import get_random_string
 from ray.serve.config import AutoscalingConfig
-from ray.serve.exceptions import BackPressureError
+from ray.serve.exceptions import BackPressureError, LoadSheddingError
 
 
 class FakeReplicaResult(ReplicaResult):
@@ -266,6 +268,36 @@ class TestAssignRequest:
             assert not replica_result._is_generator_object
             assert replica_result._replica_id == r1_id
 
+    async def test_request_trace(
+        self, setup_router: Tuple[AsyncioRouter, FakeReplicaScheduler]
+    ):
+        router, fake_replica_scheduler = setup_router
+        router._metrics_manager.record_request_trace = Mock()
+
+        r1_id = ReplicaID(
+            unique_id="test-replica-1", deployment_id=DeploymentID(name="test")
+        )
+        fake_replica_scheduler.set_replica_to_return(FakeReplica(r1_id))
+
+        # Requests that aren't sampled for tracing don't record a trace.
+        await router.assign_request(dummy_request_metadata())
+        router._metrics_manager.record_request_trace.assert_not_called()
+
+        trace = RequestTrace(
+            request_id="test-request-1",
+            deployment="test",
+            application="default",
+            proxy_received_s=time.time(),
+        )
+        request_metadata = dummy_request_metadata()
+        request_metadata._trace = trace
+        await router.assign_request(request_metadata)
+
+        assert trace.proxy_received_s <= trace.router_received_s
+        assert trace.router_received_s <= trace.router_sent_s
+        router._metrics_manager.record_request_trace.assert_called_once_with(trace)
+        assert set(trace.get_stage_latencies_ms()) == {PROXY_STAGE, ROUTER_STAGE}
+
     @pytest.mark.parametrize(
         "setup_router",
         [
@@ -826,6 +858,62 @@ class TestRouterMetricsManager:
         assert r3 in metrics_manager.num_requests_sent_to_replicas
         assert r4 in metrics_manager.num_requests_sent_to_replicas
 
+    def test_shed_low_priority_requests(self):
+        d_id = DeploymentID(name="a", app_name="b")
+        metrics_manager = RouterMetricsManager(
+            d_id,
+            "random",
+            "random_actor",
+            DeploymentHandleSource.UNKNOWN,
+            Mock(),
+            FakeCounter(
+                tag_keys=("deployment", "route", "application", "handle", "actor_id")
+            ),
+            FakeGauge(tag_keys=("deployment", "application", "handle", "actor_id")),
+            FakeGauge(tag_keys=("deployment", "application", "handle", "actor_id")),
+        )
+        metrics_manager.low_priority_max_queueing_delay_s = 1.0
+        metrics_manager.deployment_config = DeploymentConfig(
+            max_ongoing_requests=2, max_queued_requests=-1
+        )
+        metrics_manager.update_running_replicas(
+            [
+                Mock(replica_id=ReplicaID(unique_id=f"r{i}", deployment_id=d_id))
+                for i in range(2)
+            ]
+        )
+
+        low_priority = RequestMetadata(
+            request_id="low", internal_request_id="low", priority=-1
+        )
+        high_priority = RequestMetadata(request_id="high", internal_request_id="high")
+
+        # No latency information yet, so requests are admitted.
+        assert metrics_manager.estimate_queueing_delay_s() is None
+        with metrics_manager.wrap_request_assignment(low_priority):
+            pass
+
+        # 8 queued requests over a capacity of 4 at 1s each -> 2s of queueing.
+        metrics_manager.record_request_latency(1.0)
+        for _ in range(8):
+            metrics_manager.inc_num_queued_requests()
+        assert metrics_manager.estimate_queueing_delay_s() == 2.0
+
+        with pytest.raises(LoadSheddingError):
+            with metrics_manager.wrap_request_assignment(low_priority):
+                pass
+
+        # Default priority requests are never shed.
+        with metrics_manager.wrap_request_assignment(high_priority):
+            pass
+
+        # Once the queue drains, low priority requests are admitted again.
+        for _ in range(6):
+            metrics_manager.dec_num_queued_requests()
+        assert metrics_manager.estimate_queueing_delay_s() == 0.5
+        with metrics_manager.wrap_request_assignment(low_priority):
+            pass
+
     def test_should_send_scaled_to_zero_optimized_push(self):
         metrics_manager = RouterMetricsManager(
             DeploymentID(name="a", app_name="b"),
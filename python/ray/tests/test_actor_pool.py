@@ -272,6 +272,91 @@ def test_push(init):
     assert len(pool._pending_submits) == 0
 
 
+def test_max_in_flight_per_actor(init):
+    @ray.remote
+    class MyActor:
+        def double(self, x):
+            return 2 * x
+
+    pool = ActorPool([MyActor.remote()], max_in_flight_per_actor=2)
+    for i in range(3):
+        pool.submit(lambda a, v: a.double.remote(v), i)
+    stats = pool.stats()
+    assert stats.num_tasks_in_flight == 2
+    assert stats.num_pending_submits == 1
+    assert pool.has_free() is False
+
+    assert [pool.get_next() for _ in range(3)] == [0, 2, 4]
+    stats = pool.stats()
+    assert stats.num_tasks_completed == 3
+    assert stats.num_idle_actors == 1
+    assert stats.mean_latency_s > 0
+
+    with pytest.raises(ValueError):
+        ActorPool([MyActor.remote()], max_in_flight_per_actor=0)
+    with pytest.raises(ValueError):
+        ActorPool([MyActor.remote()], dispatch_policy="random")
+
+
+def test_latency_ewma_dispatch(init):
+    @ray.remote
+    class MyActor:
+        def __init__(self, delay):
+            self.delay = delay
+
+        def f(self, x):
+            time.sleep(self.delay)
+            return self.delay
+
+    pool = ActorPool(
+        [MyActor.remote(0), MyActor.remote(0.5)],
+        max_in_flight_per_actor=8,
+        dispatch_policy="latency_ewma",
+    )
+    # Sample the latency of both actors.
+    for _ in range(2):
+        pool.submit(lambda a, v: a.f.remote(v), None)
+    assert sorted(pool.get_next() for _ in range(2)) == [0, 0.5]
+
+    # Most tasks should go to the fast actor.
+    results = list(pool.map(lambda a, v: a.f.remote(v), range(8)))
+    assert results.count(0) > results.count(0.5)
+
+
+def test_autoscaling(init):
+    @ray.remote(num_cpus=0)
+    class MyActor:
+        def f(self, x):
+            time.sleep(0.1)
+            return x
+
+    pool = ActorPool(
+        [],
+        actor_factory=MyActor.remote,
+        min_size=1,
+        max_size=3,
+        idle_timeout_s=0,
+    )
+    assert pool.stats().num_actors == 1
+
+    # Scale up for the backlog, up to max_size.
+    for i in range(5):
+        pool.submit(lambda a, v: a.f.remote(v), i)
+    stats = pool.stats()
+    assert stats.num_actors == 3
+    assert stats.num_pending_submits == 2
+
+    # Scale down to min_size once the actors are idle.
+    results = []
+    while pool.has_next():
+        results.append(pool.get_next_unordered())
+    assert sorted(results) == list(range(5))
+    assert pool.stats().num_actors == 1
+
+    with pytest.raises(ValueError):
+        ActorPool([MyActor.remote()], max_size=2)
+
+
 if __name__ == "__main__":
     import os
 
@@ -18,6 +18,7 @@ import ray._private.ray_constants as ray_constants
 import ray._private.utils
 import ray.cluster_utils
 import ray.util.accelerators
+from ray import cloudpickle as pickle
 from ray._private.test_utils import wait_for_condition
 from ray.dashboard import k8s_utils
 from ray.runtime_env import RuntimeEnv
@@ -65,6 +66,59 @@ def test_export_after_shutdown(ray_start_regular):
     ray.get(export_definitions_from_worker.remote(f, Actor))
 
 
+def test_export_same_definition_once(shutdown_only):
+    ray.init(num_cpus=1)
+    gcs_client = ray._private.worker.global_worker.gcs_client
+
+    def f():
+        f.num_calls = getattr(f, "num_calls", 0) + 1
+        return os.getpid(), f.num_calls
+
+    def get_entry(remote_function):
+        key = (
+            b"RemoteFunction:"
+            + ray.get_runtime_context().get_job_id().encode()
+            + b":"
+            + remote_function._function_descriptor.function_id.binary()
+        )
+        return pickle.loads(
+            gcs_client.internal_kv_get(key, ray_constants.KV_NAMESPACE_FUNCTION_TABLE)
+        )
+
+    # Each call to `ray.remote` exports the function with a new function ID.
+    # Only the first export holds the pickled function.
+    f_1, f_2 = ray.remote(f), ray.remote(f)
+    pid_1, num_calls_1 = ray.get(f_1.remote())
+    pid_2, num_calls_2 = ray.get(f_2.remote())
+    entry_1, entry_2 = get_entry(f_1), get_entry(f_2)
+    assert entry_1["function"] is not None
+    assert entry_2["function"] is None
+    assert entry_2["content_hash"] == entry_1["content_hash"]
+
+    # The function is still unpickled for each function ID, so state set on
+    # one of them isn't shared with the other.
+    assert pid_1 == pid_2
+    assert num_calls_1 == num_calls_2 == 1
+
+
+def test_pickled_definition_cache_is_bounded():
+    from ray._private.function_manager import FunctionActorManager
+
+    manager = FunctionActorManager(worker=None)
+    max_bytes = ray_constants.PICKLED_DEFINITION_CACHE_MAX_BYTES
+
+    # Large definitions aren't kept.
+    manager._cache_pickled_definition(b"large", b"0" * (max_bytes // 16 + 1))
+    assert b"large" not in manager._pickled_definitions
+
+    # Small definitions are evicted in LRU order once the cache is full.
+    for i in range(32):
+        manager._cache_pickled_definition(str(i).encode(), b"0" * (max_bytes // 16))
+    assert manager._pickled_definitions_bytes <= max_bytes
+    assert b"0" not in manager._pickled_definitions
+    assert b"31" in manager._pickled_definitions
+
+
 def test_invalid_unicode_in_worker_log(shutdown_only):
     info = ray.init(num_cpus=1)
 
@@ -380,6 +380,48 @@ def test_submit_api(shutdown_only):
     assert ray.get([id1, id2, id3, id4]) == [0, 1, "test", 2]
 
 
+def test_map_remote(shutdown_only):
+    ray.init(num_cpus=2)
+
+    @ray.remote
+    def f(x, y=0):
+        return x + y
+
+    # Items are tuples of positional arguments.
+    assert ray.get(f.map_remote([(1,), (2, 3), (4,)])) == [1, 5, 4]
+    assert ray.get(f.map_remote((i,) for i in range(3))) == [0, 1, 2]
+    assert f.map_remote([]) == []
+    with pytest.raises(TypeError):
+        f.map_remote([1])
+
+    # A tuple can be passed as a single argument.
+    @ray.remote
+    def g(x):
+        return x
+
+    assert ray.get(g.map_remote([((1, 2),)])) == [(1, 2)]
+
+    # Tasks are submitted in chunks and the refs keep the order of the items.
+    refs = f.map_remote(((i, i) for i in range(10)), chunksize=3)
+    assert ray.get(refs) == [2 * i for i in range(10)]
+    with pytest.raises(ValueError):
+        f.map_remote([(1,)], chunksize=0)
+
+    # Large arguments are put in the object store.
+    @ray.remote
+    def size(x):
+        return len(x)
+
+    large = b"0" * (1024 * 1024)
+    assert ray.get(size.map_remote([(large,), (b"0",)] * 2)) == [len(large), 1] * 2
+
+    # Options apply to every task in the batch.
+    refs = f.options(num_returns=2).map_remote([(1,), (2,)])
+    assert all(len(task_refs) == 2 for task_refs in refs)
+    with pytest.raises(ValueError):
+        ray.get(refs[0][0])
+
+
 def test_invalid_arguments():
     import re
 
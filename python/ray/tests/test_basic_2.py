@@ -683,6 +683,57 @@ def test_duplicate_args(ray_start_regular_shared):
     )
 
 
+def test_as_completed(ray_start_regular_shared):
+    @ray.remote(num_cpus=0)
+    def f(x, delay):
+        time.sleep(delay)
+        return x
+
+    # Values are yielded in the order the objects complete.
+    object_refs = [f.remote(0, 2), f.remote(1, 0), f.remote(2, 1)]
+    assert list(ray.as_completed(object_refs)) == [1, 2, 0]
+
+    object_refs = [f.remote(i, 0) for i in range(100)]
+    assert sorted(ray.as_completed(object_refs)) == list(range(100))
+    assert list(ray.as_completed([])) == []
+
+    for batch_size, fetch_local in [(1, False), (7, True), (200, False)]:
+        object_refs = [f.remote(i, 0) for i in range(100)]
+        values = ray.as_completed(
+            object_refs, batch_size=batch_size, fetch_local=fetch_local
+        )
+        assert sorted(values) == list(range(100))
+    with pytest.raises(ValueError):
+        ray.as_completed([f.remote(0, 0)], batch_size=0)
+
+    with pytest.raises(ray.exceptions.GetTimeoutError):
+        list(ray.as_completed([f.remote(0, 10)], timeout=0.1))
+
+    @ray.remote
+    def g():
+        raise ValueError("g failed")
+
+    # Errors are raised for the failed object only, and iteration can go on.
+    values = ray.as_completed([g.remote(), f.remote(1, 1)])
+    with pytest.raises(ray.exceptions.RayTaskError):
+        next(values)
+    assert list(values) == [1]
+
+    # Failed objects in a batch don't affect the other values of the batch.
+    object_refs = [f.remote(0, 0), g.remote(), f.remote(1, 0)]
+    ray.wait(object_refs, num_returns=3)
+    values = ray.as_completed(object_refs, batch_size=3)
+    results = []
+    for _ in range(3):
+        try:
+            results.append(next(values))
+        except ray.exceptions.RayTaskError:
+            results.append("error")
+    assert sorted(results, key=str) == [0, 1, "error"]
+    with pytest.raises(StopIteration):
+        next(values)
+
+
 @pytest.mark.skipif(client_test_enabled(), reason="internal api")
 def test_get_correct_node_ip():
     with patch("ray._private.worker") as worker_mock:
@@ -1409,6 +1409,35 @@ def test_buffered_channel(shutdown_only):
         )
 
 
+def test_buffered_channel_resize(shutdown_only):
+    """Test every buffer of a buffered channel is resized for large values."""
+    NUM_BUFFERS = 3
+
+    @ray.remote(num_cpus=0)
+    class Reader:
+        def setup(self, chan):
+            self._chan = chan
+
+        def read(self, num_values):
+            return [self._chan.read() for _ in range(num_values)]
+
+    reader = Reader.remote()
+    chan = ray_channel.BufferedSharedMemoryChannel(
+        None,
+        [(reader, get_actor_node_id(reader))],
+        NUM_BUFFERS,
+        typ=ray_channel.shared_memory_channel.SharedMemoryType(buffer_size_bytes=1000),
+    )
+    ray.get(reader.setup.remote(chan))
+
+    # Resizing one buffer doesn't leave the other buffers undersized.
+    large_value = b"x" * 2000
+    ref = reader.read.remote(NUM_BUFFERS * 2)
+    for _ in range(NUM_BUFFERS * 2):
+        chan.write(large_value, timeout=10)
+    assert ray.get(ref) == [large_value] * NUM_BUFFERS * 2
+
+
 def test_torch_dtype():
     typ = TorchTensorType()
     typ.register_custom_serializer()
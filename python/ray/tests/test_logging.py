@@ -829,6 +829,86 @@ def test_log_monitor_update_backpressure(tmp_path, mock_timer):
     assert log_monitor.should_update_filenames(current)
 
 
+@pytest.mark.skipif(sys.platform != "linux", reason="Requires inotify.")
+def test_log_monitor_event_driven(tmp_path, monkeypatch):
+    monkeypatch.setattr(ray_constants, "LOG_MONITOR_EVENT_DRIVEN", True)
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    worker_id = "6df6d5dd8ca5215658e4a8f9a569a9d98e27094f9cc35a4ca43d272c"
+    job_id = "01000000"
+    mock_publisher = MagicMock()
+    log_monitor = LogMonitor(
+        "127.0.0.1", str(log_dir), mock_publisher, lambda _: True, max_files_open=5
+    )
+    assert log_monitor._watcher is not None
+
+    worker_out_log_file = f"worker-{worker_id}-{job_id}-100.out"
+    create_file(log_dir, worker_out_log_file, "line1\n")
+    log_monitor.update_log_filenames()
+    log_monitor.open_closed_files()
+    assert log_monitor.check_log_files_and_publish_updates()
+    file_info = log_monitor.open_file_infos[0]
+    assert mock_publisher.publish_logs.call_args[0][0]["lines"] == ["line1"]
+
+    # Unchanged files aren't read.
+    log_monitor._process_file_events(0)
+    assert file_info.filename not in log_monitor._updated_filenames
+    assert not log_monitor.check_log_files_and_publish_updates()
+
+    # New files are found without scanning the log directory.
+    with open(file_info.filename, "a") as f:
+        f.write("line2\n")
+    worker_err_log_file = f"worker-{worker_id}-{job_id}-100.err"
+    create_file(log_dir, worker_err_log_file, "error\n")
+    wait_for_condition(
+        lambda: log_monitor._process_file_events(0.1)
+        or len(log_monitor._updated_filenames) == 2
+    )
+    assert len(log_monitor.log_filenames) == 2
+    log_monitor.open_closed_files()
+    assert log_monitor.check_log_files_and_publish_updates()
+    published_lines = [
+        call[0][0]["lines"] for call in mock_publisher.publish_logs.call_args_list
+    ]
+    assert ["line2"] in published_lines
+    assert ["error"] in published_lines
+
+
+def test_log_monitor_batched_publish(tmp_path, mock_timer, monkeypatch):
+    monkeypatch.setattr(ray_constants, "LOG_MONITOR_PUBLISH_BATCH_INTERVAL_S", 1)
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    worker_id = "6df6d5dd8ca5215658e4a8f9a569a9d98e27094f9cc35a4ca43d272c"
+    mock_publisher = MagicMock()
+    log_monitor = LogMonitor(
+        "127.0.0.1", str(log_dir), mock_publisher, lambda _: True, max_files_open=5
+    )
+    mock_timer.return_value = 0
+    create_file(log_dir, f"worker-{worker_id}-01000000-100.out", "line1\n")
+    log_monitor.update_log_filenames()
+    log_monitor.open_closed_files()
+    file_info = log_monitor.open_file_infos[0]
+
+    # Lines are buffered until the batch interval passes.
+    assert log_monitor.check_log_files_and_publish_updates()
+    with open(file_info.filename, "a") as f:
+        f.write("line2\n")
+    mock_timer.return_value = 0.5
+    assert log_monitor.check_log_files_and_publish_updates()
+    mock_publisher.publish_logs.assert_not_called()
+    mock_timer.return_value = 1
+    assert not log_monitor.check_log_files_and_publish_updates()
+    mock_publisher.publish_logs.assert_called_once()
+    assert mock_publisher.publish_logs.call_args[0][0]["lines"] == ["line1", "line2"]
+
+    # Large batches are published right away.
+    monkeypatch.setattr(ray_constants, "LOG_MONITOR_PUBLISH_BATCH_BYTES", 10)
+    with open(file_info.filename, "a") as f:
+        f.write("a long line\n")
+    assert log_monitor.check_log_files_and_publish_updates()
+    assert mock_publisher.publish_logs.call_count == 2
+
+
 def test_repr_inheritance(shutdown_only):
     """Tests that a subclass's repr is used in logging."""
     logger = logging.getLogger(__name__)
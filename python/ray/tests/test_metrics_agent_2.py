@@ -13,7 +13,15 @@ from opencensus.stats.stats_recorder import StatsRecorder
 from opencensus.stats import execution_context
 from prometheus_client.core import REGISTRY
 from opencensus.metrics.export.metric_descriptor import MetricDescriptorType
-from ray._private.metrics_agent import Gauge, MetricsAgent, Record, RAY_WORKER_TIMEOUT_S
+from ray._private.metrics_agent import (
+    Gauge,
+    MetricsAgent,
+    OpenCensusProxyCollector,
+    Record,
+    OVERFLOW_LABEL_VALUE,
+    RAY_METRICS_MAX_SERIES_PER_METRIC,
+    RAY_WORKER_TIMEOUT_S,
+)
 from ray._private.services import new_port
 from ray.core.generated.metrics_pb2 import (
     Metric,
@@ -389,6 +397,100 @@ def test_metrics_agent_proxy_record_and_export_from_workers_delay(get_agent):  #
     assert time.time() - start > DELAY
 
 
+def test_proxy_collector_merge_and_limit_series(monkeypatch):
+    """
+    Test series with the same labels are merged across workers, and series
+    over the limit are merged into the overflow series.
+    """
+    monkeypatch.setenv(RAY_METRICS_MAX_SERIES_PER_METRIC, "2")
+    collector = OpenCensusProxyCollector("test")
+
+    def record(worker_id, label_values, value):
+        m = generate_protobuf_metric(
+            "test", "desc", "", MetricDescriptorType.CUMULATIVE_DOUBLE
+        )
+        m.timeseries.append(generate_timeseries(label_values, [value]))
+        collector.record([m], worker_id_hex=worker_id)
+
+    def get_samples():
+        (metric,) = [m for m in collector.collect() if m.type == "counter"]
+        return {tuple(s.labels.values()): s.value for s in metric.samples}
+
+    record("worker_1", ["a", "1"], 1)
+    record("worker_2", ["a", "1"], 2)
+    record("worker_2", ["a", "2"], 3)
+    assert get_samples() == {("a", "1"): 3, ("a", "2"): 3}
+
+    # New series are merged into the overflow series.
+    record("worker_1", ["a", "3"], 4)
+    record("worker_2", ["a", "4"], 5)
+    record("worker_2", ["a", "4"], 6)
+    overflow = (OVERFLOW_LABEL_VALUE, OVERFLOW_LABEL_VALUE)
+    assert get_samples() == {("a", "1"): 3, ("a", "2"): 3, overflow: 10}
+
+    # Only the latest values of as many overflowed series as the limit are
+    # kept per component. The rest are folded into a fixed aggregate.
+    record("worker_2", ["a", "6"], 1)
+    record("worker_2", ["a", "7"], 2)
+    record("worker_2", ["a", "7"], 3)
+    assert len(collector._components["worker_2"].metrics["test"]._overflow_data) == 2
+    assert get_samples() == {("a", "1"): 3, ("a", "2"): 3, overflow: 14}
+
+    # Once a series is gone, new series can be exported again.
+    collector._component_timeout_s = -1
+    collector.clean_stale_components()
+    record("worker_3", ["a", "5"], 7)
+    assert get_samples() == {("a", "5"): 7}
+
+
+def test_proxy_collector_merge_gauges():
+    """Test gauges with the same labels take the value reported last."""
+    collector = OpenCensusProxyCollector("test")
+
+    def record(worker_id, value):
+        m = generate_protobuf_metric(
+            "test", "desc", "", MetricDescriptorType.GAUGE_DOUBLE
+        )
+        m.timeseries.append(generate_timeseries(["a", "b"], [value]))
+        collector.record([m], worker_id_hex=worker_id)
+
+    def get_samples():
+        (metric,) = collector.collect()
+        return [s.value for s in metric.samples]
+
+    record("worker_1", 1)
+    record("worker_2", 2)
+    assert get_samples() == [2]
+    record("worker_1", 3)
+    assert get_samples() == [3]
+
+
+def test_proxy_collector_cache_unchanged_metrics():
+    collector = OpenCensusProxyCollector("test")
+
+    def record(name, value):
+        m = generate_protobuf_metric(
+            name, "desc", "", MetricDescriptorType.GAUGE_DOUBLE
+        )
+        m.timeseries.append(generate_timeseries(["a", "b"], [value]))
+        collector.record([m], worker_id_hex="worker")
+
+    def collect():
+        return {metric.name: metric for metric in collector.collect()}
+
+    record("test_1", 1)
+    record("test_2", 2)
+    metrics = collect()
+
+    # Metrics reported again with the same values aren't converted again.
+    record("test_1", 1)
+    record("test_2", 3)
+    new_metrics = collect()
+    assert new_metrics["test_test_1"] is metrics["test_test_1"]
+    assert new_metrics["test_test_2"] is not metrics["test_test_2"]
+    assert new_metrics["test_test_2"].samples[0].value == 3
+
+
 @pytest.mark.skipif(sys.platform == "win32", reason="Flaky on Windows.")
 def test_metrics_agent_export_format_correct(get_agent):
     """
@@ -12,6 +12,7 @@ import math
 import ray
 from ray._private.test_utils import SignalActor
 from ray.util.multiprocessing import Pool, TimeoutError, JoinableQueue
+from ray.util.multiprocessing.pool import PutArg, _put_large_arrays
 
 from ray.util.joblib import register_ray
 
@@ -387,6 +388,79 @@ def test_map_async(pool_4_processes):
         async_result.get()
 
 
+def test_map_adaptive_chunking(shutdown_only):
+    def f(index):
+        # Skew the per-item cost so that some chunks take much longer.
+        if index % 100 == 0:
+            time.sleep(0.1)
+        return index, os.getpid()
+
+    pool = Pool(processes=4, adaptive_chunking=True)
+    results = pool.map(f, range(1000))
+    assert [index for index, _ in results] == list(range(1000))
+    assert len({pid for _, pid in results}) == 4
+
+    assert pool.map(f, []) == []
+    assert pool.starmap(lambda x, y: x + y, zip(range(100), range(100))) == [
+        2 * i for i in range(100)
+    ]
+
+    callback_results = []
+    async_result = pool.map_async(
+        lambda x: x * 2, iter(range(100)), callback=callback_results.append
+    )
+    assert async_result.get(timeout=10) == [2 * i for i in range(100)]
+    async_result.wait(timeout=10)
+    assert callback_results == [[2 * i for i in range(100)]]
+
+    def bad_func(index):
+        if index == 50:
+            raise Exception("test_map_adaptive_chunking failure")
+
+    with pytest.raises(Exception, match="test_map_adaptive_chunking failure"):
+        pool.map(bad_func, range(100))
+
+    pool.terminate()
+    pool.join()
+
+
+def test_map_numpy_args(pool_4_processes):
+    import numpy as np
+
+    arr = np.arange(100 * 1024, dtype=np.int64)
+    small_arr = np.arange(10)
+
+    # Large arrays are put in the object store once, even if passed repeatedly.
+    registry = []
+    args = _put_large_arrays((arr, small_arr, arr), registry)
+    assert isinstance(args[0], PutArg) and isinstance(args[2], PutArg)
+    assert args[0].object_ref == args[2].object_ref
+    assert args[1] is small_arr
+    assert len(registry) == 1
+
+    def f(a, b):
+        result = a.sum() + b.sum(), a.flags.writeable
+        if a.flags.writeable:
+            # Writable arrays are copied for each item, so this isn't seen by
+            # the others.
+            a[:] = 0
+        return result
+
+    results = pool_4_processes.starmap(f, [(arr, small_arr)] * 20)
+    assert results == [(arr.sum() + small_arr.sum(), True)] * 20
+
+    # Read-only arrays are read zero-copy from the object store.
+    readonly_arr = arr.copy()
+    readonly_arr.setflags(write=False)
+    assert not _put_large_arrays((readonly_arr,), [])[0].copy
+    results = pool_4_processes.starmap(f, [(readonly_arr, small_arr)] * 20)
+    assert results == [(arr.sum() + small_arr.sum(), False)] * 20
+
+    # ObjectRefs passed by the user are passed through as-is.
+    ref = ray.put(arr)
+    assert pool_4_processes.map(lambda r: isinstance(r, ray.ObjectRef), [ref]) == [True]
+
+
 def test_starmap(pool):
     def f(*args):
         return args
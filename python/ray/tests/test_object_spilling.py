@@ -16,6 +16,7 @@ from ray._private.external_storage import (
     _get_unique_spill_filename,
     FileSystemStorage,
     ExternalStorageSmartOpenImpl,
+    SpillCompressor,
 )
 from ray._private.internal_api import memory_summary
 from ray._private.test_utils import wait_for_condition
@@ -248,6 +249,75 @@ def test_node_id_in_spill_dir_name():
     storage.destroy_external_storage()
 
 
+def test_spill_compressor():
+    pytest.importorskip("lz4")
+    compressor = SpillCompressor("lz4", min_size=1024, sample_size=1024)
+
+    # Small objects aren't compressed.
+    codec_id, data = compressor.compress(memoryview(b"0" * 100))
+    assert codec_id == SpillCompressor.CODEC_NONE
+
+    compressible = memoryview(np.zeros(1024 * 1024, dtype=np.uint8))
+    codec_id, data = compressor.compress(compressible)
+    assert codec_id == SpillCompressor.CODEC_IDS["lz4"]
+    assert len(data) < len(compressible)
+    assert SpillCompressor.decompress(codec_id, data) == compressible.tobytes()
+
+    # Objects whose samples don't compress are stored as is.
+    incompressible = memoryview(np.random.bytes(1024 * 1024))
+    codec_id, data = compressor.compress(incompressible)
+    assert codec_id == SpillCompressor.CODEC_NONE
+    assert data is incompressible
+
+    with pytest.raises(ValueError):
+        SpillCompressor("gzip")
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="Hangs on Windows.")
+@pytest.mark.parametrize("local_capacity_threshold", [1.0, 0.0])
+def test_tiered_spilling(local_capacity_threshold, shutdown_only, tmp_path):
+    pytest.importorskip("lz4")
+    pytest.importorskip("smart_open")
+    local_dir = tmp_path / "local"
+    remote_dir = tmp_path / "remote"
+    local_dir.mkdir()
+    remote_dir.mkdir()
+    ray.init(
+        num_cpus=0,
+        object_store_memory=75 * 1024 * 1024,
+        _system_config={
+            "max_io_workers": 2,
+            "max_restore_batch_size": 4,
+            "object_spilling_config": json.dumps(
+                {
+                    "type": "tiered",
+                    "params": {
+                        "directory_path": str(local_dir),
+                        "uri": str(remote_dir),
+                        "local_capacity_threshold": local_capacity_threshold,
+                        "compression": "lz4",
+                    },
+                }
+            ),
+        },
+    )
+    node_id = ray.get_runtime_context().get_node_id()
+    compressible = np.zeros(5 * 1024 * 1024)  # 40 MB
+    incompressible = np.random.rand(5 * 1024 * 1024)  # 40 MB
+    refs = [ray.put(arr) for arr in [compressible, incompressible] * 2]
+
+    for ref, expected in zip(refs, [compressible, incompressible] * 2):
+        assert np.array_equal(ray.get(ref), expected)
+
+    # Objects overflow to the URIs once the local disk is full.
+    if local_capacity_threshold == 1.0:
+        assert not is_dir_empty(local_dir, node_id)
+        assert is_dir_empty(remote_dir, node_id, append_path=False)
+    else:
+        assert is_dir_empty(local_dir, node_id)
+        assert not is_dir_empty(remote_dir, node_id, append_path=False)
+
+
 @pytest.mark.skipif(platform.system() == "Windows", reason="Hangs on Windows.")
 def test_spilling_not_done_for_pinned_object(object_spilling_config, shutdown_only):
     # Limit our object store to 75 MiB of memory.
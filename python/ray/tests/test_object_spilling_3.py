@@ -203,6 +203,67 @@ def test_pull_spilled_object(
         assert hash_value == hash_value1
 
 
+@pytest.mark.skipif(platform.system() == "Windows", reason="Hangs on Windows.")
+def test_pull_tiered_spilled_object(ray_start_cluster_enabled, tmp_path):
+    pytest.importorskip("lz4")
+    cluster = ray_start_cluster_enabled
+
+    # Without a URI to overflow to, objects are only spilled to the local
+    # directory of each node, which other nodes can't restore from.
+    cluster.add_node(
+        num_cpus=1,
+        resources={"custom": 0},
+        object_store_memory=75 * 1024 * 1024,
+        _system_config={
+            "max_io_workers": 2,
+            "min_spilling_size": 1 * 1024 * 1024,
+            "automatic_object_spilling_enabled": True,
+            "object_store_full_delay_ms": 100,
+            "object_spilling_config": json.dumps(
+                {
+                    "type": "tiered",
+                    "params": {
+                        "directory_path": str(tmp_path),
+                        "compression": "lz4",
+                    },
+                }
+            ),
+        },
+    )
+    ray.init(cluster.address)
+    worker_node = cluster.add_node(
+        num_cpus=1, resources={"custom": 1}, object_store_memory=75 * 1024 * 1024
+    )
+    cluster.wait_for_nodes()
+
+    @ray.remote(num_cpus=1, resources={"custom": 1})
+    def create_objects():
+        results = []
+        for i in range(5):
+            # Half of the objects are compressed when spilled.
+            if i % 2 == 0:
+                arr = np.full(i * 1024 * 1024, i, dtype=np.float64)
+            else:
+                arr = np.random.rand(i * 1024 * 1024)
+            results.append([ray.put(arr), zlib.crc32(arr.tobytes())])
+        # ensure the objects are spilled
+        arr = np.random.rand(5 * 1024 * 1024)
+        ray.get(ray.put(arr))
+        ray.get(ray.put(arr))
+        return results
+
+    @ray.remote(num_cpus=1, resources={"custom": 0})
+    def get_object(arr):
+        return zlib.crc32(arr.tobytes())
+
+    results = ray.get(create_objects.remote())
+    assert not is_dir_empty(tmp_path, worker_node.node_id)
+    # The objects are restored by the node that spilled them before they are
+    # pushed to the head node.
+    for value_ref, hash_value in results:
+        assert ray.get(get_object.remote(value_ref)) == hash_value
+
+
 # TODO(chenshen): fix error handling when spilled file
 # missing/corrupted
 @pytest.mark.skipif(True, reason="Currently hangs.")
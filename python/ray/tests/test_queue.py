@@ -3,7 +3,7 @@ import time
 
 import ray
 from ray.exceptions import GetTimeoutError, RayActorError
-from ray.util.queue import Queue, Empty, Full
+from ray.util.queue import Queue, Empty, Full, ShardedQueue
 from ray._private.test_utils import wait_for_condition, BatchQueue
 
 
@@ -215,6 +215,84 @@ def test_custom_resources(ray_start_regular_shared):
     q.shutdown()
 
 
+def test_sharded_queue(ray_start_regular_shared):
+    q = ShardedQueue(num_shards=3, batch_size=4)
+
+    # Items are buffered until a batch is full or they're flushed.
+    for item in range(10):
+        q.put(item)
+    assert q.size() == 8
+    q.flush()
+    assert q.size() == 10
+
+    assert sorted(q.get() for _ in range(10)) == list(range(10))
+    assert q.empty()
+    with pytest.raises(Empty):
+        q.get(block=False)
+    with pytest.raises(Empty):
+        q.get(timeout=0.1)
+    with pytest.raises(Empty):
+        q.get_batch(block=False)
+
+    # Batches are taken from all the shards, and only hold the items asked for.
+    for item in range(10):
+        q.put(item)
+    q.flush()
+    batch = q.get_batch(6)
+    assert 0 < len(batch) <= 6
+    assert q.size() == 10 - len(batch)
+    assert sorted(batch + q.get_batch(10)) == list(range(10))
+
+    # Items with the same shard key are kept in order.
+    for item in range(10):
+        q.put(item, shard_key="key")
+    q.flush()
+    assert [q.get() for _ in range(10)] == list(range(10))
+
+    # Producers and consumers can run in other processes.
+    @ray.remote(num_cpus=0)
+    def produce(q, items):
+        for item in items:
+            q.put(item)
+        q.flush()
+
+    @ray.remote(num_cpus=0)
+    def consume(q, num_items):
+        return [q.get(timeout=10) for _ in range(num_items)]
+
+    consumers = [consume.remote(q, 50) for _ in range(2)]
+    ray.get([produce.remote(q, range(i * 50, (i + 1) * 50)) for i in range(2)])
+    results = ray.get(consumers)
+    assert sorted(results[0] + results[1]) == list(range(100))
+
+    q.shutdown()
+    assert q.shards == []
+
+
+def test_sharded_queue_full(ray_start_regular_shared):
+    q = ShardedQueue(maxsize=2, num_shards=2, batch_size=2)
+    q.put(1, shard_key="key")
+    q.flush()
+
+    with pytest.raises(Full):
+        q.put(2, shard_key="key", block=False)
+        q.flush(block=False)
+
+    with pytest.raises(Full):
+        q.put(3, shard_key="key", timeout=0.1)
+        q.flush(timeout=0.1)
+
+    assert q.get() == 1
+
+    # Items that didn't fit stay buffered and are sent later, in order.
+    with pytest.raises(Full):
+        q.flush(timeout=0.1)
+    assert q.get() == 2
+    q.flush()
+    assert q.get() == 3
+    q.shutdown()
+
+
 def test_pull_from_streaming_batch_queue(ray_start_regular_shared):
     class QueueBatchPuller:
         def __init__(self, batch_size, queue):
@@ -1,3 +1,4 @@
+import io
 import os
 import random
 import shutil
@@ -5,6 +6,7 @@ import socket
 import string
 import sys
 import tempfile
+import time
 import uuid
 from filecmp import dircmp
 from pathlib import Path
@@ -17,16 +19,25 @@ import pytest
 from ray._private.gcs_utils import GcsAioClient
 from ray._private.ray_constants import (
     KV_NAMESPACE_PACKAGE,
+    RAY_RUNTIME_ENV_HASH_CACHE_PATH,
     RAY_RUNTIME_ENV_IGNORE_GITIGNORE,
 )
+from ray._private.runtime_env import packaging
 from ray._private.runtime_env.packaging import (
+    CHUNKED_PACKAGE_PREFIX,
     GCS_STORAGE_MAX_SIZE,
     MAC_OS_ZIP_HIDDEN_DIR_NAME,
     Protocol,
     _dir_travel,
     _get_excludes,
+    _hash_file_content_or_directory_name,
     _store_package_in_gcs,
+    complete_package,
+    create_package,
+    delete_package,
     download_and_unpack_package,
+    get_missing_package_files,
+    get_package_manifest,
     get_local_dir_from_uri,
     get_top_level_dir_from_compressed_package,
     get_uri_for_file,
@@ -227,6 +238,34 @@ class TestGetURIForDirectory:
         hex_hash = uri.split("_")[-1][: -len(".zip")]
         assert len(hex_hash) == 16
 
+    def test_hash_cache(self, random_dir, tmp_path_factory, monkeypatch):
+        cache_path = tmp_path_factory.mktemp("cache") / "hashes.json"
+        monkeypatch.setenv(RAY_RUNTIME_ENV_HASH_CACHE_PATH, str(cache_path))
+        # Recently modified files aren't cached.
+        mtime = time.time() - 60
+        for path in [random_dir, *random_dir.rglob("*")]:
+            os.utime(path, (mtime, mtime))
+        uri = get_uri_for_directory(random_dir)
+        assert cache_path.exists()
+
+        hashed_paths = []
+
+        def hash_file(filepath, relative_path, logger=None):
+            hashed_paths.append(filepath)
+            return _hash_file_content_or_directory_name(filepath, relative_path)
+
+        monkeypatch.setattr(
+            packaging, "_hash_file_content_or_directory_name", hash_file
+        )
+        assert get_uri_for_directory(random_dir) == uri
+        assert hashed_paths == []
+
+        # Only the modified file is hashed again.
+        changed_file = next(p for p in random_dir.iterdir() if p.is_file())
+        changed_file.write_text(random_string())
+        assert get_uri_for_directory(random_dir) != uri
+        assert hashed_paths == [changed_file]
+
     @pytest.mark.skipif(
         sys.platform == "win32",
         reason="Unix sockets not available on windows",
@@ -268,6 +307,32 @@ class TestUploadPackageIfNeeded:
         uploaded = upload_package_if_needed(uri, tmp_path, random_dir)
         assert uploaded
 
+    @pytest.mark.asyncio
+    async def test_upload_in_chunks(
+        self, tmp_path_factory, random_dir, ray_start_regular, monkeypatch
+    ):
+        monkeypatch.setattr(packaging, "GCS_STORAGE_CHUNK_SIZE", 1024)
+        uri = get_uri_for_directory(random_dir)
+        assert upload_package_if_needed(uri, None, random_dir)
+        value = _internal_kv_get(uri, namespace=KV_NAMESPACE_PACKAGE)
+        assert value.startswith(CHUNKED_PACKAGE_PREFIX)
+        num_chunks = int(value[len(CHUNKED_PACKAGE_PREFIX) :])
+        assert num_chunks > 1
+        for i in range(num_chunks):
+            chunk = _internal_kv_get(f"{uri}/{i}", namespace=KV_NAMESPACE_PACKAGE)
+            assert len(chunk) <= 1024
+
+        gcs_aio_client = GcsAioClient(
+            address=ray._private.worker.global_worker.gcs_client.address
+        )
+        local_dir = await download_and_unpack_package(
+            pkg_uri=uri,
+            base_directory=str(tmp_path_factory.mktemp("download")),
+            gcs_aio_client=gcs_aio_client,
+        )
+        dcmp = dircmp(random_dir, local_dir)
+        assert dcmp.left_only == dcmp.right_only == dcmp.diff_files == []
+
 
 class TestStorePackageInGcs:
     class DisconnectedClient:
@@ -484,6 +549,133 @@ class TestUnzipPackage:
             assert Path(archive_path).is_file()
 
 
+class TestContentAddressedPackage:
+    @pytest.fixture
+    def package_dir(self, tmp_path) -> Path:
+        package_dir = tmp_path / "package"
+        (package_dir / "subdir").mkdir(parents=True)
+        (package_dir / "empty").mkdir()
+        (package_dir / "a.py").write_text("a")
+        (package_dir / "subdir" / "b.py").write_text("b")
+        # Same contents as a.py.
+        (package_dir / "subdir" / "c.py").write_text("a")
+        return package_dir
+
+    def test_upload_only_missing_files(self, tmp_path, package_dir):
+        blob_store_dir = str(tmp_path / "blobs")
+        manifest = get_package_manifest(str(package_dir))
+        assert set(manifest) == {"a.py", "subdir/b.py", "subdir/c.py"}
+        assert manifest["a.py"] == manifest["subdir/c.py"]
+
+        missing = get_missing_package_files(
+            list(set(manifest.values())), blob_store_dir
+        )
+        assert len(missing) == 2
+        package_file = tmp_path / "package_1.zip"
+        create_package(
+            str(package_dir), package_file, manifest=manifest, missing_hashes=missing
+        )
+        with zipfile.ZipFile(package_file) as zip_ref:
+            # Files with the same contents are only uploaded once.
+            assert len([n for n in zip_ref.namelist() if n.endswith(".py")]) == 2
+        complete_package(str(package_file), io.BytesIO(), blob_store_dir)
+
+        # After changing a file, only that file is uploaded and the rest of the
+        # package is completed from the store.
+        (package_dir / "subdir" / "b.py").write_text("changed")
+        manifest = get_package_manifest(str(package_dir))
+        missing = get_missing_package_files(
+            list(set(manifest.values())), blob_store_dir
+        )
+        assert missing == [manifest["subdir/b.py"]]
+        package_file = tmp_path / "package_2.zip"
+        create_package(
+            str(package_dir), package_file, manifest=manifest, missing_hashes=missing
+        )
+        with zipfile.ZipFile(package_file) as zip_ref:
+            assert "a.py" not in zip_ref.namelist()
+            assert "subdir/b.py" in zip_ref.namelist()
+        with open(tmp_path / "unpacked.zip", "wb") as f:
+            complete_package(str(package_file), f, blob_store_dir)
+
+        target_dir = tmp_path / "unpacked"
+        unzip_package(tmp_path / "unpacked.zip", str(target_dir), False, False)
+        dcmp = dircmp(package_dir, target_dir)
+        assert dcmp.left_only == dcmp.right_only == dcmp.diff_files == []
+        assert (target_dir / "subdir" / "b.py").read_text() == "changed"
+
+        # Files evicted from the store must be uploaded again.
+        shutil.rmtree(blob_store_dir)
+        with pytest.raises(FileNotFoundError):
+            complete_package(str(package_file), io.BytesIO(), blob_store_dir)
+
+    def test_materialize_from_shared_store(self, tmp_path, package_dir, monkeypatch):
+        # Files are copied where clones aren't supported.
+        monkeypatch.setattr(packaging._BlobStore, "supports_clones", lambda _: True)
+        blob_store_dir = str(tmp_path / "blobs")
+        base_dir = tmp_path / "packages"
+        base_dir.mkdir()
+        local_dirs = []
+        for pkg_name in ["pkg_1", "pkg_2"]:
+            package_file = base_dir / f"{pkg_name}.zip"
+            create_package(
+                str(package_dir),
+                package_file,
+                manifest=get_package_manifest(str(package_dir)),
+            )
+            local_dir = base_dir / pkg_name
+            unzip_package(
+                package_file, str(local_dir), False, True, blob_store_dir=blob_store_dir
+            )
+            local_dirs.append(local_dir)
+            (package_dir / "subdir" / "b.py").write_text("changed")
+
+        assert (local_dirs[0] / "subdir" / "b.py").read_text() == "b"
+        assert (local_dirs[1] / "subdir" / "b.py").read_text() == "changed"
+        assert (local_dirs[1] / "empty").is_dir()
+
+        def get_blobs():
+            return [
+                path
+                for path in Path(blob_store_dir).glob("*/*")
+                if path.parent.name != "refs"
+            ]
+
+        # Unchanged files are stored once.
+        assert len(get_blobs()) == 3
+
+        # The files of a package can be modified without affecting the other
+        # packages or the store.
+        (local_dirs[0] / "a.py").write_text("modified")
+        assert (local_dirs[1] / "a.py").read_text() == "a"
+        assert (local_dirs[1] / "subdir" / "c.py").read_text() == "a"
+        assert sorted(blob.read_text() for blob in get_blobs()) == ["a", "b", "changed"]
+
+        # Only files no other package uses are deleted from the store.
+        assert delete_package("gcs://pkg_1.zip", str(base_dir), blob_store_dir)
+        assert len(get_blobs()) == 2
+        assert (local_dirs[1] / "a.py").read_text() == "a"
+
+    def test_extract_without_clones(self, tmp_path, package_dir, monkeypatch):
+        monkeypatch.setattr(packaging._BlobStore, "supports_clones", lambda _: False)
+        blob_store_dir = tmp_path / "blobs"
+        package_file = tmp_path / "pkg.zip"
+        create_package(
+            str(package_dir),
+            package_file,
+            manifest=get_package_manifest(str(package_dir)),
+        )
+        local_dir = tmp_path / "pkg"
+        unzip_package(
+            package_file, str(local_dir), False, False, blob_store_dir=blob_store_dir
+        )
+
+        # The files aren't stored a second time in the store.
+        dcmp = dircmp(package_dir, local_dir)
+        assert dcmp.left_only == dcmp.right_only == dcmp.diff_files == []
+        assert not blob_store_dir.exists()
+
+
 class TestParseUri:
     @pytest.mark.parametrize(
         "parsing_tuple",
@@ -315,6 +315,50 @@ def test_numpy_serialization(ray_start_regular):
     assert len(buffers) == 1
 
 
+def test_serialization_fast_path(ray_start_regular, monkeypatch):
+    context = ray._private.worker.global_worker.get_serialization_context()
+    monkeypatch.setattr(context, "_fast_path_enabled", True)
+
+    @ray.remote
+    def identity(x):
+        return x
+
+    ref = ray.put(1)
+    values = [
+        (1, 2, 3),
+        ("a", (b"b", [1.5, None]), {"c": ()}),
+        (ref, np.int32(7)),
+        np.float64(1.5),
+        np.bool_(True),
+        np.arange(12, dtype=np.int16).reshape(3, 4),
+        np.zeros(0),
+        # Pickled: too large, non-contiguous, and object arrays.
+        np.zeros(10000),
+        np.arange(12).reshape(3, 4).T,
+        np.array(["a", 1], dtype=object),
+    ]
+    for value in values:
+        for result in [ray.get(ray.put(value)), ray.get(identity.remote(value))]:
+            assert type(result) is type(value)
+            if isinstance(value, np.ndarray):
+                assert result.dtype == value.dtype
+                assert np.array_equal(result, value)
+            elif isinstance(value, np.generic):
+                assert result == value
+            elif value[0] is ref:
+                assert ray.get(result[0]) == 1
+                assert result[1] == value[1]
+            else:
+                assert result == value
+
+    # Self-referencing containers fall back to pickle.
+    inner = []
+    value = (inner,)
+    inner.append(value)
+    result = ray.get(ray.put(value))
+    assert result[0][0] is result
+
+
 def test_numpy_subclass_serialization_pickle(ray_start_regular):
     class MyNumpyConstant(np.ndarray):
         def __init__(self, value):
@@ -19,6 +19,7 @@ def test_api_functions():
         "remote",
         "get",
         "wait",
+        "as_completed",
         "put",
         "kill",
         "cancel",
@@ -1,4 +1,7 @@
-from typing import TYPE_CHECKING, Any, Callable, List, TypeVar
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, TypeVar
 
 import ray
 from ray.util.annotations import DeveloperAPI
@@ -8,13 +11,64 @@ if TYPE_CHECKING:
 
 V = TypeVar("V")
 
+# Dispatch tasks to the actor with the fewest tasks in flight.
+LEAST_LOADED = "least_loaded"
+# Dispatch tasks to the actor that is expected to finish them first, based on
+# the number of tasks in flight and the EWMA of its task latency.
+LATENCY_EWMA = "latency_ewma"
+DISPATCH_POLICIES = (LEAST_LOADED, LATENCY_EWMA)
+
+
+@DeveloperAPI
+@dataclass
+class ActorPoolStats:
+    """Point-in-time statistics of an ActorPool."""
+
+    num_actors: int
+    # Actors without any tasks in flight.
+    num_idle_actors: int
+    num_tasks_in_flight: int
+    # Tasks waiting for an actor to have room for them.
+    num_pending_submits: int
+    num_tasks_completed: int
+    # Completed tasks per second since the first task was submitted.
+    throughput: float
+    # Mean of the actors' task latency EWMAs. The latency of a task is
+    # measured from when it's submitted until its result is returned by
+    # the pool.
+    mean_latency_s: Optional[float]
+
 
 @DeveloperAPI
 class ActorPool:
-    """Utility class to operate on a fixed pool of actors.
+    """Utility class to operate on a pool of actors.
+
+    By default, each actor runs one task at a time and the set of actors only
+    changes with `push()` and `pop_idle()`.
 
     Arguments:
         actors: List of Ray actor handles to use in this pool.
+        max_in_flight_per_actor: The maximum number of tasks to submit to each
+            actor before their results are returned. Values above 1 pipeline
+            tasks, so actors don't sit idle between tasks.
+        dispatch_policy: How to choose the actor for each task. Either
+            "least_loaded" (the actor with the fewest tasks in flight) or
+            "latency_ewma" (the actor expected to finish the task first,
+            based on its observed task latency).
+        actor_factory: Function that creates a new actor. If set, the pool
+            autoscales between `min_size` and `max_size` actors: it adds an
+            actor whenever a task is submitted while all actors are full, and
+            removes actors that have been idle for `idle_timeout_s` (checked
+            when results are returned). Removed actors are released, so actors
+            created by `actor_factory` exit once no other handles to them
+            exist.
+        min_size: The minimum number of actors when autoscaling. Defaults to
+            the number of `actors`.
+        max_size: The maximum number of actors when autoscaling. Defaults to
+            `min_size`.
+        idle_timeout_s: How long an actor must be idle before it's removed
+            when autoscaling.
+        latency_ewma_alpha: Weight of the latest task latency in the EWMA.
 
     Examples:
         .. testcode::
@@ -37,13 +91,69 @@ class ActorPool:
             [2, 4, 6, 8]
     """
 
-    def __init__(self, actors: list):
+    def __init__(
+        self,
+        actors: list,
+        *,
+        max_in_flight_per_actor: int = 1,
+        dispatch_policy: str = LEAST_LOADED,
+        actor_factory: Optional[Callable[[], "ray.actor.ActorHandle"]] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        idle_timeout_s: float = 10.0,
+        latency_ewma_alpha: float = 0.2,
+    ):
         from ray._private.usage.usage_lib import record_library_usage
 
         record_library_usage("util.ActorPool")
 
-        # actors to be used
-        self._idle_actors = list(actors)
+        if max_in_flight_per_actor < 1:
+            raise ValueError(
+                "max_in_flight_per_actor must be at least 1, got "
+                f"{max_in_flight_per_actor}."
+            )
+        if dispatch_policy not in DISPATCH_POLICIES:
+            raise ValueError(
+                f"dispatch_policy must be one of {DISPATCH_POLICIES}, got "
+                f"{dispatch_policy!r}."
+            )
+        if not 0 < latency_ewma_alpha <= 1:
+            raise ValueError(
+                f"latency_ewma_alpha must be in (0, 1], got {latency_ewma_alpha}."
+            )
+        if min_size is None:
+            min_size = len(actors)
+        if max_size is None:
+            max_size = min_size
+        if actor_factory is None and (
+            min_size != len(actors) or max_size != len(actors)
+        ):
+            raise ValueError("min_size and max_size require an actor_factory.")
+        if not 0 <= min_size <= max_size:
+            raise ValueError(
+                "Expected 0 <= min_size <= max_size, got "
+                f"min_size={min_size} and max_size={max_size}."
+            )
+
+        self._max_in_flight_per_actor = max_in_flight_per_actor
+        self._dispatch_policy = dispatch_policy
+        self._actor_factory = actor_factory
+        self._min_size = min_size
+        self._max_size = max_size
+        self._idle_timeout_s = idle_timeout_s
+        self._latency_ewma_alpha = latency_ewma_alpha
+
+        # actors to be used, whether busy or not
+        self._actors = []
+
+        # number of tasks in flight for each actor
+        self._num_in_flight = {}
+
+        # EWMA of the task latency for each actor that completed a task
+        self._latency_ewma_s = {}
+
+        # when each actor without tasks in flight became idle
+        self._idle_since = {}
 
         # get actor from future
         self._future_to_actor = {}
@@ -51,6 +161,9 @@ class ActorPool:
         # get future from index
         self._index_to_future = {}
 
+        # get submission time from index
+        self._index_to_submit_time = {}
+
         # next task to do
         self._next_task_index = 0
 
@@ -58,7 +171,15 @@ class ActorPool:
         self._next_return_index = 0
 
         # next work depending when actors free
-        self._pending_submits = []
+        self._pending_submits = deque()
+
+        self._num_tasks_completed = 0
+        self._first_submit_time = None
+
+        for actor in actors:
+            self._add_actor(actor)
+        while self._actor_factory is not None and len(self._actors) < self._min_size:
+            self._add_actor(self._actor_factory())
 
     def map(self, fn: Callable[["ray.actor.ActorHandle", V], Any], values: List[V]):
         """Apply the given function in parallel over the actors and values.
@@ -205,16 +326,75 @@ class ActorPool:
 
                 2 4
         """
-        if self._idle_actors:
-            actor = self._idle_actors.pop()
-            future = fn(actor, value)
-            future_key = tuple(future) if isinstance(future, list) else future
-            self._future_to_actor[future_key] = (self._next_task_index, actor)
-            self._index_to_future[self._next_task_index] = future
-            self._next_task_index += 1
+        if self._first_submit_time is None:
+            self._first_submit_time = time.monotonic()
+
+        actor = self._choose_actor()
+        if (
+            actor is None
+            and self._actor_factory is not None
+            and len(self._actors) < self._max_size
+        ):
+            # All actors are full, so scale up to absorb the backlog.
+            actor = self._actor_factory()
+            self._add_actor(actor)
+
+        if actor is not None:
+            self._dispatch(actor, fn, value)
         else:
             self._pending_submits.append((fn, value))
 
+    def _add_actor(self, actor):
+        self._actors.append(actor)
+        self._num_in_flight[actor] = 0
+        self._idle_since[actor] = time.monotonic()
+
+    def _remove_actor(self, actor):
+        self._actors.remove(actor)
+        del self._num_in_flight[actor]
+        self._latency_ewma_s.pop(actor, None)
+        self._idle_since.pop(actor, None)
+
+    def _choose_actor(self):
+        """Returns the actor to run the next task on, or None if all are full."""
+        candidates = [
+            actor
+            for actor in self._actors
+            if self._num_in_flight[actor] < self._max_in_flight_per_actor
+        ]
+        if not candidates:
+            return None
+
+        if self._dispatch_policy == LATENCY_EWMA:
+            # Actors without latency samples are assumed to have the mean
+            # latency of the pool.
+            latencies_s = list(self._latency_ewma_s.values())
+            mean_latency_s = sum(latencies_s) / len(latencies_s) if latencies_s else 0
+
+            def expected_finish_time_s(actor):
+                num_in_flight = self._num_in_flight[actor]
+                latency_s = self._latency_ewma_s.get(actor, mean_latency_s)
+                # Break ties (e.g., before any latency is known) by load.
+                return (num_in_flight + 1) * latency_s, num_in_flight
+
+            key = expected_finish_time_s
+        else:
+            key = self._num_in_flight.__getitem__
+
+        # Prefer the most recently added actor on ties, so the oldest actors go
+        # idle first and can be scaled down.
+        return min(reversed(candidates), key=key)
+
+    def _dispatch(self, actor, fn, value):
+        future = fn(actor, value)
+        future_key = tuple(future) if isinstance(future, list) else future
+        self._future_to_actor[future_key] = (self._next_task_index, actor)
+        self._index_to_future[self._next_task_index] = future
+        self._index_to_submit_time[self._next_task_index] = time.monotonic()
+        self._next_task_index += 1
+        self._num_in_flight[actor] += 1
+        self._idle_since.pop(actor, None)
+
     def has_next(self):
         """Returns whether there are any pending results to return.
 
@@ -301,7 +481,7 @@ class ActorPool:
         future_key = tuple(future) if isinstance(future, list) else future
         i, a = self._future_to_actor.pop(future_key)
 
-        self._return_actor(a)
+        self._complete_task(i, a)
         if raise_timeout_after_ignore:
             raise TimeoutError(
                 timeout_msg + ". The task {} has been ignored.".format(future)
@@ -360,7 +540,7 @@ class ActorPool:
             else:
                 raise_timeout_after_ignore = True
         i, a = self._future_to_actor.pop(future)
-        self._return_actor(a)
+        self._complete_task(i, a)
         del self._index_to_future[i]
         self._next_return_index = max(self._next_return_index, i + 1)
         if raise_timeout_after_ignore:
@@ -369,16 +549,91 @@ class ActorPool:
             )
         return ray.get(future)
 
-    def _return_actor(self, actor):
-        self._idle_actors.append(actor)
+    def _complete_task(self, index, actor):
+        now = time.monotonic()
+        latency_s = now - self._index_to_submit_time.pop(index)
+        if actor in self._latency_ewma_s:
+            self._latency_ewma_s[actor] += self._latency_ewma_alpha * (
+                latency_s - self._latency_ewma_s[actor]
+            )
+        else:
+            self._latency_ewma_s[actor] = latency_s
+        self._num_tasks_completed += 1
+
+        self._num_in_flight[actor] -= 1
+        if self._num_in_flight[actor] == 0:
+            self._idle_since[actor] = now
+
+        self._dispatch_pending_submits()
+        if self._actor_factory is not None:
+            self._remove_idle_actors(now)
+
+    def _dispatch_pending_submits(self):
+        while self._pending_submits:
+            actor = self._choose_actor()
+            if actor is None:
+                break
+            self._dispatch(actor, *self._pending_submits.popleft())
+
+    def _remove_idle_actors(self, now):
+        """Scale down by removing actors that have been idle for too long."""
         if self._pending_submits:
-            self.submit(*self._pending_submits.pop(0))
+            return
+
+        for actor, idle_since in list(self._idle_since.items()):
+            if len(self._actors) <= self._min_size:
+                break
+            if now - idle_since >= self._idle_timeout_s:
+                self._remove_actor(actor)
+
+    def stats(self) -> ActorPoolStats:
+        """Returns statistics about the actors and tasks of the pool.
+
+        Examples:
+            .. testcode::
+
+                import ray
+                from ray.util.actor_pool import ActorPool
+
+                @ray.remote
+                class Actor:
+                    def double(self, v):
+                        return 2 * v
+
+                pool = ActorPool([Actor.remote()], max_in_flight_per_actor=2)
+                pool.submit(lambda a, v: a.double.remote(v), 1)
+                pool.submit(lambda a, v: a.double.remote(v), 2)
+                pool.submit(lambda a, v: a.double.remote(v), 3)
+                stats = pool.stats()
+                print(stats.num_tasks_in_flight, stats.num_pending_submits)
+
+            .. testoutput::
+
+                2 1
+        """
+        if self._first_submit_time is None:
+            throughput = 0.0
+        else:
+            elapsed_s = time.monotonic() - self._first_submit_time
+            throughput = self._num_tasks_completed / elapsed_s if elapsed_s else 0.0
+
+        latencies_s = list(self._latency_ewma_s.values())
+        return ActorPoolStats(
+            num_actors=len(self._actors),
+            num_idle_actors=sum(n == 0 for n in self._num_in_flight.values()),
+            num_tasks_in_flight=sum(self._num_in_flight.values()),
+            num_pending_submits=len(self._pending_submits),
+            num_tasks_completed=self._num_tasks_completed,
+            throughput=throughput,
+            mean_latency_s=sum(latencies_s) / len(latencies_s) if latencies_s else None,
+        )
 
     def has_free(self):
-        """Returns whether there are any idle actors available.
+        """Returns whether there are any actors available to run a task.
 
         Returns:
-            True if there are any idle actors and no pending submits.
+            True if there are any actors with fewer than
+            `max_in_flight_per_actor` tasks in flight and no pending submits.
 
         Examples:
             .. testcode::
@@ -404,13 +659,15 @@ class ActorPool:
                 2
                 True
         """
-        return len(self._idle_actors) > 0 and len(self._pending_submits) == 0
+        return len(self._pending_submits) == 0 and any(
+            n < self._max_in_flight_per_actor for n in self._num_in_flight.values()
+        )
 
     def pop_idle(self):
         """Removes an idle actor from the pool.
 
         Returns:
-            An idle actor if one is available.
+            An actor without tasks in flight if one is available.
             None if no actor was free to be removed.
 
         Examples:
@@ -432,8 +689,13 @@ class ActorPool:
                 assert pool.pop_idle() == a1
 
         """
-        if self.has_free():
-            return self._idle_actors.pop()
+        if self._pending_submits:
+            return None
+
+        for actor in reversed(self._actors):
+            if self._num_in_flight[actor] == 0:
+                self._remove_actor(actor)
+                return actor
         return None
 
     def push(self, actor):
@@ -454,10 +716,8 @@ class ActorPool:
                 pool = ActorPool([a1])
                 pool.push(a2)
         """
-        busy_actors = []
-        if self._future_to_actor.values():
-            _, busy_actors = zip(*self._future_to_actor.values())
-        if actor in self._idle_actors or actor in busy_actors:
+        if actor in self._num_in_flight:
             raise ValueError("Actor already belongs to current ActorPool")
         else:
-            self._return_actor(actor)
+            self._add_actor(actor)
+            self._dispatch_pending_submits()
@@ -9,13 +9,24 @@ from typing import Optional
 import ray
 
 import dask
-from dask.core import istask, ishashable, _execute_task
+from dask.core import (
+    flatten,
+    get_dependencies,
+    istask,
+    ishashable,
+    toposort,
+    _execute_task,
+)
+from dask.optimization import fuse_linear
 from dask.system import CPU_COUNT
 from dask.threaded import pack_exception, _thread_get_id
+from dask.utils import key_split
 
+from ray.experimental.locations import get_local_object_locations
 from ray.util.dask.callbacks import local_ray_callbacks, unpack_ray_callbacks
 from ray.util.dask.common import unpack_object_refs
 from ray.util.dask.scheduler_utils import get_async, apply_sync
+from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
 
 main_thread = threading.current_thread()
 default_pool = None
@@ -28,6 +39,11 @@ TOP_LEVEL_RESOURCES_ERR_MSG = (
     "https://docs.ray.io/en/master/ray-core/package-ref.html#ray-remote."
 )
 
+# With locality-aware submission, a task is only pinned to a node if at least
+# this many bytes of its arguments are stored there. Smaller objects are
+# inlined into the task spec, so their location doesn't matter.
+LOCALITY_MIN_ARG_BYTES = 100 * 1024
+
 
 def enable_dask_on_ray(
     shuffle: Optional[str] = "tasks",
@@ -104,6 +120,17 @@ def ray_dask_get(dsk, keys, **kwargs):
             pool=some_cool_pool,
         )
 
+    Graphs with many small tasks can be submitted as fewer, larger Ray tasks
+    to reduce the per-task overhead:
+
+    >>> dask.compute(
+            obj,
+            scheduler=ray_dask_get,
+            ray_fuse_linear_chains=True,
+            ray_max_batch_size=16,
+            ray_locality_aware=True,
+        )
+
     Args:
         dsk: Dask graph, represented as a task DAG dictionary.
         keys (List[str]): List of Dask graph keys whose values we wish to
@@ -113,6 +140,18 @@ def ray_dask_get(dsk, keys, **kwargs):
             the Ray task submission traversal of the Dask graph.
         pool (Optional[ThreadPool]): A multiprocessing threadpool to use to
             submit Ray tasks.
+        ray_fuse_linear_chains (bool): Fuse linear chains of Dask tasks, where
+            each task is the only dependent of the previous one, into a single
+            Ray task. Defaults to False.
+        ray_max_batch_size (int): The maximum number of sibling Dask tasks
+            (tasks with the same name prefix at the same depth of the graph)
+            to execute in a single Ray task. Batches are kept small enough that
+            there are at least as many Ray tasks as CPUs in the cluster.
+            Defaults to 1, i.e., no batching.
+        ray_locality_aware (bool): Prefer to run each Ray task on the node that
+            stores most of its (already computed) arguments, using a soft node
+            affinity. Tasks whose Ray remote args set a scheduling strategy are
+            not affected. Defaults to False.
 
     Returns:
         Computed values corresponding to the provided keys.
@@ -141,6 +180,9 @@ def ray_dask_get(dsk, keys, **kwargs):
     ray_callbacks = kwargs.pop("ray_callbacks", None)
     persist = kwargs.pop("ray_persist", False)
     enable_progress_bar = kwargs.pop("_ray_enable_progress_bar", None)
+    fuse_linear_chains = kwargs.pop("ray_fuse_linear_chains", False)
+    max_batch_size = kwargs.pop("ray_max_batch_size", 1)
+    locality_aware = kwargs.pop("ray_locality_aware", False)
 
     # Handle Ray remote args and resource annotations.
     if "resources" in kwargs:
@@ -156,6 +198,10 @@ def ray_dask_get(dsk, keys, **kwargs):
     scoped_ray_remote_args = _build_key_scoped_ray_remote_args(
         dsk, annotations, ray_remote_args
     )
+    if fuse_linear_chains:
+        dsk = _fuse_linear_chains(dsk, keys, scoped_ray_remote_args, ray_remote_args)
+    if max_batch_size > 1:
+        dsk = _batch_sibling_tasks(dsk, keys, scoped_ray_remote_args, max_batch_size)
 
     with local_ray_callbacks(ray_callbacks) as ray_callbacks:
         # Unpack the Ray-specific callbacks.
@@ -178,6 +224,7 @@ def ray_dask_get(dsk, keys, **kwargs):
                 ray_pretask_cbs,
                 ray_posttask_cbs,
                 scoped_ray_remote_args,
+                locality_aware=locality_aware,
             ),
             len(pool._pool),
             dsk,
@@ -259,6 +306,7 @@ def _rayify_task_wrapper(
     ray_pretask_cbs,
     ray_posttask_cbs,
     scoped_ray_remote_args,
+    locality_aware=False,
 ):
     """
     The core Ray-Dask task execution wrapper, to be given to the thread pool's
@@ -278,6 +326,8 @@ def _rayify_task_wrapper(
         ray_pretask_cbs: Pre-task execution callbacks.
         ray_posttask_cbs: Post-task execution callbacks.
         scoped_ray_remote_args: Ray task options for each key.
+        locality_aware: Whether to prefer the node that stores most of the
+            task's arguments.
 
     Returns:
         A 3-tuple of the task's key, a literal or a Ray object reference for a
@@ -294,6 +344,7 @@ def _rayify_task_wrapper(
             ray_pretask_cbs,
             ray_posttask_cbs,
             scoped_ray_remote_args.get(key, {}),
+            locality_aware,
         )
         id = get_id()
         result = dumps((result, id))
@@ -313,6 +364,7 @@ def _rayify_task(
     ray_pretask_cbs,
     ray_posttask_cbs,
     ray_remote_args,
+    locality_aware=False,
 ):
     """
     Rayifies the given task, submitting it as a Ray task to the Ray cluster.
@@ -327,6 +379,8 @@ def _rayify_task(
         ray_pretask_cbs: Pre-task execution callbacks.
         ray_posttask_cbs: Post-task execution callbacks.
         ray_remote_args: Ray task options.
+        locality_aware: Whether to prefer the node that stores most of the
+            task's arguments.
 
     Returns:
         A literal, a Ray object reference representing a submitted task, or a
@@ -345,6 +399,7 @@ def _rayify_task(
                 ray_pretask_cbs,
                 ray_posttask_cbs,
                 ray_remote_args,
+                locality_aware,
             )
             for t in task
         ]
@@ -368,6 +423,15 @@ def _rayify_task(
         # unpack said object references into a flat set of arguments so that
         # Ray properly tracks the object dependencies between Ray tasks.
         arg_object_refs, repack = unpack_object_refs(args, deps)
+        if locality_aware and "scheduling_strategy" not in ray_remote_args:
+            node_id = _get_preferred_node_id(arg_object_refs)
+            if node_id is not None:
+                ray_remote_args = dict(
+                    ray_remote_args,
+                    scheduling_strategy=NodeAffinitySchedulingStrategy(
+                        node_id, soft=True
+                    ),
+                )
         # Submit the task using a wrapper function.
         object_refs = dask_task_wrapper.options(
             name=f"dask:{key!s}",
@@ -397,6 +461,28 @@ def _rayify_task(
         return task
 
 
+def _get_preferred_node_id(object_refs) -> Optional[str]:
+    """
+    Returns the ID of the node that stores the most bytes of the given objects,
+    or None if no node stores at least `LOCALITY_MIN_ARG_BYTES` of them.
+
+    Only the locations known to this worker are used, so no RPCs are made.
+    Objects that haven't been computed yet have no location.
+    """
+    if not object_refs or ray.util.client.ray.is_connected():
+        return None
+    node_to_bytes = defaultdict(int)
+    for location in get_local_object_locations(object_refs).values():
+        for node_id in location["node_ids"]:
+            node_to_bytes[node_id] += location["object_size"] or 0
+    if not node_to_bytes:
+        return None
+    node_id, num_bytes = max(node_to_bytes.items(), key=lambda item: item[1])
+    if num_bytes < LOCALITY_MIN_ARG_BYTES:
+        return None
+    return node_id
+
+
 @ray.remote
 def dask_task_wrapper(func, repack, key, ray_pretask_cbs, ray_posttask_cbs, *args):
     """
@@ -601,6 +687,85 @@ def multiple_return_get(multiple_returns, idx):
     return multiple_returns[idx]
 
 
+def _batch(*results):
+    return list(results)
+
+
+def _fuse_linear_chains(dsk, keys, scoped_ray_remote_args, ray_remote_args):
+    """
+    Fuses linear chains of tasks, where each task is the only dependent of the
+    previous one, into the last task of the chain. The upstream tasks are
+    inlined and executed by the same Ray task.
+
+    Output keys, multiple return splits, and tasks with their own Ray remote
+    args (e.g., from annotations) are not fused away.
+    """
+    dsk = dict(dsk)
+    protected_keys = set(flatten(keys))
+    for key, task in dsk.items():
+        if istask(task) and task[0] is multiple_return_get:
+            protected_keys.add(key)
+        elif scoped_ray_remote_args.get(key, ray_remote_args) != ray_remote_args:
+            protected_keys.add(key)
+    dsk, _ = fuse_linear(dsk, keys=list(protected_keys), rename_keys=False)
+    return dsk
+
+
+def _batch_sibling_tasks(dsk, keys, scoped_ray_remote_args, max_batch_size):
+    """
+    Batches sibling tasks into a single multiple return task per batch.
+
+    Siblings are tasks with the same name prefix, the same depth in the graph
+    (the length of the longest path from a task without dependencies), and the
+    same Ray remote args. No task in a batch can depend on another one in the
+    same or an earlier batch, so the batched graph stays acyclic. Each batch has
+    at most `max_batch_size` tasks, and batches are kept small enough that there
+    are at least as many batches as CPUs in the cluster, to not limit
+    parallelism.
+
+    Each batched task is replaced with a `multiple_return_get` on the batch, so
+    its key can still be used by downstream tasks and as an output key. The Ray
+    remote args of each batch are added to `scoped_ray_remote_args`.
+    """
+    dsk = dict(dsk)
+    dependencies = {key: get_dependencies(dsk, key) for key in dsk}
+    depths = {}
+    for key in toposort(dsk, dependencies=dependencies):
+        depths[key] = 1 + max((depths[dep] for dep in dependencies[key]), default=-1)
+
+    groups = defaultdict(list)
+    for key, task in dsk.items():
+        if (
+            not istask(task)
+            or task[0] is multiple_return_get
+            or isinstance(task[0], MultipleReturnFunc)
+        ):
+            continue
+        ray_remote_args = scoped_ray_remote_args.get(key, {})
+        groups[(key_split(key), depths[key], repr(ray_remote_args))].append(key)
+
+    num_cpus = max(1, int(ray.cluster_resources().get("CPU", 1)))
+    # Groups can differ only in their Ray remote args, so the group index is
+    # part of the batch keys to keep them unique.
+    for group_idx, ((name, depth, _), group) in enumerate(groups.items()):
+        batch_size = min(max_batch_size, len(group) // num_cpus)
+        if batch_size <= 1:
+            continue
+        for batch_idx, start in enumerate(range(0, len(group), batch_size)):
+            batch = group[start : start + batch_size]
+            if len(batch) == 1:
+                continue
+            batch_key = (f"ray-batch-{name}", depth, group_idx, batch_idx)
+            dsk[batch_key] = (
+                MultipleReturnFunc(_batch, len(batch)),
+                *[dsk[key] for key in batch],
+            )
+            scoped_ray_remote_args[batch_key] = scoped_ray_remote_args.get(batch[0], {})
+            for idx, key in enumerate(batch):
+                dsk[key] = (multiple_return_get, batch_key, idx)
+    return dsk
+
+
 def _build_key_scoped_ray_remote_args(dsk, annotations, ray_remote_args):
     # Handle per-layer annotations.
     if not isinstance(dsk, dask.highlevelgraph.HighLevelGraph):
@@ -11,7 +11,12 @@ import pytest
 import ray
 from ray.tests.conftest import *  # noqa: F403, F401
 from ray.util.client.common import ClientObjectRef
-from ray.util.dask import disable_dask_on_ray, enable_dask_on_ray, ray_dask_get
+from ray.util.dask import (
+    RayDaskCallback,
+    disable_dask_on_ray,
+    enable_dask_on_ray,
+    ray_dask_get,
+)
 from ray.util.dask.callbacks import ProgressBarCallback
 
 pytestmark = pytest.mark.skipif(
@@ -134,6 +139,76 @@ def test_ray_dask_persist(ray_start_1_cpu):
     )
 
 
+def test_ray_dask_fusion_and_batching(ray_start_1_cpu):
+    class SubmitCounter(RayDaskCallback):
+        def __init__(self):
+            self.submitted_keys = []
+
+        def _ray_postsubmit(self, task, key, deps, object_refs):
+            self.submitted_keys.append(key)
+
+    @dask.delayed
+    def inc(x):
+        return x + 1
+
+    @dask.delayed
+    def double(x):
+        return 2 * x
+
+    total = dask.delayed(sum)([double(inc(i)) for i in range(20)])
+    expected = sum(2 * (i + 1) for i in range(20))
+
+    counter = SubmitCounter()
+    with counter:
+        assert total.compute(scheduler=ray_dask_get, optimize_graph=False) == expected
+    assert len(counter.submitted_keys) == 41
+
+    # Each inc is fused into the double that depends on it.
+    counter = SubmitCounter()
+    with counter:
+        result = total.compute(
+            scheduler=ray_dask_get,
+            optimize_graph=False,
+            ray_fuse_linear_chains=True,
+        )
+    assert result == expected
+    assert len(counter.submitted_keys) == 21
+
+    # The 20 fused tasks are batched into 2 tasks, one per CPU.
+    counter = SubmitCounter()
+    with counter:
+        result = total.compute(
+            scheduler=ray_dask_get,
+            optimize_graph=False,
+            ray_fuse_linear_chains=True,
+            ray_max_batch_size=16,
+        )
+    assert result == expected
+    assert len(counter.submitted_keys) == 3
+
+    # Siblings that differ only in their Ray remote args are batched separately.
+    with dask.annotate(ray_remote_args=dict(num_cpus=0.5)):
+        annotated = [inc(i) for i in range(10)]
+    total = dask.delayed(sum)(annotated + [inc(i) for i in range(10, 20)])
+    counter = SubmitCounter()
+    with counter:
+        result = total.compute(
+            scheduler=ray_dask_get,
+            optimize_graph=False,
+            ray_max_batch_size=16,
+        )
+    assert result == sum(range(1, 21))
+    assert len(counter.submitted_keys) == 3
+
+
+def test_ray_dask_locality_aware(ray_start_1_cpu):
+    arr = da.ones((4, 1_000_000), chunks=(1, 1_000_000))
+    result = (
+        (arr + 1).sum(axis=1).compute(scheduler=ray_dask_get, ray_locality_aware=True)
+    )
+    assert (result == 2_000_000).all()
+
+
 def test_sort_with_progress_bar(ray_start_1_cpu):
     npartitions = 10
     df = dd.from_pandas(
@@ -12,6 +12,7 @@ from multiprocessing import TimeoutError
 from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
 
 import ray
+from ray._private import ray_constants
 from ray._private.usage import usage_lib
 from ray.util import log_once
 
@@ -28,6 +29,15 @@ logger = logging.getLogger(__name__)
 
 RAY_ADDRESS_ENV = "RAY_ADDRESS"
 
+# NumPy arguments at least this large are put in the object store once and
+# passed to the PoolActors by reference. Smaller ones are inlined in the batch.
+ZERO_COPY_MIN_ARRAY_BYTES = ray_constants.DEFAULT_MAX_DIRECT_CALL_OBJECT_SIZE
+
+# Settings for adaptive chunking (see AdaptiveChunkDispatcher).
+ADAPTIVE_CHUNK_TARGET_S = 0.1
+ADAPTIVE_CHUNKS_IN_FLIGHT_PER_ACTOR = 2
+ADAPTIVE_LATENCY_EWMA_ALPHA = 0.3
+
 
 def _put_in_dict_registry(
     obj: Any, registry_hashable: Dict[Hashable, ray.ObjectRef]
@@ -51,14 +61,28 @@ def _put_in_list_registry(
     return ret
 
 
+def _is_numpy_array(obj: Any) -> bool:
+    # Don't import NumPy if the caller hasn't already.
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(obj, np.ndarray)
+
+
+def _object_size(obj: Any) -> int:
+    # sys.getsizeof doesn't count the buffer of arrays that are views.
+    if _is_numpy_array(obj):
+        return obj.nbytes
+    return sys.getsizeof(obj)
+
+
 def ray_put_if_needed(
     obj: Any,
     registry: Optional[List[Tuple[Any, ray.ObjectRef]]] = None,
     registry_hashable: Optional[Dict[Hashable, ray.ObjectRef]] = None,
+    min_size: int = 100,
 ) -> ray.ObjectRef:
-    """ray.put obj in object store if it's not an ObjRef and bigger than 100 bytes,
-    with support for list and dict registries"""
-    if isinstance(obj, ray.ObjectRef) or sys.getsizeof(obj) < 100:
+    """ray.put obj in object store if it's not an ObjRef and at least min_size
+    bytes, with support for list and dict registries"""
+    if isinstance(obj, ray.ObjectRef) or _object_size(obj) < min_size:
         return obj
     ret = obj
     if registry_hashable is not None:
@@ -158,6 +182,44 @@ class PoolTaskError(Exception):
         self.underlying = underlying
 
 
+class PutArg:
+    """An argument that was put in the object store when submitting a chunk.
+
+    Large NumPy arrays are passed to the PoolActors by reference, so they're
+    stored once instead of being pickled into every batch that uses them.
+    Read-only arrays are read zero-copy from shared memory. Arrays read from
+    shared memory are read-only, so writable arrays are copied for each use
+    to keep them writable. They're wrapped so that ObjectRefs passed by the
+    user are still passed through to the function unchanged.
+    """
+
+    __slots__ = ("object_ref", "copy")
+
+    def __init__(self, object_ref: ray.ObjectRef, copy: bool):
+        self.object_ref = object_ref
+        self.copy = copy
+
+
+def _put_large_arrays(args: Tuple, registry: List[Tuple[Any, ray.ObjectRef]]) -> Tuple:
+    if "numpy" not in sys.modules:
+        return args
+    return tuple(
+        PutArg(
+            ray_put_if_needed(arg, registry, min_size=ZERO_COPY_MIN_ARRAY_BYTES),
+            copy=arg.flags.writeable,
+        )
+        if _is_numpy_array(arg) and arg.nbytes >= ZERO_COPY_MIN_ARRAY_BYTES
+        else arg
+        for arg in args
+    )
+
+
+def _get_put_arg_value(arg: PutArg, put_arg_values: Dict[ray.ObjectRef, Any]) -> Any:
+    value = put_arg_values[arg.object_ref]
+    # Each use of a writable array gets its own copy, as if it was pickled.
+    return value.copy() if arg.copy else value
+
+
 class ResultThread(threading.Thread):
     """Thread that collects results from distributed actors.
 
@@ -193,6 +255,9 @@ class ResultThread(threading.Thread):
             until END_SENTINEL (submitted through self.add_object_ref())
             has been received and all objects received before that have
             been processed.
+        ready_callback: called from this thread with the index of each
+            ObjectRef once its result has been fetched. May be used to submit
+            more ObjectRefs with add_object_ref.
     """
 
     END_SENTINEL = None
@@ -204,6 +269,7 @@ class ResultThread(threading.Thread):
         callback: callable = None,
         error_callback: callable = None,
         total_object_refs: Optional[int] = None,
+        ready_callback: Optional[Callable[[int], None]] = None,
     ):
         threading.Thread.__init__(self, daemon=True)
         self._got_error = False
@@ -214,6 +280,7 @@ class ResultThread(threading.Thread):
         self._single_result = single_result
         self._callback = callback
         self._error_callback = error_callback
+        self._ready_callback = ready_callback
         self._total_object_refs = total_object_refs or len(object_refs)
         self._indices = {}
         # Thread-safe queue used to add ObjectRefs to fetch after creating
@@ -248,6 +315,7 @@ class ResultThread(threading.Thread):
                         # Receiving the END_SENTINEL object is the signal to stop.
                         # Store the total number of objects.
                         self._total_object_refs = len(self._object_refs)
+                        break
                     else:
                         self._add_object_ref(new_object_ref)
                         unready.append(new_object_ref)
@@ -255,6 +323,11 @@ class ResultThread(threading.Thread):
                     # queue.Empty means no result was retrieved if block=False.
                     break
 
+            if not unready:
+                # The END_SENTINEL arrived after all the objects were ready
+                # (e.g., if there were no objects at all).
+                continue
+
             [ready_id], unready = ray.wait(unready, num_returns=1)
             try:
                 batch = ray.get(ready_id)
@@ -276,6 +349,8 @@ class ResultThread(threading.Thread):
             self._num_ready += 1
             self._results[self._indices[ready_id]] = batch
             self._ready_index_queue.put(self._indices[ready_id])
+            if self._ready_callback is not None:
+                self._ready_callback(self._indices[ready_id])
 
         # The regular callback is called only once on the entire List of
         # results as long as none of the results were errors. If any results
@@ -320,13 +395,31 @@ class AsyncResult:
     """
 
     def __init__(
-        self, chunk_object_refs, callback=None, error_callback=None, single_result=False
+        self,
+        chunk_object_refs,
+        callback=None,
+        error_callback=None,
+        single_result=False,
+        chunk_dispatcher=None,
     ):
         self._single_result = single_result
-        self._result_thread = ResultThread(
-            chunk_object_refs, single_result, callback, error_callback
-        )
-        self._result_thread.start()
+        if chunk_dispatcher is None:
+            self._result_thread = ResultThread(
+                chunk_object_refs, single_result, callback, error_callback
+            )
+            self._result_thread.start()
+        else:
+            # The chunks are submitted by the dispatcher as results come in.
+            self._result_thread = ResultThread(
+                [],
+                single_result,
+                callback,
+                error_callback,
+                total_object_refs=float("inf"),
+                ready_callback=chunk_dispatcher.on_chunk_ready,
+            )
+            self._result_thread.start()
+            chunk_dispatcher.start(self._result_thread)
 
     def wait(self, timeout=None):
         """
@@ -516,6 +609,112 @@ class UnorderedIMapIterator(IMapIterator):
         return self._ready_objects.popleft()
 
 
+class AdaptiveChunkDispatcher:
+    """Submits the chunks of a map call to the pool as its actors free up.
+
+    Rather than splitting the iterable into equal chunks up front and
+    assigning them round-robin, at most ADAPTIVE_CHUNKS_IN_FLIGHT_PER_ACTOR
+    chunks are outstanding per actor and each new chunk goes to the actor with
+    the fewest outstanding, so actors that finish early take over the rest of
+    the work when the per-item cost is skewed.
+
+    Chunks start at a single item. Once a chunk finishes, the per-item latency
+    is measured (from when the actor started on the chunk) and later chunks are
+    sized to take about ADAPTIVE_CHUNK_TARGET_S each, which amortizes the
+    per-call overhead for tiny tasks. Chunks never cover more than a
+    1 / (2 * num_actors) share of the remaining items, so they shrink towards
+    the end of the iterable and the actors finish at around the same time.
+    """
+
+    def __init__(self, pool, func, iterable, unpack_args=False):
+        if not hasattr(iterable, "__len__"):
+            iterable = list(iterable)
+
+        self._pool = pool
+        self._func = func
+        self._unpack_args = unpack_args
+        self._iterator = iter(iterable)
+        self._num_items = len(iterable)
+        self._num_submitted_items = 0
+        self._registry: List[Tuple[Any, ray.ObjectRef]] = []
+        self._lock = threading.Lock()
+        self._result_thread = None
+        self._finished_submitting = False
+
+        num_actors = len(pool._actor_pool)
+        self._num_in_flight = [0] * num_actors
+        self._actor_free_time = [0.0] * num_actors
+        # (actor_index, submit_time, chunksize) of each submitted chunk, in the
+        # same order as they were added to the result thread.
+        self._chunks: List[Tuple[int, float, int]] = []
+        self._item_latency_s = None
+
+    def start(self, result_thread: ResultThread):
+        with self._lock:
+            self._result_thread = result_thread
+            self._submit_chunks()
+
+    def on_chunk_ready(self, index: int):
+        with self._lock:
+            actor_index, submit_time, chunksize = self._chunks[index]
+            now = time.monotonic()
+            # The actor only started on this chunk once it was done with its
+            # previous one.
+            start_time = max(submit_time, self._actor_free_time[actor_index])
+            self._actor_free_time[actor_index] = now
+            self._num_in_flight[actor_index] -= 1
+
+            item_latency_s = (now - start_time) / chunksize
+            if self._item_latency_s is None:
+                self._item_latency_s = item_latency_s
+            else:
+                self._item_latency_s += ADAPTIVE_LATENCY_EWMA_ALPHA * (
+                    item_latency_s - self._item_latency_s
+                )
+            self._submit_chunks()
+
+    def _next_chunksize(self) -> int:
+        remaining = self._num_items - self._num_submitted_items
+        chunksize = div_round_up(remaining, 2 * len(self._num_in_flight))
+        if self._item_latency_s is None:
+            return 1
+        if self._item_latency_s > 0:
+            target_chunksize = int(ADAPTIVE_CHUNK_TARGET_S / self._item_latency_s)
+            chunksize = min(chunksize, target_chunksize)
+        return max(1, chunksize)
+
+    def _submit_chunks(self):
+        if self._finished_submitting:
+            return
+
+        while self._num_submitted_items < self._num_items:
+            actor_index = min(
+                range(len(self._num_in_flight)), key=self._num_in_flight.__getitem__
+            )
+            if self._num_in_flight[actor_index] >= ADAPTIVE_CHUNKS_IN_FLIGHT_PER_ACTOR:
+                return
+
+            chunksize = self._next_chunksize()
+            object_ref = self._pool._submit_chunk(
+                self._func,
+                self._iterator,
+                chunksize,
+                actor_index,
+                unpack_args=self._unpack_args,
+                registry=self._registry,
+            )
+            self._chunks.append((actor_index, time.monotonic(), chunksize))
+            self._num_in_flight[actor_index] += 1
+            self._num_submitted_items += chunksize
+            self._result_thread.add_object_ref(object_ref)
+
+        # Everything has been submitted, so signal the result thread to stop
+        # once the results are in.
+        self._finished_submitting = True
+        self._registry.clear()
+        self._result_thread.add_object_ref(ResultThread.END_SENTINEL)
+
+
 @ray.remote(num_cpus=0)
 class PoolActor:
     """Actor used to process tasks submitted to a Pool."""
@@ -530,10 +729,30 @@ class PoolActor:
         pass
 
     def run_batch(self, func, batch):
+        # Fetch the arguments that were put in the object store once per batch.
+        put_arg_refs = list(
+            {
+                arg.object_ref
+                for args, _ in batch
+                for arg in args or ()
+                if isinstance(arg, PutArg)
+            }
+        )
+        put_arg_values = (
+            dict(zip(put_arg_refs, ray.get(put_arg_refs))) if put_arg_refs else {}
+        )
+
         results = []
         for args, kwargs in batch:
             args = args or ()
             kwargs = kwargs or {}
+            if put_arg_values:
+                args = [
+                    _get_put_arg_value(arg, put_arg_values)
+                    if isinstance(arg, PutArg)
+                    else arg
+                    for arg in args
+                ]
             try:
                 results.append(func(*args, **kwargs))
             except Exception as e:
@@ -560,6 +779,11 @@ class Pool:
             also be specified using the `RAY_ADDRESS` environment variable.
         ray_remote_args: arguments used to configure the Ray Actors making up
             the pool.
+        adaptive_chunking: if True, `map`, `map_async`, `starmap`, and
+            `starmap_async` calls that don't specify a chunksize submit their
+            chunks as the actors free up, and size them based on the measured
+            per-item latency. This reduces the overhead for tiny tasks and
+            keeps all actors busy when the per-item cost is skewed.
     """
 
     def __init__(
@@ -571,6 +795,7 @@ class Pool:
         context: Any = None,
         ray_address: Optional[str] = None,
         ray_remote_args: Optional[Dict[str, Any]] = None,
+        adaptive_chunking: bool = False,
     ):
         usage_lib.record_library_usage("util.multiprocessing.Pool")
 
@@ -584,6 +809,10 @@ class Pool:
         self._current_index = 0
         self._ray_remote_args = ray_remote_args or {}
         self._pool_actor = None
+        self._adaptive_chunking = adaptive_chunking
+        # Chunks of adaptively chunked calls are submitted from their result
+        # threads, so submission has to be thread-safe.
+        self._submit_lock = threading.Lock()
 
         if context and log_once("context_argument_warning"):
             logger.warning(
@@ -672,15 +901,16 @@ class Pool:
 
     # Batch should be a list of tuples: (args, kwargs).
     def _run_batch(self, actor_index, func, batch):
-        actor, count = self._actor_pool[actor_index]
-        object_ref = actor.run_batch.remote(func, batch)
-        count += 1
-        assert self._maxtasksperchild == -1 or count <= self._maxtasksperchild
-        if count == self._maxtasksperchild:
-            self._stop_actor(actor)
-            actor, count = self._new_actor_entry()
-        self._actor_pool[actor_index] = (actor, count)
-        return object_ref
+        with self._submit_lock:
+            actor, count = self._actor_pool[actor_index]
+            object_ref = actor.run_batch.remote(func, batch)
+            count += 1
+            assert self._maxtasksperchild == -1 or count <= self._maxtasksperchild
+            if count == self._maxtasksperchild:
+                self._stop_actor(actor)
+                actor, count = self._new_actor_entry()
+            self._actor_pool[actor_index] = (actor, count)
+            return object_ref
 
     def apply(
         self,
@@ -774,14 +1004,27 @@ class Pool:
             chunksize += 1
         return chunksize
 
-    def _submit_chunk(self, func, iterator, chunksize, actor_index, unpack_args=False):
+    def _submit_chunk(
+        self,
+        func,
+        iterator,
+        chunksize,
+        actor_index,
+        unpack_args=False,
+        registry=None,
+    ):
+        # Registry of the arrays put in the object store, so arrays that are
+        # passed multiple times are only put once.
+        if registry is None:
+            registry = []
+
         chunk = []
         while len(chunk) < chunksize:
             try:
                 args = next(iterator)
                 if not unpack_args:
                     args = (args,)
-                chunk.append((args, {}))
+                chunk.append((_put_large_arrays(args, registry), {}))
             except StopIteration:
                 break
 
@@ -798,12 +1041,18 @@ class Pool:
             chunksize = self._calculate_chunksize(iterable)
 
         iterator = iter(iterable)
+        registry = []
         chunk_object_refs = []
         while len(chunk_object_refs) * chunksize < len(iterable):
             actor_index = len(chunk_object_refs) % len(self._actor_pool)
             chunk_object_refs.append(
                 self._submit_chunk(
-                    func, iterator, chunksize, actor_index, unpack_args=unpack_args
+                    func,
+                    iterator,
+                    chunksize,
+                    actor_index,
+                    unpack_args=unpack_args,
+                    registry=registry,
                 )
             )
 
@@ -819,6 +1068,14 @@ class Pool:
         error_callback=None,
     ):
         self._check_running()
+        if chunksize is None and self._adaptive_chunking:
+            chunk_dispatcher = AdaptiveChunkDispatcher(
+                self, func, iterable, unpack_args=unpack_args
+            )
+            return AsyncResult(
+                [], callback, error_callback, chunk_dispatcher=chunk_dispatcher
+            )
+
         object_refs = self._chunk_and_run(
             func, iterable, chunksize=chunksize, unpack_args=unpack_args
         )
@@ -833,7 +1090,8 @@ class Pool:
             iterable: iterable of objects to be passed as the sole argument to
                 func.
             chunksize: number of tasks to submit as a batch to each actor
-                process. If unspecified, a suitable chunksize will be chosen.
+                process. If unspecified, a suitable chunksize will be chosen
+                (adaptively if the pool was created with adaptive_chunking).
 
         Returns:
             A list of results.
@@ -860,7 +1118,8 @@ class Pool:
             iterable: iterable of objects to be passed as the only argument to
                 func.
             chunksize: number of tasks to submit as a batch to each actor
-                process. If unspecified, a suitable chunksize will be chosen.
+                process. If unspecified, a suitable chunksize will be chosen
+                (adaptively if the pool was created with adaptive_chunking).
             callback: Will only be called if none of the results were errors,
                 and will only be called once after all results are finished.
                 A Python List of all the finished results will be passed as the
@@ -1,4 +1,6 @@
 import asyncio
+import time
+import zlib
 from typing import Optional, Any, List, Dict
 from collections.abc import Iterable
 
@@ -255,6 +257,351 @@ class Queue:
         self.actor = None
 
 
+@PublicAPI(stability="alpha")
+class ShardedQueue:
+    """A first-in, first-out queue sharded over several Ray actors.
+
+    Items are spread over `num_shards` queue actors, so the throughput isn't
+    capped by a single actor. Puts and gets are batched on the client: put
+    items are buffered and sent to a shard `batch_size` at a time, and
+    `get_batch()` fetches up to `batch_size` items from all shards at once.
+
+    Items are only ordered within a shard: items put with the same
+    `shard_key` by a producer are received in order, but there is no order
+    across shards.
+
+    Producers must call `flush()` once they're done putting items, otherwise
+    up to `batch_size` items per shard may remain buffered on the producer.
+    Buffered items are also sent on the next `put()` once `flush_interval_s`
+    has passed since the last flush. Consumers don't buffer items: `get()`
+    and `get_batch()` only take the items they return from the shards.
+
+    Args:
+        maxsize: Maximum number of items in the queue, split evenly over the
+            shards. If zero, the size is unbounded.
+        num_shards: Number of queue actors to spread the items over.
+        batch_size: Maximum number of items to send per actor call, and the
+            default number of items to get with `get_batch()`.
+        flush_interval_s: Maximum time `put()` buffers items before sending
+            them to the shards.
+        actor_options: Options to pass into each queue actor during creation.
+            These are directly passed into QueueActor.options(...).
+
+    Examples:
+        .. testcode::
+
+            from ray.util.queue import ShardedQueue
+            q = ShardedQueue(num_shards=2, batch_size=4)
+            for item in range(10):
+                q.put(item)
+            q.flush()
+            assert sorted(q.get_batch(10)) == list(range(10))
+    """
+
+    # How long a blocking get waits on one shard before checking all shards.
+    _BLOCKING_GET_POLL_INTERVAL_S = 0.1
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        num_shards: int = 4,
+        batch_size: int = 64,
+        flush_interval_s: float = 0.1,
+        actor_options: Optional[Dict] = None,
+    ) -> None:
+        from ray._private.usage.usage_lib import record_library_usage
+
+        record_library_usage("util.ShardedQueue")
+
+        if num_shards < 1:
+            raise ValueError(f"num_shards must be at least 1, got {num_shards}.")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}.")
+
+        actor_options = actor_options or {}
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        # Round up, so the shards can hold at least `maxsize` items.
+        shard_maxsize = -(-maxsize // num_shards)
+        self.shards = [
+            ray.remote(_QueueActor).options(**actor_options).remote(shard_maxsize)
+            for _ in range(num_shards)
+        ]
+        self._init_client_state()
+
+    def _init_client_state(self):
+        # Items to put into each shard that weren't sent yet.
+        self._put_buffers = [[] for _ in self.shards]
+        self._last_flush_time = time.monotonic()
+        self._next_put_shard = 0
+        self._next_get_shard = 0
+
+    def __getstate__(self):
+        # Buffered items belong to this client, they aren't copied to others.
+        state = self.__dict__.copy()
+        for key in [
+            "_put_buffers",
+            "_last_flush_time",
+            "_next_put_shard",
+            "_next_get_shard",
+        ]:
+            del state[key]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_client_state()
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def size(self) -> int:
+        """The number of items in the shards.
+
+        Items buffered on clients aren't included.
+        """
+        return sum(ray.get([shard.qsize.remote() for shard in self.shards]))
+
+    def qsize(self) -> int:
+        """The number of items in the shards."""
+        return self.size()
+
+    def empty(self) -> bool:
+        """Whether the shards are empty."""
+        return self.size() == 0
+
+    def put(
+        self,
+        item: Any,
+        block: bool = True,
+        timeout: Optional[float] = None,
+        shard_key: Optional[Any] = None,
+    ) -> None:
+        """Adds an item to the queue.
+
+        The item is buffered and sent along with other items once the buffer
+        of its shard is full or `flush_interval_s` has passed.
+
+        Args:
+            item: The item to add.
+            block: If sending buffered items to a full shard, whether to block
+                until there is room for them.
+            timeout: Maximum time to block for when sending buffered items.
+            shard_key: If set, the item is put into the shard for this key
+                (strings, bytes and integers are hashed consistently across
+                processes). Otherwise, shards are filled round-robin.
+
+        Raises:
+            Full: if a shard is full and blocking is False, or it timed out.
+                The items that didn't fit, including `item`, stay buffered and
+                are sent by a later `put()` or `flush()`.
+            ValueError: if timeout is negative.
+        """
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+
+        if shard_key is None:
+            shard_index = self._next_put_shard
+        else:
+            shard_index = _stable_hash(shard_key) % len(self.shards)
+
+        buffer = self._put_buffers[shard_index]
+        buffer.append(item)
+        if len(buffer) >= self.batch_size:
+            if shard_key is None:
+                self._next_put_shard = (shard_index + 1) % len(self.shards)
+            self._put_buffers[shard_index] = []
+            self._send_batch(shard_index, buffer, block, timeout)
+
+        if time.monotonic() - self._last_flush_time >= self.flush_interval_s:
+            self.flush(block, timeout)
+
+    def flush(self, block: bool = True, timeout: Optional[float] = None) -> None:
+        """Sends all the buffered put items to the shards.
+
+        Raises:
+            Full: if a shard is full and blocking is False, or it timed out.
+                The items that didn't fit stay buffered.
+        """
+        self._last_flush_time = time.monotonic()
+        for shard_index, buffer in enumerate(self._put_buffers):
+            if buffer:
+                self._put_buffers[shard_index] = []
+                self._send_batch(shard_index, buffer, block, timeout)
+
+    def _send_batch(
+        self, shard_index: int, items: List[Any], block: bool, timeout: Optional[float]
+    ):
+        """Sends items to a shard, buffering them again if they don't fit."""
+        shard = self.shards[shard_index]
+        if block:
+            num_put = ray.get(shard.put_batch.remote(items, timeout))
+        else:
+            try:
+                ray.get(shard.put_nowait_batch.remote(items))
+            except Full:
+                num_put = 0
+            else:
+                num_put = len(items)
+
+        if num_put < len(items):
+            # Keep the items that weren't put ahead of the ones buffered since.
+            self._put_buffers[shard_index] = (
+                items[num_put:] + self._put_buffers[shard_index]
+            )
+            raise Full(
+                f"Shard {shard_index} of the queue is full, "
+                f"{len(items) - num_put} items are still buffered."
+            )
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Gets an item from the queue.
+
+        The shards are tried in turn, so this makes one actor call if the
+        next shard has items. Use `get_batch()` to get many items at once.
+
+        Raises:
+            Empty: if the queue is empty and blocking is False.
+            Empty: if the queue is empty, blocking is True, and it timed out.
+            ValueError: if timeout is negative.
+        """
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            for _ in range(len(self.shards)):
+                items = ray.get(self._next_shard_to_get().get_batch_nowait.remote(1))
+                if items:
+                    return items[0]
+
+            items = self._wait_for_items(1, block, deadline)
+            if items:
+                return items[0]
+
+    def get_batch(
+        self,
+        max_items: Optional[int] = None,
+        block: bool = True,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """Gets up to `max_items` items from the queue.
+
+        Fetches from all shards at once, splitting `max_items` between them.
+        Items that are available are returned right away, even if there are
+        fewer than `max_items`.
+
+        Args:
+            max_items: Maximum number of items to get. Defaults to
+                `batch_size`.
+            block: Whether to block until at least one item is available.
+            timeout: Maximum time to block for.
+
+        Returns:
+            A list of at least one item, in the order they were fetched.
+
+        Raises:
+            Empty: if the queue is empty and blocking is False.
+            Empty: if the queue is empty, blocking is True, and it timed out.
+            ValueError: if timeout is negative.
+        """
+        if max_items is None:
+            max_items = self.batch_size
+        if max_items < 1:
+            raise ValueError(f"max_items must be at least 1, got {max_items}.")
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            # Split the items between the shards, starting with the next shard
+            # in turn, and only ask the shards that get any items.
+            num_shards = len(self.shards)
+            shards = [self._next_shard_to_get() for _ in range(num_shards)]
+            items_per_shard = [
+                max_items // num_shards + (i < max_items % num_shards)
+                for i in range(num_shards)
+            ]
+            batches = ray.get(
+                [
+                    shard.get_batch_nowait.remote(num_items)
+                    for shard, num_items in zip(shards, items_per_shard)
+                    if num_items > 0
+                ]
+            )
+            items = [item for batch in batches for item in batch]
+            if items:
+                return items
+
+            items = self._wait_for_items(max_items, block, deadline)
+            if items:
+                return items
+
+    def _next_shard_to_get(self):
+        shard = self.shards[self._next_get_shard]
+        self._next_get_shard = (self._next_get_shard + 1) % len(self.shards)
+        return shard
+
+    def _wait_for_items(
+        self, max_items: int, block: bool, deadline: Optional[float]
+    ) -> List[Any]:
+        """Waits on the next shard for a while for up to `max_items` items.
+
+        Returns an empty list if no items arrived in that time, so that the
+        caller can check the other shards again.
+
+        Raises:
+            Empty: if blocking is False, or the deadline has passed.
+        """
+        remaining_s = None if deadline is None else deadline - time.monotonic()
+        if not block or (remaining_s is not None and remaining_s <= 0):
+            raise Empty
+
+        wait_s = self._BLOCKING_GET_POLL_INTERVAL_S
+        if remaining_s is not None:
+            wait_s = min(wait_s, remaining_s)
+        shard = self._next_shard_to_get()
+        return ray.get(shard.wait_for_batch.remote(max_items, wait_s))
+
+    def shutdown(self, force: bool = False, grace_period_s: int = 5) -> None:
+        """Terminates the underlying queue actors.
+
+        Items that are still buffered on clients are lost.
+
+        Args:
+            force: If True, forcefully kill the actors, causing an
+                immediate failure. If False, graceful
+                actor termination will be attempted first, before falling back
+                to a forceful kill.
+            grace_period_s: If force is False, how long in seconds to
+                wait for graceful termination before falling back to
+                forceful kill.
+        """
+        if force:
+            for shard in self.shards:
+                ray.kill(shard, no_restart=True)
+        elif self.shards:
+            done_refs = {
+                shard.__ray_terminate__.remote(): shard for shard in self.shards
+            }
+            _, not_done = ray.wait(
+                list(done_refs), num_returns=len(done_refs), timeout=grace_period_s
+            )
+            for done_ref in not_done:
+                ray.kill(done_refs[done_ref], no_restart=True)
+        self.shards = []
+
+
+def _stable_hash(key: Any) -> int:
+    """Hash that is the same across processes, unlike `hash()` for strings."""
+    if isinstance(key, bytes):
+        return zlib.crc32(key)
+    if isinstance(key, (str, int)):
+        return zlib.crc32(str(key).encode())
+    return hash(key)
+
+
 class _QueueActor:
     def __init__(self, maxsize):
         self.maxsize = maxsize
@@ -294,6 +641,40 @@ class _QueueActor:
         for item in items:
             self.queue.put_nowait(item)
 
+    async def put_batch(self, items, timeout=None):
+        """Puts the items in order, waiting for room if the queue is full.
+
+        Returns the number of items put, which is less than `len(items)` if it
+        timed out.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for i, item in enumerate(items):
+            if self.queue.full():
+                remaining_s = None
+                if deadline is not None:
+                    remaining_s = max(deadline - time.monotonic(), 0)
+                try:
+                    await self.put(item, remaining_s)
+                except Full:
+                    return i
+            else:
+                self.queue.put_nowait(item)
+        return len(items)
+
+    async def wait_for_batch(self, max_items, timeout=None):
+        """Waits for an item and returns it along with up to `max_items - 1`
+        other available items. Returns an empty list if it timed out."""
+        try:
+            items = [await self.get(timeout)]
+        except Empty:
+            return []
+        return items + self.get_batch_nowait(max_items - 1)
+
+    def get_batch_nowait(self, max_items):
+        """Returns up to `max_items` available items."""
+        num_items = min(max_items, self.qsize())
+        return [self.queue.get_nowait() for _ in range(num_items)]
+
     def get_nowait(self):
         return self.queue.get_nowait()
 
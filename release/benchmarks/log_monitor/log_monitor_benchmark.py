@@ -0,0 +1,166 @@
+"""CPU usage and latency of the log monitor with many worker log files.
+
+A log directory with many worker log files is created, and a few of the files
+are appended to at a steady rate while the log monitor runs. Each appended line
+holds the time it was written, so the latency from writing a line to publishing
+it can be measured. The log monitor is run with:
+
+- poll: the default, which polls all of the log files.
+- event: RAY_LOG_MONITOR_EVENT_DRIVEN, which only reads files that changed.
+- event_batched: event, with lines buffered for up to 50ms before publishing.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+import ray._private.ray_constants as ray_constants
+from ray._private.log_monitor import LogMonitor
+
+WORKER_ID = "6df6d5dd8ca5215658e4a8f9a569a9d98e27094f9cc35a4ca43d272c"
+
+MODES = {
+    "poll": dict(event_driven=False, batch_interval_s=0),
+    "event": dict(event_driven=True, batch_interval_s=0),
+    "event_batched": dict(event_driven=True, batch_interval_s=0.05),
+}
+
+
+class LatencyRecorder:
+    """Records the latency of the published lines instead of publishing them."""
+
+    def __init__(self):
+        self.latencies = []
+        self.num_publishes = 0
+
+    def publish_logs(self, data):
+        now = time.time()
+        self.num_publishes += 1
+        for line in data["lines"]:
+            self.latencies.append(now - float(line))
+
+
+def run_log_monitor(
+    logs_dir, event_driven, batch_interval_s, ready, stop, result_queue
+):
+    ray_constants.LOG_MONITOR_EVENT_DRIVEN = event_driven
+    ray_constants.LOG_MONITOR_PUBLISH_BATCH_INTERVAL_S = batch_interval_s
+    recorder = LatencyRecorder()
+    log_monitor = LogMonitor("127.0.0.1", logs_dir, recorder, lambda _: True)
+    threading.Thread(target=log_monitor.run, daemon=True).start()
+
+    # Wait for the existing lines to be published before measuring.
+    time.sleep(5)
+    recorder.latencies = []
+    recorder.num_publishes = 0
+    start_cpu = time.process_time()
+    start = time.time()
+    ready.set()
+    stop.wait()
+    cpu_percent = (time.process_time() - start_cpu) / (time.time() - start) * 100
+    result_queue.put((cpu_percent, recorder.latencies, recorder.num_publishes))
+
+
+def run_mode(mode, num_files, num_active_files, lines_per_second, duration_s):
+    with tempfile.TemporaryDirectory() as logs_dir:
+        paths = []
+        for i in range(num_files):
+            path = os.path.join(logs_dir, f"worker-{WORKER_ID}-01000000-{i}.out")
+            with open(path, "w") as f:
+                f.write(f"{time.time()}\n")
+            paths.append(path)
+        os.mkdir(os.path.join(logs_dir, "old"))
+
+        ready = multiprocessing.Event()
+        stop = multiprocessing.Event()
+        result_queue = multiprocessing.Queue()
+        proc = multiprocessing.Process(
+            target=run_log_monitor,
+            args=(
+                logs_dir,
+                MODES[mode]["event_driven"],
+                MODES[mode]["batch_interval_s"],
+                ready,
+                stop,
+                result_queue,
+            ),
+        )
+        proc.start()
+        ready.wait()
+
+        active_paths = random.sample(paths, num_active_files)
+        num_lines = int(lines_per_second * duration_s)
+        start = time.time()
+        for i in range(num_lines):
+            delay = start + i / lines_per_second - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            with open(random.choice(active_paths), "a") as f:
+                f.write(f"{time.time()}\n")
+        # Leave time for the last lines to be published.
+        time.sleep(1)
+        stop.set()
+        cpu_percent, latencies, num_publishes = result_queue.get()
+        proc.join()
+
+    latencies_ms = np.array(latencies) * 1000
+    result = {
+        "cpu_percent": cpu_percent,
+        "p50_latency_ms": float(np.percentile(latencies_ms, 50)),
+        "p99_latency_ms": float(np.percentile(latencies_ms, 99)),
+        "lines_per_publish": len(latencies) / max(num_publishes, 1),
+    }
+    print(
+        f"{mode}: {round(result['cpu_percent'], 1)}% cpu, "
+        f"p50 {round(result['p50_latency_ms'], 1)}ms, "
+        f"p99 {round(result['p99_latency_ms'], 1)}ms, "
+        f"{len(latencies)}/{num_lines} lines published, "
+        f"{round(result['lines_per_publish'], 1)} lines per publish"
+    )
+    return result
+
+
+def main(num_files, num_active_files, lines_per_second, duration_s):
+    perf_metrics = []
+    for mode in MODES:
+        result = run_mode(
+            mode, num_files, num_active_files, lines_per_second, duration_s
+        )
+        perf_metrics += [
+            {
+                "perf_metric_name": f"{mode}_cpu_percent",
+                "perf_metric_value": result["cpu_percent"],
+                "perf_metric_type": "LATENCY",
+            },
+            {
+                "perf_metric_name": f"{mode}_p50_latency_ms",
+                "perf_metric_value": result["p50_latency_ms"],
+                "perf_metric_type": "LATENCY",
+            },
+            {
+                "perf_metric_name": f"{mode}_p99_latency_ms",
+                "perf_metric_value": result["p99_latency_ms"],
+                "perf_metric_type": "LATENCY",
+            },
+        ]
+
+    if "TEST_OUTPUT_JSON" in os.environ:
+        with open(os.environ["TEST_OUTPUT_JSON"], "w") as out_file:
+            json.dump({"success": "1", "perf_metrics": perf_metrics}, out_file)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-files", type=int, default=5_000)
+    parser.add_argument("--num-active-files", type=int, default=50)
+    parser.add_argument("--lines-per-second", type=int, default=1_000)
+    parser.add_argument("--duration-s", type=float, default=20)
+    args = parser.parse_args()
+    main(args.num_files, args.num_active_files, args.lines_per_second, args.duration_s)
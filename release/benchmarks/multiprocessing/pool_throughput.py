@@ -0,0 +1,104 @@
+"""Throughput of ray.util.multiprocessing.Pool compared to the stdlib Pool.
+
+Each workload is run with the stdlib `multiprocessing.Pool`, the Ray Pool with
+its default static chunking, and the Ray Pool with adaptive chunking:
+
+- tiny: many items that each take a few microseconds, which is dominated by
+  the per-chunk overhead.
+- skewed: a few items take much longer than the rest, which leaves actors idle
+  with static chunking.
+- numpy: the same large array is passed with every item.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+import ray
+from ray.util.multiprocessing import Pool as RayPool
+
+
+def tiny_task(x):
+    return x * 2
+
+
+def skewed_task(x):
+    if x % 100 == 0:
+        time.sleep(0.05)
+    return x
+
+
+def numpy_task(arr, i):
+    return float(arr[i])
+
+
+def numpy_workload():
+    arr = np.ones(1024 * 1024)
+    return numpy_task, [(arr, i) for i in range(2_000)]
+
+
+WORKLOADS = {
+    "tiny": lambda: (tiny_task, [(i,) for i in range(100_000)]),
+    "skewed": lambda: (skewed_task, [(i,) for i in range(5_000)]),
+    "numpy": numpy_workload,
+}
+
+
+def run_workload(pool, func, items):
+    start = time.perf_counter()
+    pool.starmap(func, items)
+    return len(items) / (time.perf_counter() - start)
+
+
+def main(num_processes: int, num_trials: int):
+    ray.init(num_cpus=num_processes)
+    pools = {
+        "stdlib": lambda: multiprocessing.Pool(num_processes),
+        "ray": lambda: RayPool(num_processes),
+        "ray_adaptive": lambda: RayPool(num_processes, adaptive_chunking=True),
+    }
+
+    results = []
+    for pool_name, make_pool in pools.items():
+        pool = make_pool()
+        for workload_name, make_workload in WORKLOADS.items():
+            func, items = make_workload()
+            throughputs = [run_workload(pool, func, items) for _ in range(num_trials)]
+            mean = float(np.mean(throughputs))
+            std = float(np.std(throughputs))
+            print(
+                f"{workload_name} ({pool_name}): "
+                f"{round(mean, 2)} +- {round(std, 2)} items/s"
+            )
+            results.append((f"{workload_name}_{pool_name}", mean, std))
+        pool.terminate()
+        pool.join()
+
+    if "TEST_OUTPUT_JSON" in os.environ:
+        with open(os.environ["TEST_OUTPUT_JSON"], "w") as out_file:
+            json.dump(
+                {
+                    "success": "1",
+                    "perf_metrics": [
+                        {
+                            "perf_metric_name": name,
+                            "perf_metric_value": mean,
+                            "perf_metric_type": "THROUGHPUT",
+                        }
+                        for name, mean, _ in results
+                    ],
+                },
+                out_file,
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-processes", type=int, default=4)
+    parser.add_argument("--num-trials", type=int, default=3)
+    args = parser.parse_args()
+    main(args.num_processes, args.num_trials)
@@ -0,0 +1,126 @@
+"""Benchmark of Dask-on-Ray on DataFrame workloads with many small tasks.
+
+Compares the Dask distributed scheduler with the Dask-on-Ray scheduler, with
+and without linear-chain fusion, sibling batching, and locality-aware
+submission.
+"""
+import argparse
+import json
+import os
+import time
+
+import dask
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+
+
+def make_dataframe(nrows, npartitions):
+    df = pd.DataFrame(
+        {
+            "key": np.random.randint(0, 100, size=nrows),
+            "x": np.random.rand(nrows),
+            "y": np.random.rand(nrows),
+        }
+    )
+    return dd.from_pandas(df, npartitions=npartitions)
+
+
+def elementwise(df):
+    # A chain of per-partition operations, which is fused into one task per
+    # partition.
+    df = df.assign(z=df.x * 2 + df.y)
+    df = df[df.z > 0.5]
+    df = df.assign(w=df.z.map_partitions(np.sqrt))
+    return df.w.sum()
+
+
+def groupby(df):
+    return df.groupby("key").agg({"x": "mean", "y": "max"})
+
+
+def shuffle(df):
+    return df.set_index("x", shuffle="tasks", max_branch=float("inf")).y.sum()
+
+
+WORKLOADS = {
+    "elementwise": elementwise,
+    "groupby": groupby,
+    "shuffle": shuffle,
+}
+
+
+def run_trials(compute, num_trials):
+    times = []
+    for _ in range(num_trials):
+        start = time.perf_counter()
+        compute()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nrows", type=int, default=1_000_000)
+    parser.add_argument("--npartitions", type=int, default=1000)
+    parser.add_argument("--num-trials", type=int, default=5)
+    parser.add_argument("--max-batch-size", type=int, default=16)
+    parser.add_argument(
+        "--distributed",
+        action="store_true",
+        help="Also run the Dask distributed scheduler on a local cluster.",
+    )
+    args = parser.parse_args()
+
+    import ray
+    from ray.util.dask import dataframe_optimize, ray_dask_get
+
+    ray.init(address=os.environ.get("RAY_ADDRESS"))
+
+    df = make_dataframe(args.nrows, args.npartitions).persist(scheduler="threads")
+
+    schedulers = {
+        "ray": {"scheduler": ray_dask_get},
+        "ray_optimized": {
+            "scheduler": ray_dask_get,
+            "ray_fuse_linear_chains": True,
+            "ray_max_batch_size": args.max_batch_size,
+            "ray_locality_aware": True,
+        },
+    }
+    client = None
+    if args.distributed:
+        from dask.distributed import Client, LocalCluster
+
+        client = Client(LocalCluster(n_workers=os.cpu_count(), threads_per_worker=1))
+        schedulers["distributed"] = {"scheduler": client.get}
+
+    results = {}
+    for workload_name, workload in WORKLOADS.items():
+        collection = workload(df)
+        for scheduler_name, compute_kwargs in schedulers.items():
+            optimize = (
+                {"dataframe_optimize": dataframe_optimize}
+                if compute_kwargs["scheduler"] is ray_dask_get
+                else {}
+            )
+            with dask.config.set(**optimize):
+                # Warm up.
+                collection.compute(**compute_kwargs)
+                times = run_trials(
+                    lambda c=collection, kw=compute_kwargs: c.compute(**kw),
+                    args.num_trials,
+                )
+            name = f"{workload_name}_{scheduler_name}"
+            results[name] = float(np.mean(times))
+            print(
+                f"{name}: {np.mean(times):.3f} +- {np.std(times):.3f} s "
+                f"({args.npartitions} partitions)"
+            )
+
+    if client is not None:
+        client.close()
+
+    if "TEST_OUTPUT_JSON" in os.environ:
+        with open(os.environ["TEST_OUTPUT_JSON"], "w") as f:
+            json.dump({**results, "success": 1}, f)
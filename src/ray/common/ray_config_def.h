@@ -654,6 +654,11 @@ RAY_CONFIG(float, object_spilling_threshold, 0.8)
 /// Maximum number of objects that can be fused into a single file.
 RAY_CONFIG(int64_t, max_fused_object_count, 2000)
 
+/// Maximum number of spilled objects that can be restored by a single request to an
+/// IO worker. Restores are only batched while all the restore workers are busy, so
+/// that objects spilled to the same file can be read together.
+RAY_CONFIG(int64_t, max_restore_batch_size, 1)
+
 /// Grace period until we throw the OOM error to the application in seconds.
 /// In unlimited allocation mode, this is the time delay prior to fallback allocating.
 RAY_CONFIG(int64_t, oom_grace_period_s, 2)
@@ -663,6 +668,13 @@ RAY_CONFIG(int64_t, oom_grace_period_s, 2)
 /// specified by object_spilling_config.
 RAY_CONFIG(bool, is_external_storage_type_fs, true)
 
+/// Whether or not the external storage is the tiered storage, which spills to local
+/// directories first. Objects spilled to its local directories are only on the local
+/// disk, but the raylet can't read them directly.
+/// Note that this value should be overridden based on the storage type
+/// specified by object_spilling_config.
+RAY_CONFIG(bool, is_external_storage_type_tiered, false)
+
 /// Control the capacity threshold for ray local file system (for object store).
 /// Once we are over the capacity, all subsequent object creation will fail.
 RAY_CONFIG(float, local_fs_capacity_threshold, 0.95)
@@ -2366,19 +2366,122 @@ std::vector<rpc::ObjectReference> CoreWorker::SubmitTask(
   RAY_CHECK(scheduling_strategy.scheduling_strategy_case() !=
             rpc::SchedulingStrategy::SchedulingStrategyCase::SCHEDULING_STRATEGY_NOT_SET);
 
-  TaskSpecBuilder builder;
-  const auto next_task_index = worker_context_.GetNextTaskIndex();
-  const auto task_id = TaskID::ForNormalTask(worker_context_.GetCurrentJobID(),
-                                             worker_context_.GetCurrentInternalTaskId(),
-                                             next_task_index);
   auto constrained_resources =
       AddPlacementGroupConstraint(task_options.resources, scheduling_strategy);
 
   auto task_name = task_options.name.empty()
                        ? function.GetFunctionDescriptor()->DefaultTaskName()
                        : task_options.name;
-  int64_t depth = worker_context_.GetTaskDepth() + 1;
   // TODO(ekl) offload task building onto a thread pool for performance
+  TaskSpecification task_spec = BuildNormalTaskSpec(function,
+                                                    args,
+                                                    task_options,
+                                                    task_name,
+                                                    constrained_resources,
+                                                    max_retries,
+                                                    retry_exceptions,
+                                                    scheduling_strategy,
+                                                    debugger_breakpoint,
+                                                    serialized_retry_exception_allowlist,
+                                                    current_task_id);
+  RAY_LOG(DEBUG) << "Submitting normal task " << task_spec.DebugString();
+  std::vector<rpc::ObjectReference> returned_refs;
+  if (options_.is_local_mode) {
+    returned_refs = ExecuteTaskLocalMode(task_spec);
+  } else {
+    returned_refs = task_manager_->AddPendingTask(
+        task_spec.CallerAddress(), task_spec, CurrentCallSite(), max_retries);
+
+    io_service_.post(
+        [this, task_spec]() {
+          RAY_UNUSED(normal_task_submitter_->SubmitTask(task_spec));
+        },
+        "CoreWorker.SubmitTask");
+  }
+  return returned_refs;
+}
+
+std::vector<std::vector<rpc::ObjectReference>> CoreWorker::SubmitTasks(
+    const RayFunction &function,
+    const std::vector<std::vector<std::unique_ptr<TaskArg>>> &args_list,
+    const TaskOptions &task_options,
+    int max_retries,
+    bool retry_exceptions,
+    const rpc::SchedulingStrategy &scheduling_strategy,
+    const std::string &debugger_breakpoint,
+    const std::string &serialized_retry_exception_allowlist,
+    const TaskID current_task_id) {
+  RAY_CHECK(scheduling_strategy.scheduling_strategy_case() !=
+            rpc::SchedulingStrategy::SchedulingStrategyCase::SCHEDULING_STRATEGY_NOT_SET);
+
+  // The options are the same for every task, so only resolve them once.
+  auto constrained_resources =
+      AddPlacementGroupConstraint(task_options.resources, scheduling_strategy);
+  auto task_name = task_options.name.empty()
+                       ? function.GetFunctionDescriptor()->DefaultTaskName()
+                       : task_options.name;
+  std::string call_site;
+  if (!options_.is_local_mode) {
+    call_site = CurrentCallSite();
+  }
+
+  std::vector<std::vector<rpc::ObjectReference>> returned_refs;
+  returned_refs.reserve(args_list.size());
+  auto task_specs = std::make_shared<std::vector<TaskSpecification>>();
+  task_specs->reserve(args_list.size());
+  for (const auto &args : args_list) {
+    TaskSpecification task_spec =
+        BuildNormalTaskSpec(function,
+                            args,
+                            task_options,
+                            task_name,
+                            constrained_resources,
+                            max_retries,
+                            retry_exceptions,
+                            scheduling_strategy,
+                            debugger_breakpoint,
+                            serialized_retry_exception_allowlist,
+                            current_task_id);
+    RAY_LOG(DEBUG) << "Submitting normal task " << task_spec.DebugString();
+    if (options_.is_local_mode) {
+      returned_refs.push_back(ExecuteTaskLocalMode(task_spec));
+    } else {
+      returned_refs.push_back(task_manager_->AddPendingTask(
+          task_spec.CallerAddress(), task_spec, call_site, max_retries));
+      task_specs->push_back(std::move(task_spec));
+    }
+  }
+
+  if (!task_specs->empty()) {
+    io_service_.post(
+        [this, task_specs]() {
+          for (const auto &task_spec : *task_specs) {
+            RAY_UNUSED(normal_task_submitter_->SubmitTask(task_spec));
+          }
+        },
+        "CoreWorker.SubmitTasks");
+  }
+  return returned_refs;
+}
+
+TaskSpecification CoreWorker::BuildNormalTaskSpec(
+    const RayFunction &function,
+    const std::vector<std::unique_ptr<TaskArg>> &args,
+    const TaskOptions &task_options,
+    const std::string &task_name,
+    const std::unordered_map<std::string, double> &constrained_resources,
+    int max_retries,
+    bool retry_exceptions,
+    const rpc::SchedulingStrategy &scheduling_strategy,
+    const std::string &debugger_breakpoint,
+    const std::string &serialized_retry_exception_allowlist,
+    const TaskID current_task_id) {
+  TaskSpecBuilder builder;
+  const auto next_task_index = worker_context_.GetNextTaskIndex();
+  const auto task_id = TaskID::ForNormalTask(worker_context_.GetCurrentJobID(),
+                                             worker_context_.GetCurrentInternalTaskId(),
+                                             next_task_index);
+  int64_t depth = worker_context_.GetTaskDepth() + 1;
 
   BuildCommonTaskSpec(builder,
                       worker_context_.GetCurrentJobID(),
@@ -2414,22 +2517,7 @@ std::vector<rpc::ObjectReference> CoreWorker::SubmitTask(
                             serialized_retry_exception_allowlist,
                             scheduling_strategy,
                             root_detached_actor_id);
-  TaskSpecification task_spec = builder.Build();
-  RAY_LOG(DEBUG) << "Submitting normal task " << task_spec.DebugString();
-  std::vector<rpc::ObjectReference> returned_refs;
-  if (options_.is_local_mode) {
-    returned_refs = ExecuteTaskLocalMode(task_spec);
-  } else {
-    returned_refs = task_manager_->AddPendingTask(
-        task_spec.CallerAddress(), task_spec, CurrentCallSite(), max_retries);
-
-    io_service_.post(
-        [this, task_spec]() {
-          RAY_UNUSED(normal_task_submitter_->SubmitTask(task_spec));
-        },
-        "CoreWorker.SubmitTask");
-  }
-  return returned_refs;
+  return builder.Build();
 }
 
 Status CoreWorker::CreateActor(const RayFunction &function,
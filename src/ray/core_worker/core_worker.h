@@ -866,6 +866,26 @@ class CoreWorker : public rpc::CoreWorkerServiceHandler {
       const std::string &serialized_retry_exception_allowlist = "",
       const TaskID current_task_id = TaskID::Nil());
 
+  /// Submit a batch of normal tasks that share the same function and options.
+  ///
+  /// This is equivalent to calling SubmitTask once per element of `args_list`, but
+  /// the options and call site are resolved once and the tasks are handed to the
+  /// task submitter in a single post to the io service.
+  ///
+  /// \param[in] args_list Arguments of each task.
+  /// See SubmitTask for the other parameters.
+  /// \return ObjectRefs returned by each task, in the order of `args_list`.
+  std::vector<std::vector<rpc::ObjectReference>> SubmitTasks(
+      const RayFunction &function,
+      const std::vector<std::vector<std::unique_ptr<TaskArg>>> &args_list,
+      const TaskOptions &task_options,
+      int max_retries,
+      bool retry_exceptions,
+      const rpc::SchedulingStrategy &scheduling_strategy,
+      const std::string &debugger_breakpoint,
+      const std::string &serialized_retry_exception_allowlist = "",
+      const TaskID current_task_id = TaskID::Nil());
+
   /// Create an actor.
   ///
   /// \param[in] caller_id ID of the task submitter.
@@ -1484,6 +1504,20 @@ class CoreWorker : public rpc::CoreWorkerServiceHandler {
                                const ObjectID &object_id,
                                bool pin_object);
 
+  /// Build the spec of a normal task with already resolved resources and name.
+  TaskSpecification BuildNormalTaskSpec(
+      const RayFunction &function,
+      const std::vector<std::unique_ptr<TaskArg>> &args,
+      const TaskOptions &task_options,
+      const std::string &task_name,
+      const std::unordered_map<std::string, double> &constrained_resources,
+      int max_retries,
+      bool retry_exceptions,
+      const rpc::SchedulingStrategy &scheduling_strategy,
+      const std::string &debugger_breakpoint,
+      const std::string &serialized_retry_exception_allowlist,
+      const TaskID current_task_id);
+
   /// Execute a local mode task (runs normal ExecuteTask)
   ///
   /// \param spec[in] task_spec Task specification.
@@ -599,10 +599,12 @@ void GcsServer::InitRuntimeEnvManager() {
             // these.
             callback(true);
           } else {
+            // Delete by prefix to also delete the chunks of large packages,
+            // which are stored under "<uri>/<index>".
             this->kv_manager_->GetInstance().Del(
                 "" /* namespace */,
                 plugin_uri /* key */,
-                false /* del_by_prefix*/,
+                true /* del_by_prefix*/,
                 [callback = std::move(callback)](int64_t) { callback(false); });
           }
         }
@@ -18,6 +18,7 @@
 
 #include "ray/common/common_protocol.h"
 #include "ray/object_manager/plasma/store.h"
+#include "ray/object_manager/spilled_object_reader.h"
 #include "ray/stats/metric_defs.h"
 #include "ray/util/util.h"
 
@@ -354,8 +355,13 @@ void ObjectManager::Push(const ObjectID &object_id, const NodeID &node_id) {
 
   // Push from spilled object directly if the object is on local disk.
   auto object_url = get_spilled_object_url_(object_id);
-  if (!object_url.empty() && RayConfig::instance().is_external_storage_type_fs()) {
-    return PushFromFilesystem(object_id, node_id, object_url);
+  if (!object_url.empty()) {
+    if (RayConfig::instance().is_external_storage_type_fs()) {
+      return PushFromFilesystem(object_id, node_id, object_url);
+    }
+    // The object is on local disk in a format that only IO workers can read (e.g.,
+    // compressed by the tiered storage), so restore it and push it once it's local.
+    RestoreLocallySpilledObject(object_id, object_url);
   }
 
   // Avoid setting duplicated timer for the same object and node pair.
@@ -433,6 +439,27 @@ void ObjectManager::PushLocalObject(const ObjectID &object_id, const NodeID &nod
                      /*from_disk=*/false);
 }
 
+void ObjectManager::RestoreLocallySpilledObject(const ObjectID &object_id,
+                                                const std::string &spilled_url) {
+  std::string file_path;
+  uint64_t object_offset = 0;
+  uint64_t object_size = 0;
+  if (!SpilledObjectReader::ParseObjectURL(
+          spilled_url, file_path, object_offset, object_size)) {
+    RAY_LOG(WARNING) << "Failed to parse spilled object url: " << spilled_url;
+    return;
+  }
+  restore_spilled_object_(object_id,
+                          object_size,
+                          spilled_url,
+                          [object_id](const ray::Status &status) {
+                            if (!status.ok()) {
+                              RAY_LOG(ERROR) << "Object restore for " << object_id
+                                             << " failed: " << status;
+                            }
+                          });
+}
+
 void ObjectManager::PushFromFilesystem(const ObjectID &object_id,
                                        const NodeID &node_id,
                                        const std::string &spilled_url) {
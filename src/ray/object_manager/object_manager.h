@@ -272,6 +272,13 @@ class ObjectManager : public ObjectManagerInterface,
   /// \return Void.
   void PushLocalObject(const ObjectID &object_id, const NodeID &node_id);
 
+  /// Restore an object that is spilled to local disk in a format the raylet can't read
+  /// directly, so that it can be pushed once it's local.
+  /// \param object_id The object's object id.
+  /// \param spilled_url The url of the spilled object.
+  void RestoreLocallySpilledObject(const ObjectID &object_id,
+                                   const std::string &spilled_url);
+
   /// Pushing a known spilled object to a remote object manager.
   /// \param object_id The object's object id.
   /// \param node_id The remote node's id.
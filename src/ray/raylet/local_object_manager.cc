@@ -14,6 +14,9 @@
 
 #include "ray/raylet/local_object_manager.h"
 
+#include <algorithm>
+
+#include "absl/strings/match.h"
 #include "ray/common/asio/instrumented_io_context.h"
 #include "ray/stats/metric_defs.h"
 #include "ray/util/util.h"
@@ -400,6 +403,10 @@ void LocalObjectManager::OnObjectSpilled(const std::vector<ObjectID> &object_ids
 
     // Mark that the object is spilled and unpin the pending requests.
     spilled_objects_url_.emplace(object_id, object_url);
+    const bool spilled_to_local_storage = IsSpilledToLocalStorage(object_url);
+    if (spilled_to_local_storage) {
+      num_locally_spilled_objects_++;
+    }
     RAY_LOG(DEBUG) << "Unpinning pending spill object " << object_id;
     auto it = objects_pending_spill_.find(object_id);
     RAY_CHECK(it != objects_pending_spill_.end());
@@ -427,22 +434,29 @@ void LocalObjectManager::OnObjectSpilled(const std::vector<ObjectID> &object_ids
         worker_addr,
         object_url,
         freed_it->second.generator_id.value_or(ObjectID::Nil()),
-        is_external_storage_type_fs_);
+        spilled_to_local_storage);
   }
 }
 
 std::string LocalObjectManager::GetLocalSpilledObjectURL(const ObjectID &object_id) {
-  if (!is_external_storage_type_fs_) {
-    // If the external storage is cloud storage like S3, returns the empty string.
+  auto entry = spilled_objects_url_.find(object_id);
+  if (entry == spilled_objects_url_.end() || !IsSpilledToLocalStorage(entry->second)) {
+    // If the object is spilled to cloud storage like S3, returns the empty string.
     // In that case, the URL is supposed to be obtained by OBOD.
     return "";
   }
-  auto entry = spilled_objects_url_.find(object_id);
-  if (entry != spilled_objects_url_.end()) {
-    return entry->second;
-  } else {
-    return "";
+  return entry->second;
+}
+
+bool LocalObjectManager::IsSpilledToLocalStorage(const std::string &object_url) const {
+  if (is_external_storage_type_fs_) {
+    return true;
   }
+  return std::any_of(local_spilling_paths_.begin(),
+                     local_spilling_paths_.end(),
+                     [&object_url](const std::string &path) {
+                       return absl::StartsWith(object_url, path);
+                     });
 }
 
 void LocalObjectManager::AsyncRestoreSpilledObject(
@@ -458,50 +472,74 @@ void LocalObjectManager::AsyncRestoreSpilledObject(
   RAY_CHECK(objects_pending_restore_.emplace(object_id).second)
       << "Object dedupe wasn't done properly. Please report if you see this issue.";
   num_bytes_pending_restore_ += object_size;
-  io_worker_pool_.PopRestoreWorker([this, object_id, object_size, object_url, callback](
-                                       std::shared_ptr<WorkerInterface> io_worker) {
-    auto start_time = absl::GetCurrentTimeNanos();
-    RAY_LOG(DEBUG) << "Sending restore spilled object request";
-    rpc::RestoreSpilledObjectsRequest request;
-    request.add_spilled_objects_url(std::move(object_url));
-    request.add_object_ids_to_restore(object_id.Binary());
-    io_worker->rpc_client()->RestoreSpilledObjects(
-        request,
-        [this, start_time, object_id, object_size, callback, io_worker](
-            const ray::Status &status, const rpc::RestoreSpilledObjectsReply &r) {
-          io_worker_pool_.PushRestoreWorker(io_worker);
-          num_bytes_pending_restore_ -= object_size;
-          objects_pending_restore_.erase(object_id);
-          if (!status.ok()) {
-            RAY_LOG(ERROR) << "Failed to send restore spilled object request: "
-                           << status.ToString();
-          } else {
-            auto now = absl::GetCurrentTimeNanos();
-            auto restored_bytes = r.bytes_restored_total();
-            RAY_LOG(DEBUG) << "Restored " << restored_bytes << " in "
-                           << (now - start_time) / 1e6 << "ms. Object id:" << object_id;
-            restored_bytes_total_ += restored_bytes;
-            restored_objects_total_ += 1;
-            // Adjust throughput timing to account for concurrent restore operations.
-            restore_time_total_s_ +=
-                (now - std::max(start_time, last_restore_finish_ns_)) / 1e9;
-            if (now - last_restore_log_ns_ > 1e9) {
-              last_restore_log_ns_ = now;
-              RAY_LOG(INFO) << "Restored "
-                            << static_cast<int>(restored_bytes_total_ / (1024 * 1024))
-                            << " MiB, " << restored_objects_total_
-                            << " objects, read throughput "
-                            << static_cast<int>(restored_bytes_total_ / (1024 * 1024) /
-                                                restore_time_total_s_)
-                            << " MiB/s";
-            }
-            last_restore_finish_ns_ = now;
+  restore_queue_.push_back({object_id, object_size, object_url, std::move(callback)});
+  io_worker_pool_.PopRestoreWorker([this](std::shared_ptr<WorkerInterface> io_worker) {
+    RestoreSpilledObjects(io_worker);
+  });
+}
+
+void LocalObjectManager::RestoreSpilledObjects(
+    const std::shared_ptr<WorkerInterface> &io_worker) {
+  if (restore_queue_.empty()) {
+    // The restore was sent along with an earlier request.
+    io_worker_pool_.PushRestoreWorker(io_worker);
+    return;
+  }
+
+  auto start_time = absl::GetCurrentTimeNanos();
+  auto restores = std::make_shared<std::vector<PendingRestore>>();
+  rpc::RestoreSpilledObjectsRequest request;
+  while (!restore_queue_.empty() &&
+         static_cast<int64_t>(restores->size()) < max_restore_batch_size_) {
+    auto &restore = restore_queue_.front();
+    request.add_spilled_objects_url(restore.object_url);
+    request.add_object_ids_to_restore(restore.object_id.Binary());
+    restores->push_back(std::move(restore));
+    restore_queue_.pop_front();
+  }
+  RAY_LOG(DEBUG) << "Sending restore spilled objects request for " << restores->size()
+                 << " objects";
+  io_worker->rpc_client()->RestoreSpilledObjects(
+      request,
+      [this, start_time, restores, io_worker](const ray::Status &status,
+                                              const rpc::RestoreSpilledObjectsReply &r) {
+        io_worker_pool_.PushRestoreWorker(io_worker);
+        for (const auto &restore : *restores) {
+          num_bytes_pending_restore_ -= restore.object_size;
+          objects_pending_restore_.erase(restore.object_id);
+        }
+        if (!status.ok()) {
+          RAY_LOG(ERROR) << "Failed to send restore spilled object request: "
+                         << status.ToString();
+        } else {
+          auto now = absl::GetCurrentTimeNanos();
+          auto restored_bytes = r.bytes_restored_total();
+          RAY_LOG(DEBUG) << "Restored " << restored_bytes << " in "
+                         << (now - start_time) / 1e6 << "ms. Number of objects: "
+                         << restores->size();
+          restored_bytes_total_ += restored_bytes;
+          restored_objects_total_ += restores->size();
+          // Adjust throughput timing to account for concurrent restore operations.
+          restore_time_total_s_ +=
+              (now - std::max(start_time, last_restore_finish_ns_)) / 1e9;
+          if (now - last_restore_log_ns_ > 1e9) {
+            last_restore_log_ns_ = now;
+            RAY_LOG(INFO) << "Restored "
+                          << static_cast<int>(restored_bytes_total_ / (1024 * 1024))
+                          << " MiB, " << restored_objects_total_
+                          << " objects, read throughput "
+                          << static_cast<int>(restored_bytes_total_ / (1024 * 1024) /
+                                              restore_time_total_s_)
+                          << " MiB/s";
           }
-          if (callback) {
-            callback(status);
+          last_restore_finish_ns_ = now;
+        }
+        for (const auto &restore : *restores) {
+          if (restore.callback) {
+            restore.callback(status);
           }
-        });
-  });
+        }
+      });
 }
 
 void LocalObjectManager::ProcessSpilledObjectsDeleteQueue(uint32_t max_batch_size) {
@@ -541,6 +579,9 @@ void LocalObjectManager::ProcessSpilledObjectsDeleteQueue(uint32_t max_batch_siz
                        << " is deleted because the references are out of scope.";
         object_urls_to_delete.emplace_back(object_url);
       }
+      if (IsSpilledToLocalStorage(object_url)) {
+        num_locally_spilled_objects_--;
+      }
       spilled_objects_url_.erase(spilled_objects_url_it);
 
       // Update current spilled objects metrics
@@ -647,14 +688,10 @@ int64_t LocalObjectManager::GetPrimaryBytes() const {
 }
 
 bool LocalObjectManager::HasLocallySpilledObjects() const {
-  if (!is_external_storage_type_fs_) {
-    // External storage is not local.
-    return false;
-  }
   // Report non-zero usage when there are spilled / spill-pending live objects, to
   // prevent this node from being drained. Note that the value reported here is also
-  // used for scheduling.
-  return !spilled_objects_url_.empty();
+  // used for scheduling. Objects spilled to external storage are not local.
+  return num_locally_spilled_objects_ > 0;
 }
 
 std::string LocalObjectManager::DebugString() const {
@@ -16,6 +16,7 @@
 
 #include <google/protobuf/repeated_field.h>
 
+#include <deque>
 #include <functional>
 
 #include "ray/common/id.h"
@@ -52,7 +53,9 @@ class LocalObjectManager {
       int max_io_workers,
       int64_t min_spilling_size,
       bool is_external_storage_type_fs,
+      std::vector<std::string> local_spilling_paths,
       int64_t max_fused_object_count,
+      int64_t max_restore_batch_size,
       std::function<void(const std::vector<ObjectID> &)> on_objects_freed,
       std::function<bool(const ray::ObjectID &)> is_plasma_object_spillable,
       pubsub::SubscriberInterface *core_worker_subscriber,
@@ -72,7 +75,9 @@ class LocalObjectManager {
         max_active_workers_(max_io_workers),
         is_plasma_object_spillable_(is_plasma_object_spillable),
         is_external_storage_type_fs_(is_external_storage_type_fs),
+        local_spilling_paths_(std::move(local_spilling_paths)),
         max_fused_object_count_(max_fused_object_count),
+        max_restore_batch_size_(max_restore_batch_size),
         next_spill_error_log_bytes_(RayConfig::instance().verbose_spill_logs()),
         core_worker_subscriber_(core_worker_subscriber),
         object_directory_(object_directory) {}
@@ -157,8 +162,8 @@ class LocalObjectManager {
 
   /// Return the spilled object URL if the object is spilled locally,
   /// or the empty string otherwise.
-  /// If the external storage is cloud, this will always return an empty string.
-  /// In that case, the URL is supposed to be obtained by the object directory.
+  /// If the object is spilled to cloud storage, this will always return an empty
+  /// string. In that case, the URL is supposed to be obtained by the object directory.
   std::string GetLocalSpilledObjectURL(const ObjectID &object_id);
 
   /// Get the current bytes used by primary object copies. This number includes
@@ -169,6 +174,10 @@ class LocalObjectManager {
   /// filesystem.
   bool HasLocallySpilledObjects() const;
 
+  /// Returns true if the object spilled to the given URL is on the local disk, so it
+  /// can only be restored on this node.
+  bool IsSpilledToLocalStorage(const std::string &object_url) const;
+
   std::string DebugString() const;
 
  private:
@@ -193,6 +202,14 @@ class LocalObjectManager {
   FRIEND_TEST(LocalObjectManagerTest, TestSpillObjectNotEvictable);
   FRIEND_TEST(LocalObjectManagerTest, TestRetryDeleteSpilledObjects);
 
+  /// A restore that is waiting for a restore worker.
+  struct PendingRestore {
+    ObjectID object_id;
+    int64_t object_size;
+    std::string object_url;
+    std::function<void(const ray::Status &)> callback;
+  };
+
   /// Asynchronously spill objects when space is needed. The callback tries to
   /// spill at least num_bytes_to_spill and returns true if we found objects to
   /// spill.
@@ -220,6 +237,11 @@ class LocalObjectManager {
   void OnObjectSpilled(const std::vector<ObjectID> &object_ids,
                        const rpc::SpillObjectsReply &worker_reply);
 
+  /// Send up to max_restore_batch_size_ of the queued restores to the given restore
+  /// worker in a single request. The worker is returned to the pool right away if
+  /// the queued restores were already sent along with an earlier request.
+  void RestoreSpilledObjects(const std::shared_ptr<WorkerInterface> &io_worker);
+
   /// Delete spilled objects stored in given urls.
   ///
   /// \param urls_to_delete List of urls to delete from external storages.
@@ -276,6 +298,9 @@ class LocalObjectManager {
   /// progress.
   absl::flat_hash_set<ObjectID> objects_pending_restore_;
 
+  /// Restores that are waiting for a restore worker, in the order they were requested.
+  std::deque<PendingRestore> restore_queue_;
+
   /// The time that we last sent a FreeObjects request to other nodes for
   /// objects that have gone out of scope in the application.
   uint64_t last_free_objects_at_ms_ = 0;
@@ -305,6 +330,9 @@ class LocalObjectManager {
   /// pinned_objects_ entries are deleted when spilling happens.
   absl::flat_hash_map<ObjectID, std::string> spilled_objects_url_;
 
+  /// The number of objects in spilled_objects_url_ that are on the local disk.
+  int64_t num_locally_spilled_objects_ = 0;
+
   /// Base URL -> ref_count. It is used because there could be multiple objects
   /// within a single spilled file. We need to ref count to avoid deleting the file
   /// before all objects within that file are out of scope.
@@ -333,9 +361,18 @@ class LocalObjectManager {
   /// directly from the external storage.
   bool is_external_storage_type_fs_;
 
+  /// Local directories that objects may be spilled to even though the external
+  /// storage isn't the local filesystem (e.g., the local tier of the tiered storage).
+  /// Objects spilled under these paths are restored only from this node.
+  std::vector<std::string> local_spilling_paths_;
+
   /// Maximum number of objects that can be fused into a single file.
   int64_t max_fused_object_count_;
 
+  /// Maximum number of objects that can be restored by a single request to a restore
+  /// worker. Restores are only batched while all the restore workers are busy.
+  int64_t max_restore_batch_size_;
+
   /// The next total bytes for an error-level spill log, or zero to disable.
   /// This is doubled each time a message is logged.
   int64_t next_spill_error_log_bytes_;
@@ -30,6 +30,7 @@
 #include "ray/common/buffer.h"
 #include "ray/common/common_protocol.h"
 #include "ray/common/constants.h"
+#include "ray/common/file_system_monitor.h"
 #include "ray/common/memory_monitor.h"
 #include "ray/common/scheduling/scheduling_ids.h"
 #include "ray/common/status.h"
@@ -263,7 +264,12 @@ NodeManager::NodeManager(
           /*min_spilling_size*/ config.min_spilling_size,
           /*is_external_storage_type_fs*/
           RayConfig::instance().is_external_storage_type_fs(),
+          /*local_spilling_paths*/
+          RayConfig::instance().is_external_storage_type_tiered()
+              ? ParseSpillingPaths(RayConfig::instance().object_spilling_config())
+              : std::vector<std::string>{},
           /*max_fused_object_count*/ RayConfig::instance().max_fused_object_count(),
+          /*max_restore_batch_size*/ RayConfig::instance().max_restore_batch_size(),
           /*on_objects_freed*/
           [this](const std::vector<ObjectID> &object_ids) {
             object_manager_.FreeObjects(object_ids,
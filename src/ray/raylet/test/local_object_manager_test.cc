@@ -114,8 +114,12 @@ class MockWorkerClient : public rpc::CoreWorkerClientInterface {
       const rpc::ClientCallback<rpc::UpdateObjectLocationBatchReply> &callback) override {
     for (const auto &object_location_update : request.object_location_updates()) {
       ASSERT_TRUE(object_location_update.has_spilled_location_update());
-      object_urls.emplace(ObjectID::FromBinary(object_location_update.object_id()),
+      const auto object_id = ObjectID::FromBinary(object_location_update.object_id());
+      object_urls.emplace(object_id,
                           object_location_update.spilled_location_update().spilled_url());
+      spilled_to_local_storage.emplace(
+          object_id,
+          object_location_update.spilled_location_update().spilled_to_local_storage());
     }
     update_object_location_batch_callbacks.push_back(callback);
   }
@@ -132,6 +136,7 @@ class MockWorkerClient : public rpc::CoreWorkerClientInterface {
   }
 
   absl::flat_hash_map<ObjectID, std::string> object_urls;
+  absl::flat_hash_map<ObjectID, bool> spilled_to_local_storage;
   std::deque<rpc::ClientCallback<rpc::UpdateObjectLocationBatchReply>>
       update_object_location_batch_callbacks;
 };
@@ -314,8 +319,12 @@ class MockObjectBuffer : public Buffer {
 
 class LocalObjectManagerTestWithMinSpillingSize {
  public:
-  LocalObjectManagerTestWithMinSpillingSize(int64_t min_spilling_size,
-                                            int64_t max_fused_object_count)
+  LocalObjectManagerTestWithMinSpillingSize(
+      int64_t min_spilling_size,
+      int64_t max_fused_object_count,
+      int64_t max_restore_batch_size = 1,
+      bool is_external_storage_type_fs = true,
+      std::vector<std::string> local_spilling_paths = {})
       : subscriber_(std::make_shared<MockSubscriber>()),
         owner_client(std::make_shared<MockWorkerClient>()),
         client_pool([&](const rpc::Address &addr) { return owner_client; }),
@@ -340,8 +349,10 @@ class LocalObjectManagerTestWithMinSpillingSize {
             client_pool,
             /*max_io_workers=*/2,
             /*min_spilling_size=*/min_spilling_size,
-            /*is_external_storage_type_fs=*/true,
+            /*is_external_storage_type_fs=*/is_external_storage_type_fs,
+            /*local_spilling_paths=*/std::move(local_spilling_paths),
             /*max_fused_object_count*/ max_fused_object_count_,
+            /*max_restore_batch_size*/ max_restore_batch_size,
             /*on_objects_freed=*/
             [&](const std::vector<ObjectID> &object_ids) {
               for (const auto &object_id : object_ids) {
@@ -429,6 +440,25 @@ class LocalObjectManagerFusedTest : public LocalObjectManagerTestWithMinSpilling
   LocalObjectManagerFusedTest() : LocalObjectManagerTestWithMinSpillingSize(100, 15) {}
 };
 
+class LocalObjectManagerBatchedRestoreTest
+    : public LocalObjectManagerTestWithMinSpillingSize,
+      public ::testing::Test {
+ public:
+  LocalObjectManagerBatchedRestoreTest()
+      : LocalObjectManagerTestWithMinSpillingSize(0, 1, /*max_restore_batch_size=*/3) {}
+};
+
+class LocalObjectManagerTieredTest : public LocalObjectManagerTestWithMinSpillingSize,
+                                     public ::testing::Test {
+ public:
+  LocalObjectManagerTieredTest()
+      : LocalObjectManagerTestWithMinSpillingSize(0,
+                                                  1,
+                                                  /*max_restore_batch_size=*/1,
+                                                  /*is_external_storage_type_fs=*/false,
+                                                  /*local_spilling_paths=*/{"/local"}) {}
+};
+
 TEST_F(LocalObjectManagerTest, TestPin) {
   rpc::Address owner_address;
   owner_address.set_worker_id(WorkerID::FromRandom().Binary());
@@ -524,6 +554,82 @@ TEST_F(LocalObjectManagerTest, TestRestoreSpilledObject) {
   ASSERT_EQ(num_times_fired, 1);
 }
 
+TEST_F(LocalObjectManagerBatchedRestoreTest, TestRestoreSpilledObjectsInBatches) {
+  std::vector<ObjectID> object_ids;
+  for (int i = 0; i < 5; i++) {
+    object_ids.push_back(ObjectID::FromRandom());
+  }
+
+  // Restores are queued while there is no restore worker available.
+  int num_times_fired = 0;
+  for (size_t i = 0; i < object_ids.size(); i++) {
+    manager.AsyncRestoreSpilledObject(object_ids[i],
+                                      object_size,
+                                      BuildURL("url", i * object_size),
+                                      [&](const Status &status) {
+                                        ASSERT_TRUE(status.ok());
+                                        num_times_fired++;
+                                      });
+  }
+  ASSERT_EQ(worker_pool.restoration_callbacks.size(), object_ids.size());
+
+  // The first two workers restore all the objects in batches of at most 3 objects, and
+  // the remaining workers are returned to the pool right away.
+  EXPECT_CALL(worker_pool, PushRestoreWorker(_)).Times(5);
+  for (size_t i = 0; i < object_ids.size(); i++) {
+    ASSERT_TRUE(worker_pool.RestoreWorkerPushed());
+  }
+  ASSERT_EQ(worker_pool.io_worker_client->restore_callbacks.size(), 2u);
+  ASSERT_EQ(num_times_fired, 0);
+
+  ASSERT_TRUE(worker_pool.io_worker_client->ReplyRestoreObjects(3 * object_size));
+  ASSERT_EQ(num_times_fired, 3);
+  ASSERT_TRUE(worker_pool.io_worker_client->ReplyRestoreObjects(2 * object_size));
+  ASSERT_EQ(num_times_fired, 5);
+}
+
+TEST_F(LocalObjectManagerTieredTest, TestLocalTierIsNodeLocal) {
+  std::vector<ObjectID> object_ids;
+  std::vector<std::unique_ptr<RayObject>> objects;
+  rpc::Address owner_address;
+  owner_address.set_worker_id(WorkerID::FromRandom().Binary());
+
+  for (size_t i = 0; i < 2; i++) {
+    ObjectID object_id = ObjectID::FromRandom();
+    object_ids.push_back(object_id);
+    auto data_buffer = std::make_shared<MockObjectBuffer>(object_size, object_id, unpins);
+    auto object = std::make_unique<RayObject>(
+        data_buffer, nullptr, std::vector<rpc::ObjectReference>());
+    objects.push_back(std::move(object));
+  }
+  manager.PinObjectsAndWaitForFree(object_ids, std::move(objects), owner_address);
+
+  manager.SpillObjects(object_ids,
+                       [&](const Status &status) mutable { ASSERT_TRUE(status.ok()); });
+  ASSERT_TRUE(worker_pool.FlushPopSpillWorkerCallbacks());
+  // The first object is spilled to the local tier, and the second one overflows to
+  // cloud storage.
+  std::vector<std::string> urls{BuildURL("/local/url0"), BuildURL("s3://bucket/url1")};
+  ASSERT_TRUE(worker_pool.io_worker_client->ReplySpillObjects(urls));
+  for (size_t i = 0; i < 2; i++) {
+    ASSERT_TRUE(owner_client->ReplyUpdateObjectLocationBatch());
+  }
+
+  // Only the object on the local disk is reported as spilled to this node.
+  ASSERT_TRUE(owner_client->spilled_to_local_storage[object_ids[0]]);
+  ASSERT_FALSE(owner_client->spilled_to_local_storage[object_ids[1]]);
+  ASSERT_EQ(manager.GetLocalSpilledObjectURL(object_ids[0]), urls[0]);
+  ASSERT_TRUE(manager.GetLocalSpilledObjectURL(object_ids[1]).empty());
+  ASSERT_TRUE(manager.HasLocallySpilledObjects());
+
+  // The node has no locally spilled objects once the local one is deleted.
+  EXPECT_CALL(*subscriber_, Unsubscribe(_, _, object_ids[0].Binary()));
+  ASSERT_TRUE(subscriber_->PublishObjectEviction());
+  manager.ProcessSpilledObjectsDeleteQueue(/* max_batch_size */ 30);
+  ASSERT_EQ(worker_pool.io_worker_client->ReplyDeleteSpilledObjects(), 1);
+  ASSERT_FALSE(manager.HasLocallySpilledObjects());
+}
+
 TEST_F(LocalObjectManagerTest, TestExplicitSpill) {
   std::vector<ObjectID> object_ids;
   std::vector<std::unique_ptr<RayObject>> objects;